@@ -0,0 +1,592 @@
+"""
+Full-size snapshots of the database, written in parallel at disk speed.
+
+    python "Sample Data/db_snapshot.py" save snapshots/2026-10-19 [--format parquet|csv] [--workers 8]
+
+Every table is exported, large ones split into primary key range chunks of
+about --chunk-rows rows. Chunks run concurrently in a process pool, each on
+its own connection with an unbuffered (SSCursor) query, so rows stream from
+MySQL to a compressed file without ever holding a table in memory:
+
+    <out>/manifest.json
+    <out>/<table>/part-00000.parquet     zstd Parquet (needs pyarrow)
+    <out>/<table>/part-00000.csv.gz      or gzip CSV, NULL written as \\N
+
+manifest.json records, per table, its CREATE TABLE statement, columns,
+primary key, the tables it references, and per chunk the file, its row count,
+size and SHA-256, so a restore can check every file before loading it.
+
+Each chunk is read in its own transaction: chunks are consistent on their
+own, not with each other, so take snapshots while nothing is being ingested.
+
+    python "Sample Data/db_snapshot.py" restore snapshots/2026-10-19 [--workers 8]
+
+loads a snapshot into an empty schema (missing tables are created from the
+manifest). Every file's SHA-256 is checked before anything is loaded. The
+secondary indexes are dropped first and rebuilt once at the end, which sorts
+each index once instead of updating it row by row. Tables load level by level
+in foreign key order (parents before the tables referencing them, foreign key
+checks stay on), every chunk of a level in parallel: CSV chunks through
+LOAD DATA LOCAL INFILE when the server allows it, Parquet chunks (and CSV
+otherwise) through multi-row INSERTs. The holdings trigger is skipped during
+the load, AuditLog is restored with Holdings instead. Row counts are compared
+with the manifest at the end.
+"""
+
+import argparse
+import csv
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pymysql
+import pymysql.cursors
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DB_CONFIG = {
+    "host": os.getenv("DB_HOST"),
+    "port": int(os.getenv("DB_PORT", 3306)),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+    "database": os.getenv("DB_NAME"),
+}
+
+MANIFEST = "manifest.json"
+
+# rows fetched from the server per round trip, and per Parquet row group / CSV write
+BATCH_SIZE = 10_000
+
+# tables above this many rows (InnoDB's estimate) are split into chunks of about this size
+CHUNK_ROWS = 1_000_000
+
+EXTENSIONS = {"parquet": ".parquet", "csv": ".csv.gz"}
+
+# MySQL writes \N for NULL in LOAD DATA files, which also keeps NULL apart from ''
+CSV_NULL = "\\N"
+SQL_CSV_NULL = "'\\\\N'"  # the same as a SQL string literal
+
+SQL_TABLES = """
+    SELECT TABLE_NAME, TABLE_ROWS
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE'
+    ORDER BY TABLE_NAME;
+"""
+
+SQL_COLUMNS = """
+    SELECT COLUMN_NAME, DATA_TYPE, COLUMN_TYPE, NUMERIC_PRECISION, NUMERIC_SCALE
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    ORDER BY ORDINAL_POSITION;
+"""
+
+SQL_PRIMARY_KEY = """
+    SELECT COLUMN_NAME
+    FROM information_schema.KEY_COLUMN_USAGE
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY'
+    ORDER BY ORDINAL_POSITION;
+"""
+
+SQL_REFERENCES = """
+    SELECT DISTINCT REFERENCED_TABLE_NAME
+    FROM information_schema.KEY_COLUMN_USAGE
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    AND REFERENCED_TABLE_NAME IS NOT NULL AND REFERENCED_TABLE_NAME <> TABLE_NAME
+    ORDER BY REFERENCED_TABLE_NAME;
+"""
+
+INTEGER_TYPES = {"tinyint", "smallint", "mediumint", "int", "bigint"}
+
+# secondary index lines of SHOW CREATE TABLE, re-added as ALTER TABLE ... ADD <line>
+SECONDARY_INDEX = re.compile(r"^\s*((?:UNIQUE |FULLTEXT |SPATIAL )?KEY `([^`]+)` .*?),?$", re.MULTILINE)
+
+# "Cannot drop index: needed in a foreign key constraint", such indexes stay during the load
+ER_DROP_INDEX_FK = 1553
+
+# same dialect CsvChunkWriter writes (csv module defaults), NULLs mapped back from CSV_NULL
+SQL_LOAD_DATA = """
+    LOAD DATA LOCAL INFILE %s INTO TABLE `{table}`
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+    LINES TERMINATED BY '\\r\\n'
+    IGNORE 1 LINES
+    ({variables})
+    SET {assignments};
+"""
+
+
+def get_connection(**kwargs):
+    return pymysql.connect(**DB_CONFIG, **kwargs)
+
+
+def sha256_of(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe_table(cursor, table):
+    cursor.execute(f"SHOW CREATE TABLE `{table}`;")
+    create_table = cursor.fetchone()[1]
+    cursor.execute(SQL_COLUMNS, (table,))
+    columns = [
+        {"name": name, "type": data_type, "column_type": column_type, "precision": precision, "scale": scale}
+        for name, data_type, column_type, precision, scale in cursor.fetchall()
+    ]
+    cursor.execute(SQL_PRIMARY_KEY, (table,))
+    primary_key = [name for (name,) in cursor.fetchall()]
+    cursor.execute(SQL_REFERENCES, (table,))
+    references = [name for (name,) in cursor.fetchall()]
+    return {
+        "create_table": create_table,
+        "columns": columns,
+        "primary_key": primary_key,
+        "references": references,
+    }
+
+
+def chunk_bounds(cursor, table, layout, estimated_rows, chunk_rows):
+    """[(low, high)] ranges of the first primary key column, None for an open end.
+
+    Integer keys are split evenly between MIN and MAX, other keys (e.g.
+    PriceHistory's ticker_symbol) at the values where the running row count
+    crosses a multiple of chunk_rows, from one GROUP BY over the key's index.
+    """
+    if not layout["primary_key"] or estimated_rows <= chunk_rows:
+        return [(None, None)]
+    key = layout["primary_key"][0]
+    key_type = next(column["type"] for column in layout["columns"] if column["name"] == key)
+    n_chunks = -(-estimated_rows // chunk_rows)
+
+    if key_type in INTEGER_TYPES:
+        cursor.execute(f"SELECT MIN(`{key}`), MAX(`{key}`) FROM `{table}`;")
+        low, high = cursor.fetchone()
+        if low is None:
+            return [(None, None)]
+        step = max(1, -(-(high - low + 1) // n_chunks))
+        cuts = list(range(low + step, high + 1, step))
+    else:
+        cursor.execute(f"SELECT `{key}`, COUNT(*) FROM `{table}` GROUP BY `{key}` ORDER BY `{key}`;")
+        cuts, rows = [], 0
+        for value, count in cursor.fetchall():
+            if rows >= chunk_rows * (len(cuts) + 1):
+                cuts.append(value)
+            rows += count
+
+    edges = [None, *cuts, None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _where(key, low, high):
+    conditions, params = [], []
+    if low is not None:
+        conditions.append(f"`{key}` >= %s")
+        params.append(low)
+    if high is not None:
+        conditions.append(f"`{key}` < %s")
+        params.append(high)
+    return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+
+def _arrow_schema(columns):
+    import pyarrow as pa
+
+    def arrow_type(column):
+        data_type = column["type"]
+        if data_type in INTEGER_TYPES:
+            return pa.int64()
+        if data_type == "decimal":
+            decimal = pa.decimal128 if column["precision"] <= 38 else pa.decimal256
+            return decimal(column["precision"], column["scale"])
+        if data_type in ("float", "double"):
+            return pa.float64()
+        if data_type == "date":
+            return pa.date32()
+        if data_type in ("datetime", "timestamp"):
+            return pa.timestamp("us")
+        if data_type in ("binary", "varbinary", "bit", "blob", "tinyblob", "mediumblob", "longblob"):
+            return pa.binary()
+        return pa.string()  # char, varchar, text, enum, json, time...
+
+    return pa.schema([(column["name"], arrow_type(column)) for column in columns])
+
+
+class ParquetChunkWriter:
+    def __init__(self, path, columns):
+        import pyarrow.parquet as pq
+
+        self.schema = _arrow_schema(columns)
+        # TIME comes back as timedelta, YEAR as int: stored as their text
+        self.stringify = [i for i, column in enumerate(columns) if column["type"] in ("time", "year")]
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write(self, rows):
+        import pyarrow as pa
+
+        values = [list(column) for column in zip(*rows)]
+        for i in self.stringify:
+            values[i] = [None if value is None else str(value) for value in values[i]]
+        self.writer.write_table(pa.Table.from_arrays(values, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+class CsvChunkWriter:
+    def __init__(self, path, columns):
+        # level 6 keeps up with the cursor, 9 mostly burns CPU for a few percent
+        self.file = gzip.open(path, "wt", newline="", encoding="utf-8", compresslevel=6)
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([column["name"] for column in columns])
+
+    def write(self, rows):
+        self.writer.writerows([CSV_NULL if value is None else value for value in row] for row in rows)
+
+    def close(self):
+        self.file.close()
+
+
+WRITERS = {"parquet": ParquetChunkWriter, "csv": CsvChunkWriter}
+
+
+def export_chunk(table, columns, key, low, high, path, file_format, batch_size):
+    """Worker task: stream one key range of `table` into `path`. Returns its manifest entry."""
+    path = Path(path)
+    partial = path.with_name(path.name + ".partial")
+    where, params = _where(key, low, high)
+    select = ", ".join(f"`{column['name']}`" for column in columns)
+    n_rows = 0
+    with get_connection(cursorclass=pymysql.cursors.SSCursor) as conn:
+        with conn.cursor() as cursor:
+            # the server waits on us while we compress, don't let it drop the connection
+            cursor.execute("SET SESSION net_write_timeout = 3600;")
+            cursor.execute(f"SELECT {select} FROM `{table}`{where};", params)
+            writer = WRITERS[file_format](partial, columns)
+            try:
+                while rows := cursor.fetchmany(batch_size):
+                    writer.write(rows)
+                    n_rows += len(rows)
+            finally:
+                writer.close()
+    partial.replace(path)
+    return {
+        "file": f"{path.parent.name}/{path.name}",
+        "rows": n_rows,
+        "bytes": path.stat().st_size,
+        "sha256": sha256_of(path),
+        "low": low,
+        "high": high,
+    }
+
+
+def _json_value(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def save(out_dir, file_format="parquet", tables=None, workers=None, chunk_rows=CHUNK_ROWS, batch_size=BATCH_SIZE):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if file_format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow (pip install pyarrow), or use --format csv")
+
+    started = time.perf_counter()
+    manifest = {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "database": DB_CONFIG["database"],
+        "format": file_format,
+        "csv_null": CSV_NULL if file_format == "csv" else None,
+        "tables": {},
+    }
+    tasks = []
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(SQL_TABLES)
+            estimates = dict(cursor.fetchall())
+            for table in tables or sorted(estimates):
+                if table not in estimates:
+                    sys.exit(f"no table {table!r} in {DB_CONFIG['database']}")
+                layout = describe_table(cursor, table)
+                estimated = int(estimates[table] or 0)
+                bounds = chunk_bounds(cursor, table, layout, estimated, chunk_rows)
+                manifest["tables"][table] = {**layout, "chunks": []}
+                (out_dir / table).mkdir(exist_ok=True)
+                key = layout["primary_key"][0] if layout["primary_key"] else None
+                for i, (low, high) in enumerate(bounds):
+                    path = out_dir / table / f"part-{i:05d}{EXTENSIONS[file_format]}"
+                    tasks.append((estimated / len(bounds), (table, layout["columns"], key, low, high, str(path))))
+
+    # biggest chunks first so the pool doesn't end on one long straggler
+    tasks.sort(key=lambda task: task[0], reverse=True)
+    total_rows = 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(export_chunk, *args, file_format, batch_size): args[0] for _, args in tasks
+        }
+        for future in as_completed(futures):
+            table = futures[future]
+            chunk = future.result()
+            chunk["low"], chunk["high"] = _json_value(chunk["low"]), _json_value(chunk["high"])
+            manifest["tables"][table]["chunks"].append(chunk)
+            total_rows += chunk["rows"]
+            print(f"{chunk['file']}: {chunk['rows']:,} rows, {chunk['bytes'] / 2**20:,.1f} MiB")
+
+    for entry in manifest["tables"].values():
+        entry["chunks"].sort(key=lambda chunk: chunk["file"])
+        entry["rows"] = sum(chunk["rows"] for chunk in entry["chunks"])
+    # written last: a snapshot without a manifest is incomplete
+    with open(out_dir / MANIFEST, "w") as f_json:
+        json.dump(manifest, f_json, indent=2, default=str)
+
+    elapsed = time.perf_counter() - started
+    print(f"{len(manifest['tables'])} tables, {total_rows:,} rows in {elapsed:.1f}s -> {out_dir}")
+    return manifest
+
+
+def fk_levels(tables):
+    """Table names grouped so every table comes after the tables it references."""
+    remaining = {name: set(entry["references"]) & set(tables) for name, entry in tables.items()}
+    levels = []
+    while remaining:
+        level = sorted(name for name, parents in remaining.items() if not parents)
+        if not level:
+            sys.exit(f"foreign key cycle between {sorted(remaining)}")
+        levels.append(level)
+        for name in level:
+            del remaining[name]
+        for parents in remaining.values():
+            parents.difference_update(level)
+    return levels
+
+
+def verify_chunk(path, sha256):
+    """Worker task: (path, whether the file exists and matches its manifest checksum)."""
+    return path, os.path.exists(path) and sha256_of(path) == sha256
+
+
+def drop_secondary_indexes(cursor, table):
+    """Drops the secondary indexes of `table` the foreign keys can do without, returns their definitions."""
+    cursor.execute(f"SHOW CREATE TABLE `{table}`;")
+    dropped = []
+    for definition, name in SECONDARY_INDEX.findall(cursor.fetchone()[1]):
+        try:
+            cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{name}`;")
+        except pymysql.MySQLError as e:
+            if e.args[0] != ER_DROP_INDEX_FK:
+                raise
+            continue
+        dropped.append(definition)
+    return dropped
+
+
+def rebuild_indexes(table, definitions):
+    """Worker task: adds back every deferred index of `table` in one ALTER TABLE."""
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            additions = ", ".join(f"ADD {definition}" for definition in definitions)
+            cursor.execute(f"ALTER TABLE `{table}` {additions};")
+    return table
+
+
+def _csv_rows(path):
+    with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # header
+        for row in reader:
+            yield [None if value == CSV_NULL else value for value in row]
+
+
+def _parquet_rows(path, batch_size):
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
+def _batches(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_chunk(table, columns, path, file_format, load_data, batch_size):
+    """Worker task: loads one snapshot file into `table`. Returns (table, rows loaded)."""
+    names = [column["name"] for column in columns]
+    with get_connection(local_infile=load_data) as conn:
+        with conn.cursor() as cursor:
+            # the snapshot already holds the AuditLog rows of its Holdings, so the
+            # holdings trigger must not write them again (like setup_db's bulk load)
+            cursor.execute("SET @skip_holdings_audit = 1;")
+            if file_format == "csv" and load_data:
+                # LOAD DATA can't read gzip, it gets a decompressed copy
+                with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f_csv:
+                    with gzip.open(path, "rb") as f_gz:
+                        shutil.copyfileobj(f_gz, f_csv, 1 << 20)
+                try:
+                    sql = SQL_LOAD_DATA.format(
+                        table=table,
+                        variables=", ".join(f"@c{i}" for i in range(len(names))),
+                        assignments=", ".join(
+                            f"`{name}` = NULLIF(@c{i}, {SQL_CSV_NULL})"
+                            for i, name in enumerate(names)
+                        ),
+                    )
+                    n_rows = cursor.execute(sql, (f_csv.name,))
+                finally:
+                    os.unlink(f_csv.name)
+            else:
+                rows = _csv_rows(path) if file_format == "csv" else _parquet_rows(path, batch_size)
+                sql = "INSERT INTO `{}` ({}) VALUES ({});".format(
+                    table, ", ".join(f"`{name}`" for name in names), ", ".join(["%s"] * len(names))
+                )
+                n_rows = 0
+                for batch in _batches(rows, batch_size):
+                    # pymysql sends each batch as one multi-row INSERT
+                    cursor.executemany(sql, batch)
+                    n_rows += len(batch)
+        conn.commit()
+    return table, n_rows
+
+
+def _run(executor, fn, task_args):
+    futures = [executor.submit(fn, *args) for args in task_args]
+    for future in as_completed(futures):
+        yield future.result()
+
+
+def restore(snapshot_dir, tables=None, workers=None, verify=True, load_data=True, batch_size=BATCH_SIZE):
+    snapshot_dir = Path(snapshot_dir)
+    with open(snapshot_dir / MANIFEST) as f_json:
+        manifest = json.load(f_json)
+    file_format = manifest["format"]
+    selected = {name: entry for name, entry in manifest["tables"].items() if not tables or name in tables}
+    if tables and set(tables) - set(selected):
+        sys.exit(f"not in the snapshot: {sorted(set(tables) - set(selected))}")
+    if "Holdings" in selected and "AuditLog" not in selected and "AuditLog" in manifest["tables"]:
+        # Holdings load without their trigger's AuditLog rows, those come from the snapshot
+        print("restoring AuditLog along with Holdings")
+        selected["AuditLog"] = manifest["tables"]["AuditLog"]
+    if file_format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            sys.exit("Parquet snapshots need pyarrow (pip install pyarrow)")
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        if verify:
+            chunks = [
+                (str(snapshot_dir / chunk["file"]), chunk["sha256"])
+                for entry in selected.values()
+                for chunk in entry["chunks"]
+            ]
+            bad = [path for path, ok in _run(executor, verify_chunk, chunks) if not ok]
+            if bad:
+                sys.exit(f"missing or corrupt snapshot files, nothing loaded: {bad}")
+            print(f"{len(chunks)} files match their checksums")
+
+        levels = fk_levels(selected)
+        deferred = {}
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(SQL_TABLES)
+                existing = {name for name, _ in cursor.fetchall()}
+                for level in levels:
+                    for table in level:
+                        if table not in existing:
+                            cursor.execute(selected[table]["create_table"])
+                        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM `{table}`);")
+                        if cursor.fetchone()[0]:
+                            sys.exit(f"{table} is not empty, restore only loads into empty tables")
+                        deferred[table] = drop_secondary_indexes(cursor, table)
+                if load_data and file_format == "csv":
+                    cursor.execute("SELECT @@GLOBAL.local_infile;")
+                    if not cursor.fetchone()[0]:
+                        print("local_infile is off on the server, loading with INSERTs")
+                        load_data = False
+
+        loaded = {table: 0 for table in selected}
+        for depth, level in enumerate(levels):
+            tasks = [
+                (table, selected[table]["columns"], str(snapshot_dir / chunk["file"]),
+                 file_format, load_data, batch_size)
+                for table in level
+                for chunk in selected[table]["chunks"]
+            ]
+            for table, n_rows in _run(executor, load_chunk, tasks):
+                loaded[table] += n_rows
+            print(f"level {depth}: {', '.join(f'{table} ({loaded[table]:,} rows)' for table in level)}")
+
+        rebuilds = [(table, definitions) for table, definitions in deferred.items() if definitions]
+        for table in _run(executor, rebuild_indexes, rebuilds):
+            print(f"{table}: {len(deferred[table])} indexes rebuilt")
+
+    mismatched = []
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            for table, entry in selected.items():
+                cursor.execute(f"SELECT COUNT(*) FROM `{table}`;")
+                (count,) = cursor.fetchone()
+                if count != entry["rows"]:
+                    mismatched.append(f"{table}: {count:,} rows, snapshot has {entry['rows']:,}")
+    for line in mismatched:
+        print(f"MISMATCH {line}")
+
+    elapsed = time.perf_counter() - started
+    print(f"{len(selected)} tables, {sum(loaded.values()):,} rows restored in {elapsed:.1f}s")
+    return not mismatched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Save the database as a snapshot directory, or restore one.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save_parser = commands.add_parser("save", help="export every table, in parallel")
+    save_parser.add_argument("out_dir", type=Path)
+    save_parser.add_argument("--format", choices=sorted(WRITERS), default="parquet")
+    save_parser.add_argument("--tables", nargs="+", help="only these tables (default: all)")
+    save_parser.add_argument("--workers", type=int, help="concurrent chunks (default: every core)")
+    save_parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    save_parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    restore_parser = commands.add_parser("restore", help="load a snapshot into an empty schema")
+    restore_parser.add_argument("snapshot_dir", type=Path)
+    restore_parser.add_argument("--tables", nargs="+", help="only these tables (default: all in the manifest)")
+    restore_parser.add_argument("--workers", type=int, help="concurrent chunks (default: every core)")
+    restore_parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    restore_parser.add_argument("--skip-verify", action="store_true", help="don't check the file checksums first")
+    restore_parser.add_argument("--no-load-data", action="store_true", help="load CSV with INSERTs, not LOAD DATA")
+
+    args = parser.parse_args(argv)
+    if args.command == "save":
+        save(args.out_dir, args.format, args.tables, args.workers, args.chunk_rows, args.batch_size)
+    elif args.command == "restore":
+        ok = restore(
+            args.snapshot_dir, args.tables, args.workers, not args.skip_verify, not args.no_load_data, args.batch_size
+        )
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Gap-aware price history backfill planning.
+
+One query reads, for every ticker, the first and last stored date plus every
+hole in its history. The planner turns that into the date ranges that are
+actually missing, so a resumed or daily run only downloads what the database
+doesn't have yet instead of a whole year per ticker.
+
+Some missing ranges can never be filled (before a ticker's listing, trading
+halts, long exchange holidays). Ranges that were downloaded and came back
+empty are kept in an EmptyRanges file and left out of later plans.
+"""
+
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+# A weekend is a 3 day step between stored dates and a long weekend 4, anything
+# wider than this is treated as missing data
+MAX_GAP_DAYS = 4
+
+# where the ranges known to have no bars are kept between runs
+EMPTY_RANGES_PATH = Path(
+    os.getenv(
+        "BACKFILL_EMPTY_RANGES_PATH",
+        Path(__file__).resolve().parents[2] / ".cache" / "backfill_empty_ranges.json",
+    )
+)
+
+# Needs MySQL 8 (window functions). Tickers without any price history come back
+# with NULL first/last dates thanks to the LEFT JOIN.
+COVERAGE_SQL = """
+    WITH ordered AS (
+        SELECT
+            ticker_symbol,
+            date,
+            LAG(date) OVER (PARTITION BY ticker_symbol ORDER BY date) AS prev_date
+        FROM PriceHistory
+    )
+    SELECT
+        t.ticker_symbol,
+        MIN(o.date) AS first_date,
+        MAX(o.date) AS last_date,
+        GROUP_CONCAT(
+            CASE WHEN DATEDIFF(o.date, o.prev_date) > %(max_gap_days)s
+                 THEN CONCAT(o.prev_date, '/', o.date) END
+            ORDER BY o.date SEPARATOR ','
+        ) AS gaps
+    FROM Ticker t
+    LEFT JOIN ordered o ON o.ticker_symbol = t.ticker_symbol
+    GROUP BY t.ticker_symbol
+    ORDER BY t.ticker_symbol;
+"""
+
+
+@dataclass
+class Coverage:
+    ticker_symbol: str
+    first_date: date | None = None
+    last_date: date | None = None
+    # (last date before the hole, first date after it)
+    gaps: list[tuple[date, date]] = field(default_factory=list)
+
+
+def _parse_gaps(gaps):
+    if not gaps:
+        return []
+    parsed = []
+    for gap in gaps.split(","):
+        before, after = gap.split("/")
+        parsed.append((date.fromisoformat(before), date.fromisoformat(after)))
+    return parsed
+
+
+def get_coverage(conn, max_gap_days=MAX_GAP_DAYS):
+    """Stored date range and holes for every ticker, in one round trip."""
+    cursor = conn.cursor()
+    try:
+        # the gap list of a ticker with a patchy history easily outgrows the 1 KB default
+        cursor.execute("SET SESSION group_concat_max_len = 1048576;")
+        cursor.execute(COVERAGE_SQL, {"max_gap_days": max_gap_days})
+        return {
+            ticker_symbol: Coverage(ticker_symbol, first_date, last_date, _parse_gaps(gaps))
+            for ticker_symbol, first_date, last_date, gaps in cursor.fetchall()
+        }
+    finally:
+        cursor.close()
+
+
+def _subtract(start, end, covered):
+    """The parts of [start, end) outside the sorted, disjoint [start, end) ranges in `covered`."""
+    parts = []
+    for covered_start, covered_end in covered:
+        if covered_end <= start or covered_start >= end:
+            continue
+        if covered_start > start:
+            parts.append((start, covered_start))
+        start = max(start, covered_end)
+    if start < end:
+        parts.append((start, end))
+    return parts
+
+
+class EmptyRanges:
+    """[start, end) ranges per ticker that were downloaded and had no bars."""
+
+    def __init__(self, ranges=None):
+        self.ranges = defaultdict(list, ranges or {})
+
+    @classmethod
+    def load(cls, path=EMPTY_RANGES_PATH):
+        try:
+            with open(path) as f_json:
+                stored = json.load(f_json)
+        except FileNotFoundError:
+            return cls()
+        return cls({
+            ticker: [(date.fromisoformat(start), date.fromisoformat(end)) for start, end in ranges]
+            for ticker, ranges in stored.items()
+        })
+
+    def save(self, path=EMPTY_RANGES_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f_json:
+            json.dump(
+                {
+                    ticker: [(start.isoformat(), end.isoformat()) for start, end in ranges]
+                    for ticker, ranges in sorted(self.ranges.items())
+                    if ranges
+                },
+                f_json,
+                indent=1,
+            )
+        tmp_path.replace(path)
+
+    def add(self, ticker_symbol, start, end, today=None):
+        """Record [start, end) of `ticker_symbol` as empty, up to yesterday (today may still get bars)."""
+        end = min(end, today or date.today())
+        if start >= end:
+            return
+        merged = []
+        for other_start, other_end in sorted([*self.ranges[ticker_symbol], (start, end)]):
+            if merged and other_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], other_end))
+            else:
+                merged.append((other_start, other_end))
+        self.ranges[ticker_symbol] = merged
+
+    def missing(self, ticker_symbol, start, end):
+        """The parts of [start, end) not known to be empty."""
+        return _subtract(start, end, self.ranges.get(ticker_symbol, []))
+
+
+def plan_backfill(coverage, today=None, history_days=365, max_gap_days=MAX_GAP_DAYS, empty=None):
+    """Missing [start, end) date ranges per ticker.
+
+    - no data at all: the whole history window
+    - data starting late: the head of the window up to the first stored date
+    - holes wider than `max_gap_days`: the dates in between
+    - always: from the last stored date (re-fetched, its bars may have been
+      partial) up to today
+
+    minus the parts `empty` (an EmptyRanges) knows to have no bars.
+    """
+    today = today or date.today()
+    horizon_start = today - timedelta(days=history_days)
+    end = today + timedelta(days=1)  # end dates are exclusive
+
+    plan = {}
+    for ticker_symbol, cov in coverage.items():
+        if cov.last_date is None:
+            plan[ticker_symbol] = [(horizon_start, end)]
+            continue
+
+        ranges = []
+        if (cov.first_date - horizon_start).days > max_gap_days:
+            ranges.append((horizon_start, cov.first_date))
+        for before, after in cov.gaps:
+            if after > horizon_start:
+                ranges.append((max(before + timedelta(days=1), horizon_start), after))
+        ranges.append((max(cov.last_date, horizon_start), end))
+        plan[ticker_symbol] = ranges
+
+    if empty is not None:
+        plan = {
+            ticker_symbol: [part for start, end in ranges for part in empty.missing(ticker_symbol, start, end)]
+            for ticker_symbol, ranges in plan.items()
+        }
+    return plan
+
+
+def group_by_range(plan):
+    """{(start, end): [tickers]} so tickers needing the same range share batched downloads."""
+    groups = defaultdict(list)
+    for ticker_symbol, ranges in plan.items():
+        for date_range in ranges:
+            groups[date_range].append(ticker_symbol)
+    return dict(groups)
+
+
+def summarize(plan):
+    n_ranges = sum(len(ranges) for ranges in plan.values())
+    n_days = sum((end - start).days for ranges in plan.values() for start, end in ranges)
+    return f"{len(plan)} tickers, {n_ranges} ranges, {n_days} ticker-days to download"
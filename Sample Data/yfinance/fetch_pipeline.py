@@ -0,0 +1,368 @@
+"""
+Concurrent price history download pipeline.
+
+Tickers are split into batches (one multi-symbol download per batch where the
+source supports it) and fetched by a thread pool. Every request first takes a
+token from a shared token bucket, so the whole pool stays under the source's
+rate limit; when the source throttles anyway the bucket slows down (and then
+speeds back up slowly while requests succeed) and the batch is retried with
+exponential backoff.
+
+Run directly to benchmark the pipeline offline against the stub source:
+
+    python fetch_pipeline.py --tickers 500 --workers 16 --rate 20 --batch-size 25
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = [
+    "ticker_symbol",
+    "date",
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+]
+
+
+class RateLimitedError(Exception):
+    """Raised by a source when the upstream API is throttling us."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket with adaptive (AIMD) refill rate."""
+
+    def __init__(self, rate, capacity=None, min_rate=0.2, recover_step=0.1):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.min_rate = min_rate
+        self.recover_step = recover_step
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    def acquire(self, tokens=1.0):
+        """Block until `tokens` are available, then take them."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def throttle(self):
+        """Halve the rate and drain the bucket after the source pushed back."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+
+    def recover(self):
+        """Creep the rate back towards the configured maximum after a success."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.recover_step)
+
+
+def normalize_price_frame(ticker, data):
+    """Turn a yfinance OHLCV frame into PriceHistory rows (empty frame if unusable)."""
+    if data is None or data.empty:
+        return pd.DataFrame(columns=PRICE_COLUMNS)
+
+    # Flatten multi-index columns if present
+    if isinstance(data.columns, pd.MultiIndex):
+        data = data.copy()
+        data.columns = [col[0] for col in data.columns]
+
+    # Rename and clean
+    rename_map = {
+        "Open": "open_price",
+        "High": "high_price",
+        "Low": "low_price",
+        "Close": "close_price",
+        "Volume": "volume",
+    }
+    for old_col in rename_map:
+        if old_col not in data.columns:
+            print(f"Skipping {ticker}: missing '{old_col}' column")
+            return pd.DataFrame(columns=PRICE_COLUMNS)
+
+    data = data.reset_index().rename(columns=rename_map)
+    # intraday downloads index on "Datetime", daily ones on "Date"
+    data = data.rename(columns={"Datetime": "date", "Date": "date"})
+    data = data.dropna(
+        subset=["open_price", "high_price", "low_price", "close_price", "volume"]
+    )
+    data = data[data["volume"] > 0]
+    data["ticker_symbol"] = ticker
+
+    return data[PRICE_COLUMNS]
+
+
+def _is_rate_limit(error_type, message):
+    return "RateLimit" in error_type or "RateLimit" in message or "Too Many Requests" in message
+
+
+class YFinanceSource:
+    """Yahoo Finance through yfinance, many symbols per request."""
+
+    max_batch_size = 50
+
+    def __init__(self, period="1y", interval="1h"):
+        self.period = period
+        self.interval = interval
+
+    def fetch(self, tickers, start=None, end=None):
+        import yfinance as yf  # only needed when actually downloading
+        import yfinance.shared as yf_shared
+
+        # an explicit [start, end) range wins over the default period
+        window = {"start": start, "end": end} if start else {"period": self.period}
+        try:
+            data = yf.download(
+                tickers,
+                **window,
+                interval=self.interval,
+                group_by="ticker",
+                threads=False,  # the pipeline already runs requests concurrently
+                progress=False,
+                auto_adjust=False,
+            )
+        except Exception as e:
+            if _is_rate_limit(type(e).__name__, str(e)):
+                raise RateLimitedError(str(e)) from e
+            raise
+
+        # yf.download logs per-symbol failures (throttling included) to
+        # shared._ERRORS instead of raising. An empty download alone is no sign
+        # of throttling: weekends, holidays and not yet listed tickers are empty too
+        errors = {
+            ticker: str(error)
+            for ticker, error in getattr(yf_shared, "_ERRORS", {}).items()
+            if ticker in tickers
+        }
+        throttled = [ticker for ticker, error in errors.items() if _is_rate_limit("", error)]
+        if throttled:
+            raise RateLimitedError(f"{len(throttled)} symbols throttled: {errors[throttled[0]]}")
+
+        results = {}
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    results[ticker] = normalize_price_frame(ticker, None)
+                    continue
+                ticker_data = data[ticker]
+            else:
+                ticker_data = data
+            results[ticker] = normalize_price_frame(ticker, ticker_data)
+        return results
+
+
+class StubSource:
+    """Offline stand-in for YFinanceSource that serves synthetic hourly bars.
+
+    `latency` simulates the request round trip, `throttle_above` makes the stub
+    raise RateLimitedError whenever it receives more than that many requests
+    per second, like a real API would.
+    """
+
+    max_batch_size = 50
+
+    def __init__(self, bars=1750, latency=0.2, throttle_above=None, seed=0):
+        self.bars = bars
+        self.latency = latency
+        self.throttle_above = throttle_above
+        self.seed = seed
+        self.requests = 0
+        self.throttled = 0
+        self._recent = []
+        self._lock = threading.Lock()
+
+    def _check_rate(self):
+        if self.throttle_above is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._recent = [t for t in self._recent if now - t < 1.0]
+            self._recent.append(now)
+            if len(self._recent) > self.throttle_above:
+                self.throttled += 1
+                raise RateLimitedError("stub: too many requests")
+
+    def fetch(self, tickers, start=None, end=None):
+        with self._lock:
+            self.requests += 1
+        self._check_rate()
+        time.sleep(self.latency)
+
+        index = pd.date_range(end="2025-11-10 15:30", periods=self.bars, freq="h")
+        in_range = np.ones(self.bars, dtype=bool)
+        if start is not None:
+            in_range &= index >= pd.Timestamp(start)
+        if end is not None:
+            in_range &= index < pd.Timestamp(end)
+        results = {}
+        for ticker in tickers:
+            rng = np.random.default_rng([self.seed, *map(ord, ticker)])
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, self.bars)))
+            spread = np.abs(rng.normal(0, 0.003, self.bars)) * close
+            data = pd.DataFrame(
+                {
+                    "Open": close + rng.normal(0, 0.001, self.bars) * close,
+                    "High": close + spread,
+                    "Low": close - spread,
+                    "Close": close,
+                    "Volume": rng.integers(1_000, 1_000_000, self.bars),
+                },
+                index=pd.Index(index, name="Datetime"),
+            )
+            results[ticker] = normalize_price_frame(ticker, data[in_range])
+        return results
+
+
+def _batches(tickers, batch_size):
+    for i in range(0, len(tickers), batch_size):
+        yield tickers[i : i + batch_size]
+
+
+def _fetch_batch(source, bucket, batch, start, end, max_retries, base_backoff):
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            results = source.fetch(batch, start=start, end=end)
+        except RateLimitedError:
+            if attempt == max_retries:
+                raise
+            bucket.throttle()
+            # exponential backoff with jitter so the workers don't retry in lockstep
+            time.sleep(base_backoff * 2**attempt * random.uniform(0.5, 1.5))
+            continue
+        bucket.recover()
+        return results
+
+
+def fetch_all(
+    tickers,
+    source,
+    max_workers=8,
+    requests_per_second=2.0,
+    batch_size=None,
+    max_retries=5,
+    base_backoff=1.0,
+):
+    """Download every ticker's default period concurrently, see fetch_ranges."""
+    return fetch_ranges(
+        {(None, None): list(tickers)},
+        source,
+        max_workers=max_workers,
+        requests_per_second=requests_per_second,
+        batch_size=batch_size,
+        max_retries=max_retries,
+        base_backoff=base_backoff,
+    )
+
+
+def fetch_ranges(
+    range_groups,
+    source,
+    max_workers=8,
+    requests_per_second=2.0,
+    batch_size=None,
+    max_retries=5,
+    base_backoff=1.0,
+    on_empty=None,
+):
+    """Download {(start, end): [tickers]} concurrently, yielding (ticker, df) as batches finish.
+
+    Tickers sharing a date range are downloaded together in multi-symbol
+    batches. Results are yielded in completion order so the caller can insert
+    them into the database while the remaining downloads are still running.
+    Tickers whose batch failed for good are yielded with an empty frame.
+    `on_empty(ticker, start, end)` is called for every ticker that was
+    downloaded successfully but had no bars in its (explicit) range.
+    """
+    batch_size = batch_size or getattr(source, "max_batch_size", 1)
+    bucket = TokenBucket(requests_per_second)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                _fetch_batch, source, bucket, batch, start, end, max_retries, base_backoff
+            ): (batch, start, end)
+            for (start, end), tickers in range_groups.items()
+            for batch in _batches(list(tickers), batch_size)
+        }
+        for future in as_completed(futures):
+            batch, start, end = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"Error fetching {','.join(batch)}: {e}")
+                results = None
+            for ticker in batch:
+                df = (results or {}).get(ticker, pd.DataFrame(columns=PRICE_COLUMNS))
+                if on_empty is not None and results is not None and start is not None and df.empty:
+                    on_empty(ticker, start, end)
+                yield ticker, df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the fetch pipeline against the offline stub source."
+    )
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=20.0, help="requests per second")
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument("--latency", type=float, default=0.2, help="stub seconds per request")
+    parser.add_argument("--bars", type=int, default=1750, help="stub bars per ticker")
+    parser.add_argument(
+        "--throttle-above",
+        type=int,
+        default=None,
+        help="stub throttles above this many requests per second",
+    )
+    args = parser.parse_args()
+
+    stub = StubSource(
+        bars=args.bars, latency=args.latency, throttle_above=args.throttle_above
+    )
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+
+    start = time.perf_counter()
+    n_tickers = n_bars = 0
+    for ticker, df in fetch_all(
+        tickers,
+        stub,
+        max_workers=args.workers,
+        requests_per_second=args.rate,
+        batch_size=args.batch_size,
+        base_backoff=0.1,
+    ):
+        n_tickers += 1
+        n_bars += len(df)
+    elapsed = time.perf_counter() - start
+
+    print(f"Tickers      : {n_tickers}")
+    print(f"Bars         : {n_bars}")
+    print(f"Requests     : {stub.requests} ({stub.throttled} throttled)")
+    print(f"Elapsed      : {elapsed:.2f} s")
+    print(f"Throughput   : {n_tickers / elapsed:.1f} tickers/s, {n_bars / elapsed:,.0f} bars/s")
@@ -1,52 +1,60 @@
-import glob, pymysql, os
 import pandas as pd
-from pathlib import Path
-from dotenv import load_dotenv
+from pymysql.converters import escape_item
 
 GENERATED_SQL_FILE_PATH = "../../backend/api/sql/insert_sample_data.generated.sql"
 
+CSV_TABLES_DIR = "data/tables"
+
+# parents before children so the script runs with foreign key checks on
+TABLES_LOAD_ORDER = [
+    "User",
+    "Ticker",
+    "PriceHistory",
+    "Portfolio",
+    "Holdings",
+    "Alert",
+]
+
+# rows per INSERT statement, keeps each statement well under max_allowed_packet
+ROWS_PER_STATEMENT = 1000
 
-if __name__ == "__main__":
-    load_dotenv()
 
-    DB_CONNECT_CONFIG = {
-        "host": os.environ["DB_HOST"],
-        "user": os.environ["DB_USER"],
-        "password": os.environ["DB_PASSWORD"],
-        "database": os.environ["DB_NAME"],
-        "port": int(os.environ["DB_PORT"]),
-    }
+def sql_literal(value):
+    """Escape one python value as a MySQL literal (no db connection needed)."""
+    return escape_item(value, "utf8mb4")
 
-    csv_files_paths = glob.glob("data/tables/*.csv")
 
-    with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
-        print("connected")
-        cursor = conn.cursor()
+def multi_row_inserts(table_name, df):
+    """Yield compact `INSERT ... VALUES (...),(...)` statements for a whole table."""
+    columns = ",".join(f"`{col}`" for col in df.columns)
+    # object dtype so numpy scalars become plain python values, NaN becomes NULL
+    values = df.astype(object).where(df.notna(), None).to_numpy().tolist()
 
-        try:
-            with open(GENERATED_SQL_FILE_PATH, "w") as sql_file:
+    for i in range(0, len(values), ROWS_PER_STATEMENT):
+        rows = ",\n".join(
+            "(" + ",".join(sql_literal(value) for value in row) + ")"
+            for row in values[i : i + ROWS_PER_STATEMENT]
+        )
+        yield f"INSERT INTO `{table_name}` ({columns}) VALUES\n{rows};"
 
-                for csv_file_path in csv_files_paths:
-                    # 1 table
-                    df = pd.read_csv(csv_file_path)
 
-                    for index, row in df.iterrows():
-                        # 1 row
-                        print(
-                            cursor.mogrify(
-                                f"""INSERT INTO `{Path(csv_file_path).stem}` ({','.join([f"`{col}`" for col in df.columns])}) VALUES ({','.join([f"%s" for col in df.columns])});""",
-                                tuple(row),
-                            ),
-                            file=sql_file,
-                        )
+if __name__ == "__main__":
+    try:
+        with open(GENERATED_SQL_FILE_PATH, "w") as sql_file:
+
+            for table_name in TABLES_LOAD_ORDER:
+                # 1 table
+                df = pd.read_csv(f"{CSV_TABLES_DIR}/{table_name}.csv")
+                if df.empty:
+                    continue
 
-                    print("", file=sql_file)
+                for statement in multi_row_inserts(table_name, df):
+                    print(statement, file=sql_file)
 
-                sql_file.flush()  # Force write to disk
+                print("", file=sql_file)
+                print(f"{table_name} : {len(df)} rows")
 
-        except Exception as e:
-            conn.rollback()
-            print(f"Database morgify failed: {e}")
+            sql_file.flush()  # Force write to disk
 
-        finally:
-            cursor.close()
+    except Exception as e:
+        print(f"SQL script generation failed: {e}")
@@ -1,13 +1,31 @@
 import os
+import sys
+from pathlib import Path
 import pymysql
-import yfinance as yf
 import pandas as pd
 from dotenv import load_dotenv
 from tqdm import tqdm
-import time
+
+from backfill_plan import EmptyRanges, get_coverage, group_by_range, plan_backfill, summarize
+from fetch_pipeline import YFinanceSource, fetch_ranges
+from price_history_loader import PriceHistoryLoader
+
+# repo root, for the indicators package and its PriceHistory cache
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from indicators import cache as indicators_cache
+from indicators import snapshot as indicators_snapshot
 
 load_dotenv()
 
+# Yahoo starts throttling above a few requests per second, the token bucket
+# in fetch_pipeline keeps all workers together under this rate
+FETCH_WORKERS = 8
+FETCH_REQUESTS_PER_SECOND = 2.0
+
+# how far back a ticker without any stored history is backfilled
+# (yahoo only serves hourly bars for the last 730 days)
+HISTORY_DAYS = 365
+
 DB_CONFIG = {
     "host": os.getenv(
         "DB_HOST", "main-marketwatch-db.c74uqiecyemg.us-east-2.rds.amazonaws.com"
@@ -30,138 +48,61 @@ def get_tickers():
     return df["ticker_symbol"].tolist()
 
 
-def fetch_hourly_data(ticker):
-    """Fetch 1 year of hourly price data for a given ticker safely."""
-    try:
-        data = yf.download(
-            ticker, period="1y", interval="1h", progress=False, auto_adjust=False
-        )
-    except Exception as e:
-        print(f"Error fetching {ticker}: {e}")
-        return pd.DataFrame()
-
-    if data.empty:
-        print(f"No data returned for {ticker}")
-        return pd.DataFrame()
-
-    # Flatten multi-index columns if present
-    if isinstance(data.columns, pd.MultiIndex):
-        data.columns = [col[0] for col in data.columns]
-
-    # Rename and clean
-    rename_map = {
-        "Open": "open_price",
-        "High": "high_price",
-        "Low": "low_price",
-        "Close": "close_price",
-        "Volume": "volume",
-    }
-    for old_col in rename_map:
-        if old_col not in data.columns:
-            print(f"Skipping {ticker}: missing '{old_col}' column")
-            return pd.DataFrame()
-
-    data = data.reset_index().rename(columns=rename_map)
-    data = data.dropna(
-        subset=["open_price", "high_price", "low_price", "close_price", "volume"]
-    )
-    data = data[data["volume"] > 0]
-    data["ticker_symbol"] = ticker
-
-    return data[
-        [
-            "ticker_symbol",
-            "Datetime",
-            "open_price",
-            "high_price",
-            "low_price",
-            "close_price",
-            "volume",
-        ]
-    ].rename(columns={"Datetime": "date"})
-
-
-def insert_price_history(df):
+def insert_price_history(loader, df):
+    """Stage, validate and merge one ticker's bars, printing the ones the database would reject."""
     if df.empty:
         return
 
-    # Replace NaNs with None for MySQL
-    df = df.replace({pd.NA: None, float("nan"): None})
-
-    max_retries = 3
-    retry_count = 0
-
-    while retry_count < max_retries:
-        try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            sql = """
-                  INSERT INTO PriceHistory (ticker_symbol, date, open_price, high_price, low_price, close_price, volume)
-                  VALUES (%s, %s, %s, %s, %s, %s, %s)
-                      ON DUPLICATE KEY UPDATE
-                                           open_price = VALUES(open_price),
-                                           high_price = VALUES(high_price),
-                                           low_price = VALUES(low_price),
-                                           close_price = VALUES(close_price),
-                                           volume = VALUES(volume); \
-                  """
-            cursor.executemany(sql, df.values.tolist())
-            conn.commit()
-            cursor.close()
-            conn.close()
-            return  # Success, exit the function
-        except Exception as e:
-            retry_count += 1
-            error_msg = str(e)
-            if "gone away" in error_msg or "BrokenPipe" in error_msg:
-                print(f"Connection lost for {df['ticker_symbol'].iloc[0]}, retrying ({retry_count}/{max_retries})...")
-                time.sleep(2)  # Wait before retry
-                try:
-                    cursor.close()
-                    conn.close()
-                except:
-                    pass
-            else:
-                print(f"Insert error for {df['ticker_symbol'].iloc[0]}: {e}")
-                try:
-                    conn.rollback()
-                    cursor.close()
-                    conn.close()
-                except:
-                    pass
-                return  # Exit on non-connection errors
-
-
-def check_ticker_has_data(ticker):
-    """Check if ticker already has price history data"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM PriceHistory WHERE ticker_symbol = %s", (ticker,))
-        count = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
-        return count > 0
-    except:
-        return False
-
-if __name__ == "__main__":
-    tickers = get_tickers()
-    print(f"Fetching hourly data for {len(tickers)} tickers (1 year)\n")
+        report = loader.load(df)
+    except Exception as e:
+        print(f"Insert error for {df['ticker_symbol'].iloc[0]}: {e}")
+        return
 
-    # Check which tickers already have data
-    tickers_to_fetch = []
-    for ticker in tickers:
-        if not check_ticker_has_data(ticker):
-            tickers_to_fetch.append(ticker)
+    for ticker_symbol, day, reason in report.rejected:
+        print(f"Rejected {ticker_symbol} {day}: {reason}")
 
-    if len(tickers_to_fetch) < len(tickers):
-        print(f"Resuming: {len(tickers_to_fetch)} tickers remaining (skipping {len(tickers) - len(tickers_to_fetch)} already loaded)\n")
 
-    for ticker in tqdm(tickers_to_fetch):
-        df = fetch_hourly_data(ticker)
-        if not df.empty:
-            insert_price_history(df)
-        time.sleep(1)  # Prevent Yahoo rate limiting
+if __name__ == "__main__":
+    # one query for every ticker's stored range and holes, then only the missing ranges are downloaded
+    conn = get_connection()
+    try:
+        coverage = get_coverage(conn)
+    finally:
+        conn.close()
 
-    print("\nPrice history insertion completed successfully.")
+    # ranges earlier runs found without bars (before listing, halts, holidays) are skipped
+    empty = EmptyRanges.load()
+    plan = plan_backfill(coverage, history_days=HISTORY_DAYS, empty=empty)
+    range_groups = group_by_range(plan)
+    print(f"Backfilling hourly data: {summarize(plan)}\n")
+
+    # one connection for the whole run, every ticker goes through the staged loader:
+    # hourly bars are kept in PriceBar and rolled up into PriceHistory and PriceRollup
+    loader = PriceHistoryLoader(get_connection(), interval="1h")
+
+    # downloads run concurrently (batched, rate limited), inserts happen here as they finish
+    for ticker, df in tqdm(
+        fetch_ranges(
+            range_groups,
+            YFinanceSource(period="1y", interval="1h"),
+            max_workers=FETCH_WORKERS,
+            requests_per_second=FETCH_REQUESTS_PER_SECOND,
+            on_empty=empty.add,
+        ),
+        total=sum(len(tickers) for tickers in range_groups.values()),
+    ):
+        insert_price_history(loader, df)
+    empty.save()
+
+    # append the new bars to the indicators' local cache
+    written = indicators_cache.refresh(conn=loader.conn)
+    print(f"\nIndicator cache: {sum(written.values())} bars appended for {len(written)} tickers")
+
+    # latest values of every ticker for the screener
+    updated = indicators_snapshot.refresh_snapshot(conn=loader.conn)
+    print(f"IndicatorSnapshot: {updated} tickers updated")
+
+    loader.conn.close()
+    print(f"\n{loader.report}")
+    print("Price history insertion completed successfully.")
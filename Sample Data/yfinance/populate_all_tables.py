@@ -21,7 +21,7 @@ SCRIPTS = [
         "name": "Price History",
         "script": "insert_price_history.py",
         "description": "Downloading 1 year of hourly price data",
-        "estimated_time": "~5-15 minutes (depending on network speed)"
+        "estimated_time": "~1-5 minutes (concurrent, rate limited downloads)"
     },
     {
         "name": "Users",
@@ -0,0 +1,495 @@
+"""
+Staged, set-based PriceHistory loader.
+
+Cleaned rows are streamed in batches into a session TEMPORARY table, validated
+there against the same rules as PriceHistory's CHECK and FOREIGN KEY
+constraints, and merged with one INSERT ... SELECT ... ON DUPLICATE KEY UPDATE
+per batch that only touches rows that are new or whose values changed. Invalid
+rows are reported instead of failing the whole ticker.
+
+Intraday downloads (interval="1h", ...) are merged into PriceBar, keyed by
+(ticker, interval, bar time), and the days they touched are rolled up into
+PriceHistory (first open, highest high, lowest low, last close, summed
+volume). Either way the weeks and months holding a changed day are then
+rolled up again into PriceRollup, so every resolution stays current without
+ever rescanning more than the periods a batch touched.
+
+Run directly to benchmark ingest throughput (rows/s) against the configured
+database; the benchmark rolls back, nothing is kept:
+
+    python price_history_loader.py --benchmark --tickers 50 --bars 1750
+"""
+
+import argparse
+import os
+import time
+from dataclasses import dataclass, field
+
+import pandas as pd
+import pymysql
+from dotenv import load_dotenv
+
+from fetch_pipeline import PRICE_COLUMNS
+
+# Temporary tables are private to the session and vanish with the connection.
+# No constraints here on purpose: bad rows must land so they can be reported.
+SQL_CREATE_STAGE = """
+    CREATE TEMPORARY TABLE IF NOT EXISTS PriceHistoryStage (
+        row_no INT PRIMARY KEY,
+        ticker_symbol VARCHAR(10),
+        date DATE,
+        open_price DECIMAL(19, 4),
+        high_price DECIMAL(19, 4),
+        low_price DECIMAL(19, 4),
+        close_price DECIMAL(19, 4),
+        volume BIGINT,
+        reject_reason VARCHAR(32) NULL
+    );
+"""
+
+SQL_INSERT_STAGE = """
+    INSERT INTO PriceHistoryStage
+        (row_no, ticker_symbol, date, open_price, high_price, low_price, close_price, volume)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
+"""
+
+SQL_CREATE_BAR_STAGE = """
+    CREATE TEMPORARY TABLE IF NOT EXISTS PriceBarStage (
+        row_no INT PRIMARY KEY,
+        ticker_symbol VARCHAR(10),
+        bar_time DATETIME,
+        open_price DECIMAL(19, 4),
+        high_price DECIMAL(19, 4),
+        low_price DECIMAL(19, 4),
+        close_price DECIMAL(19, 4),
+        volume BIGINT,
+        reject_reason VARCHAR(32) NULL
+    );
+"""
+
+SQL_INSERT_BAR_STAGE = """
+    INSERT INTO PriceBarStage
+        (row_no, ticker_symbol, bar_time, open_price, high_price, low_price, close_price, volume)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
+"""
+
+# (ticker, day) of every changed row of the batch, the periods to roll up again
+SQL_CREATE_TOUCHED_DAYS = """
+    CREATE TEMPORARY TABLE IF NOT EXISTS PriceTouchedDays (
+        ticker_symbol VARCHAR(10),
+        trade_date DATE,
+        PRIMARY KEY (ticker_symbol, trade_date)
+    );
+"""
+
+# Mirrors the chk_* constraints of PriceHistory and PriceBar, and stands in for
+# the foreign key to Ticker that partitioned PriceHistory can't have
+SQL_VALIDATE = """
+    UPDATE {stage} s
+    SET s.reject_reason = CASE
+        WHEN NOT EXISTS (SELECT 1 FROM Ticker t WHERE t.ticker_symbol = s.ticker_symbol)
+            THEN 'unknown ticker'
+        WHEN s.{time_column} IS NULL OR s.open_price IS NULL OR s.high_price IS NULL
+             OR s.low_price IS NULL OR s.close_price IS NULL OR s.volume IS NULL
+            THEN 'missing value'
+        WHEN s.open_price <= 0 OR s.high_price <= 0 OR s.low_price <= 0 OR s.close_price <= 0
+            THEN 'non-positive price'
+        WHEN s.volume < 0
+            THEN 'negative volume'
+        WHEN s.low_price > s.high_price
+            THEN 'low above high'
+    END;
+"""
+
+SQL_SELECT_REJECTED = """
+    SELECT row_no, ticker_symbol, {time_column}, reject_reason
+    FROM {stage}
+    WHERE reject_reason IS NOT NULL
+    ORDER BY row_no;
+"""
+
+SQL_VALIDATE_STAGE = SQL_VALIDATE.format(stage="PriceHistoryStage", time_column="date")
+SQL_SELECT_REJECTED_STAGE = SQL_SELECT_REJECTED.format(stage="PriceHistoryStage", time_column="date")
+SQL_VALIDATE_BAR_STAGE = SQL_VALIDATE.format(stage="PriceBarStage", time_column="bar_time")
+SQL_SELECT_REJECTED_BAR_STAGE = SQL_SELECT_REJECTED.format(stage="PriceBarStage", time_column="bar_time")
+
+# rows that are new, or exist with at least one different value
+SQL_CHANGED_ROWS = """
+    FROM PriceHistoryStage s
+    LEFT JOIN PriceHistory p
+        ON p.ticker_symbol = s.ticker_symbol AND p.date = s.date
+    WHERE s.reject_reason IS NULL
+      AND (
+        p.ticker_symbol IS NULL
+        OR p.open_price <> s.open_price
+        OR p.high_price <> s.high_price
+        OR p.low_price <> s.low_price
+        OR p.close_price <> s.close_price
+        OR p.volume <> s.volume
+      )
+"""
+
+SQL_COUNT_CHANGES = f"""
+    SELECT
+        COALESCE(SUM(p.ticker_symbol IS NULL), 0) AS n_new,
+        COALESCE(SUM(p.ticker_symbol IS NOT NULL), 0) AS n_changed
+    {SQL_CHANGED_ROWS};
+"""
+
+SQL_MERGE = f"""
+    INSERT INTO PriceHistory
+        (ticker_symbol, date, open_price, high_price, low_price, close_price, volume)
+    SELECT
+        s.ticker_symbol, s.date, s.open_price, s.high_price, s.low_price, s.close_price, s.volume
+    {SQL_CHANGED_ROWS}
+    ON DUPLICATE KEY UPDATE
+        open_price = VALUES(open_price),
+        high_price = VALUES(high_price),
+        low_price = VALUES(low_price),
+        close_price = VALUES(close_price),
+        volume = VALUES(volume);
+"""
+
+SQL_TOUCH_DAYS = f"""
+    INSERT IGNORE INTO PriceTouchedDays (ticker_symbol, trade_date)
+    SELECT DISTINCT s.ticker_symbol, s.date
+    {SQL_CHANGED_ROWS};
+"""
+
+SQL_CHANGED_BARS = """
+    FROM PriceBarStage s
+    LEFT JOIN PriceBar b
+        ON b.ticker_symbol = s.ticker_symbol
+        AND b.bar_interval = %(interval)s
+        AND b.bar_time = s.bar_time
+    WHERE s.reject_reason IS NULL
+      AND (
+        b.ticker_symbol IS NULL
+        OR b.open_price <> s.open_price
+        OR b.high_price <> s.high_price
+        OR b.low_price <> s.low_price
+        OR b.close_price <> s.close_price
+        OR b.volume <> s.volume
+      )
+"""
+
+SQL_COUNT_BAR_CHANGES = f"""
+    SELECT
+        COALESCE(SUM(b.ticker_symbol IS NULL), 0) AS n_new,
+        COALESCE(SUM(b.ticker_symbol IS NOT NULL), 0) AS n_changed
+    {SQL_CHANGED_BARS};
+"""
+
+SQL_TOUCH_BAR_DAYS = f"""
+    INSERT IGNORE INTO PriceTouchedDays (ticker_symbol, trade_date)
+    SELECT DISTINCT s.ticker_symbol, DATE(s.bar_time)
+    {SQL_CHANGED_BARS};
+"""
+
+SQL_MERGE_BARS = f"""
+    INSERT INTO PriceBar
+        (ticker_symbol, bar_interval, bar_time, open_price, high_price, low_price, close_price, volume)
+    SELECT
+        s.ticker_symbol, %(interval)s, s.bar_time, s.open_price, s.high_price, s.low_price, s.close_price, s.volume
+    {SQL_CHANGED_BARS}
+    ON DUPLICATE KEY UPDATE
+        open_price = VALUES(open_price),
+        high_price = VALUES(high_price),
+        low_price = VALUES(low_price),
+        close_price = VALUES(close_price),
+        volume = VALUES(volume);
+"""
+
+# OHLCV of a group of bars, over the window `w` of the enclosing query
+SQL_OHLCV_WINDOW = """
+            FIRST_VALUE({t}.open_price) OVER w AS open_price,
+            MAX({t}.high_price) OVER w AS high_price,
+            MIN({t}.low_price) OVER w AS low_price,
+            LAST_VALUE({t}.close_price) OVER w AS close_price,
+            SUM({t}.volume) OVER w AS volume,
+            COUNT(*) OVER w AS n_bars,
+            ROW_NUMBER() OVER w AS bar_no
+"""
+
+# every bar of each touched day, whether it arrived in this batch or before
+SQL_ROLLUP_DAYS = """
+    INSERT INTO PriceHistory
+        (ticker_symbol, date, open_price, high_price, low_price, close_price, volume)
+    SELECT ticker_symbol, trade_date, open_price, high_price, low_price, close_price, volume
+    FROM (
+        SELECT
+            d.ticker_symbol,
+            d.trade_date,
+            {ohlcv}
+        FROM PriceTouchedDays d
+        JOIN PriceBar b
+            ON b.ticker_symbol = d.ticker_symbol
+            AND b.bar_interval = %(interval)s
+            AND b.bar_time >= d.trade_date
+            AND b.bar_time < d.trade_date + INTERVAL 1 DAY
+        WINDOW w AS (
+            PARTITION BY d.ticker_symbol, d.trade_date
+            ORDER BY b.bar_time
+            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+        )
+    ) days
+    WHERE bar_no = 1
+    ON DUPLICATE KEY UPDATE
+        PriceHistory.open_price = VALUES(open_price),
+        PriceHistory.high_price = VALUES(high_price),
+        PriceHistory.low_price = VALUES(low_price),
+        PriceHistory.close_price = VALUES(close_price),
+        PriceHistory.volume = VALUES(volume);
+""".format(ohlcv=SQL_OHLCV_WINDOW.format(t="b").strip())
+
+# PriceRollup period -> (first day of the period holding `trade_date`, period length)
+ROLLUP_PERIODS = {
+    "1w": ("trade_date - INTERVAL WEEKDAY(trade_date) DAY", "INTERVAL 1 WEEK"),
+    "1M": ("trade_date - INTERVAL (DAYOFMONTH(trade_date) - 1) DAY", "INTERVAL 1 MONTH"),
+}
+
+# every PriceHistory day of each period holding a touched day
+SQL_ROLLUP_PERIOD = """
+    INSERT INTO PriceRollup
+        (ticker_symbol, rollup_period, period_start, open_price, high_price, low_price, close_price, volume, trading_days)
+    SELECT ticker_symbol, %(period)s, period_start, open_price, high_price, low_price, close_price, volume, n_bars
+    FROM (
+        SELECT
+            t.ticker_symbol,
+            t.period_start,
+            {ohlcv}
+        FROM (
+            SELECT DISTINCT ticker_symbol, {period_start} AS period_start
+            FROM PriceTouchedDays
+        ) t
+        JOIN PriceHistory p
+            ON p.ticker_symbol = t.ticker_symbol
+            AND p.date >= t.period_start
+            AND p.date < t.period_start + {length}
+        WINDOW w AS (
+            PARTITION BY t.ticker_symbol, t.period_start
+            ORDER BY p.date
+            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+        )
+    ) periods
+    WHERE bar_no = 1
+    ON DUPLICATE KEY UPDATE
+        PriceRollup.open_price = VALUES(open_price),
+        PriceRollup.high_price = VALUES(high_price),
+        PriceRollup.low_price = VALUES(low_price),
+        PriceRollup.close_price = VALUES(close_price),
+        PriceRollup.volume = VALUES(volume),
+        PriceRollup.trading_days = VALUES(trading_days);
+"""
+
+SQL_ROLLUP_PERIODS = {
+    period: SQL_ROLLUP_PERIOD.format(
+        ohlcv=SQL_OHLCV_WINDOW.format(t="p").strip(), period_start=period_start, length=length
+    )
+    for period, (period_start, length) in ROLLUP_PERIODS.items()
+}
+
+# bar intervals stored in PriceBar, anything else is loaded as daily bars
+INTRADAY_INTERVALS = ("1m", "5m", "15m", "30m", "1h")
+
+
+@dataclass
+class LoadReport:
+    staged: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # days recomputed from intraday bars
+    days_rolled_up: int = 0
+    # (ticker_symbol, date or bar time, reason)
+    rejected: list = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.staged / self.seconds if self.seconds else 0.0
+
+    def add(self, other):
+        self.staged += other.staged
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.days_rolled_up += other.days_rolled_up
+        self.rejected.extend(other.rejected)
+        self.seconds += other.seconds
+
+    def __str__(self):
+        rolled_up = f", {self.days_rolled_up} days rolled up" if self.days_rolled_up else ""
+        return (
+            f"{self.staged} rows staged: {self.inserted} inserted, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {len(self.rejected)} rejected{rolled_up} "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def clean_price_rows(df):
+    """PriceHistory rows ready for staging: one row per (ticker, date), NaN as NULL.
+
+    Meant for daily bars, a repeated day keeps its last row.
+    """
+    df = df[PRICE_COLUMNS].copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.date
+    df = df.drop_duplicates(subset=["ticker_symbol", "date"], keep="last")
+    return df.astype(object).where(df.notna(), None)
+
+
+def clean_bar_rows(df):
+    """PriceBar rows ready for staging: one row per (ticker, bar time), NaN as NULL.
+
+    Bar times are kept in the exchange's local time (yfinance's timezone-aware
+    index without its timezone), so DATE(bar_time) is the trading day.
+    """
+    df = df[PRICE_COLUMNS].copy()
+    bar_time = pd.to_datetime(df["date"])
+    if bar_time.dt.tz is not None:
+        bar_time = bar_time.dt.tz_localize(None)
+    df["date"] = bar_time.dt.to_pydatetime()
+    df = df.drop_duplicates(subset=["ticker_symbol", "date"], keep="last")
+    return df.astype(object).where(df.notna(), None)
+
+
+class PriceHistoryLoader:
+    """Loads price frames over one connection, batch by batch.
+
+    `interval` is the bar size of the frames: intraday bars go to PriceBar and
+    are rolled up into PriceHistory, daily bars ("1d") go to PriceHistory.
+    """
+
+    def __init__(self, conn, batch_size=10_000, commit=True, interval="1d"):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.commit = commit
+        self.interval = interval
+        self.intraday = interval in INTRADAY_INTERVALS
+        self.report = LoadReport()
+
+    def load(self, df):
+        """Stage, validate and merge `df`, returns the report for this frame."""
+        report = LoadReport()
+        if df.empty:
+            return report
+
+        clean = clean_bar_rows if self.intraday else clean_price_rows
+        rows = clean(df).to_numpy().tolist()
+        for i in range(0, len(rows), self.batch_size):
+            report.add(self._load_batch(rows[i : i + self.batch_size]))
+
+        self.report.add(report)
+        return report
+
+    def _stage(self, cursor, rows):
+        """Fill and validate the staging table, returns the rejected rows."""
+        if self.intraday:
+            create, stage, insert, validate, select_rejected = (
+                SQL_CREATE_BAR_STAGE, "PriceBarStage", SQL_INSERT_BAR_STAGE,
+                SQL_VALIDATE_BAR_STAGE, SQL_SELECT_REJECTED_BAR_STAGE,
+            )
+        else:
+            create, stage, insert, validate, select_rejected = (
+                SQL_CREATE_STAGE, "PriceHistoryStage", SQL_INSERT_STAGE,
+                SQL_VALIDATE_STAGE, SQL_SELECT_REJECTED_STAGE,
+            )
+        cursor.execute(create)
+        cursor.execute(f"DELETE FROM {stage};")
+        cursor.executemany(insert, [(row_no, *row) for row_no, row in enumerate(rows)])
+        cursor.execute(validate)
+
+        cursor.execute(select_rejected)
+        return [(ticker_symbol, when, reason) for _, ticker_symbol, when, reason in cursor.fetchall()]
+
+    def _merge(self, cursor):
+        """Merge the valid staged rows and roll up what changed, returns (new, changed, days rolled up)."""
+        cursor.execute(SQL_CREATE_TOUCHED_DAYS)
+        cursor.execute("DELETE FROM PriceTouchedDays;")
+        params = {"interval": self.interval}
+        days_rolled_up = 0
+        # the changed rows are counted and their days noted before the merge makes them unchanged
+        if self.intraday:
+            cursor.execute(SQL_COUNT_BAR_CHANGES, params)
+            n_new, n_changed = (int(n) for n in cursor.fetchone())
+            days_rolled_up = cursor.execute(SQL_TOUCH_BAR_DAYS, params)
+            cursor.execute(SQL_MERGE_BARS, params)
+            cursor.execute(SQL_ROLLUP_DAYS, params)
+        else:
+            cursor.execute(SQL_COUNT_CHANGES)
+            n_new, n_changed = (int(n) for n in cursor.fetchone())
+            cursor.execute(SQL_TOUCH_DAYS)
+            cursor.execute(SQL_MERGE)
+
+        for period, sql in SQL_ROLLUP_PERIODS.items():
+            cursor.execute(sql, {"period": period})
+        return n_new, n_changed, days_rolled_up
+
+    def _load_batch(self, rows):
+        start = time.perf_counter()
+        # reconnects if the server dropped us (the temp tables are then recreated below)
+        self.conn.ping(reconnect=True)
+        cursor = self.conn.cursor()
+        try:
+            rejected = self._stage(cursor, rows)
+            n_new, n_changed, days_rolled_up = self._merge(cursor)
+            if self.commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        return LoadReport(
+            staged=len(rows),
+            inserted=n_new,
+            updated=n_changed,
+            unchanged=len(rows) - len(rejected) - n_new - n_changed,
+            days_rolled_up=days_rolled_up,
+            rejected=rejected,
+            seconds=time.perf_counter() - start,
+        )
+
+
+if __name__ == "__main__":
+    from fetch_pipeline import StubSource
+
+    parser = argparse.ArgumentParser(description="Benchmark the staged PriceBar/PriceHistory loader.")
+    parser.add_argument("--benchmark", action="store_true", required=True)
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--bars", type=int, default=1750, help="hourly bars per ticker")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    load_dotenv()
+    conn = pymysql.connect(
+        host=os.environ["DB_HOST"],
+        user=os.environ["DB_USER"],
+        password=os.environ["DB_PASSWORD"],
+        database=os.environ["DB_NAME"],
+        port=int(os.environ["DB_PORT"]),
+    )
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT ticker_symbol FROM Ticker ORDER BY ticker_symbol LIMIT %s;", (args.tickers,))
+        tickers = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+
+        frames = StubSource(bars=args.bars, latency=0).fetch(tickers)
+        # nothing is committed, everything is rolled back at the end
+        loader = PriceHistoryLoader(conn, batch_size=args.batch_size, commit=False, interval="1h")
+        for ticker in tickers:
+            loader.load(frames[ticker])
+        # second pass over identical data: everything should be unchanged
+        first_pass = loader.report
+        loader.report = LoadReport()
+        for ticker in tickers:
+            loader.load(frames[ticker])
+
+        print(f"First load  : {first_pass}")
+        print(f"Reload      : {loader.report}")
+    finally:
+        conn.rollback()
+        conn.close()
@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from ..dependencies import DB_CONNECT_CONFIG
+from . import db
 
 import pymysql
 
@@ -46,23 +47,17 @@ def hash_password(password: str):
 
 
 def verify_user_authentication(user_id: str, password_hash: str):
-    with pymysql.connect(**DB_CONNECT_CONFIG) as conn, open(
-        "api/sql/crud_ops/read/authenticate_user.sql", "r"
-    ) as query:
-        cursor = conn.cursor()
-        cursor.execute(
-            query.read(),
-            {
-                "user_id": user_id,
-                "password_hash": password_hash,
-            },
-        )
-        conn.commit()
-
-        is_auth_successful = cursor.fetchone()[0]
-
-        if is_auth_successful:
-            return True
+    (is_auth_successful,) = db.fetchall(
+        "api/sql/crud_ops/read/authenticate_user.sql",
+        {
+            "user_id": user_id,
+            "password_hash": password_hash,
+        },
+        session=user_id,
+    )[0]
+
+    if is_auth_successful:
+        return True
     return False
 
 
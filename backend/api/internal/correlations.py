@@ -0,0 +1,262 @@
+"""
+Pairwise correlation of the daily returns of every ticker, kept up to date
+incrementally and served from memory.
+
+For every pair of tickers the running sums n, Σx, Σx², Σxy over the days
+both have a return are kept, so a new day of bars only adds its outer
+products (O(tickers²)) instead of rereading the history. The correlation
+matrix derived from them is persisted next to the sums in CORRELATION_DIR:
+
+    correlations.json       tickers (row/column order), as_of date, first day
+    correlations.f32        the matrix, row-major float32
+    correlation_sums.npz    the running sums, float64
+
+The API loads these on first use, checks for new bars at most every
+CHECK_INTERVAL_SECONDS, and answers the most/least correlated tickers of a
+symbol from the matrix. The as_of day is taken out of the sums and added again
+by every update, so a day still being ingested when it was first added ends
+up complete. Bars arriving for days before as_of (backfills) are only picked
+up by a rebuild:
+
+    python -m api.internal.correlations [--rebuild]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from . import db
+
+CORRELATION_DIR = os.getenv("CORRELATION_DIR", "correlations")
+
+# a rebuild starts this many calendar days before today
+CORRELATION_HISTORY_DAYS = int(os.getenv("CORRELATION_HISTORY_DAYS", 365 * 3))
+
+# pairs with fewer common days than this have no correlation (NaN)
+MIN_OBSERVATIONS = int(os.getenv("CORRELATION_MIN_OBSERVATIONS", 60))
+
+CHECK_INTERVAL_SECONDS = float(os.getenv("CORRELATION_CHECK_INTERVAL_SECONDS", 60))
+
+SQL_RETURNS = "api/sql/crud_ops/read/universe_daily_returns.sql"
+SQL_PRICE_DATA_VERSION = "api/sql/crud_ops/read/price_data_version.sql"
+
+
+class RunningSums:
+    """Count, Σx, Σx² and Σxy of every pair of tickers over the days both have a return.
+
+    sx[i, j] is the sum of ticker i's returns on the days j also has one (and
+    sxx likewise), so each pair's correlation only uses their common days.
+    `last` keeps the returns of the newest day added, so it can be taken out
+    again when that day's bars change.
+    """
+
+    def __init__(self, tickers: list[str], n=None, sx=None, sxx=None, sxy=None, last=None):
+        self.tickers = list(tickers)
+        size = (len(self.tickers), len(self.tickers))
+        self.n = n if n is not None else np.zeros(size)
+        self.sx = sx if sx is not None else np.zeros(size)
+        self.sxx = sxx if sxx is not None else np.zeros(size)
+        self.sxy = sxy if sxy is not None else np.zeros(size)
+        self.last = last
+
+    def extend(self, tickers: list[str]):
+        """Adds rows/columns of zeros for tickers not seen before."""
+        new = [ticker for ticker in tickers if ticker not in set(self.tickers)]
+        if not new:
+            return
+        grow = len(new)
+        for name in ("n", "sx", "sxx", "sxy"):
+            setattr(self, name, np.pad(getattr(self, name), ((0, grow), (0, grow))))
+        if self.last is not None:
+            self.last = np.pad(self.last, (0, grow), constant_values=np.nan)
+        self.tickers += new
+
+    def _accumulate(self, returns: np.ndarray, sign: float):
+        present = (~np.isnan(returns)).astype(np.float64)
+        x = np.nan_to_num(returns)
+        self.n += sign * (present.T @ present)
+        self.sx += sign * (x.T @ present)
+        self.sxx += sign * ((x * x).T @ present)
+        self.sxy += sign * (x.T @ x)
+
+    def add(self, returns: np.ndarray):
+        """Adds days of returns (days x tickers, NaN where a ticker has no bar)."""
+        self._accumulate(returns, 1.0)
+        self.last = returns[-1].copy()
+
+    def remove_last(self):
+        """Takes the newest day added back out of the sums."""
+        self._accumulate(self.last[None, :], -1.0)
+        self.last = None
+
+    def correlation(self, min_observations: int = MIN_OBSERVATIONS) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = self.n * self.sxy - self.sx * self.sx.T
+            variance = self.n * self.sxx - self.sx * self.sx
+            matrix = covariance / np.sqrt(variance * variance.T)
+        matrix[self.n < min_observations] = np.nan
+        np.fill_diagonal(matrix, 1.0)
+        return np.clip(matrix, -1.0, 1.0).astype(np.float32)
+
+    def save(self, path: str):
+        last = {} if self.last is None else {"last": self.last}
+        np.savez(path, n=self.n, sx=self.sx, sxx=self.sxx, sxy=self.sxy, **last)
+
+    @classmethod
+    def load(cls, path: str, tickers: list[str]) -> "RunningSums":
+        with np.load(path) as sums:
+            last = sums["last"] if "last" in sums else None
+            return cls(tickers, sums["n"], sums["sx"], sums["sxx"], sums["sxy"], last)
+
+
+def returns_matrix(rows, tickers: list[str]) -> tuple[np.ndarray, list[datetime.date]]:
+    """(ticker, date, return) rows as a days x tickers matrix in `tickers` order."""
+    frame = pd.DataFrame(list(rows), columns=["ticker_symbol", "date", "daily_return"])
+    matrix = frame.pivot(index="date", columns="ticker_symbol", values="daily_return").reindex(columns=tickers)
+    return matrix.astype(np.float64).to_numpy(), list(matrix.index)
+
+
+class CorrelationService:
+    def __init__(self, directory: str = CORRELATION_DIR):
+        self.directory = directory
+        self.sums: RunningSums | None = None
+        self.start: datetime.date | None = None
+        # (tickers, ticker -> row, matrix, as_of), replaced as a whole so readers never see a mix
+        self.view: tuple[list[str], dict[str, int], np.ndarray, datetime.date] | None = None
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        # price data version the sums were last updated at
+        self._version = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def load(self) -> bool:
+        try:
+            with open(self._path("correlations.json")) as f_json:
+                meta = json.load(f_json)
+            tickers = meta["tickers"]
+            matrix = np.fromfile(self._path("correlations.f32"), dtype=np.float32)
+            self.sums = RunningSums.load(self._path("correlation_sums.npz"), tickers)
+        except FileNotFoundError:
+            return False
+        self.start = datetime.date.fromisoformat(meta["start"])
+        self._publish(matrix.reshape(len(tickers), len(tickers)), datetime.date.fromisoformat(meta["as_of"]))
+        return True
+
+    def save(self):
+        tickers, _, matrix, as_of = self.view
+        os.makedirs(self.directory, exist_ok=True)
+        # written beside the old files and swapped in, so a crash never leaves half a matrix
+        self.sums.save(self._path("correlation_sums.tmp.npz"))
+        matrix.tofile(self._path("correlations.f32.tmp"))
+        with open(self._path("correlations.json.tmp"), "w") as f_json:
+            json.dump({"tickers": tickers, "as_of": as_of.isoformat(), "start": self.start.isoformat()}, f_json)
+        os.replace(self._path("correlation_sums.tmp.npz"), self._path("correlation_sums.npz"))
+        os.replace(self._path("correlations.f32.tmp"), self._path("correlations.f32"))
+        os.replace(self._path("correlations.json.tmp"), self._path("correlations.json"))
+
+    def _publish(self, matrix: np.ndarray, as_of: datetime.date):
+        tickers = list(self.sums.tickers)
+        self.view = (tickers, {ticker: i for i, ticker in enumerate(tickers)}, matrix, as_of)
+
+    def rebuild(self, start: datetime.date | None = None) -> int:
+        """Recomputes the sums from PriceHistory since `start`. Returns the number of days added."""
+        with self._lock:
+            self.start = start or datetime.date.today() - datetime.timedelta(days=CORRELATION_HISTORY_DAYS)
+            self.sums = RunningSums([])
+            self.view = None
+            return self._update(self.start - datetime.timedelta(days=1))
+
+    def update(self) -> int:
+        """Adds the days after as_of and redoes as_of itself. Returns the number of new days."""
+        with self._lock:
+            if self.view is None and not self.load():
+                self.start = datetime.date.today() - datetime.timedelta(days=CORRELATION_HISTORY_DAYS)
+                self.sums = RunningSums([])
+                return self._update(self.start - datetime.timedelta(days=1))
+            as_of = self.view[3]
+            if self.sums.last is None:
+                return self._update(as_of)
+            # as_of may have been only partly ingested when it was added
+            return self._update(as_of - datetime.timedelta(days=1), redo=as_of)
+
+    def _update(self, after: datetime.date, redo: datetime.date | None = None) -> int:
+        rows = db.fetchall(SQL_RETURNS, {"after": after})
+        if not rows:
+            if self.view is None:
+                self._publish(self.sums.correlation(), after)
+            return 0
+        if redo is not None:
+            self.sums.remove_last()
+        self.sums.extend(sorted({ticker for ticker, _, _ in rows}))
+        returns, days = returns_matrix(rows, self.sums.tickers)
+        self.sums.add(returns)
+        self._publish(self.sums.correlation(), days[-1])
+        self.save()
+        return len(days) - (days[0] == redo)
+
+    def refresh(self):
+        """update() if the last check is older than CHECK_INTERVAL_SECONDS.
+
+        Blocks only while nothing is loaded yet, otherwise a request arriving
+        during another one's update keeps serving the current matrix.
+        """
+        if self.view is not None:
+            if time.monotonic() - self._checked_at < CHECK_INTERVAL_SECONDS:
+                return
+            if self._lock.locked():
+                return
+        self._checked_at = time.monotonic()
+        # moves with every ingest, also one that only adds bars to the as_of day
+        (version,) = db.fetchall(SQL_PRICE_DATA_VERSION)
+        if self.view is not None and tuple(version) == self._version:
+            return
+        self.update()
+        self._version = tuple(version)
+
+    def top_k(self, symbol: str, k: int) -> dict | None:
+        """The k most and k least correlated tickers of `symbol`, None if it is unknown."""
+        if self.view is None:
+            return None
+        tickers, index, matrix, as_of = self.view
+        i = index.get(symbol)
+        if i is None:
+            return None
+        row = matrix[i].astype(np.float64)
+        row[i] = np.nan
+        candidates = np.flatnonzero(~np.isnan(row))
+        values = row[candidates]
+        k = min(k, len(candidates))
+
+        def pick(order_values):
+            if k == 0:
+                return []
+            chosen = np.argpartition(order_values, k - 1)[:k]
+            chosen = chosen[np.argsort(order_values[chosen], kind="stable")]
+            return [
+                {"tickerSymbol": tickers[candidates[j]], "correlation": float(values[j])} for j in chosen
+            ]
+
+        return {"asOf": as_of, "most": pick(-values), "least": pick(values)}
+
+
+# one per api worker process
+service = CorrelationService()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update the persisted correlation matrix of every ticker.")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from PriceHistory instead of adding new days")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, help="first day of a rebuild")
+    args = parser.parse_args()
+
+    days = service.rebuild(args.start) if args.rebuild else service.update()
+    tickers, _, _, as_of = service.view
+    print(f"correlations: {len(tickers)} tickers as of {as_of}, {days} days added")
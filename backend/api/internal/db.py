@@ -0,0 +1,302 @@
+import asyncio
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, Hashable
+
+import pymysql
+from starlette.concurrency import run_in_threadpool
+
+from ..dependencies import DB_CONNECT_CONFIG
+
+# read replicas as "host[:port]" separated by commas, same user, password and database as DB_HOST
+DB_READ_REPLICAS = [
+    address.strip() for address in os.getenv("DB_READ_REPLICAS", "").split(",") if address.strip()
+]
+
+# replicas further behind the primary than this are skipped until they catch up
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", 5))
+
+# how often each replica's health and lag are checked again
+REPLICA_CHECK_INTERVAL_SECONDS = float(os.getenv("DB_REPLICA_CHECK_INTERVAL_SECONDS", 5))
+
+REPLICA_CONNECT_TIMEOUT_SECONDS = 2
+
+# after a write, reads of the same session stay on the primary this long
+READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", 30))
+
+# the time of a client's last write, returned by the api after each write and sent back by the client
+# so any worker can route its reads, not only the one that handled the write
+LAST_WRITE_HEADER = "X-Last-Write"
+LAST_WRITE_COOKIE = "last_write"
+
+# Seconds_Behind_Source is whole seconds, a replica is only trusted this much after it caught up
+REPLICA_LAG_MARGIN_SECONDS = 1
+
+# the only sql scripts that are safe to run on a replica
+READ_ONLY_SQL_DIR = "api/sql/crud_ops/read/"
+
+
+@lru_cache(maxsize=None)
+def read_sql_script(sql_script_path: str) -> str:
+    # sql scripts never change while the api is running, read each one only once
+    with open(sql_script_path, "r") as f_sql:
+        return f_sql.read()
+
+
+def _replication_lag(conn) -> float | None:
+    """Seconds the server is behind its source, None if replication isn't running."""
+    with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        try:
+            cursor.execute("SHOW REPLICA STATUS;")
+        except pymysql.err.ProgrammingError:  # before MySQL 8.0.22
+            cursor.execute("SHOW SLAVE STATUS;")
+        status = cursor.fetchone()
+    if status is None:
+        # not a binlog replica, e.g. an Aurora reader sharing the primary's storage
+        return 0.0
+    lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+    return None if lag is None else float(lag)
+
+
+class Replica:
+    """One read replica and the result of its last health check."""
+
+    def __init__(self, address: str):
+        host, _, port = address.partition(":")
+        self.config = {**DB_CONNECT_CONFIG, "host": host, "port": int(port or DB_CONNECT_CONFIG["port"])}
+        self.healthy = False
+        self.lag: float | None = None
+        self.checked_at = float("-inf")
+        # wall clock time up to which the replica had every write of the primary at its last check
+        self.caught_up_to = float("-inf")
+        self._checking = threading.Lock()
+
+    def check(self):
+        try:
+            with pymysql.connect(**self.config, connect_timeout=REPLICA_CONNECT_TIMEOUT_SECONDS) as conn:
+                self.lag = _replication_lag(conn)
+        except pymysql.MySQLError:
+            self.lag = None
+        self.healthy = self.lag is not None and self.lag <= REPLICA_MAX_LAG_SECONDS
+        self.caught_up_to = (
+            time.time() - self.lag - REPLICA_LAG_MARGIN_SECONDS if self.lag is not None else float("-inf")
+        )
+        self.checked_at = time.monotonic()
+
+    def usable(self, written_at: float | None = None) -> bool:
+        """Healthy, and if `written_at` is given, caught up with the writes made until then."""
+        stale = time.monotonic() - self.checked_at >= REPLICA_CHECK_INTERVAL_SECONDS
+        # checked again by whichever request finds the last check stale, the others use the last result
+        if stale and self._checking.acquire(blocking=False):
+            try:
+                self.check()
+            finally:
+                self._checking.release()
+        return self.healthy and (written_at is None or self.caught_up_to >= written_at)
+
+    def mark_down(self):
+        """Skips the replica until its next health check."""
+        self.healthy = False
+        self.checked_at = time.monotonic()
+
+
+class ReadRouter:
+    """Picks a replica for read-only statements, round robin over the healthy ones.
+
+    Sessions (e.g. a user id) that just wrote are pinned to the primary for
+    READ_YOUR_WRITES_SECONDS, so they read their own writes before the
+    replicas have them. These pins only live in this worker process: with
+    several uvicorn workers, a client's next request usually lands on another
+    one. That case is covered by the LAST_WRITE_HEADER / LAST_WRITE_COOKIE
+    timestamp the client sends back (see last_write_middleware), which only
+    lets replicas that have caught up with it serve the read.
+    """
+
+    def __init__(self, addresses: list[str]):
+        self.replicas = [Replica(address) for address in addresses]
+        self._turn = itertools.count()
+        self._pinned: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def pick(self, written_at: float | None = None) -> Replica | None:
+        """A healthy replica within the lag limit (and having the writes up to
+        `written_at`), None to use the primary."""
+        if not self.replicas:
+            return None
+        first = next(self._turn)
+        for i in range(len(self.replicas)):
+            replica = self.replicas[(first + i) % len(self.replicas)]
+            if replica.usable(written_at):
+                return replica
+        return None
+
+    def read_your_writes(self, *sessions):
+        until = time.monotonic() + READ_YOUR_WRITES_SECONDS
+        with self._lock:
+            now = time.monotonic()
+            self._pinned = {session: end for session, end in self._pinned.items() if end > now}
+            self._pinned.update((str(session), until) for session in sessions)
+
+    def pinned_to_primary(self, session: Hashable | None) -> bool:
+        return session is not None and self._pinned.get(str(session), 0.0) > time.monotonic()
+
+
+# one per worker process: its session pins are only seen by this worker, the last write
+# timestamp carried by the client is what routes reads consistently across workers
+read_router = ReadRouter(DB_READ_REPLICAS)
+
+# {"written_at": the client's last write it sent, "wrote": this request's write}, set per request
+# by last_write_middleware; a dict so writes made in threadpool threads reach the middleware
+_last_write: ContextVar[dict | None] = ContextVar("last_write", default=None)
+
+
+def _parse_write_time(value: str | None) -> float | None:
+    try:
+        written_at = float(value)
+    except (TypeError, ValueError):
+        return None
+    # older than this, every usable replica has it anyway
+    return written_at if written_at > time.time() - READ_YOUR_WRITES_SECONDS else None
+
+
+async def last_write_middleware(request, call_next):
+    """Reads the client's last write time from LAST_WRITE_HEADER or LAST_WRITE_COOKIE
+    and, when the request writes, returns the new one in both."""
+    state = {
+        "written_at": _parse_write_time(
+            request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+        ),
+        "wrote": None,
+    }
+    token = _last_write.set(state)
+    try:
+        response = await call_next(request)
+    finally:
+        _last_write.reset(token)
+    if state["wrote"] is not None:
+        value = f"{state['wrote']:.6f}"
+        response.headers[LAST_WRITE_HEADER] = value
+        response.set_cookie(
+            LAST_WRITE_COOKIE, value, max_age=int(READ_YOUR_WRITES_SECONDS), httponly=True, samesite="lax"
+        )
+    return response
+
+
+def read_your_writes(*sessions):
+    """Call after committing a write: reads of these sessions stay on the primary for a while,
+    and the client gets the write time to send back to any worker."""
+    read_router.read_your_writes(*sessions)
+    state = _last_write.get()
+    if state is not None:
+        state["wrote"] = time.time()
+
+
+@contextmanager
+def read_connection(session: Hashable | None = None):
+    """Connection for read-only statements: a replica that is healthy and has the
+    client's last write, or the primary if there is none or `session` wrote recently."""
+    state = _last_write.get()
+    written_at = state["written_at"] if state is not None else None
+    replica = None if read_router.pinned_to_primary(session) else read_router.pick(written_at)
+    conn = None
+    if replica is not None:
+        try:
+            conn = pymysql.connect(**replica.config)
+        except pymysql.MySQLError:
+            replica.mark_down()
+    if conn is None:
+        conn = pymysql.connect(**DB_CONNECT_CONFIG)
+    with conn:
+        yield conn
+
+
+def fetchall(
+    sql_script_path: str, params: dict | tuple | None = None, session: Hashable | None = None
+) -> tuple:
+    return fetchall_sql(
+        read_sql_script(sql_script_path),
+        params,
+        read_only=sql_script_path.startswith(READ_ONLY_SQL_DIR),
+        session=session,
+    )
+
+
+def fetchall_sql(
+    sql: str, params: dict | tuple | None = None, read_only: bool = False, session: Hashable | None = None
+) -> tuple:
+    # anything not known to be read-only runs on the primary
+    with read_connection(session) if read_only else pymysql.connect(**DB_CONNECT_CONFIG) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+
+def _hashable_params(params: dict | tuple | list | None) -> Hashable:
+    if isinstance(params, dict):
+        return tuple(sorted(params.items()))
+    if isinstance(params, list):
+        return tuple(params)
+    return params
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key starts the work in the threadpool, every caller
+    that arrives while it is still running awaits that same result instead of
+    running the work again. Nothing is cached: once the call finishes the key is
+    forgotten and the next caller starts a fresh execution.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[..., Any], *args) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_in_threadpool(fn, *args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # shield so one client disconnecting does not cancel the query for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, done: asyncio.Future):
+        if self._in_flight.get(key) is done:
+            del self._in_flight[key]
+        if not done.cancelled():
+            done.exception()  # mark as retrieved even if every waiter went away
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+# one per worker process, shared by every request handled by that worker
+read_single_flight = SingleFlight()
+
+
+async def coalesced_fetchall(
+    sql_script_path: str, params: dict | tuple | list | None = None
+) -> tuple:
+    """Runs a read-only sql script, sharing one db execution between identical concurrent calls."""
+    return await read_single_flight.do(
+        (sql_script_path, _hashable_params(params)),
+        fetchall,
+        sql_script_path,
+        params,
+    )
+
+
+async def coalesced_fetchall_sql(sql: str, params: dict | tuple | list | None = None) -> tuple:
+    """Same as coalesced_fetchall for read-only sql built at runtime (e.g. from a sql script template)."""
+    return await read_single_flight.do(
+        (sql, _hashable_params(params)),
+        fetchall_sql,
+        sql,
+        params,
+        True,
+    )
@@ -1,27 +1,15 @@
-import os
 import pandas as pd
-import pymysql
-from dotenv import load_dotenv
 
-# Shared DB connection helper
-def get_db_connection():
-    load_dotenv()
-    return pymysql.connect(
-        host=os.getenv('DB_HOST'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME')
-    )
-
-def bollinger(ticker, range=20):
-    conn = get_db_connection()
-    df = pd.read_sql(f"SELECT date, close_price FROM PriceHistory WHERE ticker_symbol='{ticker}' ORDER BY date ASC;", conn)
-    conn.close()
 
-
-    df['MA'] = df['close_price'].rolling(window=range).mean()
-    df['STD'] = df['close_price'].rolling(window=range).std()
-    df['Upper'] = df['MA'] + (2 * df['STD'])
-    df['Lower'] = df['MA'] - (2 * df['STD'])
-    print(df.tail())
-    return df[['date', 'MA', 'Upper', 'Lower']]
\ No newline at end of file
+def bollinger(df: pd.DataFrame, range: int = 20, num_std: float = 2) -> pd.DataFrame:
+    """Bollinger bands over `df` (date-sorted rows with date and close_price)."""
+    ma = df["close_price"].rolling(window=range).mean()
+    std = df["close_price"].rolling(window=range).std()
+    return pd.DataFrame(
+        {
+            "date": df["date"],
+            "MA": ma,
+            "Upper": ma + (num_std * std),
+            "Lower": ma - (num_std * std),
+        }
+    )
@@ -1,24 +1,8 @@
-import os
 import pandas as pd
-import pymysql
-from dotenv import load_dotenv
 
-# Shared DB connection helper
-def get_db_connection():
-    load_dotenv()
-    return pymysql.connect(
-        host=os.getenv('DB_HOST'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME')
-    )
-
-def moving_avg(ticker, range=50):
-    conn = get_db_connection()
-    df = pd.read_sql(f"SELECT date, close_price FROM PriceHistory WHERE ticker_symbol='{ticker}' ORDER BY date ASC;", conn)
-    conn.close()
 
-
-    df['SMA'] = df['close_price'].rolling(window=range).mean()
-    print(df.tail())
-    return df[['date', 'SMA']]
\ No newline at end of file
+def moving_avg(df: pd.DataFrame, range: int = 50) -> pd.DataFrame:
+    """Simple moving average over `df` (date-sorted rows with date and close_price)."""
+    return pd.DataFrame(
+        {"date": df["date"], "SMA": df["close_price"].rolling(window=range).mean()}
+    )
@@ -0,0 +1,113 @@
+"""
+Indicator specs for the API: parsing, warm-up lookback and columnar output.
+
+A spec is the indicator name optionally followed by its positional
+parameters, e.g. "rsi", "rsi:7" or "bollinger:20,2". Every indicator declares
+how many bars before the requested start it needs to be warmed up, so the
+API only reads a bounded window of PriceHistory instead of the whole series.
+"""
+
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from ..risk import ResultCache
+from .atr import atr
+from .bollinger import bollinger
+from .macd import macd
+from .moving_avg import moving_avg
+from .rsi import rsi
+from .stochastic import stochastic
+
+PRICE_COLUMNS = ["open_price", "high_price", "low_price", "close_price", "volume"]
+
+# EMAs never fully forget their seed: after this many spans its weight is below e^-8
+EMA_WARMUP_SPANS = 4
+
+MAX_LOOKBACK_BARS = 1000
+
+MAX_PARAMETER = 500
+
+# compute_columnar() results of this api process, keyed by the request and the
+# rows it was computed from (their count and newest row move with every ingest)
+results_cache = ResultCache(maxsize=256)
+
+# name -> (function, bars of warm-up needed before the first returned bar)
+INDICATORS = {
+    "rsi": (rsi, lambda range=14: range),
+    "macd": (macd, lambda fast=12, slow=26, signal=9: EMA_WARMUP_SPANS * (max(fast, slow) + signal)),
+    "bollinger": (bollinger, lambda range=20, num_std=2: range),
+    "moving_avg": (moving_avg, lambda range=50: range),
+    "atr": (atr, lambda range=14: range + 1),
+    "stochastic": (stochastic, lambda range=14: range + 3),
+}
+
+
+def parse_spec(spec: str) -> tuple[str, tuple]:
+    """"bollinger:20,2" -> ("bollinger", (20, 2.0)), raises ValueError if invalid."""
+    name, _, raw_params = spec.strip().partition(":")
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator '{name}', expected one of {list(INDICATORS)}")
+
+    params = []
+    for raw in filter(None, raw_params.split(",")):
+        value = float(raw)
+        if value.is_integer():
+            value = int(value)
+        if not 0 < value <= MAX_PARAMETER:
+            raise ValueError(f"Parameter {raw} of '{name}' is out of range")
+        params.append(value)
+
+    fn, _ = INDICATORS[name]
+    try:
+        inspect.signature(fn).bind(None, *params)
+    except TypeError as e:
+        raise ValueError(f"Too many parameters for '{name}'") from e
+    for parameter, value in zip(list(inspect.signature(fn).parameters.values())[1:], params):
+        if parameter.annotation is int and not isinstance(value, int):
+            raise ValueError(f"'{parameter.name}' of '{name}' must be an integer")
+    return name, tuple(params)
+
+
+def lookback(specs: list[tuple[str, tuple]]) -> int:
+    """Bars needed before the requested start so every spec is warmed up."""
+    bars = max((INDICATORS[name][1](*params) for name, params in specs), default=0)
+    return min(bars, MAX_LOOKBACK_BARS)
+
+
+def _output_name(column: str, name: str, params: tuple) -> str:
+    return "_".join([column, *map(str, params)]) if params else column
+
+
+def _to_list(values: pd.Series) -> list:
+    # NaN is not valid JSON, the warm-up gaps become nulls
+    array = values.to_numpy(dtype=np.float64)
+    return np.where(np.isnan(array), None, array).tolist()
+
+
+def cache_key(symbol: str, start, end, specs: list[tuple[str, tuple]], rows: tuple) -> tuple:
+    return (symbol, start, end, tuple(specs), len(rows), tuple(rows[-1]) if rows else None)
+
+
+def compute_columnar(rows: tuple, specs: list[tuple[str, tuple]], start) -> dict[str, list]:
+    """Evaluate `specs` over PriceHistory rows, returns {"date": [...], output name: [...]}.
+
+    Rows dated before `start` are the warm-up window and are not returned.
+    Runs in a worker process, so it only takes and returns picklable values.
+    """
+    df = pd.DataFrame(list(rows), columns=["date", *PRICE_COLUMNS])
+    df[PRICE_COLUMNS] = df[PRICE_COLUMNS].astype(np.float64)
+
+    outputs = {}
+    for name, params in specs:
+        fn, _ = INDICATORS[name]
+        result = fn(df, *params)
+        for column in result.columns.drop("date"):
+            outputs[_output_name(column, name, params)] = result[column]
+
+    in_range = (df["date"] >= start).to_numpy()
+    return {
+        "date": [day.isoformat() for day in df["date"][in_range]],
+        **{name: _to_list(values[in_range]) for name, values in outputs.items()},
+    }
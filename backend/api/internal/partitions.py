@@ -0,0 +1,368 @@
+"""
+Monthly partitions of PriceHistory and AuditLog: creation, archival, retention.
+
+Both tables are RANGE partitioned by month, PriceHistory on `date` and
+AuditLog on UNIX_TIMESTAMP(`timestamp`), in partitions named pYYYYMM (the
+oldest one also holds everything before its month) followed by a p_future
+catch-all. Queries with a date predicate only read the partitions it covers.
+
+maintain() keeps MONTHS_AHEAD empty partitions split off p_future, and moves
+every partition older than the table's retention out of the table in O(1):
+the partition is exchanged with an empty copy of the table and dropped, then
+the copy is written to ARCHIVE_DIR/<table>/pYYYYMM.csv.gz and dropped too.
+read_archive() reads archived rows back; the daily bars and indicators
+endpoints read archived PriceHistory through price_bars.archived_daily()
+for ranges starting before retention_start().
+
+Run from backend/, e.g. daily from cron:
+
+    python -m api.internal.partitions [--migrate] [--dry-run]
+
+--migrate partitions tables created before partitioning, once.
+"""
+
+import argparse
+import csv
+import datetime
+import gzip
+import os
+import re
+
+import pandas as pd
+import pymysql
+
+from ..dependencies import DB_CONNECT_CONFIG
+
+MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", 3))
+
+ARCHIVE_DIR = os.getenv("PARTITION_ARCHIVE_DIR", "archive")
+
+# table -> (partitioning column, its bound for a month, months kept in the table)
+PARTITIONED_TABLES = {
+    "PriceHistory": (
+        "date",
+        lambda month: f"'{month.isoformat()}'",
+        int(os.getenv("PRICE_HISTORY_RETENTION_MONTHS", 120)),
+    ),
+    "AuditLog": (
+        "timestamp",
+        lambda month: f"UNIX_TIMESTAMP('{month.isoformat()} 00:00:00')",
+        int(os.getenv("AUDIT_LOG_RETENTION_MONTHS", 24)),
+    ),
+}
+
+_PARTITION_NAME = re.compile(r"p(\d{4})(\d{2})$")
+
+_FUTURE = "PARTITION p_future VALUES LESS THAN (MAXVALUE)"
+
+# (check, statement) pairs --migrate runs before partitioning an existing table
+# when the check counts something, since every unique key must hold the
+# partitioning column and foreign keys aren't allowed
+_MIGRATE_KEYS = {
+    "PriceHistory": [
+        (
+            """
+            SELECT COUNT(*) FROM information_schema.TABLE_CONSTRAINTS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'PriceHistory'
+            AND CONSTRAINT_NAME = 'fk_pricehistory_ticker';
+            """,
+            "ALTER TABLE PriceHistory DROP FOREIGN KEY fk_pricehistory_ticker;",
+        ),
+        (
+            # the surrogate primary key of databases from before the clustered (ticker_symbol, date) one
+            """
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'PriceHistory'
+            AND COLUMN_NAME = 'price_history_id';
+            """,
+            "api/sql/schema/cluster_price_history.sql",
+        ),
+    ],
+    "AuditLog": [
+        (None, "ALTER TABLE AuditLog MODIFY timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP;"),
+        (None, "ALTER TABLE AuditLog DROP PRIMARY KEY, ADD PRIMARY KEY (audit_id, timestamp);"),
+    ],
+}
+
+_PARTITION_BY = {
+    "PriceHistory": "RANGE COLUMNS (date)",
+    "AuditLog": "RANGE (UNIX_TIMESTAMP(timestamp))",
+}
+
+
+def month_start(day: datetime.date) -> datetime.date:
+    return day.replace(day=1)
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _partition_month(name: str) -> datetime.date | None:
+    match = _PARTITION_NAME.match(name)
+    return datetime.date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def _definitions(table: str, months: list[datetime.date]) -> list[str]:
+    # partition pYYYYMM holds the rows before the first day of the next month
+    bound = PARTITIONED_TABLES[table][1]
+    return [
+        f"PARTITION {partition_name(month)} VALUES LESS THAN ({bound(add_months(month, 1))})"
+        for month in months
+    ]
+
+
+def monthly_partitions(cursor, table: str) -> list[datetime.date] | None:
+    """Months of the pYYYYMM partitions of `table` in order, None if it isn't partitioned."""
+    cursor.execute(
+        """
+        SELECT PARTITION_NAME
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY PARTITION_ORDINAL_POSITION;
+        """,
+        (table,),
+    )
+    names = [name for (name,) in cursor.fetchall()]
+    if not names or names == [None]:
+        return None
+    return [month for month in map(_partition_month, names) if month is not None]
+
+
+def ensure_partitions(
+    cursor, table: str, first_month: datetime.date | None = None, through: datetime.date | None = None
+) -> list[str]:
+    """Adds the monthly partitions of `table` missing up to `through` (default MONTHS_AHEAD from now).
+
+    With `first_month`, months before the oldest partition are split off it
+    too (e.g. before loading older data). Returns the names of the new partitions.
+    """
+    through = month_start(through or add_months(datetime.date.today(), MONTHS_AHEAD))
+    existing = monthly_partitions(cursor, table)
+    if existing is None:
+        raise ValueError(f"{table} is not partitioned, run with --migrate first")
+
+    created = []
+    if not existing:
+        first = month_start(first_month or datetime.date.today())
+        months = [add_months(first, i) for i in range(_months_between(first, through) + 1)]
+        _reorganize(cursor, table, "p_future", _definitions(table, months) + [_FUTURE])
+        return [partition_name(month) for month in months]
+
+    oldest, newest = existing[0], existing[-1]
+    if first_month is not None and month_start(first_month) < oldest:
+        # the oldest partition also holds everything before it, split it in months
+        first = month_start(first_month)
+        months = [add_months(first, i) for i in range(_months_between(first, oldest) + 1)]
+        _reorganize(cursor, table, partition_name(oldest), _definitions(table, months))
+        created += [partition_name(month) for month in months[:-1]]
+
+    if newest < through:
+        # p_future is normally empty, splitting it moves no rows
+        months = [add_months(newest, i) for i in range(1, _months_between(newest, through) + 1)]
+        _reorganize(cursor, table, "p_future", _definitions(table, months) + [_FUTURE])
+        created += [partition_name(month) for month in months]
+    return created
+
+
+def _months_between(first: datetime.date, last: datetime.date) -> int:
+    return (last.year - first.year) * 12 + last.month - first.month
+
+
+def _reorganize(cursor, table: str, partition: str, definitions: list[str]):
+    cursor.execute(
+        f"ALTER TABLE {table} REORGANIZE PARTITION {partition} INTO ({', '.join(definitions)});"
+    )
+
+
+def archive_path(table: str, month: datetime.date, archive_dir: str | None = None) -> str:
+    return os.path.join(archive_dir or ARCHIVE_DIR, table, f"{partition_name(month)}.csv.gz")
+
+
+def _detach_partition(cursor, table: str, month: datetime.date) -> str:
+    """Swaps partition `month` with an empty copy of `table` and drops it, returns the copy's name."""
+    partition = partition_name(month)
+    detached = f"{table}Archive_{partition}"
+    cursor.execute(f"CREATE TABLE {detached} LIKE {table};")
+    cursor.execute(f"ALTER TABLE {detached} REMOVE PARTITIONING;")
+    # metadata only: the partition's rows now belong to the copy, the partition is empty
+    cursor.execute(f"ALTER TABLE {table} EXCHANGE PARTITION {partition} WITH TABLE {detached};")
+    cursor.execute(f"ALTER TABLE {table} DROP PARTITION {partition};")
+    return detached
+
+
+def _write_archive(conn, detached: str, path: str) -> int:
+    """Streams every row of table `detached` into a gzip CSV at `path`, returns the row count."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f"{path}.partial"
+    rows = 0
+    # unbuffered cursor: one row at a time instead of the whole partition in memory
+    with conn.cursor(pymysql.cursors.SSCursor) as cursor, gzip.open(partial, "wt", newline="") as f_csv:
+        cursor.execute(f"SELECT * FROM {detached};")
+        writer = csv.writer(f_csv)
+        writer.writerow(column[0] for column in cursor.description)
+        for row in cursor:
+            writer.writerow(row)
+            rows += 1
+    os.replace(partial, path)
+    return rows
+
+
+def _archive_detached(conn, table: str, detached: str, archive_dir: str | None = None) -> int:
+    month = _partition_month(detached.rsplit("_", 1)[-1])
+    path = archive_path(table, month, archive_dir)
+    if os.path.exists(path):
+        # the month was archived before (e.g. rows loaded late), keep both files
+        path = path.replace(".csv.gz", f".{datetime.datetime.now():%Y%m%d%H%M%S}.csv.gz")
+    rows = _write_archive(conn, detached, path)
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP TABLE {detached};")
+    return rows
+
+
+def retention_start(table: str, today: datetime.date | None = None) -> datetime.date:
+    """First day of the oldest month `table` keeps, older rows may only be in the archive."""
+    return add_months(month_start(today or datetime.date.today()), -PARTITIONED_TABLES[table][2])
+
+
+def expired_months(table: str, months: list[datetime.date], today: datetime.date | None = None):
+    """The partition months of `table` past its retention."""
+    cutoff = retention_start(table, today)
+    # the newest monthly partition is always kept: dropping it would leave only p_future
+    return [month for month in months[:-1] if month < cutoff]
+
+
+def archive_expired(
+    conn, table: str, today: datetime.date | None = None, archive_dir: str | None = None
+) -> dict:
+    """Moves the partitions of `table` older than its retention into archive files.
+
+    Returns {partition name: archived rows}. Copies left behind by an earlier
+    interrupted run are archived first.
+    """
+    archived = {}
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT TABLE_NAME
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME LIKE %s;
+            """,
+            (f"{table}Archive\\_p%",),
+        )
+        leftovers = [name for (name,) in cursor.fetchall()]
+        months = monthly_partitions(cursor, table) or []
+
+    for detached in leftovers:
+        archived[detached.rsplit("_", 1)[-1]] = _archive_detached(conn, table, detached, archive_dir)
+
+    for month in expired_months(table, months, today):
+        with conn.cursor() as cursor:
+            detached = _detach_partition(cursor, table, month)
+        archived[partition_name(month)] = _archive_detached(conn, table, detached, archive_dir)
+    return archived
+
+
+def read_archive(
+    table: str,
+    start: datetime.date | None = None,
+    end: datetime.date | None = None,
+    archive_dir: str | None = None,
+    equal: dict | None = None,
+) -> pd.DataFrame:
+    """Archived rows of `table` with their partitioning column in [start, end], as a DataFrame.
+
+    `equal` ({column: value}) keeps only the rows with those values, e.g. one ticker.
+    """
+    column = PARTITIONED_TABLES[table][0]
+    directory = os.path.join(archive_dir or ARCHIVE_DIR, table)
+    files = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+
+    frames = []
+    for file_name in files:
+        month = _partition_month(file_name.split(".", 1)[0])
+        if month is None:
+            continue
+        # the oldest archive may hold earlier rows, so only skip files past `end`
+        if end is not None and month > end:
+            continue
+        # ...but a month ending before `start` has nothing to return
+        if start is not None and add_months(month, 1) <= start:
+            continue
+        frame = pd.read_csv(os.path.join(directory, file_name), compression="gzip", parse_dates=[column])
+        for name, value in (equal or {}).items():
+            frame = frame[frame[name] == value]
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+
+    rows = pd.concat(frames, ignore_index=True)
+    when = rows[column].dt.date
+    keep = pd.Series(True, index=rows.index)
+    if start is not None:
+        keep &= when >= start
+    if end is not None:
+        keep &= when <= end
+    return rows[keep].sort_values(column, ignore_index=True)
+
+
+def migrate(cursor, table: str) -> bool:
+    """Partitions an existing unpartitioned `table` by month, False if it already is."""
+    if monthly_partitions(cursor, table) is not None:
+        return False
+    column = PARTITIONED_TABLES[table][0]
+    cursor.execute(f"SELECT MIN({column}) FROM {table};")
+    (first,) = cursor.fetchone()
+    if isinstance(first, datetime.datetime):
+        first = first.date()
+    first = month_start(first or datetime.date.today())
+    through = add_months(datetime.date.today(), MONTHS_AHEAD)
+    months = [add_months(first, i) for i in range(_months_between(first, through) + 1)]
+
+    for check, statement in _MIGRATE_KEYS[table]:
+        if check is not None:
+            cursor.execute(check)
+            if not cursor.fetchone()[0]:
+                continue
+        if statement.endswith(".sql"):
+            with open(statement, "r") as sql_file:
+                statement = sql_file.read()
+        cursor.execute(statement)
+    # rebuilds the table once, rows are copied into their partitions
+    definitions = _definitions(table, months) + [_FUTURE]
+    cursor.execute(f"ALTER TABLE {table} PARTITION BY {_PARTITION_BY[table]} ({', '.join(definitions)});")
+    return True
+
+
+def maintain(conn, dry_run: bool = False) -> dict:
+    """Partitions ahead and archival for every partitioned table, returns what was done per table."""
+    done = {}
+    for table in PARTITIONED_TABLES:
+        with conn.cursor() as cursor:
+            if dry_run:
+                months = monthly_partitions(cursor, table) or []
+                done[table] = {"expired": [partition_name(m) for m in expired_months(table, months)]}
+                continue
+            created = ensure_partitions(cursor, table)
+        done[table] = {"created": created, "archived": archive_expired(conn, table)}
+    return done
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monthly partition maintenance of PriceHistory and AuditLog.")
+    parser.add_argument("--migrate", action="store_true", help="partition tables created before partitioning")
+    parser.add_argument("--dry-run", action="store_true", help="only list the partitions that would be archived")
+    args = parser.parse_args()
+
+    with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
+        if args.migrate:
+            with conn.cursor() as cursor:
+                for table in PARTITIONED_TABLES:
+                    print(f"{table}: {'partitioned' if migrate(cursor, table) else 'already partitioned'}")
+        for table, result in maintain(conn, dry_run=args.dry_run).items():
+            print(f"{table}: {result}")
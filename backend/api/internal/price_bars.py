@@ -0,0 +1,113 @@
+"""
+Price chart bars at the coarsest resolution a range needs.
+
+Bars are stored at several resolutions: hourly bars in PriceBar, daily bars
+in PriceHistory and weekly/monthly rollups in PriceRollup, all kept current
+by the price loader. A chart reads the finest resolution that still fits in
+`max_points` bars, so ten years of history is ~120 monthly rows instead of
+~17k hourly ones.
+
+Daily bars older than PriceHistory's retention are moved out of the table
+into the partition archive (see partitions.py); archived_daily() reads them
+back for ranges that reach that far.
+"""
+
+import datetime
+
+from . import partitions
+
+# finest first: interval -> (sql script, estimated bars per calendar day)
+RESOLUTIONS = {
+    "1h": ("api/sql/crud_ops/read/ticker_bars_intraday.sql", 7 * 5 / 7),  # 7 bars per trading day
+    "1d": ("api/sql/crud_ops/read/ticker_bars_daily.sql", 5 / 7),
+    "1w": ("api/sql/crud_ops/read/ticker_bars_rollup.sql", 1 / 7),
+    "1M": ("api/sql/crud_ops/read/ticker_bars_rollup.sql", 12 / 365.25),
+}
+
+
+def estimated_bars(interval: str, start: datetime.date, end: datetime.date) -> float:
+    return ((end - start).days + 1) * RESOLUTIONS[interval][1]
+
+
+def pick_resolution(start: datetime.date, end: datetime.date, max_points: int) -> str:
+    """Finest interval whose bars over [start, end] fit in max_points, monthly if none does."""
+    for interval in RESOLUTIONS:
+        if estimated_bars(interval, start, end) <= max_points:
+            return interval
+    return "1M"
+
+
+def fallbacks(interval: str) -> list[str]:
+    """`interval` and every coarser one, e.g. for ranges older than the stored hourly bars."""
+    intervals = list(RESOLUTIONS)
+    return intervals[intervals.index(interval) :]
+
+
+def period_start(interval: str, day: datetime.date) -> datetime.date:
+    """First day of the PriceRollup period holding `day` (weeks start on monday)."""
+    if interval == "1w":
+        return day - datetime.timedelta(days=day.weekday())
+    if interval == "1M":
+        return day.replace(day=1)
+    return day
+
+
+def query(symbol: str, interval: str, start: datetime.date, end: datetime.date) -> tuple[str, dict]:
+    """(sql script, params) reading the bars of `symbol` over [start, end] at `interval`."""
+    return RESOLUTIONS[interval][0], {
+        "symbol": symbol,
+        "interval": interval,
+        # a partial period at the start still shows up as its whole bar
+        "start": period_start(interval, start),
+        "end": end,
+    }
+
+
+def columnar(rows) -> dict[str, list]:
+    """{"time", "open", "high", "low", "close", "volume"} lists from (time, o, h, l, c, v) rows."""
+    columns = {"time": [], "open": [], "high": [], "low": [], "close": [], "volume": []}
+    for time, open_price, high_price, low_price, close_price, volume in rows:
+        columns["time"].append(time)
+        columns["open"].append(float(open_price))
+        columns["high"].append(float(high_price))
+        columns["low"].append(float(low_price))
+        columns["close"].append(float(close_price))
+        columns["volume"].append(int(volume))
+    return columns
+
+
+def reaches_archive(start: datetime.date) -> bool:
+    """Whether daily bars from `start` on may be partly in the partition archive only."""
+    return start < partitions.retention_start("PriceHistory")
+
+
+def archived_daily(symbol: str, start: datetime.date, end: datetime.date) -> list[tuple]:
+    """Archived daily (date, o, h, l, c, v) rows of `symbol` over [start, end], oldest first.
+
+    Reads gzip CSVs, so it runs in the worker pool (workers.run_cpu_bound).
+    """
+    rows = partitions.read_archive("PriceHistory", start, end, equal={"ticker_symbol": symbol})
+    if rows.empty:
+        return []
+    return list(zip(
+        rows["date"].dt.date,
+        rows["open_price"].astype(float),
+        rows["high_price"].astype(float),
+        rows["low_price"].astype(float),
+        rows["close_price"].astype(float),
+        rows["volume"].astype(int),
+    ))
+
+
+def with_archived(archived: list[tuple], rows, start: datetime.date | None = None, lookback: int | None = None):
+    """The archived rows dated before the first of `rows`, followed by `rows`.
+
+    With `lookback`, at most that many rows dated before `start` are kept, like
+    the warm-up window of ticker_price_range.sql.
+    """
+    first = rows[0][0] if rows else None
+    merged = [row for row in archived if first is None or row[0] < first] + list(rows)
+    if lookback is not None:
+        before = sum(1 for row in merged if row[0] < start)
+        merged = merged[max(0, before - lookback):]
+    return merged
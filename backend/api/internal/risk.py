@@ -0,0 +1,260 @@
+"""
+Historical risk of a portfolio from PriceHistory daily returns.
+
+The closes of every holding are aligned into one returns matrix (date x
+ticker), extended with the portfolio's return (market value weighted) and the
+market's (the equal weighted average return of every ticker, standing in for
+an index). One covariance product and one cumulative product over that matrix
+give every figure at once: annualized volatility, beta, Sharpe ratio and max
+drawdown of each holding, of the portfolio and of the market, plus the
+holdings' correlation matrix.
+
+The Monte Carlo value at risk draws correlated daily log returns of the
+holdings from their historical mean and covariance (through its Cholesky
+factor) and reads VaR/CVaR off the simulated portfolio losses. Paths are
+simulated in fixed size batches, each seeded from its own child of one
+SeedSequence, so a seed gives the same result however many processes share
+the batches.
+
+Results only change when prices do, so they are cached by price data version
+(see price_data_version.sql), which moves with every ingest.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+# paths per simulate_batch call, fixed so the batch seeds do not depend on the pool size
+BATCH_PATHS = 20_000
+
+# holdings with returns on fewer than this share of the range's days are left out
+MIN_HISTORY_SHARE = 0.5
+
+
+class ResultCache:
+    """Small thread-safe LRU of computed results, keys carry the price data version."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable):
+        with self._lock:
+            if key not in self._entries:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+# one per api worker process; entries of older price data versions simply age out
+results_cache = ResultCache()
+market_cache = ResultCache(maxsize=32)
+var_cache = ResultCache(maxsize=64)
+
+
+def aligned_returns(close_rows, tickers: list[str]) -> tuple[pd.DataFrame, pd.Series, list[str]]:
+    """Daily returns (date x ticker) of `tickers` from (ticker, date, close) rows.
+
+    A ticker without a bar on some day keeps its last close (a zero return).
+    Tickers with too little history are dropped and returned separately, the
+    remaining returns only keep the days every ticker has. Also returns the
+    last close of every ticker.
+    """
+    frame = pd.DataFrame(list(close_rows), columns=["ticker_symbol", "date", "close_price"])
+    closes = (
+        frame.pivot(index="date", columns="ticker_symbol", values="close_price")
+        .reindex(columns=tickers)
+        .astype(np.float64)
+        .sort_index()
+        .ffill()
+    )
+    returns = closes.pct_change(fill_method=None).iloc[1:]
+    enough = returns.notna().mean() >= MIN_HISTORY_SHARE if len(returns) else returns.notna().any()
+    excluded = [ticker for ticker in tickers if not enough[ticker]]
+    return returns.loc[:, enough.to_numpy()].dropna(), closes.iloc[-1] if len(closes) else None, excluded
+
+
+def _max_drawdowns(returns: np.ndarray) -> np.ndarray:
+    wealth = np.cumprod(1.0 + returns, axis=0)
+    peaks = np.maximum.accumulate(wealth, axis=0)
+    return (1.0 - wealth / peaks).max(axis=0, initial=0.0)
+
+
+def _number(x) -> float | None:
+    # NaN/inf (e.g. beta of a flat market) is not valid JSON
+    return float(x) if np.isfinite(x) else None
+
+
+def compute_risk(close_rows, market_rows, quantities: dict[str, float], risk_free_rate: float = 0.0) -> dict:
+    """Risk figures of a portfolio holding `quantities` (ticker -> shares).
+
+    `close_rows` are (ticker, date, close) rows of the holdings, `market_rows`
+    (date, market return) rows. Runs in a worker process, so it only takes and
+    returns picklable values.
+    """
+    tickers = sorted(quantities)
+    returns, last_close, excluded = aligned_returns(close_rows, tickers)
+    market = pd.Series(
+        {day: float(value) for day, value in market_rows}, dtype=np.float64, name="market"
+    )
+    returns = returns.join(market, how="inner")
+    held = [ticker for ticker in tickers if ticker not in excluded]
+    result = {"observations": len(returns), "excluded": excluded}
+    if len(returns) < 2 or not held:
+        return result | {"portfolio": None, "market": None, "holdings": [], "correlation": None}
+
+    # market value weights at the last close of the range
+    values = np.array([quantities[ticker] * last_close[ticker] for ticker in held])
+    weights = values / values.sum()
+
+    # columns: holdings..., portfolio, market
+    R = returns[held].to_numpy()
+    M = np.column_stack([R, R @ weights, returns["market"].to_numpy()])
+    mean = M.mean(axis=0)
+    centred = M - mean
+    cov = centred.T @ centred / (len(M) - 1)
+    std = np.sqrt(np.diag(cov))
+
+    annual_return = mean * TRADING_DAYS
+    annual_vol = std * np.sqrt(TRADING_DAYS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = cov[:, -1] / cov[-1, -1]
+        sharpe = (annual_return - risk_free_rate) / annual_vol
+        corr = cov[:-2, :-2] / np.outer(std[:-2], std[:-2])
+    drawdown = _max_drawdowns(M)
+
+    def figures(j):
+        return {
+            "annualizedReturn": _number(annual_return[j]),
+            "annualizedVolatility": _number(annual_vol[j]),
+            "beta": _number(beta[j]),
+            "sharpe": _number(sharpe[j]),
+            "maxDrawdown": _number(drawdown[j]),
+        }
+
+    n = len(held)
+    return result | {
+        "portfolio": figures(n),
+        "market": figures(n + 1),
+        "holdings": [
+            {"tickerSymbol": ticker, "weight": float(weights[j]), **figures(j)}
+            for j, ticker in enumerate(held)
+        ],
+        "correlation": {
+            "tickers": held,
+            "matrix": [[_number(x) for x in row] for row in corr],
+        },
+    }
+
+
+def _covariance_factor(cov: np.ndarray) -> np.ndarray:
+    """A with A @ A.T == cov: the Cholesky factor, or for a singular covariance
+    (more holdings than days, or holdings moving in lockstep) its eigen square root."""
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+def simulation_inputs(close_rows, quantities: dict[str, float]) -> dict:
+    """Weights, daily log return mean and covariance factor of a portfolio holding `quantities`."""
+    returns, last_close, excluded = aligned_returns(close_rows, sorted(quantities))
+    held = list(returns.columns)
+    inputs = {"tickers": held, "excluded": excluded, "observations": len(returns)}
+    if len(returns) < 2 or not held:
+        return inputs | {"value": None}
+
+    values = np.array([quantities[ticker] * last_close[ticker] for ticker in held])
+    log_returns = np.log1p(returns.to_numpy())
+    return inputs | {
+        "value": float(values.sum()),
+        "weights": values / values.sum(),
+        "mean": log_returns.mean(axis=0),
+        "factor": _covariance_factor(np.atleast_2d(np.cov(log_returns, rowvar=False))),
+    }
+
+
+def simulate_batch(mean, factor, weights, steps, n_paths: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """Portfolio losses (fraction of its value) of `n_paths` paths at each horizon.
+
+    `steps` are the trading days between consecutive horizons: the log returns
+    over d days are normal with mean d * mean and covariance d * cov, so each
+    horizon only needs one draw per path and holding.
+    """
+    rng = np.random.default_rng(seed)
+    log_prices = np.zeros((n_paths, len(mean)))
+    losses = np.empty((len(steps), n_paths))
+    for k, days in enumerate(steps):
+        shocks = rng.standard_normal((n_paths, len(mean))) @ factor.T
+        log_prices += days * mean + np.sqrt(days) * shocks
+        losses[k] = -(np.expm1(log_prices) @ weights)
+    return losses
+
+
+def monte_carlo_var(inputs: dict, horizons: list[int], levels: list[float], paths: int, seed: int, executor) -> list[dict]:
+    """VaR and CVaR (fractions of the portfolio value) per horizon and confidence level.
+
+    The batches of paths are submitted to `executor` (a process pool), so call
+    this from a thread, not the event loop.
+    """
+    horizons = sorted(set(horizons))
+    steps = np.diff([0, *horizons])
+    n_batches = -(-paths // BATCH_PATHS)
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    futures = [
+        executor.submit(
+            simulate_batch,
+            inputs["mean"],
+            inputs["factor"],
+            inputs["weights"],
+            steps,
+            min(BATCH_PATHS, paths - i * BATCH_PATHS),
+            batch_seed,
+        )
+        for i, batch_seed in enumerate(seeds)
+    ]
+    losses = np.concatenate([future.result() for future in futures], axis=1)
+
+    results = []
+    for days, horizon_losses in zip(horizons, losses):
+        value_at_risk = np.quantile(horizon_losses, levels)
+        results.append({
+            "days": days,
+            "levels": [
+                {
+                    "confidence": level,
+                    "var": float(var),
+                    "cvar": float(horizon_losses[horizon_losses >= var].mean()),
+                }
+                for level, var in zip(levels, value_at_risk)
+            ],
+        })
+    return results
@@ -0,0 +1,189 @@
+"""
+Screener filter expressions compiled to SQL over IndicatorSnapshot.
+
+A filter is a boolean expression over the snapshot fields, e.g.
+
+    rsi < 30 and close < bb_lower
+    (macd > macd_signal or stoch_k < 20) and not close > sma_50 * 1.1
+
+with comparisons (< <= > >= = == != <>), arithmetic (+ - * /), and/or/not
+and parentheses. Field names are looked up in FIELDS and numbers become query
+parameters, so nothing the user typed ever reaches the SQL text.
+"""
+
+import re
+from functools import lru_cache
+
+# filter name -> IndicatorSnapshot column
+FIELDS = {
+    "close": "s.close_price",
+    "rsi": "s.rsi_14",
+    "macd": "s.macd",
+    "macd_signal": "s.macd_signal",
+    "sma_50": "s.sma_50",
+    "bb_middle": "s.bb_middle",
+    "bb_upper": "s.bb_upper",
+    "bb_lower": "s.bb_lower",
+    "atr": "s.atr_14",
+    "stoch_k": "s.stoch_k",
+    "stoch_d": "s.stoch_d",
+}
+
+# results can also be sorted alphabetically
+SORT_FIELDS = {**FIELDS, "ticker": "s.ticker_symbol"}
+
+MAX_EXPRESSION_LENGTH = 500
+MAX_TOKENS = 100
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>\d+(?:\.\d*)?|\.\d+)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<op><=|>=|!=|<>|==|[<>=()+\-*/]))"
+)
+
+_COMPARISONS = {"<": "<", "<=": "<=", ">": ">", ">=": ">=", "=": "=", "==": "=", "!=": "<>", "<>": "<>"}
+
+NUM, BOOL = "number", "boolean"
+
+
+class ScreenerSyntaxError(ValueError):
+    pass
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ScreenerSyntaxError("filter is too long")
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            rest = expression[position:].lstrip()
+            raise ScreenerSyntaxError(f"unexpected character {rest[0]!r} at {len(expression) - len(rest)}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "name" and value.lower() in ("and", "or", "not"):
+            kind, value = "op", value.lower()
+        tokens.append((kind, value))
+        position = match.end()
+    if len(tokens) > MAX_TOKENS:
+        raise ScreenerSyntaxError("filter has too many terms")
+    return tokens
+
+
+class _Parser:
+    """Recursive descent, one method per precedence level, each returning (sql, type)."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+        self.params = []
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def accept(self, *ops):
+        kind, value = self.peek()
+        if kind == "op" and value in ops:
+            self.position += 1
+            return value
+        return None
+
+    def expect_type(self, node, expected, context):
+        if node[1] != expected:
+            raise ScreenerSyntaxError(f"{context} needs a {expected} operand")
+        return node[0]
+
+    def parse(self):
+        sql, kind = self.parse_or()
+        if self.position != len(self.tokens):
+            raise ScreenerSyntaxError(f"unexpected {self.peek()[1]!r}")
+        if kind != BOOL:
+            raise ScreenerSyntaxError("filter must be a condition, e.g. rsi < 30")
+        return sql, tuple(self.params)
+
+    def parse_or(self):
+        node = self.parse_and()
+        while self.accept("or"):
+            left = self.expect_type(node, BOOL, "or")
+            right = self.expect_type(self.parse_and(), BOOL, "or")
+            node = (f"({left} OR {right})", BOOL)
+        return node
+
+    def parse_and(self):
+        node = self.parse_not()
+        while self.accept("and"):
+            left = self.expect_type(node, BOOL, "and")
+            right = self.expect_type(self.parse_not(), BOOL, "and")
+            node = (f"({left} AND {right})", BOOL)
+        return node
+
+    def parse_not(self):
+        if self.accept("not"):
+            return (f"(NOT {self.expect_type(self.parse_not(), BOOL, 'not')})", BOOL)
+        return self.parse_comparison()
+
+    def parse_comparison(self):
+        node = self.parse_sum()
+        op = self.accept(*_COMPARISONS)
+        if op is None:
+            return node
+        left = self.expect_type(node, NUM, op)
+        right = self.expect_type(self.parse_sum(), NUM, op)
+        return (f"({left} {_COMPARISONS[op]} {right})", BOOL)
+
+    def parse_sum(self):
+        node = self.parse_product()
+        while op := self.accept("+", "-"):
+            left = self.expect_type(node, NUM, op)
+            node = (f"({left} {op} {self.expect_type(self.parse_product(), NUM, op)})", NUM)
+        return node
+
+    def parse_product(self):
+        node = self.parse_unary()
+        while op := self.accept("*", "/"):
+            left = self.expect_type(node, NUM, op)
+            node = (f"({left} {op} {self.expect_type(self.parse_unary(), NUM, op)})", NUM)
+        return node
+
+    def parse_unary(self):
+        if self.accept("-"):
+            return (f"(-{self.expect_type(self.parse_unary(), NUM, '-')})", NUM)
+        return self.parse_primary()
+
+    def parse_primary(self):
+        kind, value = self.peek()
+        if kind is None:
+            raise ScreenerSyntaxError("filter ends unexpectedly")
+        self.position += 1
+        if kind == "number":
+            self.params.append(float(value))
+            return ("%s", NUM)
+        if kind == "name":
+            column = FIELDS.get(value.lower())
+            if column is None:
+                raise ScreenerSyntaxError(f"unknown field {value!r}, expected one of {sorted(FIELDS)}")
+            return (column, NUM)
+        if value == "(":
+            node = self.parse_or()
+            if not self.accept(")"):
+                raise ScreenerSyntaxError("missing )")
+            return node  # every compound node is already parenthesized
+        raise ScreenerSyntaxError(f"unexpected {value!r}")
+
+
+@lru_cache(maxsize=1024)
+def compile_filter(expression: str | None) -> tuple[str, tuple]:
+    """(SQL condition with %s placeholders, parameters), TRUE for an empty filter."""
+    if expression is None or not expression.strip():
+        return "TRUE", ()
+    return _Parser(_tokenize(expression)).parse()
+
+
+def order_by(sort: str, descending: bool) -> str:
+    """ORDER BY clause for a FIELDS name, NULLs (indicator not computable yet) last."""
+    column = SORT_FIELDS.get(sort.lower())
+    if column is None:
+        raise ScreenerSyntaxError(f"unknown sort field {sort!r}, expected one of {sorted(SORT_FIELDS)}")
+    return f"{column} IS NULL, {column} {'DESC' if descending else 'ASC'}"
@@ -1,6 +1,7 @@
-import pymysql, logging
+import csv, datetime, os, pymysql, logging
 
 from ..dependencies import DB_CONNECT_CONFIG, DatabaseError
+from . import partitions
 
 
 def setup_db(logger: logging.Logger):
@@ -17,6 +18,8 @@ def setup_db(logger: logging.Logger):
             cursor.execute(sql_drop_all.read())
             cursor.execute(sql_create_tables.read())
             cursor.execute(sql_create_holdings_trigger.read())
+            for table_name in partitions.PARTITIONED_TABLES:
+                partitions.ensure_partitions(cursor, table_name)
             conn.commit()
             logger.info("Database tables (re)created.")
 
@@ -31,21 +34,108 @@ def setup_db(logger: logging.Logger):
             cursor.close()
 
 
+# starter data csvs (one per table, header row = column names), relative to backend/
+STARTER_DATA_CSV_DIR = "../Sample Data/yfinance/data/tables"
+
+# parents before children so foreign keys are satisfied while loading
+STARTER_DATA_LOAD_ORDER = [
+    "User",
+    "Ticker",
+    "PriceHistory",
+    "Portfolio",
+    "Holdings",
+    "Alert",
+]
+
+# rows per executemany call, pymysql turns each call into multi-row INSERT statements
+STARTER_DATA_BATCH_SIZE = 5000
+
+
+def _csv_value(value: str):
+    if value == "":
+        return None
+    if value in ("True", "False"):  # pandas writes booleans this way
+        return int(value == "True")
+    return value
+
+
+def _read_starter_data_csv(table_name: str) -> tuple[list[str], list[tuple]]:
+    with open(
+        os.path.join(STARTER_DATA_CSV_DIR, f"{table_name}.csv"), "r", newline=""
+    ) as f_csv:
+        reader = csv.reader(f_csv)
+        columns = next(reader, [])
+        rows = [tuple(_csv_value(value) for value in row) for row in reader if row]
+    return columns, rows
+
+
 def db_fill_starter_data(logger: logging.Logger):
     with pymysql.connect(**DB_CONNECT_CONFIG) as conn, open(
-        "api/sql/insert_sample_data.generated.sql", "r"
-    ) as sql_insert_sample_data:
+        "api/sql/crud_ops/create/audit_loaded_holdings.sql", "r"
+    ) as sql_audit_loaded_holdings, open(
+        "api/sql/crud_ops/create/rebuild_price_rollups.sql", "r"
+    ) as sql_rebuild_price_rollups:
         cursor = conn.cursor()
 
         try:
-            cursor.execute(sql_insert_sample_data.read())
+            # bulk load session: defer secondary unique checks, and let the holdings
+            # trigger skip its per-row AuditLog insert (done set-based below instead)
+            cursor.execute("SET unique_checks = 0, @skip_holdings_audit = 1;")
+
+            starter_data = {}
+            for table_name in STARTER_DATA_LOAD_ORDER:
+                columns, rows = _read_starter_data_csv(table_name)
+                if not rows:
+                    continue
+                # csv exports can carry columns the schema has since dropped
+                # (e.g. PriceHistory.price_history_id), those are left out
+                cursor.execute(f"SHOW COLUMNS FROM `{table_name}`;")
+                table_columns = {column for column, *_ in cursor.fetchall()}
+                keep = [i for i, column in enumerate(columns) if column in table_columns]
+                if len(keep) < len(columns):
+                    columns = [columns[i] for i in keep]
+                    rows = [tuple(row[i] for i in keep) for row in rows]
+                starter_data[table_name] = (columns, rows)
+
+            # monthly partitions back to the oldest row, all before the transaction:
+            # DDL commits implicitly, so it can't run once rows are inserted
+            # (AuditLog has no csv, its rows are written now and land in the current months)
+            for table_name in partitions.PARTITIONED_TABLES:
+                first_month = None
+                if table_name in starter_data:
+                    columns, rows = starter_data[table_name]
+                    column = columns.index(partitions.PARTITIONED_TABLES[table_name][0])
+                    oldest = min(row[column] for row in rows if row[column] is not None)
+                    first_month = datetime.date.fromisoformat(oldest[:10])
+                partitions.ensure_partitions(cursor, table_name, first_month=first_month)
+
+            conn.begin()
+            for table_name, (columns, rows) in starter_data.items():
+                sql_insert = "INSERT INTO `{}` ({}) VALUES ({});".format(
+                    table_name,
+                    ",".join(f"`{col}`" for col in columns),
+                    ",".join(["%s"] * len(columns)),
+                )
+                for i in range(0, len(rows), STARTER_DATA_BATCH_SIZE):
+                    cursor.executemany(sql_insert, rows[i : i + STARTER_DATA_BATCH_SIZE])
+
+                logger.info(f"Loaded {len(rows)} rows into {table_name}.")
+
+            cursor.execute(sql_audit_loaded_holdings.read())
+            # the starter PriceHistory is daily only, weekly/monthly bars are derived from it
+            cursor.execute(sql_rebuild_price_rollups.read())
+            while cursor.nextset():  # run every statement of the script before committing
+                pass
             conn.commit()
             logger.info("Database filled with starter data.")
 
         except Exception as e:
             conn.rollback()
             logger.error(f"Database insert failed: {e}")
-            raise DatabaseError(("insert_sample_data.generated.sql"))
+            raise DatabaseError(
+                tuple(f"{table_name}.csv" for table_name in STARTER_DATA_LOAD_ORDER)
+            )
 
         finally:
+            # session settings above end with the connection
             cursor.close()
@@ -0,0 +1,32 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+# indicator math holds the GIL, so it runs in processes instead of the threadpool
+CPU_WORKERS = int(os.getenv("API_CPU_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    # created on first use so importing the api (and the docs generator) spawns nothing
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=CPU_WORKERS)
+    return _pool
+
+
+async def run_cpu_bound(fn: Callable[..., Any], *args) -> Any:
+    """Runs `fn(*args)` in the worker pool without blocking the event loop.
+
+    `fn` must be a module level function and args/result picklable.
+    """
+    return await asyncio.get_running_loop().run_in_executor(get_pool(), fn, *args)
+
+
+def shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
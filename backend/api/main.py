@@ -5,7 +5,7 @@ from fastapi_pagination import add_pagination
 from fastapi.middleware.cors import CORSMiddleware
 
 from .dependencies import DB_CONNECT_CONFIG
-from .internal import setup_db
+from .internal import db, setup_db, workers
 from .routers import admin_actions, user_actions, tests, public_actions
 
 app = FastAPI()
@@ -21,8 +21,12 @@ app.add_middleware(
     allow_credentials=True,  # Set to True if your frontend needs to send cookies or HTTP authentication
     allow_methods=["*"],  # Or specify a list of allowed methods, e.g., ["GET", "POST"]
     allow_headers=["*"],  # Or specify a list of allowed headers
+    expose_headers=[db.LAST_WRITE_HEADER],
 )
+# read-your-writes across workers: the time of a client's last write travels with its requests
+app.middleware("http")(db.last_write_middleware)
 add_pagination(app)
+app.add_event_handler("shutdown", workers.shutdown)
 
 app.include_router(tests.router)
 app.include_router(
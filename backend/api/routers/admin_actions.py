@@ -8,7 +8,8 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from starlette.responses import Response, PlainTextResponse
 
 from ..internal.setup_db import setup_db, db_fill_starter_data
-from ..internal import auth
+from ..internal import auth, db
+from ..internal.indicators import registry as indicator_registry
 from ..dependencies import DB_CONNECT_CONFIG, get_logger
 
 import json, pymysql, datetime, decimal, io, logging
@@ -95,7 +96,8 @@ async def view_table(
                 auth.FORBIDDEN_RESPONSE
             )  # should be FORBIDDEN_RESPONSE not ADMIN_FORBIDDEN_RESPONSE
 
-        with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
+        # read-only, served by a read replica when one is healthy
+        with db.read_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     f"""SELECT
@@ -161,7 +163,8 @@ async def check_db_size(
 ):
     def _task():
         response_text = io.StringIO()
-        with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
+        # read-only, served by a read replica when one is healthy
+        with db.read_connection() as conn:
             with conn.cursor() as cursor:
                 with open(
                     "api/sql/crud_ops/read/check_tables_sizes.sql", "r"
@@ -208,6 +211,16 @@ async def check_db_size(
                     file=response_text,
                 )
 
+        # hits/misses of the /ticker/{symbol}/indicators results cached in this api process
+        print("\n" + "=" * 60, file=response_text)
+        print("INDICATOR RESULT CACHE", file=response_text)
+        print("=" * 60, file=response_text)
+        for name, value in indicator_registry.results_cache.stats().items():
+            if isinstance(value, float):
+                value = f"{value:.3f}"
+            print(f"{name:<20} {value}", file=response_text)
+        print("=" * 60, file=response_text)
+
         return response_text.getvalue()
 
     return auth.basic_admin_auth_wrapper(credentials, _task)
@@ -9,9 +9,12 @@ from fastapi import (
     Query,
 )
 from fastapi_pagination import LimitOffsetParams, Params
-import pymysql, logging
+from starlette.concurrency import run_in_threadpool
+import logging, datetime
 
-from ..dependencies import DB_CONNECT_CONFIG, BAD_REQUEST_RESPONSE, get_logger
+from ..dependencies import BAD_REQUEST_RESPONSE, DatabaseError, get_logger
+from ..internal import correlations, db, price_bars, screener, workers
+from ..internal.indicators import registry as indicator_registry
 
 router = APIRouter()
 
@@ -30,28 +33,24 @@ async def tickers_overview(
     search_query = search_query.strip().lower()
     # returns all tickers if search_query is None, else tickers that contain search_query
     try:
-        with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
-            with conn.cursor() as cursor:
-                with open(
-                    "api/sql/crud_ops/read/overview_tickers.sql", "r"
-                ) as f_sql_overview_tickers:
-                    cursor.execute(
-                        f_sql_overview_tickers.read(),
-                        {
-                            "offset": int(pagination_params.offset),  # type: ignore
-                            "limit": int(pagination_params.limit),
-                            "starts_with": str(search_query),
-                        },
-                    )
-                results = cursor.fetchall()
-                listOfDicts = [
-                    {
-                        "tickerSymbol": ticker_symbol,
-                        "company": company,
-                        "lastPrice": last_price,
-                    }
-                    for (ticker_symbol, company, last_price) in results
-                ]
+        # identical concurrent requests (e.g. everyone opening the first page at market open)
+        # share a single execution of the latest-price join
+        results = await db.coalesced_fetchall(
+            "api/sql/crud_ops/read/overview_tickers.sql",
+            {
+                "offset": int(pagination_params.offset),  # type: ignore
+                "limit": int(pagination_params.limit),
+                "starts_with": str(search_query),
+            },
+        )
+        listOfDicts = [
+            {
+                "tickerSymbol": ticker_symbol,
+                "company": company,
+                "lastPrice": last_price,
+            }
+            for (ticker_symbol, company, last_price) in results
+        ]
         return listOfDicts
     except:
         logger.error("failed to fetch tickers ", exc_info=True)
@@ -65,3 +64,182 @@ async def tickers_overview(
 async def ticker_details_and_price_history(symbol: str):
     # TODO
     return
+
+
+@router.get("/ticker/{symbol}/indicators", tags=["public"])
+async def ticker_indicators(
+    symbol: str,
+    include: list[str] = Query(["rsi", "macd", "bollinger"]),
+    start: datetime.date | None = Query(None),
+    end: datetime.date | None = Query(None),
+    logger: logging.Logger = Depends(get_logger),
+):
+    # include entries are "name" or "name:param,param", e.g. include=rsi:7&include=bollinger:20,2
+    MAX_RANGE_DAYS = 366 * 10
+    MAX_INDICATORS = 10
+    end = end or datetime.date.today()
+    start = start or end - datetime.timedelta(days=365)
+    if start > end or (end - start).days > MAX_RANGE_DAYS or len(include) > MAX_INDICATORS:
+        raise BAD_REQUEST_RESPONSE
+    try:
+        specs = [indicator_registry.parse_spec(spec) for spec in include]
+    except ValueError:
+        raise BAD_REQUEST_RESPONSE
+
+    lookback = indicator_registry.lookback(specs)
+    try:
+        rows = await db.coalesced_fetchall(
+            "api/sql/crud_ops/read/ticker_price_range.sql",
+            {
+                "symbol": symbol.upper(),
+                "start": start,
+                "end": end,
+                "lookback": lookback,
+            },
+        )
+    except:
+        logger.error("failed to fetch price range of %s", symbol, exc_info=True)
+        raise DatabaseError("ticker_price_range.sql")
+    # the warm-up bars in calendar days, with room for weekends and holidays
+    warmup_start = start - datetime.timedelta(days=lookback * 7 // 5 + 10)
+    if price_bars.reaches_archive(warmup_start):
+        archived = await workers.run_cpu_bound(price_bars.archived_daily, symbol.upper(), warmup_start, end)
+        rows = price_bars.with_archived(archived, rows, start, lookback)
+
+    key = indicator_registry.cache_key(symbol.upper(), start, end, specs, rows)
+    columns = indicator_registry.results_cache.get(key)
+    if columns is None:
+        # the indicator math runs in a worker process, the event loop keeps serving other requests
+        columns = await workers.run_cpu_bound(
+            indicator_registry.compute_columnar, rows, specs, start
+        )
+        indicator_registry.results_cache.put(key, columns)
+    return {
+        "tickerSymbol": symbol.upper(),
+        "start": start,
+        "end": end,
+        "columns": columns,
+    }
+
+
+@router.get("/ticker/{symbol}/bars", tags=["public"])
+async def ticker_bars(
+    symbol: str,
+    start: datetime.date | None = Query(None),
+    end: datetime.date | None = Query(None),
+    interval: str | None = Query(None),
+    max_points: int = Query(500),
+    logger: logging.Logger = Depends(get_logger),
+):
+    # OHLCV chart bars; without an interval the finest of 1h/1d/1w/1M that fits in max_points is used
+    MAX_POINTS = 5000
+    end = end or datetime.date.today()
+    start = start or end - datetime.timedelta(days=365)
+    if start > end or not 0 < max_points <= MAX_POINTS:
+        raise BAD_REQUEST_RESPONSE
+    if interval is None:
+        interval = price_bars.pick_resolution(start, end, max_points)
+    elif interval not in price_bars.RESOLUTIONS or price_bars.estimated_bars(interval, start, end) > MAX_POINTS:
+        raise BAD_REQUEST_RESPONSE
+
+    # hourly bars only go back as far as they were downloaded, older ranges are read daily
+    for interval in price_bars.fallbacks(interval):
+        sql_script, params = price_bars.query(symbol.upper(), interval, start, end)
+        try:
+            rows = await db.coalesced_fetchall(sql_script, params)
+        except:
+            logger.error("failed to fetch %s bars of %s", interval, symbol, exc_info=True)
+            raise DatabaseError(sql_script.rsplit("/", 1)[-1])
+        if interval == "1d" and price_bars.reaches_archive(start):
+            archived = await workers.run_cpu_bound(price_bars.archived_daily, symbol.upper(), start, end)
+            rows = price_bars.with_archived(archived, rows)
+        if rows:
+            break
+
+    return {
+        "tickerSymbol": symbol.upper(),
+        "start": start,
+        "end": end,
+        "interval": interval,
+        "columns": price_bars.columnar(rows),
+    }
+
+
+@router.get("/ticker/{symbol}/correlated", tags=["public"])
+async def ticker_correlated(
+    symbol: str,
+    k: int = Query(10),
+    logger: logging.Logger = Depends(get_logger),
+):
+    # most and least correlated tickers by daily returns, from the in-memory correlation matrix
+    MAX_K = 100
+    if not 0 < k <= MAX_K:
+        raise BAD_REQUEST_RESPONSE
+    try:
+        # adds the days ingested since the last check, at most once a minute
+        await run_in_threadpool(correlations.service.refresh)
+    except:
+        logger.error("failed to update correlations", exc_info=True)
+        if correlations.service.view is None:
+            raise DatabaseError("universe_daily_returns.sql")
+
+    result = correlations.service.top_k(symbol.upper(), k)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="no returns for this ticker")
+    return {"tickerSymbol": symbol.upper(), **result}
+
+
+@router.get("/screener", tags=["public"])
+async def screen_tickers(
+    filter: str | None = Query(None),
+    sort: str = Query("ticker"),
+    descending: bool = Query(False),
+    pagination_params: LimitOffsetParams = Depends(),
+    logger: logging.Logger = Depends(get_logger),
+):
+    # e.g. filter="rsi < 30 and close < bb_lower"&sort=rsi, over the latest values of every ticker
+    MAX_PAGE_SIZE = 100
+    if pagination_params.limit > MAX_PAGE_SIZE:
+        raise BAD_REQUEST_RESPONSE
+    try:
+        where, params = screener.compile_filter(filter)
+        order_by = screener.order_by(sort, descending)
+    except screener.ScreenerSyntaxError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    sql = db.read_sql_script("api/sql/crud_ops/read/screen_indicator_snapshot.sql").format(
+        where=where, order_by=order_by
+    )
+    try:
+        results = await db.coalesced_fetchall_sql(
+            sql, [*params, int(pagination_params.limit), int(pagination_params.offset)]  # type: ignore
+        )
+    except:
+        logger.error("failed to screen tickers with filter %r", filter, exc_info=True)
+        raise DatabaseError("screen_indicator_snapshot.sql")
+
+    return {
+        "total": results[0][-1] if results else 0,
+        "results": [
+            {
+                "tickerSymbol": ticker_symbol,
+                "company": company,
+                "asOf": as_of_date,
+                "close": close_price,
+                "rsi": rsi_14,
+                "macd": macd,
+                "macdSignal": macd_signal,
+                "sma50": sma_50,
+                "bbMiddle": bb_middle,
+                "bbUpper": bb_upper,
+                "bbLower": bb_lower,
+                "atr": atr_14,
+                "stochK": stoch_k,
+                "stochD": stoch_d,
+            }
+            for (
+                ticker_symbol, company, as_of_date, close_price, rsi_14, macd, macd_signal,
+                sma_50, bb_middle, bb_upper, bb_lower, atr_14, stoch_k, stoch_d, _,
+            ) in results
+        ],
+    }
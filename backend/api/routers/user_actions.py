@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from ..internal import auth
+from ..internal import auth, db, risk, workers
 from ..internal.demo_assignment import sql_code_return_wrapper
 from ..dependencies import (
     DB_CONNECT_CONFIG,
@@ -11,9 +11,10 @@ from ..dependencies import (
 
 from fastapi import APIRouter, Header, status, HTTPException, Depends, Body, Query
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import RedirectResponse, Response
 
-import pymysql, re, logging
+import pymysql, re, logging, datetime
 
 from ..routers.admin_actions import GENERIC_ADMIN_USER_ID
 
@@ -88,6 +89,9 @@ async def register_new_user(
 
                 conn.commit()
 
+        # the new account signs in right away, before the replicas may have it
+        db.read_your_writes(created_user_id, email)
+
         return auth.credentials_b64(
                 str(created_user_id), password_hash
             )
@@ -105,19 +109,14 @@ async def signin(
 ):
     password_hash = auth.hash_password(password)
     try:
-        with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
-            with conn.cursor() as cursor:
-                with open(
-                    "api/sql/crud_ops/read/user_sign_in.sql", "r"
-                ) as f_sql_user_sign_in:
-                    cursor.execute(
-                        f_sql_user_sign_in.read(),
-                        {
-                            "email_address": email,
-                            "password_hash": password_hash,
-                        },
-                    )
-                query_results = cursor.fetchall()
+        query_results = db.fetchall(
+            "api/sql/crud_ops/read/user_sign_in.sql",
+            {
+                "email_address": email,
+                "password_hash": password_hash,
+            },
+            session=email,
+        )
 
         is_auth_successful = len(query_results) > 0
         queried_user_id = query_results[0]
@@ -163,22 +162,17 @@ async def user_profile_details(
 ):
     if logged_in_user_id:
         if id == logged_in_user_id:
-            with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
-                with conn.cursor() as cursor:
-                    with open(
-                        "api/sql/crud_ops/read/get_user_info_except_password.sql", "r"
-                    ) as f_sql_get_user_info_except_password:
-                        cursor.execute(
-                            f_sql_get_user_info_except_password.read(),
-                            {"id": id},
-                        )
-                        (
-                            query_result__user_id,
-                            query_result__first_name,
-                            query_result__last_name,
-                            query_result__email_address,
-                            query_result__member_since,
-                        ) = cursor.fetchone()
+            (
+                query_result__user_id,
+                query_result__first_name,
+                query_result__last_name,
+                query_result__email_address,
+                query_result__member_since,
+            ) = db.fetchall(
+                "api/sql/crud_ops/read/get_user_info_except_password.sql",
+                {"id": id},
+                session=id,
+            )[0]
 
             return {
                 "user_id": query_result__user_id,
@@ -256,6 +250,8 @@ async def create_portfolio(
 
                 conn.commit()
 
+        db.read_your_writes(id)
+
         return {"portfolio_id": new_portfolio_id}, mogrified_sql_create_a_portfolio
 
     if logged_in_user_id:
@@ -274,3 +270,161 @@ async def create_portfolio(
         raise auth.FORBIDDEN_RESPONSE  # not you
 
     raise auth.UNAUTHORIZED_RESPONSE  # user is not logged-in
+
+
+async def _portfolio_quantities(id: int, portfolio_id: int, logger: logging.Logger) -> dict[str, float]:
+    """Shares held per ticker in one of the user's portfolios, 404 if there are none."""
+    try:
+        holdings = await run_in_threadpool(
+            db.fetchall,
+            "api/sql/crud_ops/read/portfolio_holdings.sql",
+            {"user_id": id, "portfolio_id": portfolio_id},
+            id,
+        )
+    except:
+        logger.error("failed to fetch holdings of portfolio %s", portfolio_id, exc_info=True)
+        raise DatabaseError("portfolio_holdings.sql")
+    if not holdings:
+        # not the user's portfolio, or nothing in it yet
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="no holdings in this portfolio")
+    return {ticker: float(quantity) for ticker, quantity in holdings}
+
+
+async def _price_data_version(logger: logging.Logger) -> tuple:
+    try:
+        return (await db.coalesced_fetchall("api/sql/crud_ops/read/price_data_version.sql"))[0]
+    except:
+        logger.error("failed to fetch price data version", exc_info=True)
+        raise DatabaseError("price_data_version.sql")
+
+
+async def _holdings_closes(quantities: dict[str, float], start, end, logger: logging.Logger) -> tuple:
+    try:
+        return await db.coalesced_fetchall(
+            "api/sql/crud_ops/read/tickers_close_range.sql",
+            {"tickers": tuple(quantities), "start": start, "end": end},
+        )
+    except:
+        logger.error("failed to fetch closes of %s", sorted(quantities), exc_info=True)
+        raise DatabaseError("tickers_close_range.sql")
+
+
+@router.get("/users/{id}/portfolios/{portfolio_id}/risk", tags=["users"])
+async def portfolio_risk(
+    id: int,
+    portfolio_id: int,
+    logged_in_user_id: Annotated[str, Depends(get_logged_in_user_id)],
+    start: datetime.date | None = Query(None),
+    end: datetime.date | None = Query(None),
+    risk_free_rate: float = Query(0.0),
+    logger: logging.Logger = Depends(get_logger),
+):
+    # volatility, beta, Sharpe and drawdown of the portfolio and each holding, plus their correlations
+    MAX_RANGE_DAYS = 366 * 10
+    if not logged_in_user_id:
+        raise auth.UNAUTHORIZED_RESPONSE
+    if str(id) != str(logged_in_user_id):
+        raise auth.FORBIDDEN_RESPONSE
+    end = end or datetime.date.today()
+    start = start or end - datetime.timedelta(days=365)
+    if start > end or (end - start).days > MAX_RANGE_DAYS or not -1 < risk_free_rate < 1:
+        raise BAD_REQUEST_RESPONSE
+
+    quantities = await _portfolio_quantities(id, portfolio_id, logger)
+    version = await _price_data_version(logger)
+
+    # prices only change with an ingest, so the figures are reused until the next one
+    key = (tuple(sorted(quantities.items())), start, end, risk_free_rate, version)
+    result = risk.results_cache.get(key)
+    if result is None:
+        market_key = (start, end, version)
+        market_rows = risk.market_cache.get(market_key)
+        if market_rows is None:
+            try:
+                market_rows = await db.coalesced_fetchall(
+                    "api/sql/crud_ops/read/market_average_returns.sql", {"start": start, "end": end}
+                )
+            except:
+                logger.error("failed to fetch market returns", exc_info=True)
+                raise DatabaseError("market_average_returns.sql")
+            risk.market_cache.put(market_key, market_rows)
+        close_rows = await _holdings_closes(quantities, start, end, logger)
+
+        result = await workers.run_cpu_bound(
+            risk.compute_risk, close_rows, market_rows, quantities, risk_free_rate
+        )
+        risk.results_cache.put(key, result)
+
+    return {
+        "user_id": id,
+        "portfolio_id": portfolio_id,
+        "start": start,
+        "end": end,
+        "riskFreeRate": risk_free_rate,
+        **result,
+    }
+
+
+@router.get("/users/{id}/portfolios/{portfolio_id}/var", tags=["users"])
+async def portfolio_value_at_risk(
+    id: int,
+    portfolio_id: int,
+    logged_in_user_id: Annotated[str, Depends(get_logged_in_user_id)],
+    horizons: list[int] = Query([1, 5, 10, 21]),
+    confidence: list[float] = Query([0.95, 0.99]),
+    paths: int = Query(100_000),
+    seed: int = Query(0),
+    start: datetime.date | None = Query(None),
+    end: datetime.date | None = Query(None),
+    logger: logging.Logger = Depends(get_logger),
+):
+    # Monte Carlo VaR/CVaR, horizons in trading days, covariance estimated over start..end
+    MAX_RANGE_DAYS = 366 * 10
+    MAX_PATHS = 1_000_000
+    MAX_HORIZON_DAYS = 252
+    if not logged_in_user_id:
+        raise auth.UNAUTHORIZED_RESPONSE
+    if str(id) != str(logged_in_user_id):
+        raise auth.FORBIDDEN_RESPONSE
+    end = end or datetime.date.today()
+    start = start or end - datetime.timedelta(days=365)
+    CONSTRAINTS = [
+        start <= end and (end - start).days <= MAX_RANGE_DAYS,
+        0 < paths <= MAX_PATHS,
+        0 < len(horizons) <= 10 and all(0 < days <= MAX_HORIZON_DAYS for days in horizons),
+        0 < len(confidence) <= 5 and all(0.5 <= level < 1 for level in confidence),
+        seed >= 0,
+    ]
+    if not all(CONSTRAINTS):
+        raise BAD_REQUEST_RESPONSE
+
+    quantities = await _portfolio_quantities(id, portfolio_id, logger)
+    version = await _price_data_version(logger)
+
+    key = (tuple(sorted(quantities.items())), start, end, tuple(horizons), tuple(confidence), paths, seed, version)
+    result = risk.var_cache.get(key)
+    if result is None:
+        close_rows = await _holdings_closes(quantities, start, end, logger)
+        inputs = await workers.run_cpu_bound(risk.simulation_inputs, close_rows, quantities)
+        result = {
+            "observations": inputs["observations"],
+            "excluded": inputs["excluded"],
+            "portfolioValue": inputs["value"],
+            "horizons": [],
+        }
+        if inputs["value"] is not None:
+            # waits on the pool from a thread; the batches themselves run in the worker processes
+            result["horizons"] = await run_in_threadpool(
+                risk.monte_carlo_var, inputs, horizons, confidence, paths, seed, workers.get_pool()
+            )
+        risk.var_cache.put(key, result)
+
+    return {
+        "user_id": id,
+        "portfolio_id": portfolio_id,
+        "start": start,
+        "end": end,
+        "paths": paths,
+        "seed": seed,
+        **result,
+    }
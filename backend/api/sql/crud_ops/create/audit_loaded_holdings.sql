@@ -0,0 +1,31 @@
+-- Writes the AuditLog rows the holdings trigger skipped during a bulk load,
+-- one set-based INSERT instead of one trigger call per loaded row
+
+INSERT INTO AuditLog (
+    table_name,
+    operation_type,
+    record_id,
+    ticker_symbol,
+    quantity,
+    purchase_price,
+    user_id,
+    timestamp
+)
+SELECT
+    'Holdings',
+    'INSERT',
+    h.holding_id,
+    h.ticker_symbol,
+    h.quantity,
+    h.purchase_price,
+    p.user_id,
+    CURRENT_TIMESTAMP
+FROM Holdings h
+INNER JOIN Portfolio p ON h.portfolio_id = p.portfolio_id
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM AuditLog a
+    WHERE a.table_name = 'Holdings'
+      AND a.operation_type = 'INSERT'
+      AND a.record_id = h.holding_id
+);
@@ -0,0 +1,49 @@
+-- weekly (weeks start on monday) and monthly bars of every ticker, rebuilt from PriceHistory
+-- (the price loader keeps them up to date incrementally afterwards)
+DELETE FROM PriceRollup;
+
+INSERT INTO PriceRollup
+    (ticker_symbol, rollup_period, period_start, open_price, high_price, low_price, close_price, volume, trading_days)
+SELECT ticker_symbol, '1w', period_start, open_price, high_price, low_price, close_price, volume, trading_days
+FROM (
+    SELECT
+        ticker_symbol,
+        date - INTERVAL WEEKDAY(date) DAY AS period_start,
+        FIRST_VALUE(open_price) OVER w AS open_price,
+        MAX(high_price) OVER w AS high_price,
+        MIN(low_price) OVER w AS low_price,
+        LAST_VALUE(close_price) OVER w AS close_price,
+        SUM(volume) OVER w AS volume,
+        COUNT(*) OVER w AS trading_days,
+        ROW_NUMBER() OVER w AS day_no
+    FROM PriceHistory
+    WINDOW w AS (
+        PARTITION BY ticker_symbol, date - INTERVAL WEEKDAY(date) DAY
+        ORDER BY date
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    )
+) weeks
+WHERE day_no = 1;
+
+INSERT INTO PriceRollup
+    (ticker_symbol, rollup_period, period_start, open_price, high_price, low_price, close_price, volume, trading_days)
+SELECT ticker_symbol, '1M', period_start, open_price, high_price, low_price, close_price, volume, trading_days
+FROM (
+    SELECT
+        ticker_symbol,
+        date - INTERVAL (DAYOFMONTH(date) - 1) DAY AS period_start,
+        FIRST_VALUE(open_price) OVER w AS open_price,
+        MAX(high_price) OVER w AS high_price,
+        MIN(low_price) OVER w AS low_price,
+        LAST_VALUE(close_price) OVER w AS close_price,
+        SUM(volume) OVER w AS volume,
+        COUNT(*) OVER w AS trading_days,
+        ROW_NUMBER() OVER w AS day_no
+    FROM PriceHistory
+    WINDOW w AS (
+        PARTITION BY ticker_symbol, date - INTERVAL (DAYOFMONTH(date) - 1) DAY
+        ORDER BY date
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    )
+) months
+WHERE day_no = 1;
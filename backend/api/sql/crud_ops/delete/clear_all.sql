@@ -1,6 +1,9 @@
 DELETE FROM AuditLog;
 DELETE FROM Alert;
 DELETE FROM Holdings;
+DELETE FROM IndicatorSnapshot;
+DELETE FROM PriceRollup;
+DELETE FROM PriceBar;
 DELETE FROM PriceHistory;
 DELETE FROM Portfolio;
 DELETE FROM Ticker;
@@ -1,6 +1,9 @@
 DROP TABLE IF EXISTS AuditLog;
 DROP TABLE IF EXISTS Alert;
 DROP TABLE IF EXISTS Holdings;
+DROP TABLE IF EXISTS IndicatorSnapshot;
+DROP TABLE IF EXISTS PriceRollup;
+DROP TABLE IF EXISTS PriceBar;
 DROP TABLE IF EXISTS PriceHistory;
 DROP TABLE IF EXISTS Portfolio;
 DROP TABLE IF EXISTS Ticker;
@@ -0,0 +1,15 @@
+-- equal weighted average daily return of every ticker between start and end (the market proxy)
+-- closes of the week before start give the first day its previous close
+SELECT date, AVG(close_price / prev_close - 1) AS market_return
+FROM (
+    SELECT
+        date,
+        close_price,
+        LAG(close_price) OVER (PARTITION BY ticker_symbol ORDER BY date) AS prev_close
+    FROM PriceHistory
+    WHERE date BETWEEN DATE_SUB(%(start)s, INTERVAL 7 DAY) AND %(end)s
+) r
+WHERE prev_close > 0
+AND date >= %(start)s
+GROUP BY date
+ORDER BY date;
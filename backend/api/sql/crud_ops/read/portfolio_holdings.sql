@@ -0,0 +1,8 @@
+-- shares held per ticker in one portfolio, only if the portfolio belongs to the user
+SELECT h.ticker_symbol, SUM(h.quantity) AS quantity
+FROM Portfolio p
+INNER JOIN Holdings h ON p.portfolio_id = h.portfolio_id
+WHERE p.portfolio_id = %(portfolio_id)s
+AND p.user_id = %(user_id)s
+GROUP BY h.ticker_symbol
+ORDER BY h.ticker_symbol;
@@ -0,0 +1,4 @@
+-- changes whenever prices are ingested: the newest bar, and the snapshot refresh every ingest ends with
+SELECT
+    (SELECT MAX(date) FROM PriceHistory) AS latest_price_date,
+    (SELECT MAX(updated_at) FROM IndicatorSnapshot) AS latest_snapshot_update;
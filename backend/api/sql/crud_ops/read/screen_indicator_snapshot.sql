@@ -0,0 +1,23 @@
+-- WHERE and ORDER BY clauses are filled in by internal/screener.py from whitelisted columns only, filter values are query parameters
+SELECT
+    s.ticker_symbol,
+    t.company_name,
+    s.as_of_date,
+    s.close_price,
+    s.rsi_14,
+    s.macd,
+    s.macd_signal,
+    s.sma_50,
+    s.bb_middle,
+    s.bb_upper,
+    s.bb_lower,
+    s.atr_14,
+    s.stoch_k,
+    s.stoch_d,
+    COUNT(*) OVER () AS total_matches
+FROM IndicatorSnapshot s
+JOIN Ticker t ON t.ticker_symbol = s.ticker_symbol
+WHERE {where}
+ORDER BY {order_by}, s.ticker_symbol
+LIMIT %s
+OFFSET %s;
@@ -0,0 +1,6 @@
+-- daily bars of one ticker between start and end
+SELECT date, open_price, high_price, low_price, close_price, volume
+FROM PriceHistory
+WHERE ticker_symbol = %(symbol)s
+AND date BETWEEN %(start)s AND %(end)s
+ORDER BY date;
@@ -0,0 +1,8 @@
+-- intraday bars of one ticker between start and end (both days included)
+SELECT bar_time, open_price, high_price, low_price, close_price, volume
+FROM PriceBar
+WHERE ticker_symbol = %(symbol)s
+AND bar_interval = %(interval)s
+AND bar_time >= %(start)s
+AND bar_time < %(end)s + INTERVAL 1 DAY
+ORDER BY bar_time;
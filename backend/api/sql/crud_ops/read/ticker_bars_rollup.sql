@@ -0,0 +1,7 @@
+-- weekly ('1w') or monthly ('1M') bars of one ticker, start is the first period's first day
+SELECT period_start, open_price, high_price, low_price, close_price, volume
+FROM PriceRollup
+WHERE ticker_symbol = %(symbol)s
+AND rollup_period = %(interval)s
+AND period_start BETWEEN %(start)s AND %(end)s
+ORDER BY period_start;
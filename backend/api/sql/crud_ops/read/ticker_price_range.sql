@@ -0,0 +1,17 @@
+-- bars of one ticker between start and end, plus up to `lookback` bars before start to warm up indicators
+(
+    SELECT date, open_price, high_price, low_price, close_price, volume
+    FROM PriceHistory
+    WHERE ticker_symbol = %(symbol)s
+    AND date < %(start)s
+    ORDER BY date DESC
+    LIMIT %(lookback)s
+)
+UNION ALL
+(
+    SELECT date, open_price, high_price, low_price, close_price, volume
+    FROM PriceHistory
+    WHERE ticker_symbol = %(symbol)s
+    AND date BETWEEN %(start)s AND %(end)s
+)
+ORDER BY date;
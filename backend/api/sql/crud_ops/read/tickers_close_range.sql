@@ -0,0 +1,6 @@
+-- daily closes of several tickers between start and end
+SELECT ticker_symbol, date, close_price
+FROM PriceHistory
+WHERE ticker_symbol IN %(tickers)s
+AND date BETWEEN %(start)s AND %(end)s
+ORDER BY ticker_symbol, date;
@@ -0,0 +1,15 @@
+-- daily return of every ticker on the days after `after`
+-- closes of the week before give the first day its previous close
+SELECT ticker_symbol, date, close_price / prev_close - 1 AS daily_return
+FROM (
+    SELECT
+        ticker_symbol,
+        date,
+        close_price,
+        LAG(close_price) OVER (PARTITION BY ticker_symbol ORDER BY date) AS prev_close
+    FROM PriceHistory
+    WHERE date > DATE_SUB(%(after)s, INTERVAL 7 DAY)
+) r
+WHERE prev_close > 0
+AND date > %(after)s
+ORDER BY date, ticker_symbol;
@@ -1,1016 +1,1016 @@
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.35e0,'2024-11-12',130.43e0,129.9e0,130.105e0,1,'MMM',594254);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (131.45e0,'2024-11-13',131.56e0,131.1475e0,131.435e0,2,'MMM',363322);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (132.33e0,'2024-11-14',132.54e0,132.12e0,132.52e0,3,'MMM',346375);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.78e0,'2024-11-15',130.01e0,129.73e0,129.88e0,4,'MMM',318453);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.18e0,'2024-11-18',130.24e0,129.88e0,129.93e0,5,'MMM',317504);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (128.19e0,'2024-11-19',128.255e0,128.0e0,128.24e0,6,'MMM',335179);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (127.83e0,'2024-11-20',128.09e0,127.54e0,127.54e0,7,'MMM',247532);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (127.31e0,'2024-11-21',127.82e0,127.2e0,127.769e0,8,'MMM',383077);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (128.44e0,'2024-11-22',128.48e0,128.12e0,128.13e0,9,'MMM',489524);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.31e0,'2024-11-25',130.33e0,129.42e0,129.445e0,10,'MMM',695067);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (132.945e0,'2024-11-26',133.23e0,132.75e0,132.85e0,11,'MMM',752088);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (132.48e0,'2024-11-27',132.86e0,132.36e0,132.72e0,12,'MMM',329219);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (133.585e0,'2024-11-29',133.63e0,133.04e0,133.2e0,13,'MMM',268307);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (132.84e0,'2024-12-02',133.415e0,132.635e0,133.415e0,14,'MMM',590330);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (131.15e0,'2024-12-03',131.5235e0,131.13e0,131.34e0,15,'MMM',359187);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.43e0,'2024-12-04',130.75e0,130.17e0,130.27e0,16,'MMM',359242);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (133.33e0,'2024-12-05',133.47e0,132.97e0,132.97e0,17,'MMM',540419);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (133.08e0,'2024-12-06',133.18e0,132.47e0,132.57e0,18,'MMM',346683);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (131.48e0,'2024-12-09',132.19e0,131.27e0,132.08e0,19,'MMM',886411);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.77e0,'2024-12-10',129.89e0,129.43e0,129.87e0,20,'MMM',490103);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.79e0,'2024-12-11',130.03e0,129.58e0,129.71e0,21,'MMM',496158);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.74e0,'2024-12-12',129.83e0,129.17e0,129.18e0,22,'MMM',356843);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.91e0,'2024-12-13',129.98e0,129.49e0,129.55e0,23,'MMM',422174);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.47e0,'2024-12-16',129.74e0,129.345e0,129.535e0,24,'MMM',600734);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (128.05e0,'2024-12-17',128.36e0,127.93e0,128.3e0,25,'MMM',423390);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (125.5e0,'2024-12-18',127.06e0,125.37e0,126.815e0,26,'MMM',975886);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (127.11e0,'2024-12-19',127.738e0,127.016e0,127.48e0,27,'MMM',512895);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.26e0,'2024-12-20',130.35e0,129.14e0,129.4e0,28,'MMM',1108101);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (128.94e0,'2024-12-23',129.19e0,128.695e0,128.79e0,29,'MMM',301318);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.8905e0,'2024-12-24',129.94e0,129.33e0,129.52e0,30,'MMM',123666);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (131.23e0,'2024-12-26',131.4e0,130.43e0,130.52e0,31,'MMM',311205);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.18e0,'2024-12-27',130.23e0,129.565e0,129.78e0,32,'MMM',392235);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.14e0,'2024-12-30',129.845e0,129.11e0,129.56e0,33,'MMM',431634);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.1e0,'2024-12-31',129.335e0,128.84e0,129.26e0,34,'MMM',377924);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.72e0,'2025-01-02',130.03e0,129.47e0,129.79e0,35,'MMM',527960);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (129.84e0,'2025-01-03',130.22e0,129.8e0,129.93e0,36,'MMM',351897);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.3e0,'2025-01-06',130.31e0,129.945e0,130.14e0,37,'MMM',511582);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (132.79e0,'2025-01-07',132.8e0,131.71e0,131.88e0,38,'MMM',746750);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (134.53e0,'2025-01-08',134.57e0,133.625e0,133.705e0,39,'MMM',761180);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (131.21e0,'2025-01-10',131.49e0,130.63e0,130.75e0,40,'MMM',873482);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (134.54e0,'2025-01-13',134.73e0,133.92e0,133.96e0,41,'MMM',1191342);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (137.22e0,'2025-01-14',137.58e0,137.0749e0,137.24e0,42,'MMM',872432);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (137.79e0,'2025-01-15',138.11e0,137.61e0,137.95e0,43,'MMM',839018);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (139.17e0,'2025-01-16',139.45e0,139.075e0,139.13e0,44,'MMM',579080);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (141.015e0,'2025-01-17',141.28e0,140.65e0,140.685e0,45,'MMM',1140968);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.93e0,'2025-01-21',147.26e0,146.5202e0,147.2e0,46,'MMM',1080001);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.14e0,'2025-01-22',150.05e0,149.04e0,149.89e0,47,'MMM',991692);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.62e0,'2025-01-23',149.8e0,149.0e0,149.735e0,48,'MMM',993725);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.44e0,'2025-01-24',149.7e0,149.23e0,149.43e0,49,'MMM',844795);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.51e0,'2025-01-27',151.56e0,150.8e0,150.94e0,50,'MMM',864013);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.39e0,'2025-01-28',151.48e0,150.73e0,150.8839e0,51,'MMM',816336);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.5e0,'2025-01-29',151.655e0,150.91e0,151.6e0,52,'MMM',786219);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.41e0,'2025-01-30',154.59e0,153.33e0,154.42e0,53,'MMM',968761);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.22e0,'2025-01-31',152.92e0,152.13e0,152.84e0,54,'MMM',577851);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.97e0,'2025-02-03',150.45e0,149.63e0,149.75e0,55,'MMM',573310);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.66e0,'2025-02-04',151.98e0,151.515e0,151.87e0,56,'MMM',418170);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.45e0,'2025-02-05',152.81e0,152.4e0,152.75e0,57,'MMM',427496);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.31e0,'2025-02-06',152.685e0,152.064e0,152.33e0,58,'MMM',323154);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.9e0,'2025-02-07',150.0e0,149.58e0,149.58e0,59,'MMM',502516);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.69e0,'2025-02-10',149.765e0,149.13e0,149.2e0,60,'MMM',569336);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.01e0,'2025-02-11',150.38e0,149.65e0,150.235e0,61,'MMM',381343);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.895e0,'2025-02-12',149.18e0,148.76e0,148.95e0,62,'MMM',332740);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.7e0,'2025-02-13',149.15e0,148.63e0,149.15e0,63,'MMM',364482);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.62e0,'2025-02-14',148.9363e0,148.57e0,148.8568e0,64,'MMM',265442);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.98e0,'2025-02-18',149.09e0,148.6001e0,149.01e0,65,'MMM',400881);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.19e0,'2025-02-19',150.22e0,149.8601e0,150.12e0,66,'MMM',463553);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.09e0,'2025-02-20',149.19e0,148.3975e0,148.535e0,67,'MMM',427434);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (144.95e0,'2025-02-21',145.74e0,144.72e0,144.87e0,68,'MMM',875169);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (145.5e0,'2025-02-24',146.09e0,145.38e0,145.58e0,69,'MMM',526265);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.58e0,'2025-02-25',147.35e0,146.2e0,147.3e0,70,'MMM',867476);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.45e0,'2025-02-26',148.28e0,147.185e0,147.39e0,71,'MMM',798088);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.5e0,'2025-02-27',150.85e0,149.57e0,149.6e0,72,'MMM',1267026);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.26e0,'2025-02-28',155.26e0,153.87e0,154.96e0,73,'MMM',1415149);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.42e0,'2025-03-03',153.46e0,151.9e0,152.75e0,74,'MMM',975272);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (145.9e0,'2025-03-04',148.7e0,145.62e0,148.7e0,75,'MMM',958451);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.58e0,'2025-03-05',148.25e0,147.13e0,148.25e0,76,'MMM',635908);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.9e0,'2025-03-06',147.35e0,146.4e0,147.0e0,77,'MMM',661573);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.255e0,'2025-03-07',146.8e0,145.36e0,146.3e0,78,'MMM',877091);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.63e0,'2025-03-10',148.24e0,147.28e0,147.6e0,79,'MMM',622782);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.57e0,'2025-03-11',149.0e0,147.49e0,148.42e0,80,'MMM',876284);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.24e0,'2025-03-12',150.895e0,150.1031e0,150.72e0,81,'MMM',624768);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.11e0,'2025-03-13',146.82e0,145.91e0,146.69e0,82,'MMM',636289);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.41e0,'2025-03-14',150.79e0,150.0301e0,150.26e0,83,'MMM',616206);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.22e0,'2025-03-17',153.72e0,153.05e0,153.66e0,84,'MMM',614131);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.9e0,'2025-03-18',151.4e0,150.5675e0,151.32e0,85,'MMM',556215);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.22e0,'2025-03-19',153.69e0,152.85e0,153.11e0,86,'MMM',467720);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.27e0,'2025-03-20',152.1e0,151.09e0,151.895e0,87,'MMM',569948);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.355e0,'2025-03-21',150.46e0,149.86e0,150.01e0,88,'MMM',376941);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.13e0,'2025-03-24',153.77e0,153.01e0,153.01e0,89,'MMM',477421);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.53e0,'2025-03-25',153.73e0,152.68e0,153.2e0,90,'MMM',506386);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.66e0,'2025-03-26',152.86e0,152.36e0,152.54e0,91,'MMM',512712);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.44e0,'2025-03-27',149.56e0,148.33e0,149.56e0,92,'MMM',394040);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (144.82e0,'2025-03-28',145.29e0,144.71e0,145.04e0,93,'MMM',429262);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.86e0,'2025-03-31',147.735e0,146.64e0,146.97e0,94,'MMM',625216);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.67e0,'2025-04-01',148.0e0,147.325e0,147.41e0,95,'MMM',385304);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.75e0,'2025-04-02',148.17e0,147.17e0,147.18e0,96,'MMM',659387);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (139.73e0,'2025-04-03',140.44e0,139.59e0,140.015e0,97,'MMM',885163);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (126.93e0,'2025-04-04',129.17e0,126.43e0,128.315e0,98,'MMM',1193009);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (128.61e0,'2025-04-07',128.93e0,126.97e0,127.425e0,99,'MMM',992844);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (127.17e0,'2025-04-08',127.42e0,124.82e0,127.08e0,100,'MMM',1028769);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (138.225e0,'2025-04-09',139.23e0,137.3e0,138.155e0,101,'MMM',1174530);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (132.93e0,'2025-04-10',133.15e0,130.505e0,132.03e0,102,'MMM',806285);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (135.92e0,'2025-04-11',136.485e0,135.43e0,135.8421e0,103,'MMM',763986);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (136.015e0,'2025-04-14',136.75e0,135.83e0,136.45e0,104,'MMM',488804);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (135.27e0,'2025-04-15',135.73e0,135.14e0,135.57e0,105,'MMM',471335);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.47e0,'2025-04-16',131.22e0,129.89e0,130.04e0,106,'MMM',1358552);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (130.17e0,'2025-04-17',131.14e0,130.08e0,130.655e0,107,'MMM',776627);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (126.05e0,'2025-04-21',126.12e0,125.12e0,125.35e0,108,'MMM',1200864);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (136.34e0,'2025-04-22',137.272e0,136.04e0,136.4e0,109,'MMM',1203674);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (135.96e0,'2025-04-23',136.4e0,135.28e0,135.73e0,110,'MMM',726250);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (138.87e0,'2025-04-24',139.45e0,138.7375e0,139.105e0,111,'MMM',482619);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (137.285e0,'2025-04-25',137.57e0,137.105e0,137.46e0,112,'MMM',458243);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (137.93e0,'2025-04-28',138.41e0,137.4e0,137.695e0,113,'MMM',417426);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (138.38e0,'2025-04-29',138.68e0,138.1525e0,138.37e0,114,'MMM',346312);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (138.83e0,'2025-04-30',139.31e0,137.35e0,137.59e0,115,'MMM',593023);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (137.9e0,'2025-05-01',138.8e0,137.79e0,138.775e0,116,'MMM',403655);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (142.07e0,'2025-05-02',142.625e0,141.95e0,142.31e0,117,'MMM',509019);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (140.79e0,'2025-05-05',141.2e0,140.55e0,141.19e0,118,'MMM',463123);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (138.0e0,'2025-05-06',138.56e0,137.93e0,138.25e0,119,'MMM',496618);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (138.56e0,'2025-05-07',139.28e0,137.89e0,137.91e0,120,'MMM',411371);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (141.16e0,'2025-05-08',142.2e0,140.94e0,142.0e0,121,'MMM',469888);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (142.61e0,'2025-05-09',142.62e0,141.9e0,142.13e0,122,'MMM',561632);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.35e0,'2025-05-12',150.4599e0,149.81e0,150.225e0,123,'MMM',765990);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.72e0,'2025-05-13',151.28e0,150.7e0,150.96e0,124,'MMM',597976);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.88e0,'2025-05-14',148.41e0,147.81e0,147.96e0,125,'MMM',537522);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.8e0,'2025-05-15',149.15e0,148.59e0,149.0225e0,126,'MMM',334560);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.09e0,'2025-05-16',153.28e0,152.7101e0,152.73e0,127,'MMM',616289);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.1e0,'2025-05-19',154.26e0,153.65e0,153.65e0,128,'MMM',594505);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.14e0,'2025-05-20',154.23e0,153.74e0,153.77e0,129,'MMM',403362);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.39e0,'2025-05-21',149.9e0,149.33e0,149.45e0,130,'MMM',574393);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.75e0,'2025-05-22',150.53e0,149.59e0,150.52e0,131,'MMM',446200);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.62e0,'2025-05-23',148.28e0,147.45e0,148.132e0,132,'MMM',440393);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.5e0,'2025-05-27',149.58e0,149.19e0,149.3e0,133,'MMM',380679);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.67e0,'2025-05-28',148.77e0,148.395e0,148.635e0,134,'MMM',307743);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.66e0,'2025-05-29',149.8e0,149.11e0,149.14e0,135,'MMM',290623);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.3e0,'2025-05-30',148.96e0,148.11e0,148.96e0,136,'MMM',728664);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.44e0,'2025-06-02',146.54e0,146.21e0,146.53e0,137,'MMM',364339);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.13e0,'2025-06-03',148.36e0,147.92e0,147.945e0,138,'MMM',388537);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.8e0,'2025-06-04',147.585e0,146.71e0,147.51e0,139,'MMM',551742);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.25e0,'2025-06-05',146.835e0,146.0e0,146.07e0,140,'MMM',739071);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (145.48e0,'2025-06-06',146.05e0,145.46e0,145.78e0,141,'MMM',497388);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (144.23e0,'2025-06-09',144.95e0,144.1201e0,144.92e0,142,'MMM',535097);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (145.04e0,'2025-06-10',145.15e0,144.685e0,144.91e0,143,'MMM',501135);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.17e0,'2025-06-11',147.25e0,146.63e0,146.96e0,144,'MMM',408240);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (144.76e0,'2025-06-12',145.08e0,144.49e0,145.0316e0,145,'MMM',449358);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (142.31e0,'2025-06-13',142.48e0,142.02e0,142.16e0,146,'MMM',461107);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (145.12e0,'2025-06-16',145.21e0,144.677e0,144.74e0,147,'MMM',317029);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (142.17e0,'2025-06-17',142.48e0,141.99e0,142.16e0,148,'MMM',360757);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (142.54e0,'2025-06-18',143.1e0,142.2414e0,142.25e0,149,'MMM',583263);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (144.02e0,'2025-06-20',144.05e0,143.03e0,143.28e0,150,'MMM',759182);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.6e0,'2025-06-23',147.72e0,146.6548e0,146.685e0,151,'MMM',831903);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.89e0,'2025-06-24',150.29e0,149.75e0,150.045e0,152,'MMM',447507);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.76e0,'2025-06-25',147.83e0,147.3e0,147.64e0,153,'MMM',381670);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.79e0,'2025-06-26',150.92e0,150.29e0,150.57e0,154,'MMM',610460);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.02e0,'2025-06-27',152.23e0,151.18e0,151.41e0,155,'MMM',371152);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.17e0,'2025-06-30',152.46e0,151.8694e0,152.06e0,156,'MMM',349206);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.81e0,'2025-07-01',154.625e0,153.76e0,154.625e0,157,'MMM',564597);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.97e0,'2025-07-02',154.16e0,153.66e0,153.93e0,158,'MMM',630014);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.845e0,'2025-07-03',153.18e0,152.39e0,152.57e0,159,'MMM',455011);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.83e0,'2025-07-07',152.28e0,151.77e0,151.84e0,160,'MMM',713788);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.75e0,'2025-07-08',154.43e0,153.45e0,154.43e0,161,'MMM',502625);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.03e0,'2025-07-09',156.22e0,155.77e0,155.815e0,162,'MMM',492610);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (157.34e0,'2025-07-10',158.42e0,157.21e0,158.16e0,163,'MMM',654844);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.81e0,'2025-07-11',156.1e0,155.59e0,156.02e0,164,'MMM',377355);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (157.91e0,'2025-07-14',158.11e0,157.32e0,157.4e0,165,'MMM',551476);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.58e0,'2025-07-15',157.295e0,156.55e0,156.88e0,166,'MMM',433344);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (157.46e0,'2025-07-16',157.68e0,157.035e0,157.12e0,167,'MMM',515248);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (159.18e0,'2025-07-17',159.41e0,158.63e0,158.88e0,168,'MMM',1374137);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.25e0,'2025-07-18',154.18e0,151.93e0,152.17e0,169,'MMM',2241541);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.81e0,'2025-07-21',152.91e0,151.735e0,152.34e0,170,'MMM',726699);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.09e0,'2025-07-22',151.83e0,151.09e0,151.65e0,171,'MMM',675245);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.87e0,'2025-07-23',151.45e0,150.69e0,151.27e0,172,'MMM',759981);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.34e0,'2025-07-24',149.65e0,149.16e0,149.22e0,173,'MMM',787112);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.26e0,'2025-07-25',151.4e0,151.01e0,151.15e0,174,'MMM',363213);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.09e0,'2025-07-28',152.22e0,151.745e0,152.03e0,175,'MMM',571695);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.8e0,'2025-07-29',151.84e0,151.1501e0,151.53e0,176,'MMM',641174);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (146.66e0,'2025-07-30',147.3e0,146.5e0,147.09e0,177,'MMM',724683);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (149.22e0,'2025-07-31',149.46e0,148.88e0,149.33e0,178,'MMM',823669);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (144.38e0,'2025-08-01',145.07e0,144.25e0,144.915e0,179,'MMM',830350);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (147.9e0,'2025-08-04',148.18e0,147.58e0,147.72e0,180,'MMM',540721);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.19e0,'2025-08-05',150.61e0,149.99e0,150.285e0,181,'MMM',570587);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (150.83e0,'2025-08-06',151.385e0,150.81e0,151.17e0,182,'MMM',454055);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.76e0,'2025-08-07',151.78e0,151.27e0,151.29e0,183,'MMM',326977);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.345e0,'2025-08-08',153.67e0,153.02e0,153.63e0,184,'MMM',435766);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.325e0,'2025-08-11',155.61e0,155.005e0,155.22e0,185,'MMM',633131);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (157.84e0,'2025-08-12',158.46e0,157.33e0,157.57e0,186,'MMM',728648);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (160.2e0,'2025-08-13',160.47e0,159.4376e0,159.89e0,187,'MMM',560788);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.68e0,'2025-08-14',157.57e0,156.63e0,157.56e0,188,'MMM',454537);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.41e0,'2025-08-15',152.77e0,152.1501e0,152.7e0,189,'MMM',714241);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.81e0,'2025-08-18',152.94e0,152.7e0,152.85e0,190,'MMM',318580);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.32e0,'2025-08-19',154.39e0,153.78e0,154.05e0,191,'MMM',384257);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.73e0,'2025-08-20',155.195e0,154.59e0,154.93e0,192,'MMM',594124);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.41e0,'2025-08-21',154.67e0,154.24e0,154.625e0,193,'MMM',286388);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (158.69e0,'2025-08-22',158.83e0,158.43e0,158.45e0,194,'MMM',354694);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.86e0,'2025-08-25',156.3e0,155.8e0,156.3e0,195,'MMM',275950);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.54e0,'2025-08-26',156.72e0,155.91e0,155.97e0,196,'MMM',491782);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.58e0,'2025-08-27',157.115e0,156.58e0,156.74e0,197,'MMM',517821);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (157.56e0,'2025-08-28',157.705e0,157.09e0,157.25e0,198,'MMM',392706);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.55e0,'2025-08-29',155.85e0,155.315e0,155.76e0,199,'MMM',573519);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.23e0,'2025-09-02',154.415e0,153.95e0,154.16e0,200,'MMM',561378);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.98e0,'2025-09-03',152.34e0,151.705e0,151.72e0,201,'MMM',605583);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.5e0,'2025-09-04',155.6e0,154.88e0,154.92e0,202,'MMM',444295);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.37e0,'2025-09-05',155.61e0,154.77e0,155.485e0,203,'MMM',536087);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.975e0,'2025-09-08',154.04e0,153.34e0,153.525e0,204,'MMM',505843);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.06e0,'2025-09-09',153.25e0,152.8101e0,153.05e0,205,'MMM',301180);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.56e0,'2025-09-10',153.63e0,152.5e0,152.605e0,206,'MMM',444961);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (159.46e0,'2025-09-11',159.5e0,158.39e0,158.39e0,207,'MMM',800007);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (157.88e0,'2025-09-12',158.42e0,157.81e0,158.3e0,208,'MMM',384402);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.66e0,'2025-09-15',156.7e0,156.105e0,156.2e0,209,'MMM',438054);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.49e0,'2025-09-16',156.72e0,155.405e0,155.555e0,210,'MMM',395797);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.16e0,'2025-09-17',155.35e0,154.4e0,154.69e0,211,'MMM',428044);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.4e0,'2025-09-18',155.44e0,154.93e0,155.24e0,212,'MMM',281476);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.63e0,'2025-09-19',157.41e0,156.3e0,156.68e0,213,'MMM',779155);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.85e0,'2025-09-22',154.265e0,153.81e0,153.96e0,214,'MMM',466053);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.335e0,'2025-09-23',156.75e0,156.04e0,156.115e0,215,'MMM',376357);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.63e0,'2025-09-24',154.875e0,154.46e0,154.75e0,216,'MMM',244163);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.04e0,'2025-09-25',153.075e0,152.385e0,152.56e0,217,'MMM',417732);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.77e0,'2025-09-26',152.87e0,152.47e0,152.7e0,218,'MMM',453466);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.07e0,'2025-09-29',154.4e0,153.76e0,154.25e0,219,'MMM',276692);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.18e0,'2025-09-30',155.2e0,154.05e0,154.665e0,220,'MMM',387337);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (156.04e0,'2025-10-01',156.325e0,155.83e0,156.1885e0,221,'MMM',278105);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (158.81e0,'2025-10-02',158.89e0,158.03e0,158.85e0,222,'MMM',445635);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (158.66e0,'2025-10-03',159.0e0,158.13e0,158.65e0,223,'MMM',469071);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.94e0,'2025-10-06',156.19e0,155.475e0,155.8e0,224,'MMM',408206);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.33e0,'2025-10-07',155.75e0,155.18e0,155.455e0,225,'MMM',284945);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (155.98e0,'2025-10-08',156.09e0,155.73e0,155.805e0,226,'MMM',258694);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.88e0,'2025-10-09',152.93e0,152.11e0,152.155e0,227,'MMM',408040);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (148.8e0,'2025-10-10',149.32e0,148.455e0,149.31e0,228,'MMM',575645);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.11e0,'2025-10-13',151.41e0,150.85e0,151.22e0,229,'MMM',573108);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.49e0,'2025-10-14',153.21e0,152.14e0,153.21e0,230,'MMM',534678);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (153.49e0,'2025-10-15',153.95e0,153.21e0,153.93e0,231,'MMM',396326);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (151.41e0,'2025-10-16',151.7e0,151.18e0,151.66e0,232,'MMM',704602);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (152.67e0,'2025-10-17',152.79e0,152.41e0,152.705e0,233,'MMM',581844);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (154.81e0,'2025-10-20',156.07e0,154.59e0,156.0e0,234,'MMM',793693);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (166.67e0,'2025-10-21',166.82e0,164.8e0,164.8e0,235,'MMM',1232351);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (167.25e0,'2025-10-22',167.45e0,166.39e0,166.82e0,236,'MMM',830415);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (171.6e0,'2025-10-23',171.63e0,170.6115e0,170.78e0,237,'MMM',1117597);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (168.47e0,'2025-10-24',168.68e0,168.065e0,168.53e0,238,'MMM',692810);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (168.35e0,'2025-10-27',168.46e0,168.06e0,168.2e0,239,'MMM',529089);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (166.82e0,'2025-10-28',166.87e0,166.35e0,166.63e0,240,'MMM',510797);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (164.62e0,'2025-10-29',164.74e0,163.61e0,164.4e0,241,'MMM',678985);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (166.44e0,'2025-10-30',166.54e0,166.235e0,166.45e0,242,'MMM',421396);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (166.46e0,'2025-10-31',167.22e0,166.34e0,167.05e0,243,'MMM',384119);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (162.2e0,'2025-11-03',162.77e0,161.485e0,162.525e0,244,'MMM',805801);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (160.57e0,'2025-11-04',161.48e0,160.18e0,161.33e0,245,'MMM',634353);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (164.29e0,'2025-11-05',164.825e0,164.21e0,164.355e0,246,'MMM',667351);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (163.89e0,'2025-11-06',164.42e0,163.705e0,164.0e0,247,'MMM',435825);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (164.8e0,'2025-11-07',165.18e0,164.36e0,164.93e0,248,'MMM',470886);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (167.63e0,'2025-11-10',168.56e0,167.5e0,168.33e0,249,'MMM',482610);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (168.73e0,'2025-11-11',169.1e0,168.59e0,168.9675e0,250,'MMM',361520);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.15e0,'2024-11-12',73.355e0,73.05e0,73.28e0,1739,'AOS',347549);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.13e0,'2024-11-13',73.29e0,73.02e0,73.17e0,1740,'AOS',229786);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.0e0,'2024-11-14',73.345e0,72.92e0,73.33e0,1741,'AOS',196369);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.25e0,'2024-11-15',72.415e0,72.2e0,72.38e0,1742,'AOS',243935);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.15e0,'2024-11-18',72.26e0,72.03e0,72.16e0,1743,'AOS',207988);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.42e0,'2024-11-19',71.46e0,71.255e0,71.36e0,1744,'AOS',257523);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.76e0,'2024-11-20',71.93e0,71.58e0,71.58e0,1745,'AOS',198934);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.97e0,'2024-11-21',73.56e0,72.91e0,73.38e0,1746,'AOS',275175);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.42e0,'2024-11-22',73.57e0,73.35e0,73.41e0,1747,'AOS',140474);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (75.43e0,'2024-11-25',75.59e0,75.35e0,75.49e0,1748,'AOS',158218);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.905e0,'2024-11-26',74.18e0,73.83e0,73.91e0,1749,'AOS',181222);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (74.11e0,'2024-11-27',74.18e0,74.01e0,74.105e0,1750,'AOS',99862);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (74.56e0,'2024-11-29',74.67e0,74.47e0,74.5e0,1751,'AOS',53355);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (74.65e0,'2024-12-02',74.86e0,74.54e0,74.68e0,1752,'AOS',208012);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (74.02e0,'2024-12-03',74.07e0,73.68e0,73.81e0,1753,'AOS',254507);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.59e0,'2024-12-04',73.62e0,73.23e0,73.44e0,1754,'AOS',332780);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.32e0,'2024-12-05',72.38e0,71.98e0,72.372e0,1755,'AOS',276389);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.57e0,'2024-12-06',72.72e0,72.54e0,72.66e0,1756,'AOS',250762);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.88e0,'2024-12-09',74.17e0,73.79e0,74.09e0,1757,'AOS',340749);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.0e0,'2024-12-10',73.01e0,72.62e0,72.85e0,1758,'AOS',199560);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.85e0,'2024-12-11',73.035e0,72.7e0,72.85e0,1759,'AOS',212846);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.62e0,'2024-12-12',72.92e0,72.45e0,72.9e0,1760,'AOS',149857);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.48e0,'2024-12-13',72.565e0,72.36e0,72.48e0,1761,'AOS',195355);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.9e0,'2024-12-16',72.025e0,71.8e0,72.025e0,1762,'AOS',136959);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.82e0,'2024-12-17',71.085e0,70.76e0,71.07e0,1763,'AOS',210743);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.89e0,'2024-12-18',69.74e0,68.89e0,69.63e0,1764,'AOS',171369);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.42e0,'2024-12-19',68.82e0,68.38e0,68.745e0,1765,'AOS',267791);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.72e0,'2024-12-20',69.11e0,68.62e0,68.89e0,1766,'AOS',267862);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.54e0,'2024-12-23',68.635e0,68.365e0,68.47e0,1767,'AOS',102357);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.7e0,'2024-12-24',68.74e0,68.51e0,68.58e0,1768,'AOS',51032);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.86e0,'2024-12-26',69.02e0,68.58e0,68.62e0,1769,'AOS',149980);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.46e0,'2024-12-27',68.56e0,68.29e0,68.37e0,1770,'AOS',122162);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.03e0,'2024-12-30',68.23e0,67.93e0,68.06e0,1771,'AOS',157138);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.21e0,'2024-12-31',68.23e0,68.0e0,68.14e0,1772,'AOS',146610);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.33e0,'2025-01-02',67.58e0,67.29e0,67.495e0,1773,'AOS',197061);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.59e0,'2025-01-03',68.76e0,68.43e0,68.735e0,1774,'AOS',191098);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.9e0,'2025-01-06',68.95e0,68.585e0,68.73e0,1775,'AOS',236392);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.31e0,'2025-01-07',68.32e0,67.96e0,68.155e0,1776,'AOS',226745);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.67e0,'2025-01-08',68.7594e0,68.51e0,68.63e0,1777,'AOS',173712);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.58e0,'2025-01-10',67.62e0,67.2e0,67.415e0,1778,'AOS',285544);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.61e0,'2025-01-13',68.78e0,68.4899e0,68.53e0,1779,'AOS',200612);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.26e0,'2025-01-14',71.35e0,71.16e0,71.35e0,1780,'AOS',335903);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.93e0,'2025-01-15',71.23e0,70.895e0,71.19e0,1781,'AOS',368508);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.41e0,'2025-01-16',71.47e0,71.065e0,71.09e0,1782,'AOS',176591);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.81e0,'2025-01-17',71.9e0,71.42e0,71.5e0,1783,'AOS',294953);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.69e0,'2025-01-21',72.78e0,72.54e0,72.63e0,1784,'AOS',238902);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.99e0,'2025-01-22',71.22e0,70.93e0,71.0809e0,1785,'AOS',257523);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.27e0,'2025-01-23',71.5e0,71.26e0,71.43e0,1786,'AOS',281739);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.59e0,'2025-01-24',70.68e0,70.41e0,70.44e0,1787,'AOS',249345);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.44e0,'2025-01-27',71.59e0,71.295e0,71.59e0,1788,'AOS',225726);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.9e0,'2025-01-28',70.09e0,69.76e0,69.93e0,1789,'AOS',290023);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.22e0,'2025-01-29',69.25e0,68.9e0,69.15e0,1790,'AOS',340973);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.26e0,'2025-01-30',67.41e0,66.475e0,67.14e0,1791,'AOS',897880);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.3e0,'2025-01-31',67.45e0,67.1742e0,67.21e0,1792,'AOS',455448);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.05e0,'2025-02-03',67.13e0,66.55e0,66.55e0,1793,'AOS',402371);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.66e0,'2025-02-04',66.02e0,65.65e0,66.01e0,1794,'AOS',301131);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.62e0,'2025-02-05',65.76e0,65.545e0,65.575e0,1795,'AOS',272375);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.49e0,'2025-02-06',65.75e0,65.45e0,65.66e0,1796,'AOS',165539);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.18e0,'2025-02-07',65.43e0,65.05e0,65.26e0,1797,'AOS',170981);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.72e0,'2025-02-10',65.86e0,65.6e0,65.845e0,1798,'AOS',171492);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.97e0,'2025-02-11',66.01e0,65.75e0,65.755e0,1799,'AOS',139592);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.25e0,'2025-02-12',65.52e0,65.25e0,65.48e0,1800,'AOS',185092);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.005e0,'2025-02-13',66.08e0,65.88e0,66.015e0,1801,'AOS',285192);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.24e0,'2025-02-14',66.25e0,65.92e0,66.15e0,1802,'AOS',305213);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.73e0,'2025-02-18',65.855e0,65.6132e0,65.625e0,1803,'AOS',275457);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.37e0,'2025-02-19',67.45e0,67.13e0,67.31e0,1804,'AOS',400516);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.82e0,'2025-02-20',67.01e0,66.65e0,66.7e0,1805,'AOS',291116);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.0e0,'2025-02-21',66.055e0,65.81e0,65.88e0,1806,'AOS',212399);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.24e0,'2025-02-24',66.38e0,66.1e0,66.17e0,1807,'AOS',178120);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.98e0,'2025-02-25',67.01e0,66.56e0,67.0e0,1808,'AOS',234931);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.18e0,'2025-02-26',66.56e0,66.1e0,66.505e0,1809,'AOS',208216);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.94e0,'2025-02-27',66.21e0,65.88e0,66.08e0,1810,'AOS',146585);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.47e0,'2025-02-28',66.48e0,65.73e0,65.96e0,1811,'AOS',279580);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.37e0,'2025-03-03',66.53e0,66.145e0,66.16e0,1812,'AOS',367004);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.61e0,'2025-03-04',66.51e0,65.55e0,66.51e0,1813,'AOS',276885);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.5e0,'2025-03-05',66.68e0,66.21e0,66.68e0,1814,'AOS',350572);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.23e0,'2025-03-06',68.39e0,68.03e0,68.2e0,1815,'AOS',341632);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.41e0,'2025-03-07',69.64e0,69.22e0,69.59e0,1816,'AOS',210723);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.61e0,'2025-03-10',70.01e0,69.61e0,69.8e0,1817,'AOS',280029);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.09e0,'2025-03-11',67.62e0,67.09e0,67.53e0,1818,'AOS',293526);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.62e0,'2025-03-12',66.05e0,65.62e0,65.98e0,1819,'AOS',217043);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.47e0,'2025-03-13',65.59e0,65.31e0,65.45e0,1820,'AOS',287142);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.82e0,'2025-03-14',66.92e0,66.4901e0,66.63e0,1821,'AOS',243216);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.49e0,'2025-03-17',67.629e0,67.41e0,67.56e0,1822,'AOS',199194);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.68e0,'2025-03-18',67.75e0,67.57e0,67.69e0,1823,'AOS',209256);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.61e0,'2025-03-19',67.905e0,67.57e0,67.67e0,1824,'AOS',265835);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.7e0,'2025-03-20',66.84e0,66.6e0,66.645e0,1825,'AOS',228456);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.47e0,'2025-03-21',66.62e0,66.24e0,66.405e0,1826,'AOS',351752);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.36e0,'2025-03-24',66.54e0,66.3e0,66.51e0,1827,'AOS',282070);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.72e0,'2025-03-25',66.93e0,66.21e0,66.72e0,1828,'AOS',285893);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.33e0,'2025-03-26',67.39e0,67.21e0,67.28e0,1829,'AOS',174204);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.92e0,'2025-03-27',67.23e0,66.89e0,67.13e0,1830,'AOS',154366);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.6e0,'2025-03-28',65.9e0,65.57e0,65.86e0,1831,'AOS',158656);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.37e0,'2025-03-31',65.92e0,65.21e0,65.655e0,1832,'AOS',411251);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.59e0,'2025-04-01',65.65e0,65.26e0,65.32e0,1833,'AOS',397133);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.12e0,'2025-04-02',66.25e0,65.83e0,65.86e0,1834,'AOS',310842);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.66e0,'2025-04-03',63.93e0,63.58e0,63.84e0,1835,'AOS',307614);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (61.98e0,'2025-04-04',62.63e0,61.89e0,62.35e0,1836,'AOS',381221);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (60.66e0,'2025-04-07',60.985e0,60.23e0,60.23e0,1837,'AOS',377084);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (59.63e0,'2025-04-08',59.98e0,59.12e0,59.85e0,1838,'AOS',445799);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (62.54e0,'2025-04-09',62.825e0,61.7e0,62.28e0,1839,'AOS',555644);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (62.86e0,'2025-04-10',63.04e0,62.19e0,62.61e0,1840,'AOS',365862);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.5e0,'2025-04-11',64.705e0,64.43e0,64.57e0,1841,'AOS',348583);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.21e0,'2025-04-14',65.5e0,65.03e0,65.39e0,1842,'AOS',343728);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.86e0,'2025-04-15',64.04e0,63.72e0,64.03e0,1843,'AOS',509801);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (62.85e0,'2025-04-16',62.95e0,62.44e0,62.465e0,1844,'AOS',320161);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.13e0,'2025-04-17',63.365e0,63.02e0,63.18e0,1845,'AOS',300007);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (61.71e0,'2025-04-21',61.81e0,61.38e0,61.435e0,1846,'AOS',339162);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.95e0,'2025-04-22',64.02e0,63.74e0,63.93e0,1847,'AOS',361511);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.76e0,'2025-04-23',63.95e0,63.62e0,63.76e0,1848,'AOS',200246);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.29e0,'2025-04-24',65.57e0,65.19e0,65.3e0,1849,'AOS',275252);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.0e0,'2025-04-25',65.07e0,64.68e0,64.87e0,1850,'AOS',194487);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.8e0,'2025-04-28',65.08e0,64.5e0,64.535e0,1851,'AOS',493308);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.0e0,'2025-04-29',67.31e0,66.83e0,67.09e0,1852,'AOS',593387);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.87e0,'2025-04-30',68.22e0,67.47e0,67.495e0,1853,'AOS',345612);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.41e0,'2025-05-01',67.79e0,67.32e0,67.55e0,1854,'AOS',459397);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.45e0,'2025-05-02',68.77e0,68.39e0,68.53e0,1855,'AOS',214346);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.38e0,'2025-05-05',68.57e0,68.315e0,68.53e0,1856,'AOS',266043);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.48e0,'2025-05-06',67.695e0,67.45e0,67.63e0,1857,'AOS',268678);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.91e0,'2025-05-07',67.095e0,66.71e0,66.95e0,1858,'AOS',332484);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.99e0,'2025-05-08',68.585e0,67.93e0,68.49e0,1859,'AOS',244411);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.28e0,'2025-05-09',68.33e0,68.18e0,68.25e0,1860,'AOS',153893);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.47e0,'2025-05-12',70.49e0,70.21e0,70.26e0,1861,'AOS',231114);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.11e0,'2025-05-13',70.45e0,70.08e0,70.37e0,1862,'AOS',196316);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.34e0,'2025-05-14',68.67e0,68.29e0,68.6e0,1863,'AOS',271807);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.43e0,'2025-05-15',69.48e0,69.175e0,69.195e0,1864,'AOS',285748);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.5e0,'2025-05-16',70.54e0,70.26e0,70.32e0,1865,'AOS',366535);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.52e0,'2025-05-19',70.58e0,70.33e0,70.33e0,1866,'AOS',323907);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.59e0,'2025-05-20',69.62e0,69.46e0,69.54e0,1867,'AOS',191788);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.1e0,'2025-05-21',67.2e0,67.011e0,67.02e0,1868,'AOS',303623);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.35e0,'2025-05-22',67.599e0,67.285e0,67.49e0,1869,'AOS',308295);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.01e0,'2025-05-23',67.085e0,66.8e0,67.02e0,1870,'AOS',256033);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.569e0,'2025-05-27',68.67e0,68.23e0,68.31e0,1871,'AOS',436687);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.225e0,'2025-05-28',64.27e0,63.8e0,64.05e0,1872,'AOS',813069);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.74e0,'2025-05-29',64.81e0,64.51e0,64.75e0,1873,'AOS',498379);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.31e0,'2025-05-30',64.64e0,64.08e0,64.55e0,1874,'AOS',921681);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.01e0,'2025-06-02',63.24e0,62.89e0,63.24e0,1875,'AOS',681392);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.01e0,'2025-06-03',64.14e0,63.87e0,64.025e0,1876,'AOS',374329);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.3e0,'2025-06-04',64.63e0,64.3e0,64.57e0,1877,'AOS',308476);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.79e0,'2025-06-05',63.92e0,63.64e0,63.76e0,1878,'AOS',404319);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.35e0,'2025-06-06',64.51e0,64.32e0,64.43e0,1879,'AOS',321507);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.83e0,'2025-06-09',65.02e0,64.81e0,64.91e0,1880,'AOS',263318);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.73e0,'2025-06-10',65.8e0,65.67e0,65.74e0,1881,'AOS',260734);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.44e0,'2025-06-11',65.49e0,65.21e0,65.26e0,1882,'AOS',273946);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.2e0,'2025-06-12',64.22e0,63.98e0,64.11e0,1883,'AOS',368731);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.82e0,'2025-06-13',63.83e0,63.57e0,63.59e0,1884,'AOS',375907);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.3e0,'2025-06-16',64.37e0,64.16e0,64.22e0,1885,'AOS',280248);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.22e0,'2025-06-17',63.28e0,63.08e0,63.14e0,1886,'AOS',250194);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (63.09e0,'2025-06-18',63.25e0,63.0e0,63.12e0,1887,'AOS',234886);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (62.73e0,'2025-06-20',62.77e0,62.25e0,62.25e0,1888,'AOS',440053);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.135e0,'2025-06-23',64.15e0,63.77e0,63.88e0,1889,'AOS',314681);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.94e0,'2025-06-24',64.983e0,64.775e0,64.97e0,1890,'AOS',212954);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.055e0,'2025-06-25',65.11e0,64.895e0,65.085e0,1891,'AOS',287829);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (64.66e0,'2025-06-26',64.735e0,64.47e0,64.61e0,1892,'AOS',208526);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.64e0,'2025-06-27',65.69e0,65.18e0,65.245e0,1893,'AOS',412110);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.565e0,'2025-06-30',65.79e0,65.55e0,65.62e0,1894,'AOS',283493);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.76e0,'2025-07-01',67.93e0,67.64e0,67.92e0,1895,'AOS',178289);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.09e0,'2025-07-02',68.12e0,67.87e0,67.895e0,1896,'AOS',269658);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.855e0,'2025-07-03',67.955e0,67.76e0,67.8e0,1897,'AOS',84252);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.07e0,'2025-07-07',68.11e0,67.87e0,67.9266e0,1898,'AOS',346646);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.45e0,'2025-07-08',68.62e0,68.375e0,68.515e0,1899,'AOS',292556);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.48e0,'2025-07-09',69.655e0,69.375e0,69.42e0,1900,'AOS',268605);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.45e0,'2025-07-10',71.0e0,70.39e0,70.96e0,1901,'AOS',356218);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.06e0,'2025-07-11',69.33e0,69.06e0,69.285e0,1902,'AOS',207739);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.84e0,'2025-07-14',68.9699e0,68.82e0,68.92e0,1903,'AOS',212395);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.23e0,'2025-07-15',67.59e0,67.16e0,67.57e0,1904,'AOS',233746);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.05e0,'2025-07-16',68.085e0,67.8e0,67.97e0,1905,'AOS',423171);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.75e0,'2025-07-17',70.795e0,70.53e0,70.53e0,1906,'AOS',456028);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.31e0,'2025-07-18',70.34e0,69.9e0,70.04e0,1907,'AOS',439235);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.07e0,'2025-07-21',69.32e0,69.03e0,69.3e0,1908,'AOS',420603);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.09e0,'2025-07-22',71.15e0,70.86e0,70.925e0,1909,'AOS',358641);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.31e0,'2025-07-23',71.54e0,71.24e0,71.25e0,1910,'AOS',352247);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.97e0,'2025-07-24',74.68e0,73.93e0,74.68e0,1911,'AOS',721290);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.05e0,'2025-07-25',72.235e0,71.87e0,71.91e0,1912,'AOS',414854);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.035e0,'2025-07-28',71.195e0,70.93e0,71.16e0,1913,'AOS',369356);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.65e0,'2025-07-29',71.72e0,71.38e0,71.49e0,1914,'AOS',325388);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.84e0,'2025-07-30',70.875e0,70.3175e0,70.52e0,1915,'AOS',335883);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.8e0,'2025-07-31',70.99e0,70.71e0,70.75e0,1916,'AOS',382878);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.43e0,'2025-08-01',70.57e0,70.24e0,70.57e0,1917,'AOS',333140);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.33e0,'2025-08-04',70.39e0,70.27e0,70.33e0,1918,'AOS',166386);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.3e0,'2025-08-05',70.35e0,70.0e0,70.03e0,1919,'AOS',253256);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.57e0,'2025-08-06',70.83e0,70.54e0,70.8e0,1920,'AOS',224841);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.64e0,'2025-08-07',70.66e0,70.38e0,70.5e0,1921,'AOS',176007);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.84e0,'2025-08-08',70.84e0,70.62e0,70.73e0,1922,'AOS',374715);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.53e0,'2025-08-11',70.56e0,70.37e0,70.45e0,1923,'AOS',151394);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.35e0,'2025-08-12',71.42e0,71.1e0,71.11e0,1924,'AOS',276732);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.66e0,'2025-08-13',73.81e0,73.61e0,73.61e0,1925,'AOS',260410);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.52e0,'2025-08-14',72.58e0,72.32e0,72.39e0,1926,'AOS',230045);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.22e0,'2025-08-15',72.33e0,72.09e0,72.29e0,1927,'AOS',226425);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.16e0,'2025-08-18',72.355e0,72.105e0,72.19e0,1928,'AOS',205755);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.82e0,'2025-08-19',72.8925e0,72.76e0,72.885e0,1929,'AOS',145528);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.87e0,'2025-08-20',72.15e0,71.845e0,72.15e0,1930,'AOS',188514);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.74e0,'2025-08-21',71.84e0,71.65e0,71.83e0,1931,'AOS',99090);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.61e0,'2025-08-22',73.66e0,73.49e0,73.49e0,1932,'AOS',129655);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.53e0,'2025-08-25',72.66e0,72.4e0,72.44e0,1933,'AOS',138026);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.36e0,'2025-08-26',72.53e0,72.21e0,72.475e0,1934,'AOS',258477);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.39e0,'2025-08-27',72.6e0,72.39e0,72.42e0,1935,'AOS',263943);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.61e0,'2025-08-28',71.77e0,71.45e0,71.59e0,1936,'AOS',254515);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.29e0,'2025-08-29',71.42e0,71.02e0,71.13e0,1937,'AOS',234331);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.36e0,'2025-09-02',70.58e0,70.3e0,70.535e0,1938,'AOS',262006);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (70.78e0,'2025-09-03',70.81e0,70.52e0,70.52e0,1939,'AOS',350323);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.64e0,'2025-09-04',72.64e0,72.23e0,72.27e0,1940,'AOS',283738);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.7e0,'2025-09-05',73.72e0,73.36e0,73.47e0,1941,'AOS',350750);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.96e0,'2025-09-08',73.97e0,73.54e0,73.6e0,1942,'AOS',234342);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.0e0,'2025-09-09',72.16e0,71.81e0,71.89e0,1943,'AOS',241559);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.49e0,'2025-09-10',72.54e0,72.36e0,72.36e0,1944,'AOS',310626);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (74.3e0,'2025-09-11',74.41e0,73.83e0,73.84e0,1945,'AOS',306117);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.55e0,'2025-09-12',72.96e0,72.53e0,72.94e0,1946,'AOS',205254);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.27e0,'2025-09-15',73.43e0,72.97e0,73.115e0,1947,'AOS',196198);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.605e0,'2025-09-16',73.71e0,73.21e0,73.34e0,1948,'AOS',208952);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.15e0,'2025-09-17',73.36e0,72.915e0,73.05e0,1949,'AOS',207136);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.06e0,'2025-09-18',73.26e0,72.97e0,73.095e0,1950,'AOS',212857);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.09e0,'2025-09-19',73.385e0,72.98e0,73.19e0,1951,'AOS',278085);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.26e0,'2025-09-22',72.51e0,72.26e0,72.34e0,1952,'AOS',205426);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.17e0,'2025-09-23',72.32e0,71.83e0,71.85e0,1953,'AOS',149939);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.97e0,'2025-09-24',72.23e0,71.96e0,72.165e0,1954,'AOS',142215);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.4e0,'2025-09-25',71.535e0,71.2261e0,71.23e0,1955,'AOS',161838);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.45e0,'2025-09-26',72.55e0,72.25e0,72.27e0,1956,'AOS',140301);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.745e0,'2025-09-29',72.98e0,72.66e0,72.96e0,1957,'AOS',189746);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.42e0,'2025-09-30',73.56e0,73.32e0,73.38e0,1958,'AOS',203755);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.1e0,'2025-10-01',73.28e0,73.07e0,73.2e0,1959,'AOS',245219);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.54e0,'2025-10-02',73.615e0,73.35e0,73.56e0,1960,'AOS',207251);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (73.33e0,'2025-10-03',73.56e0,73.3e0,73.48e0,1961,'AOS',127705);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (72.42e0,'2025-10-06',72.67e0,72.295e0,72.32e0,1962,'AOS',161537);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.39e0,'2025-10-07',71.61e0,71.37e0,71.4e0,1963,'AOS',179194);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.07e0,'2025-10-08',71.19e0,70.92e0,70.98e0,1964,'AOS',153225);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.73e0,'2025-10-09',70.05e0,69.72e0,69.82e0,1965,'AOS',203803);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.74e0,'2025-10-10',68.24e0,67.67e0,67.92e0,1966,'AOS',278063);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (67.685e0,'2025-10-13',67.86e0,67.66e0,67.81e0,1967,'AOS',213323);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.84e0,'2025-10-14',69.04e0,68.54e0,69.0e0,1968,'AOS',262388);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.22e0,'2025-10-15',69.355e0,69.09e0,69.22e0,1969,'AOS',325192);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.36e0,'2025-10-16',69.48e0,69.25e0,69.29e0,1970,'AOS',244206);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.71e0,'2025-10-17',69.86e0,69.59e0,69.62e0,1971,'AOS',251696);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.81e0,'2025-10-20',69.99e0,69.8e0,69.87e0,1972,'AOS',238149);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (71.01e0,'2025-10-21',71.031e0,70.6525e0,70.7e0,1973,'AOS',337629);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.21e0,'2025-10-22',68.6e0,68.12e0,68.27e0,1974,'AOS',321199);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (69.04e0,'2025-10-23',69.355e0,68.97e0,69.045e0,1975,'AOS',168934);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.9e0,'2025-10-24',69.1e0,68.88e0,68.98e0,1976,'AOS',323743);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (68.61e0,'2025-10-27',68.78e0,68.57e0,68.59e0,1977,'AOS',364127);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.84e0,'2025-10-28',67.39e0,66.76e0,67.29e0,1978,'AOS',540474);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.61e0,'2025-10-29',65.7e0,65.06e0,65.2e0,1979,'AOS',407741);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.71e0,'2025-10-30',66.84e0,66.63e0,66.7e0,1980,'AOS',356233);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.0e0,'2025-10-31',66.14e0,65.882e0,66.102e0,1981,'AOS',364397);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.67e0,'2025-11-03',65.77e0,65.51e0,65.56e0,1982,'AOS',298595);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.16e0,'2025-11-04',65.35e0,65.11e0,65.29e0,1983,'AOS',265184);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.04e0,'2025-11-05',66.19e0,65.98e0,66.0175e0,1984,'AOS',261218);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.6e0,'2025-11-06',65.88e0,65.575e0,65.75e0,1985,'AOS',262430);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.27e0,'2025-11-07',66.27e0,65.94e0,65.97e0,1986,'AOS',214100);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (66.17e0,'2025-11-10',66.34e0,66.125e0,66.225e0,1987,'AOS',194290);
-INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES (65.78e0,'2025-11-11',65.91e0,65.71e0,65.735e0,1988,'AOS',229607);
+INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES
+('andrethomas@example.org','oo99A+a1gYf7BBCtJyX10QKLmb8HU3bngUgdV1kxn7s=','Renee','Wright'),
+('hortonpaul@example.com','O4GWQryyyhUlHrCgXxIYXAOsj4x9YMUqgnokKOdjcMM=','David','Clark'),
+('qbarron@example.org','U1s2AagrISKZXn6j1I/MctZhvvxyD//mRF3MRnuUFc4=','Patricia','Holland'),
+('kristinarobinson@example.org','D9vsFprj3JXeTl/bLUy2FzP+yZtfgIeC2aZ3xGpN8pc=','James','Scott'),
+('cjordan@example.org','raWyWAm/lI+alW83GPma7DRmHZ6LOYTenBjHVJodZFQ=','Ronald','Burke'),
+('uanderson@example.net','vYIGZUvYqJPTguICAAG051hQ9XFmEXDeO79isSG0ARo=','Randall','Jackson'),
+('dgrant@example.org','N3UIxj3wivgElTA2nSp1sZMazjuZmpzlSXFTDJJJxUM=','Derrick','Olsen'),
+('hamptonkenneth@example.org','mmDP7D42WQtB9u0s/GBZdZfE6t4xXOFxSEG2mPWJLoQ=','George','Henderson'),
+('castillomatthew@example.net','8R/0KDxVWOIOYFAIYlr97g1MfcFfDLCSPX4ykFubCoE=','Kenneth','Molina'),
+('kimberlypadilla@example.org','UGvyaLAFSD0hypP3JYvqRtomsq2Z4YZXPWnyOvx/ngc=','Clinton','Harris');
 
+INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES
+('Agilent Technologies','California','Life Sciences Tools & Services','Health Care','A'),
+('Apple Inc.','California','Technology Hardware, Storage & Peripherals','Information Technology','AAPL'),
+('AbbVie','Illinois','Biotechnology','Health Care','ABBV'),
+('Airbnb','California','Hotels, Resorts & Cruise Lines','Consumer Discretionary','ABNB'),
+('Abbott Laboratories','Illinois','Health Care Equipment','Health Care','ABT'),
+('Arch Capital Group','Bermuda','Property & Casualty Insurance','Financials','ACGL'),
+('Accenture','Ireland','IT Consulting & Other Services','Information Technology','ACN'),
+('Adobe Inc.','California','Application Software','Information Technology','ADBE'),
+('Analog Devices','Massachusetts','Semiconductors','Information Technology','ADI'),
+('Archer Daniels Midland','Illinois','Agricultural Products & Services','Consumer Staples','ADM'),
+('Automatic Data Processing','New Jersey','Human Resource & Employment Services','Industrials','ADP'),
+('Autodesk','California','Application Software','Information Technology','ADSK'),
+('Ameren','Missouri','Multi-Utilities','Utilities','AEE'),
+('American Electric Power','Ohio','Electric Utilities','Utilities','AEP'),
+('AES Corporation','Virginia','Independent Power Producers & Energy Traders','Utilities','AES'),
+('Aflac','Georgia','Life & Health Insurance','Financials','AFL'),
+('American International Group','New York','Multi-line Insurance','Financials','AIG'),
+('Assurant','Georgia','Multi-line Insurance','Financials','AIZ'),
+('Arthur J. Gallagher & Co.','Illinois','Insurance Brokers','Financials','AJG'),
+('Akamai Technologies','Massachusetts','Internet Services & Infrastructure','Information Technology','AKAM'),
+('Albemarle Corporation','North Carolina','Specialty Chemicals','Materials','ALB'),
+('Align Technology','Arizona','Health Care Supplies','Health Care','ALGN'),
+('Allstate','Illinois','Property & Casualty Insurance','Financials','ALL'),
+('Allegion','Ireland','Building Products','Industrials','ALLE'),
+('Applied Materials','California','Semiconductor Materials & Equipment','Information Technology','AMAT'),
+('Amcor','United Kingdom','Paper & Plastic Packaging Products & Materials','Materials','AMCR'),
+('Advanced Micro Devices','California','Semiconductors','Information Technology','AMD'),
+('Ametek','Pennsylvania','Electrical Components & Equipment','Industrials','AME'),
+('Amgen','California','Biotechnology','Health Care','AMGN'),
+('Ameriprise Financial','Minnesota','Asset Management & Custody Banks','Financials','AMP'),
+('American Tower','Massachusetts','Telecom Tower REITs','Real Estate','AMT'),
+('Amazon','Washington','Broadline Retail','Consumer Discretionary','AMZN'),
+('Arista Networks','California','Communications Equipment','Information Technology','ANET'),
+('Aon plc','United Kingdom','Insurance Brokers','Financials','AON'),
+('A. O. Smith','Wisconsin','Building Products','Industrials','AOS'),
+('APA Corporation','Texas','Oil & Gas Exploration & Production','Energy','APA'),
+('Air Products','Pennsylvania','Industrial Gases','Materials','APD'),
+('Amphenol','Connecticut','Electronic Components','Information Technology','APH'),
+('Apollo Global Management','New York','Asset Management & Custody Banks','Financials','APO'),
+('AppLovin','California','Application Software','Information Technology','APP'),
+('Aptiv','Ireland','Automotive Parts & Equipment','Consumer Discretionary','APTV'),
+('Alexandria Real Estate Equities','California','Office REITs','Real Estate','ARE'),
+('Atmos Energy','Texas','Gas Utilities','Utilities','ATO'),
+('AvalonBay Communities','Virginia','Multi-Family Residential REITs','Real Estate','AVB'),
+('Broadcom','California','Semiconductors','Information Technology','AVGO'),
+('Avery Dennison','Ohio','Paper & Plastic Packaging Products & Materials','Materials','AVY'),
+('American Water Works','New Jersey','Water Utilities','Utilities','AWK'),
+('Axon Enterprise','Arizona','Aerospace & Defense','Industrials','AXON'),
+('American Express','New York','Consumer Finance','Financials','AXP'),
+('AutoZone','Tennessee','Automotive Retail','Consumer Discretionary','AZO'),
+('Boeing','Virginia','Aerospace & Defense','Industrials','BA'),
+('Bank of America','North Carolina','Diversified Banks','Financials','BAC'),
+('Ball Corporation','Colorado','Metal, Glass & Plastic Containers','Materials','BALL'),
+('Baxter International','Illinois','Health Care Equipment','Health Care','BAX'),
+('Best Buy','Minnesota','Computer & Electronics Retail','Consumer Discretionary','BBY'),
+('Becton Dickinson','New Jersey','Health Care Equipment','Health Care','BDX'),
+('Franklin Resources','California','Asset Management & Custody Banks','Financials','BEN'),
+('Brown–Forman','Kentucky','Distillers & Vintners','Consumer Staples','BF-B'),
+('Bunge Global','Missouri','Agricultural Products & Services','Consumer Staples','BG'),
+('Biogen','Massachusetts','Biotechnology','Health Care','BIIB'),
+('BNY Mellon','New York','Asset Management & Custody Banks','Financials','BK'),
+('Booking Holdings','Connecticut','Hotels, Resorts & Cruise Lines','Consumer Discretionary','BKNG'),
+('Baker Hughes','Texas','Oil & Gas Equipment & Services','Energy','BKR'),
+('Builders FirstSource','Texas','Building Products','Industrials','BLDR'),
+('BlackRock','New York','Asset Management & Custody Banks','Financials','BLK'),
+('Bristol Myers Squibb','New York','Pharmaceuticals','Health Care','BMY'),
+('Broadridge Financial Solutions','New York','Data Processing & Outsourced Services','Industrials','BR'),
+('Berkshire Hathaway','Nebraska','Multi-Sector Holdings','Financials','BRK-B'),
+('Brown & Brown','Florida','Insurance Brokers','Financials','BRO'),
+('Boston Scientific','Massachusetts','Health Care Equipment','Health Care','BSX'),
+('Blackstone Inc.','New York','Asset Management & Custody Banks','Financials','BX'),
+('BXP, Inc.','Massachusetts','Office REITs','Real Estate','BXP'),
+('Citigroup','New York','Diversified Banks','Financials','C'),
+('Conagra Brands','Illinois','Packaged Foods & Meats','Consumer Staples','CAG'),
+('Cardinal Health','Ohio','Health Care Distributors','Health Care','CAH'),
+('Carrier Global','Florida','Building Products','Industrials','CARR'),
+('Caterpillar Inc.','Texas','Construction Machinery & Heavy Transportation Equipment','Industrials','CAT'),
+('Chubb Limited','Switzerland','Property & Casualty Insurance','Financials','CB'),
+('Cboe Global Markets','Illinois','Financial Exchanges & Data','Financials','CBOE'),
+('CBRE Group','Texas','Real Estate Services','Real Estate','CBRE'),
+('Crown Castle','Texas','Telecom Tower REITs','Real Estate','CCI'),
+('Carnival','Florida','Hotels, Resorts & Cruise Lines','Consumer Discretionary','CCL'),
+('Cadence Design Systems','California','Application Software','Information Technology','CDNS'),
+('CDW Corporation','Illinois','Technology Distributors','Information Technology','CDW'),
+('Constellation Energy','Maryland','Electric Utilities','Utilities','CEG'),
+('CF Industries','Illinois','Fertilizers & Agricultural Chemicals','Materials','CF'),
+('Citizens Financial Group','Rhode Island','Regional Banks','Financials','CFG'),
+('Church & Dwight','New Jersey','Household Products','Consumer Staples','CHD'),
+('C.H. Robinson','Minnesota','Air Freight & Logistics','Industrials','CHRW'),
+('Charter Communications','Connecticut','Cable & Satellite','Communication Services','CHTR'),
+('Cigna','Connecticut','Health Care Services','Health Care','CI'),
+('Cincinnati Financial','Ohio','Property & Casualty Insurance','Financials','CINF'),
+('Colgate-Palmolive','New York','Household Products','Consumer Staples','CL'),
+('Clorox','California','Household Products','Consumer Staples','CLX'),
+('Comcast','Pennsylvania','Cable & Satellite','Communication Services','CMCSA'),
+('CME Group','Illinois','Financial Exchanges & Data','Financials','CME'),
+('Chipotle Mexican Grill','California','Restaurants','Consumer Discretionary','CMG'),
+('Cummins','Indiana','Construction Machinery & Heavy Transportation Equipment','Industrials','CMI'),
+('CMS Energy','Michigan','Multi-Utilities','Utilities','CMS'),
+('Centene Corporation','Missouri','Managed Health Care','Health Care','CNC'),
+('CenterPoint Energy','Texas','Multi-Utilities','Utilities','CNP'),
+('Capital One','Virginia','Consumer Finance','Financials','COF'),
+('Coinbase','New York','Financial Exchanges & Data','Financials','COIN'),
+('Cooper Companies (The)','California','Health Care Supplies','Health Care','COO'),
+('ConocoPhillips','Texas','Oil & Gas Exploration & Production','Energy','COP'),
+('Cencora','Pennsylvania','Health Care Distributors','Health Care','COR'),
+('Costco','Washington','Consumer Staples Merchandise Retail','Consumer Staples','COST'),
+('Corpay','Georgia','Transaction & Payment Processing Services','Financials','CPAY'),
+('Campbell\'s Company (The)','New Jersey','Packaged Foods & Meats','Consumer Staples','CPB'),
+('Copart','Texas','Diversified Support Services','Industrials','CPRT'),
+('Camden Property Trust','Texas','Multi-Family Residential REITs','Real Estate','CPT'),
+('Charles River Laboratories','Massachusetts','Life Sciences Tools & Services','Health Care','CRL'),
+('Salesforce','California','Application Software','Information Technology','CRM'),
+('CrowdStrike','Texas','Systems Software','Information Technology','CRWD'),
+('Cisco','California','Communications Equipment','Information Technology','CSCO'),
+('CoStar Group','D.C.','Real Estate Services','Real Estate','CSGP'),
+('CSX Corporation','Florida','Rail Transportation','Industrials','CSX'),
+('Cintas','Ohio','Diversified Support Services','Industrials','CTAS'),
+('Coterra','Texas','Oil & Gas Exploration & Production','Energy','CTRA'),
+('Cognizant','New Jersey','IT Consulting & Other Services','Information Technology','CTSH'),
+('Corteva','Indiana','Fertilizers & Agricultural Chemicals','Materials','CTVA'),
+('CVS Health','Rhode Island','Health Care Services','Health Care','CVS'),
+('Chevron Corporation','Texas','Integrated Oil & Gas','Energy','CVX'),
+('Dominion Energy','Virginia','Multi-Utilities','Utilities','D'),
+('Delta Air Lines','Georgia','Passenger Airlines','Industrials','DAL'),
+('DoorDash','California','Specialized Consumer Services','Consumer Discretionary','DASH'),
+('Dayforce','Minnesota','Human Resource & Employment Services','Industrials','DAY'),
+('DuPont','Delaware','Specialty Chemicals','Materials','DD'),
+('Datadog','New York','Application Software','Information Technology','DDOG'),
+('Deere & Company','Illinois','Agricultural & Farm Machinery','Industrials','DE'),
+('Deckers Brands','California','Footwear','Consumer Discretionary','DECK'),
+('Dell Technologies','Texas','Technology Hardware, Storage & Peripherals','Information Technology','DELL'),
+('Dollar General','Tennessee','Consumer Staples Merchandise Retail','Consumer Staples','DG'),
+('Quest Diagnostics','New Jersey','Health Care Services','Health Care','DGX'),
+('D. R. Horton','Texas','Homebuilding','Consumer Discretionary','DHI'),
+('Danaher Corporation','D.C.','Life Sciences Tools & Services','Health Care','DHR'),
+('Walt Disney Company (The)','California','Movies & Entertainment','Communication Services','DIS'),
+('Digital Realty','Texas','Data Center REITs','Real Estate','DLR'),
+('Dollar Tree','Virginia','Consumer Staples Merchandise Retail','Consumer Staples','DLTR'),
+('Healthpeak Properties','Colorado','Health Care REITs','Real Estate','DOC'),
+('Dover Corporation','Illinois','Industrial Machinery & Supplies & Components','Industrials','DOV'),
+('Dow Inc.','Michigan','Commodity Chemicals','Materials','DOW'),
+('Domino\'s','Michigan','Restaurants','Consumer Discretionary','DPZ'),
+('Darden Restaurants','Florida','Restaurants','Consumer Discretionary','DRI'),
+('DTE Energy','Michigan','Multi-Utilities','Utilities','DTE'),
+('Duke Energy','North Carolina','Electric Utilities','Utilities','DUK'),
+('DaVita','Colorado','Health Care Services','Health Care','DVA'),
+('Devon Energy','Oklahoma','Oil & Gas Exploration & Production','Energy','DVN'),
+('Dexcom','California','Health Care Equipment','Health Care','DXCM'),
+('Electronic Arts','California','Interactive Home Entertainment','Communication Services','EA'),
+('eBay Inc.','California','Broadline Retail','Consumer Discretionary','EBAY'),
+('Ecolab','Minnesota','Specialty Chemicals','Materials','ECL'),
+('Consolidated Edison','New York','Multi-Utilities','Utilities','ED'),
+('Equifax','Georgia','Research & Consulting Services','Industrials','EFX'),
+('Everest Group','Bermuda','Reinsurance','Financials','EG'),
+('Edison International','California','Electric Utilities','Utilities','EIX'),
+('Estée Lauder Companies (The)','New York','Personal Care Products','Consumer Staples','EL'),
+('Elevance Health','Indiana','Managed Health Care','Health Care','ELV'),
+('Emcor','Connecticut','Construction & Engineering','Industrials','EME'),
+('Emerson Electric','Missouri','Electrical Components & Equipment','Industrials','EMR'),
+('EOG Resources','Texas','Oil & Gas Exploration & Production','Energy','EOG'),
+('EPAM Systems','Pennsylvania','IT Consulting & Other Services','Information Technology','EPAM'),
+('Equinix','California','Data Center REITs','Real Estate','EQIX'),
+('Equity Residential','Illinois','Multi-Family Residential REITs','Real Estate','EQR'),
+('EQT Corporation','Pennsylvania','Oil & Gas Exploration & Production','Energy','EQT'),
+('Erie Indemnity','Pennsylvania','Insurance Brokers','Financials','ERIE'),
+('Eversource Energy','Connecticut','Electric Utilities','Utilities','ES'),
+('Essex Property Trust','California','Multi-Family Residential REITs','Real Estate','ESS'),
+('Eaton Corporation','Ireland','Electrical Components & Equipment','Industrials','ETN'),
+('Entergy','Louisiana','Electric Utilities','Utilities','ETR'),
+('Evergy','Missouri','Electric Utilities','Utilities','EVRG'),
+('Edwards Lifesciences','California','Health Care Equipment','Health Care','EW'),
+('Exelon','Illinois','Electric Utilities','Utilities','EXC'),
+('Expand Energy','Oklahoma','Oil & Gas Exploration & Production','Energy','EXE'),
+('Expeditors International','Washington','Air Freight & Logistics','Industrials','EXPD'),
+('Expedia Group','Washington','Hotels, Resorts & Cruise Lines','Consumer Discretionary','EXPE'),
+('Extra Space Storage','Utah','Self-Storage REITs','Real Estate','EXR'),
+('Ford Motor Company','Michigan','Automobile Manufacturers','Consumer Discretionary','F'),
+('Diamondback Energy','Texas','Oil & Gas Exploration & Production','Energy','FANG'),
+('Fastenal','Minnesota','Trading Companies & Distributors','Industrials','FAST'),
+('Freeport-McMoRan','Arizona','Copper','Materials','FCX'),
+('FactSet','Connecticut','Financial Exchanges & Data','Financials','FDS'),
+('FedEx','Tennessee','Air Freight & Logistics','Industrials','FDX'),
+('FirstEnergy','Ohio','Electric Utilities','Utilities','FE'),
+('F5, Inc.','Washington','Communications Equipment','Information Technology','FFIV'),
+('Fair Isaac','Montana','Application Software','Information Technology','FICO'),
+('Fidelity National Information Services','Florida','Transaction & Payment Processing Services','Financials','FIS'),
+('Fiserv','Wisconsin','Transaction & Payment Processing Services','Financials','FISV'),
+('Fifth Third Bancorp','Ohio','Regional Banks','Financials','FITB'),
+('Fox Corporation (Class B)','New York','Broadcasting','Communication Services','FOX'),
+('Fox Corporation (Class A)','New York','Broadcasting','Communication Services','FOXA'),
+('Federal Realty Investment Trust','Maryland','Retail REITs','Real Estate','FRT'),
+('First Solar','Arizona','Semiconductors','Information Technology','FSLR'),
+('Fortinet','California','Systems Software','Information Technology','FTNT'),
+('Fortive','Washington','Industrial Machinery & Supplies & Components','Industrials','FTV'),
+('General Dynamics','Virginia','Aerospace & Defense','Industrials','GD'),
+('GoDaddy','Arizona','Internet Services & Infrastructure','Information Technology','GDDY'),
+('GE Aerospace','Ohio','Aerospace & Defense','Industrials','GE'),
+('GE HealthCare','Illinois','Health Care Equipment','Health Care','GEHC'),
+('Gen Digital','Arizona','Systems Software','Information Technology','GEN'),
+('GE Vernova','Massachusetts','Heavy Electrical Equipment','Industrials','GEV'),
+('Gilead Sciences','California','Biotechnology','Health Care','GILD'),
+('General Mills','Minnesota','Packaged Foods & Meats','Consumer Staples','GIS'),
+('Globe Life','Texas','Life & Health Insurance','Financials','GL'),
+('Corning Inc.','New York','Electronic Components','Information Technology','GLW'),
+('General Motors','Michigan','Automobile Manufacturers','Consumer Discretionary','GM'),
+('Generac','Wisconsin','Electrical Components & Equipment','Industrials','GNRC'),
+('Alphabet Inc. (Class C)','California','Interactive Media & Services','Communication Services','GOOG'),
+('Alphabet Inc. (Class A)','California','Interactive Media & Services','Communication Services','GOOGL'),
+('Genuine Parts Company','Georgia','Distributors','Consumer Discretionary','GPC'),
+('Global Payments','Georgia','Transaction & Payment Processing Services','Financials','GPN'),
+('Garmin','Switzerland','Consumer Electronics','Consumer Discretionary','GRMN'),
+('Goldman Sachs','New York','Investment Banking & Brokerage','Financials','GS'),
+('W. W. Grainger','Illinois','Industrial Machinery & Supplies & Components','Industrials','GWW'),
+('Halliburton','Texas','Oil & Gas Equipment & Services','Energy','HAL'),
+('Hasbro','Rhode Island','Leisure Products','Consumer Discretionary','HAS'),
+('Huntington Bancshares','Michigan','Regional Banks','Financials','HBAN'),
+('HCA Healthcare','Tennessee','Health Care Facilities','Health Care','HCA'),
+('Home Depot (The)','Georgia','Home Improvement Retail','Consumer Discretionary','HD'),
+('Hartford (The)','Connecticut','Property & Casualty Insurance','Financials','HIG'),
+('Huntington Ingalls Industries','Virginia','Aerospace & Defense','Industrials','HII'),
+('Hilton Worldwide','Virginia','Hotels, Resorts & Cruise Lines','Consumer Discretionary','HLT'),
+('Hologic','Massachusetts','Health Care Equipment','Health Care','HOLX'),
+('Honeywell','North Carolina','Industrial Conglomerates','Industrials','HON'),
+('Robinhood Markets','California','Investment Banking & Brokerage','Financials','HOOD'),
+('Hewlett Packard Enterprise','Texas','Technology Hardware, Storage & Peripherals','Information Technology','HPE'),
+('HP Inc.','California','Technology Hardware, Storage & Peripherals','Information Technology','HPQ'),
+('Hormel Foods','Minnesota','Packaged Foods & Meats','Consumer Staples','HRL'),
+('Henry Schein','New York','Health Care Distributors','Health Care','HSIC'),
+('Host Hotels & Resorts','Maryland','Hotel & Resort REITs','Real Estate','HST'),
+('Hershey Company (The)','Pennsylvania','Packaged Foods & Meats','Consumer Staples','HSY'),
+('Hubbell Incorporated','Connecticut','Industrial Machinery & Supplies & Components','Industrials','HUBB'),
+('Humana','Kentucky','Managed Health Care','Health Care','HUM'),
+('Howmet Aerospace','Pennsylvania','Aerospace & Defense','Industrials','HWM'),
+('Interactive Brokers','Connecticut','Investment Banking & Brokerage','Financials','IBKR'),
+('IBM','New York','IT Consulting & Other Services','Information Technology','IBM'),
+('Intercontinental Exchange','Georgia','Financial Exchanges & Data','Financials','ICE'),
+('Idexx Laboratories','Maine','Health Care Equipment','Health Care','IDXX'),
+('IDEX Corporation','Illinois','Industrial Machinery & Supplies & Components','Industrials','IEX'),
+('International Flavors & Fragrances','New York','Specialty Chemicals','Materials','IFF'),
+('Incyte','Delaware','Biotechnology','Health Care','INCY'),
+('Intel','California','Semiconductors','Information Technology','INTC'),
+('Intuit','California','Application Software','Information Technology','INTU'),
+('Invitation Homes','Texas','Single-Family Residential REITs','Real Estate','INVH'),
+('International Paper','Tennessee','Paper & Plastic Packaging Products & Materials','Materials','IP'),
+('Interpublic Group of Companies (The)','New York','Advertising','Communication Services','IPG'),
+('IQVIA','North Carolina','Life Sciences Tools & Services','Health Care','IQV'),
+('Ingersoll Rand','North Carolina','Industrial Machinery & Supplies & Components','Industrials','IR'),
+('Iron Mountain','New Hampshire','Other Specialized REITs','Real Estate','IRM'),
+('Intuitive Surgical','California','Health Care Equipment','Health Care','ISRG'),
+('Gartner','Connecticut','IT Consulting & Other Services','Information Technology','IT'),
+('Illinois Tool Works','Illinois','Industrial Machinery & Supplies & Components','Industrials','ITW'),
+('Invesco','Georgia','Asset Management & Custody Banks','Financials','IVZ'),
+('Jacobs Solutions','Texas','Construction & Engineering','Industrials','J'),
+('J.B. Hunt','Arkansas','Cargo Ground Transportation','Industrials','JBHT'),
+('Jabil','Florida','Electronic Manufacturing Services','Information Technology','JBL'),
+('Johnson Controls','Ireland','Building Products','Industrials','JCI'),
+('Jack Henry & Associates','Missouri','Transaction & Payment Processing Services','Financials','JKHY'),
+('Johnson & Johnson','New Jersey','Pharmaceuticals','Health Care','JNJ'),
+('JPMorgan Chase','New York','Diversified Banks','Financials','JPM'),
+('Kellanova','Illinois','Packaged Foods & Meats','Consumer Staples','K'),
+('Keurig Dr Pepper','Massachusetts','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','KDP'),
+('KeyCorp','Ohio','Regional Banks','Financials','KEY'),
+('Keysight Technologies','California','Electronic Equipment & Instruments','Information Technology','KEYS'),
+('Kraft Heinz','Pennsylvania','Packaged Foods & Meats','Consumer Staples','KHC'),
+('Kimco Realty','New York','Retail REITs','Real Estate','KIM'),
+('KKR & Co.','New York','Asset Management & Custody Banks','Financials','KKR'),
+('KLA Corporation','California','Semiconductor Materials & Equipment','Information Technology','KLAC'),
+('Kimberly-Clark','Texas','Household Products','Consumer Staples','KMB'),
+('Kinder Morgan','Texas','Oil & Gas Storage & Transportation','Energy','KMI'),
+('Coca-Cola Company (The)','Georgia','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','KO'),
+('Kroger','Ohio','Food Retail','Consumer Staples','KR'),
+('Kenvue','New Jersey','Personal Care Products','Consumer Staples','KVUE'),
+('Loews Corporation','New York','Multi-line Insurance','Financials','L'),
+('Leidos','Virginia','Diversified Support Services','Industrials','LDOS'),
+('Lennar','Florida','Homebuilding','Consumer Discretionary','LEN'),
+('Labcorp','North Carolina','Health Care Services','Health Care','LH'),
+('L3Harris','Florida','Aerospace & Defense','Industrials','LHX'),
+('Lennox International','Texas','Building Products','Industrials','LII'),
+('Linde plc','United Kingdom','Industrial Gases','Materials','LIN'),
+('LKQ Corporation','Tennessee','Distributors','Consumer Discretionary','LKQ'),
+('Lilly (Eli)','Indiana','Pharmaceuticals','Health Care','LLY'),
+('Lockheed Martin','Maryland','Aerospace & Defense','Industrials','LMT'),
+('Alliant Energy','Wisconsin','Electric Utilities','Utilities','LNT'),
+('Lowe\'s','North Carolina','Home Improvement Retail','Consumer Discretionary','LOW'),
+('Lam Research','California','Semiconductor Materials & Equipment','Information Technology','LRCX'),
+('Lululemon Athletica','Canada','Apparel, Accessories & Luxury Goods','Consumer Discretionary','LULU'),
+('Southwest Airlines','Texas','Passenger Airlines','Industrials','LUV'),
+('Las Vegas Sands','Nevada','Casinos & Gaming','Consumer Discretionary','LVS'),
+('Lamb Weston','Idaho','Packaged Foods & Meats','Consumer Staples','LW'),
+('LyondellBasell','Netherlands','Specialty Chemicals','Materials','LYB'),
+('Live Nation Entertainment','California','Movies & Entertainment','Communication Services','LYV'),
+('Mastercard','New York','Transaction & Payment Processing Services','Financials','MA'),
+('Mid-America Apartment Communities','Tennessee','Multi-Family Residential REITs','Real Estate','MAA'),
+('Marriott International','Maryland','Hotels, Resorts & Cruise Lines','Consumer Discretionary','MAR'),
+('Masco','Michigan','Building Products','Industrials','MAS'),
+('McDonald\'s','Illinois','Restaurants','Consumer Discretionary','MCD'),
+('Microchip Technology','Arizona','Semiconductors','Information Technology','MCHP'),
+('McKesson Corporation','Texas','Health Care Distributors','Health Care','MCK'),
+('Moody\'s Corporation','New York','Financial Exchanges & Data','Financials','MCO'),
+('Mondelez International','Illinois','Packaged Foods & Meats','Consumer Staples','MDLZ'),
+('Medtronic','Ireland','Health Care Equipment','Health Care','MDT'),
+('MetLife','New York','Life & Health Insurance','Financials','MET'),
+('Meta Platforms','California','Interactive Media & Services','Communication Services','META'),
+('MGM Resorts','Nevada','Casinos & Gaming','Consumer Discretionary','MGM'),
+('Mohawk Industries','Georgia','Home Furnishings','Consumer Discretionary','MHK'),
+('McCormick & Company','Maryland','Packaged Foods & Meats','Consumer Staples','MKC'),
+('Martin Marietta Materials','North Carolina','Construction Materials','Materials','MLM'),
+('Marsh McLennan','New York','Insurance Brokers','Financials','MMC'),
+('3M','Minnesota','Industrial Conglomerates','Industrials','MMM'),
+('Monster Beverage','California','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','MNST'),
+('Altria','Virginia','Tobacco','Consumer Staples','MO'),
+('Molina Healthcare','California','Managed Health Care','Health Care','MOH'),
+('Mosaic Company (The)','Florida','Fertilizers & Agricultural Chemicals','Materials','MOS'),
+('Marathon Petroleum','Ohio','Oil & Gas Refining & Marketing','Energy','MPC'),
+('Monolithic Power Systems','Washington','Semiconductors','Information Technology','MPWR'),
+('Merck & Co.','New Jersey','Pharmaceuticals','Health Care','MRK'),
+('Moderna','Massachusetts','Biotechnology','Health Care','MRNA'),
+('Morgan Stanley','New York','Investment Banking & Brokerage','Financials','MS'),
+('MSCI Inc.','New York','Financial Exchanges & Data','Financials','MSCI'),
+('Microsoft','Washington','Systems Software','Information Technology','MSFT'),
+('Motorola Solutions','Illinois','Communications Equipment','Information Technology','MSI'),
+('M&T Bank','New York','Regional Banks','Financials','MTB'),
+('Match Group','Texas','Interactive Media & Services','Communication Services','MTCH'),
+('Mettler Toledo','Ohio','Life Sciences Tools & Services','Health Care','MTD'),
+('Micron Technology','Idaho','Semiconductors','Information Technology','MU'),
+('Norwegian Cruise Line Holdings','Florida[4]','Hotels, Resorts & Cruise Lines','Consumer Discretionary','NCLH'),
+('Nasdaq, Inc.','New York','Financial Exchanges & Data','Financials','NDAQ'),
+('Nordson Corporation','Ohio','Industrial Machinery & Supplies & Components','Industrials','NDSN'),
+('NextEra Energy','Florida','Multi-Utilities','Utilities','NEE'),
+('Newmont','Colorado','Gold','Materials','NEM'),
+('Netflix','California','Movies & Entertainment','Communication Services','NFLX'),
+('NiSource','Indiana','Multi-Utilities','Utilities','NI'),
+('Nike, Inc.','Oregon','Apparel, Accessories & Luxury Goods','Consumer Discretionary','NKE'),
+('Northrop Grumman','Virginia[3]','Aerospace & Defense','Industrials','NOC'),
+('ServiceNow','California','Systems Software','Information Technology','NOW'),
+('NRG Energy','Texas','Independent Power Producers & Energy Traders','Utilities','NRG'),
+('Norfolk Southern','Georgia','Rail Transportation','Industrials','NSC'),
+('NetApp','California','Technology Hardware, Storage & Peripherals','Information Technology','NTAP'),
+('Northern Trust','Illinois','Asset Management & Custody Banks','Financials','NTRS'),
+('Nucor','North Carolina','Steel','Materials','NUE'),
+('Nvidia','California','Semiconductors','Information Technology','NVDA'),
+('NVR, Inc.','Virginia','Homebuilding','Consumer Discretionary','NVR'),
+('News Corp (Class B)','New York','Publishing','Communication Services','NWS'),
+('News Corp (Class A)','New York','Publishing','Communication Services','NWSA'),
+('NXP Semiconductors','Netherlands','Semiconductors','Information Technology','NXPI'),
+('Realty Income','California','Retail REITs','Real Estate','O'),
+('Old Dominion','North Carolina','Cargo Ground Transportation','Industrials','ODFL'),
+('Oneok','Oklahoma','Oil & Gas Storage & Transportation','Energy','OKE'),
+('Omnicom Group','New York','Advertising','Communication Services','OMC'),
+('ON Semiconductor','Arizona','Semiconductors','Information Technology','ON'),
+('Oracle Corporation','Texas','Application Software','Information Technology','ORCL'),
+('O’Reilly Automotive','Missouri','Automotive Retail','Consumer Discretionary','ORLY'),
+('Otis Worldwide','Connecticut','Industrial Machinery & Supplies & Components','Industrials','OTIS'),
+('Occidental Petroleum','Texas','Oil & Gas Exploration & Production','Energy','OXY'),
+('Palo Alto Networks','California','Systems Software','Information Technology','PANW'),
+('Paycom','Oklahoma','Human Resource & Employment Services','Industrials','PAYC'),
+('Paychex','New York','Human Resource & Employment Services','Industrials','PAYX'),
+('Paccar','Washington','Construction Machinery & Heavy Transportation Equipment','Industrials','PCAR'),
+('PG&E Corporation','California','Multi-Utilities','Utilities','PCG'),
+('Public Service Enterprise Group','New Jersey','Electric Utilities','Utilities','PEG'),
+('PepsiCo','New York','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','PEP'),
+('Pfizer','New York','Pharmaceuticals','Health Care','PFE'),
+('Principal Financial Group','Iowa','Life & Health Insurance','Financials','PFG'),
+('Procter & Gamble','Ohio','Personal Care Products','Consumer Staples','PG'),
+('Progressive Corporation','Ohio','Property & Casualty Insurance','Financials','PGR'),
+('Parker Hannifin','Ohio','Industrial Machinery & Supplies & Components','Industrials','PH'),
+('PulteGroup','Georgia','Homebuilding','Consumer Discretionary','PHM'),
+('Packaging Corporation of America','Illinois','Paper & Plastic Packaging Products & Materials','Materials','PKG'),
+('Prologis','California','Industrial REITs','Real Estate','PLD'),
+('Palantir Technologies','Colorado','Application Software','Information Technology','PLTR'),
+('Philip Morris International','New York','Tobacco','Consumer Staples','PM'),
+('PNC Financial Services','Pennsylvania','Diversified Banks','Financials','PNC'),
+('Pentair','United Kingdom','Industrial Machinery & Supplies & Components','Industrials','PNR'),
+('Pinnacle West Capital','Arizona','Multi-Utilities','Utilities','PNW'),
+('Insulet Corporation','Massachusetts','Health Care Equipment','Health Care','PODD'),
+('Pool Corporation','Louisiana','Distributors','Consumer Discretionary','POOL'),
+('PPG Industries','Pennsylvania','Specialty Chemicals','Materials','PPG'),
+('PPL Corporation','Pennsylvania','Electric Utilities','Utilities','PPL'),
+('Prudential Financial','New Jersey','Life & Health Insurance','Financials','PRU'),
+('Public Storage','California','Self-Storage REITs','Real Estate','PSA'),
+('Paramount Skydance Corporation','California','Movies & Entertainment','Communication Services','PSKY'),
+('Phillips 66','Texas','Oil & Gas Refining & Marketing','Energy','PSX'),
+('PTC Inc.','Massachusetts','Application Software','Information Technology','PTC'),
+('Quanta Services','Texas','Construction & Engineering','Industrials','PWR'),
+('PayPal','California','Transaction & Payment Processing Services','Financials','PYPL'),
+('Qnity Electronics','Delaware','Semiconductor Materials & Equipment','Information Technology','Q'),
+('Qualcomm','California','Semiconductors','Information Technology','QCOM'),
+('Royal Caribbean Group','Florida','Hotels, Resorts & Cruise Lines','Consumer Discretionary','RCL'),
+('Regency Centers','Florida','Retail REITs','Real Estate','REG'),
+('Regeneron Pharmaceuticals','New York','Biotechnology','Health Care','REGN'),
+('Regions Financial Corporation','Alabama','Regional Banks','Financials','RF'),
+('Raymond James Financial','Florida','Investment Banking & Brokerage','Financials','RJF'),
+('Ralph Lauren Corporation','New York','Apparel, Accessories & Luxury Goods','Consumer Discretionary','RL'),
+('ResMed','California','Health Care Equipment','Health Care','RMD'),
+('Rockwell Automation','Wisconsin','Electrical Components & Equipment','Industrials','ROK'),
+('Rollins, Inc.','Georgia','Environmental & Facilities Services','Industrials','ROL'),
+('Roper Technologies','Florida','Electronic Equipment & Instruments','Information Technology','ROP'),
+('Ross Stores','California','Apparel Retail','Consumer Discretionary','ROST'),
+('Republic Services','Arizona','Environmental & Facilities Services','Industrials','RSG'),
+('RTX Corporation','Massachusetts','Aerospace & Defense','Industrials','RTX'),
+('Revvity','Massachusetts','Health Care Equipment','Health Care','RVTY'),
+('SBA Communications','Florida','Telecom Tower REITs','Real Estate','SBAC'),
+('Starbucks','Washington','Restaurants','Consumer Discretionary','SBUX'),
+('Charles Schwab Corporation','Texas','Investment Banking & Brokerage','Financials','SCHW'),
+('Sherwin-Williams','Ohio','Specialty Chemicals','Materials','SHW'),
+('J.M. Smucker Company (The)','Ohio','Packaged Foods & Meats','Consumer Staples','SJM'),
+('Schlumberger','Texas','Oil & Gas Equipment & Services','Energy','SLB'),
+('Supermicro','California','Technology Hardware, Storage & Peripherals','Information Technology','SMCI'),
+('Snap-on','Wisconsin','Industrial Machinery & Supplies & Components','Industrials','SNA'),
+('Synopsys','California','Application Software','Information Technology','SNPS'),
+('Southern Company','Georgia','Electric Utilities','Utilities','SO'),
+('Solstice Advanced Materials','New Jersey','TBD','Materials','SOLS'),
+('Solventum','Minnesota','Health Care Technology','Health Care','SOLV'),
+('Simon Property Group','Indiana','Retail REITs','Real Estate','SPG'),
+('S&P Global','New York','Financial Exchanges & Data','Financials','SPGI'),
+('Sempra','California','Multi-Utilities','Utilities','SRE'),
+('Steris','Ireland','Health Care Equipment','Health Care','STE'),
+('Steel Dynamics','Indiana','Steel','Materials','STLD'),
+('State Street Corporation','Massachusetts','Asset Management & Custody Banks','Financials','STT'),
+('Seagate Technology','Ireland','Technology Hardware, Storage & Peripherals','Information Technology','STX'),
+('Constellation Brands','New York','Distillers & Vintners','Consumer Staples','STZ'),
+('Smurfit Westrock','Ireland','Paper & Plastic Packaging Products & Materials','Materials','SW'),
+('Stanley Black & Decker','Connecticut','Industrial Machinery & Supplies & Components','Industrials','SWK'),
+('Skyworks Solutions','California','Semiconductors','Information Technology','SWKS'),
+('Synchrony Financial','Connecticut','Consumer Finance','Financials','SYF'),
+('Stryker Corporation','Michigan','Health Care Equipment','Health Care','SYK'),
+('Sysco','Texas','Food Distributors','Consumer Staples','SYY'),
+('AT&T','Texas','Integrated Telecommunication Services','Communication Services','T'),
+('Molson Coors Beverage Company','Illinois','Brewers','Consumer Staples','TAP'),
+('TransDigm Group','Ohio','Aerospace & Defense','Industrials','TDG'),
+('Teledyne Technologies','California','Electronic Equipment & Instruments','Information Technology','TDY'),
+('Bio-Techne','Minnesota','Life Sciences Tools & Services','Health Care','TECH'),
+('TE Connectivity','Ireland','Electronic Manufacturing Services','Information Technology','TEL'),
+('Teradyne','Massachusetts','Semiconductor Materials & Equipment','Information Technology','TER'),
+('Truist Financial','North Carolina','Diversified Banks','Financials','TFC'),
+('Target Corporation','Minnesota','Consumer Staples Merchandise Retail','Consumer Staples','TGT'),
+('TJX Companies','Massachusetts','Apparel Retail','Consumer Discretionary','TJX'),
+('TKO Group Holdings','New York','Movies & Entertainment','Communication Services','TKO'),
+('Thermo Fisher Scientific','Massachusetts','Life Sciences Tools & Services','Health Care','TMO'),
+('T-Mobile US','Washington','Wireless Telecommunication Services','Communication Services','TMUS'),
+('Texas Pacific Land Corporation','Texas','Oil & Gas Exploration & Production','Energy','TPL'),
+('Tapestry, Inc.','New York','Apparel, Accessories & Luxury Goods','Consumer Discretionary','TPR'),
+('Targa Resources','Texas','Oil & Gas Storage & Transportation','Energy','TRGP'),
+('Trimble Inc.','Colorado','Electronic Equipment & Instruments','Information Technology','TRMB'),
+('T. Rowe Price','Maryland','Asset Management & Custody Banks','Financials','TROW'),
+('Travelers Companies (The)','New York','Property & Casualty Insurance','Financials','TRV'),
+('Tractor Supply','Tennessee','Other Specialty Retail','Consumer Discretionary','TSCO'),
+('Tesla, Inc.','Texas','Automobile Manufacturers','Consumer Discretionary','TSLA'),
+('Tyson Foods','Arkansas','Packaged Foods & Meats','Consumer Staples','TSN'),
+('Trane Technologies','Ireland','Building Products','Industrials','TT'),
+('Trade Desk (The)','California','Advertising','Communication Services','TTD'),
+('Take-Two Interactive','New York','Interactive Home Entertainment','Communication Services','TTWO'),
+('Texas Instruments','Texas','Semiconductors','Information Technology','TXN'),
+('Textron','Rhode Island','Aerospace & Defense','Industrials','TXT'),
+('Tyler Technologies','Texas','Application Software','Information Technology','TYL'),
+('United Airlines Holdings','Illinois','Passenger Airlines','Industrials','UAL'),
+('Uber','California','Passenger Ground Transportation','Industrials','UBER'),
+('UDR, Inc.','Colorado','Multi-Family Residential REITs','Real Estate','UDR'),
+('Universal Health Services','Pennsylvania','Health Care Facilities','Health Care','UHS'),
+('Ulta Beauty','Illinois','Other Specialty Retail','Consumer Discretionary','ULTA'),
+('UnitedHealth Group','Minnesota','Managed Health Care','Health Care','UNH'),
+('Union Pacific Corporation','Nebraska','Rail Transportation','Industrials','UNP'),
+('United Parcel Service','Georgia','Air Freight & Logistics','Industrials','UPS'),
+('United Rentals','Connecticut','Trading Companies & Distributors','Industrials','URI'),
+('U.S. Bancorp','Minnesota','Diversified Banks','Financials','USB'),
+('Visa Inc.','California','Transaction & Payment Processing Services','Financials','V'),
+('Vici Properties','New York','Hotel & Resort REITs','Real Estate','VICI'),
+('Valero Energy','Texas','Oil & Gas Refining & Marketing','Energy','VLO'),
+('Veralto','Massachusetts','Environmental & Facilities Services','Industrials','VLTO'),
+('Vulcan Materials Company','Alabama','Construction Materials','Materials','VMC'),
+('Verisk Analytics','New Jersey','Research & Consulting Services','Industrials','VRSK'),
+('Verisign','Virginia','Internet Services & Infrastructure','Information Technology','VRSN'),
+('Vertex Pharmaceuticals','Massachusetts','Biotechnology','Health Care','VRTX'),
+('Vistra Corp.','Texas','Electric Utilities','Utilities','VST'),
+('Ventas','Illinois','Health Care REITs','Real Estate','VTR'),
+('Viatris','Pennsylvania','Pharmaceuticals','Health Care','VTRS'),
+('Verizon','New York','Integrated Telecommunication Services','Communication Services','VZ'),
+('Wabtec','Pennsylvania','Construction Machinery & Heavy Transportation Equipment','Industrials','WAB'),
+('Waters Corporation','Massachusetts','Life Sciences Tools & Services','Health Care','WAT'),
+('Warner Bros. Discovery','New York','Broadcasting','Communication Services','WBD'),
+('Workday, Inc.','California','Application Software','Information Technology','WDAY'),
+('Western Digital','California','Technology Hardware, Storage & Peripherals','Information Technology','WDC'),
+('WEC Energy Group','Wisconsin','Electric Utilities','Utilities','WEC'),
+('Welltower','Ohio','Health Care REITs','Real Estate','WELL'),
+('Wells Fargo','California','Diversified Banks','Financials','WFC'),
+('Waste Management','Texas','Environmental & Facilities Services','Industrials','WM'),
+('Williams Companies','Oklahoma','Oil & Gas Storage & Transportation','Energy','WMB'),
+('Walmart','Arkansas','Consumer Staples Merchandise Retail','Consumer Staples','WMT'),
+('W. R. Berkley Corporation','Connecticut','Property & Casualty Insurance','Financials','WRB'),
+('Williams-Sonoma, Inc.','California','Homefurnishing Retail','Consumer Discretionary','WSM'),
+('West Pharmaceutical Services','Pennsylvania','Health Care Supplies','Health Care','WST'),
+('Willis Towers Watson','United Kingdom','Insurance Brokers','Financials','WTW'),
+('Weyerhaeuser','Washington','Timber REITs','Real Estate','WY'),
+('Wynn Resorts','Nevada','Casinos & Gaming','Consumer Discretionary','WYNN'),
+('Xcel Energy','Minnesota','Multi-Utilities','Utilities','XEL'),
+('ExxonMobil','Texas','Integrated Oil & Gas','Energy','XOM'),
+('Xylem Inc.','New York','Industrial Machinery & Supplies & Components','Industrials','XYL'),
+('Block, Inc.','none','Transaction & Payment Processing Services','Financials','XYZ'),
+('Yum! Brands','Kentucky','Restaurants','Consumer Discretionary','YUM');
 
-
-
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Agilent Technologies','California','Life Sciences Tools & Services','Health Care','A');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Apple Inc.','California','Technology Hardware, Storage & Peripherals','Information Technology','AAPL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('AbbVie','Illinois','Biotechnology','Health Care','ABBV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Airbnb','California','Hotels, Resorts & Cruise Lines','Consumer Discretionary','ABNB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Abbott Laboratories','Illinois','Health Care Equipment','Health Care','ABT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Arch Capital Group','Bermuda','Property & Casualty Insurance','Financials','ACGL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Accenture','Ireland','IT Consulting & Other Services','Information Technology','ACN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Adobe Inc.','California','Application Software','Information Technology','ADBE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Analog Devices','Massachusetts','Semiconductors','Information Technology','ADI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Archer Daniels Midland','Illinois','Agricultural Products & Services','Consumer Staples','ADM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Automatic Data Processing','New Jersey','Human Resource & Employment Services','Industrials','ADP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Autodesk','California','Application Software','Information Technology','ADSK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ameren','Missouri','Multi-Utilities','Utilities','AEE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('American Electric Power','Ohio','Electric Utilities','Utilities','AEP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('AES Corporation','Virginia','Independent Power Producers & Energy Traders','Utilities','AES');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Aflac','Georgia','Life & Health Insurance','Financials','AFL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('American International Group','New York','Multi-line Insurance','Financials','AIG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Assurant','Georgia','Multi-line Insurance','Financials','AIZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Arthur J. Gallagher & Co.','Illinois','Insurance Brokers','Financials','AJG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Akamai Technologies','Massachusetts','Internet Services & Infrastructure','Information Technology','AKAM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Albemarle Corporation','North Carolina','Specialty Chemicals','Materials','ALB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Align Technology','Arizona','Health Care Supplies','Health Care','ALGN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Allstate','Illinois','Property & Casualty Insurance','Financials','ALL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Allegion','Ireland','Building Products','Industrials','ALLE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Applied Materials','California','Semiconductor Materials & Equipment','Information Technology','AMAT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Amcor','United Kingdom','Paper & Plastic Packaging Products & Materials','Materials','AMCR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Advanced Micro Devices','California','Semiconductors','Information Technology','AMD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ametek','Pennsylvania','Electrical Components & Equipment','Industrials','AME');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Amgen','California','Biotechnology','Health Care','AMGN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ameriprise Financial','Minnesota','Asset Management & Custody Banks','Financials','AMP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('American Tower','Massachusetts','Telecom Tower REITs','Real Estate','AMT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Amazon','Washington','Broadline Retail','Consumer Discretionary','AMZN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Arista Networks','California','Communications Equipment','Information Technology','ANET');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Aon plc','United Kingdom','Insurance Brokers','Financials','AON');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('A. O. Smith','Wisconsin','Building Products','Industrials','AOS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('APA Corporation','Texas','Oil & Gas Exploration & Production','Energy','APA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Air Products','Pennsylvania','Industrial Gases','Materials','APD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Amphenol','Connecticut','Electronic Components','Information Technology','APH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Apollo Global Management','New York','Asset Management & Custody Banks','Financials','APO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('AppLovin','California','Application Software','Information Technology','APP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Aptiv','Ireland','Automotive Parts & Equipment','Consumer Discretionary','APTV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Alexandria Real Estate Equities','California','Office REITs','Real Estate','ARE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Atmos Energy','Texas','Gas Utilities','Utilities','ATO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('AvalonBay Communities','Virginia','Multi-Family Residential REITs','Real Estate','AVB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Broadcom','California','Semiconductors','Information Technology','AVGO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Avery Dennison','Ohio','Paper & Plastic Packaging Products & Materials','Materials','AVY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('American Water Works','New Jersey','Water Utilities','Utilities','AWK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Axon Enterprise','Arizona','Aerospace & Defense','Industrials','AXON');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('American Express','New York','Consumer Finance','Financials','AXP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('AutoZone','Tennessee','Automotive Retail','Consumer Discretionary','AZO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Boeing','Virginia','Aerospace & Defense','Industrials','BA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Bank of America','North Carolina','Diversified Banks','Financials','BAC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ball Corporation','Colorado','Metal, Glass & Plastic Containers','Materials','BALL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Baxter International','Illinois','Health Care Equipment','Health Care','BAX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Best Buy','Minnesota','Computer & Electronics Retail','Consumer Discretionary','BBY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Becton Dickinson','New Jersey','Health Care Equipment','Health Care','BDX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Franklin Resources','California','Asset Management & Custody Banks','Financials','BEN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Brown–Forman','Kentucky','Distillers & Vintners','Consumer Staples','BF-B');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Bunge Global','Missouri','Agricultural Products & Services','Consumer Staples','BG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Biogen','Massachusetts','Biotechnology','Health Care','BIIB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('BNY Mellon','New York','Asset Management & Custody Banks','Financials','BK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Booking Holdings','Connecticut','Hotels, Resorts & Cruise Lines','Consumer Discretionary','BKNG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Baker Hughes','Texas','Oil & Gas Equipment & Services','Energy','BKR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Builders FirstSource','Texas','Building Products','Industrials','BLDR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('BlackRock','New York','Asset Management & Custody Banks','Financials','BLK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Bristol Myers Squibb','New York','Pharmaceuticals','Health Care','BMY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Broadridge Financial Solutions','New York','Data Processing & Outsourced Services','Industrials','BR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Berkshire Hathaway','Nebraska','Multi-Sector Holdings','Financials','BRK-B');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Brown & Brown','Florida','Insurance Brokers','Financials','BRO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Boston Scientific','Massachusetts','Health Care Equipment','Health Care','BSX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Blackstone Inc.','New York','Asset Management & Custody Banks','Financials','BX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('BXP, Inc.','Massachusetts','Office REITs','Real Estate','BXP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Citigroup','New York','Diversified Banks','Financials','C');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Conagra Brands','Illinois','Packaged Foods & Meats','Consumer Staples','CAG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cardinal Health','Ohio','Health Care Distributors','Health Care','CAH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Carrier Global','Florida','Building Products','Industrials','CARR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Caterpillar Inc.','Texas','Construction Machinery & Heavy Transportation Equipment','Industrials','CAT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Chubb Limited','Switzerland','Property & Casualty Insurance','Financials','CB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cboe Global Markets','Illinois','Financial Exchanges & Data','Financials','CBOE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CBRE Group','Texas','Real Estate Services','Real Estate','CBRE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Crown Castle','Texas','Telecom Tower REITs','Real Estate','CCI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Carnival','Florida','Hotels, Resorts & Cruise Lines','Consumer Discretionary','CCL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cadence Design Systems','California','Application Software','Information Technology','CDNS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CDW Corporation','Illinois','Technology Distributors','Information Technology','CDW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Constellation Energy','Maryland','Electric Utilities','Utilities','CEG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CF Industries','Illinois','Fertilizers & Agricultural Chemicals','Materials','CF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Citizens Financial Group','Rhode Island','Regional Banks','Financials','CFG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Church & Dwight','New Jersey','Household Products','Consumer Staples','CHD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('C.H. Robinson','Minnesota','Air Freight & Logistics','Industrials','CHRW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Charter Communications','Connecticut','Cable & Satellite','Communication Services','CHTR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cigna','Connecticut','Health Care Services','Health Care','CI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cincinnati Financial','Ohio','Property & Casualty Insurance','Financials','CINF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Colgate-Palmolive','New York','Household Products','Consumer Staples','CL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Clorox','California','Household Products','Consumer Staples','CLX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Comcast','Pennsylvania','Cable & Satellite','Communication Services','CMCSA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CME Group','Illinois','Financial Exchanges & Data','Financials','CME');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Chipotle Mexican Grill','California','Restaurants','Consumer Discretionary','CMG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cummins','Indiana','Construction Machinery & Heavy Transportation Equipment','Industrials','CMI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CMS Energy','Michigan','Multi-Utilities','Utilities','CMS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Centene Corporation','Missouri','Managed Health Care','Health Care','CNC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CenterPoint Energy','Texas','Multi-Utilities','Utilities','CNP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Capital One','Virginia','Consumer Finance','Financials','COF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Coinbase','New York','Financial Exchanges & Data','Financials','COIN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cooper Companies (The)','California','Health Care Supplies','Health Care','COO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('ConocoPhillips','Texas','Oil & Gas Exploration & Production','Energy','COP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cencora','Pennsylvania','Health Care Distributors','Health Care','COR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Costco','Washington','Consumer Staples Merchandise Retail','Consumer Staples','COST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Corpay','Georgia','Transaction & Payment Processing Services','Financials','CPAY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Campbell\'s Company (The)','New Jersey','Packaged Foods & Meats','Consumer Staples','CPB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Copart','Texas','Diversified Support Services','Industrials','CPRT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Camden Property Trust','Texas','Multi-Family Residential REITs','Real Estate','CPT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Charles River Laboratories','Massachusetts','Life Sciences Tools & Services','Health Care','CRL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Salesforce','California','Application Software','Information Technology','CRM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CrowdStrike','Texas','Systems Software','Information Technology','CRWD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cisco','California','Communications Equipment','Information Technology','CSCO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CoStar Group','D.C.','Real Estate Services','Real Estate','CSGP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CSX Corporation','Florida','Rail Transportation','Industrials','CSX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cintas','Ohio','Diversified Support Services','Industrials','CTAS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Coterra','Texas','Oil & Gas Exploration & Production','Energy','CTRA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Cognizant','New Jersey','IT Consulting & Other Services','Information Technology','CTSH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Corteva','Indiana','Fertilizers & Agricultural Chemicals','Materials','CTVA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('CVS Health','Rhode Island','Health Care Services','Health Care','CVS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Chevron Corporation','Texas','Integrated Oil & Gas','Energy','CVX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dominion Energy','Virginia','Multi-Utilities','Utilities','D');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Delta Air Lines','Georgia','Passenger Airlines','Industrials','DAL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('DoorDash','California','Specialized Consumer Services','Consumer Discretionary','DASH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dayforce','Minnesota','Human Resource & Employment Services','Industrials','DAY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('DuPont','Delaware','Specialty Chemicals','Materials','DD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Datadog','New York','Application Software','Information Technology','DDOG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Deere & Company','Illinois','Agricultural & Farm Machinery','Industrials','DE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Deckers Brands','California','Footwear','Consumer Discretionary','DECK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dell Technologies','Texas','Technology Hardware, Storage & Peripherals','Information Technology','DELL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dollar General','Tennessee','Consumer Staples Merchandise Retail','Consumer Staples','DG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Quest Diagnostics','New Jersey','Health Care Services','Health Care','DGX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('D. R. Horton','Texas','Homebuilding','Consumer Discretionary','DHI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Danaher Corporation','D.C.','Life Sciences Tools & Services','Health Care','DHR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Walt Disney Company (The)','California','Movies & Entertainment','Communication Services','DIS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Digital Realty','Texas','Data Center REITs','Real Estate','DLR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dollar Tree','Virginia','Consumer Staples Merchandise Retail','Consumer Staples','DLTR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Healthpeak Properties','Colorado','Health Care REITs','Real Estate','DOC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dover Corporation','Illinois','Industrial Machinery & Supplies & Components','Industrials','DOV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dow Inc.','Michigan','Commodity Chemicals','Materials','DOW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Domino\'s','Michigan','Restaurants','Consumer Discretionary','DPZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Darden Restaurants','Florida','Restaurants','Consumer Discretionary','DRI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('DTE Energy','Michigan','Multi-Utilities','Utilities','DTE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Duke Energy','North Carolina','Electric Utilities','Utilities','DUK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('DaVita','Colorado','Health Care Services','Health Care','DVA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Devon Energy','Oklahoma','Oil & Gas Exploration & Production','Energy','DVN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Dexcom','California','Health Care Equipment','Health Care','DXCM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Electronic Arts','California','Interactive Home Entertainment','Communication Services','EA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('eBay Inc.','California','Broadline Retail','Consumer Discretionary','EBAY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ecolab','Minnesota','Specialty Chemicals','Materials','ECL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Consolidated Edison','New York','Multi-Utilities','Utilities','ED');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Equifax','Georgia','Research & Consulting Services','Industrials','EFX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Everest Group','Bermuda','Reinsurance','Financials','EG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Edison International','California','Electric Utilities','Utilities','EIX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Estée Lauder Companies (The)','New York','Personal Care Products','Consumer Staples','EL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Elevance Health','Indiana','Managed Health Care','Health Care','ELV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Emcor','Connecticut','Construction & Engineering','Industrials','EME');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Emerson Electric','Missouri','Electrical Components & Equipment','Industrials','EMR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('EOG Resources','Texas','Oil & Gas Exploration & Production','Energy','EOG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('EPAM Systems','Pennsylvania','IT Consulting & Other Services','Information Technology','EPAM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Equinix','California','Data Center REITs','Real Estate','EQIX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Equity Residential','Illinois','Multi-Family Residential REITs','Real Estate','EQR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('EQT Corporation','Pennsylvania','Oil & Gas Exploration & Production','Energy','EQT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Erie Indemnity','Pennsylvania','Insurance Brokers','Financials','ERIE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Eversource Energy','Connecticut','Electric Utilities','Utilities','ES');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Essex Property Trust','California','Multi-Family Residential REITs','Real Estate','ESS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Eaton Corporation','Ireland','Electrical Components & Equipment','Industrials','ETN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Entergy','Louisiana','Electric Utilities','Utilities','ETR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Evergy','Missouri','Electric Utilities','Utilities','EVRG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Edwards Lifesciences','California','Health Care Equipment','Health Care','EW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Exelon','Illinois','Electric Utilities','Utilities','EXC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Expand Energy','Oklahoma','Oil & Gas Exploration & Production','Energy','EXE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Expeditors International','Washington','Air Freight & Logistics','Industrials','EXPD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Expedia Group','Washington','Hotels, Resorts & Cruise Lines','Consumer Discretionary','EXPE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Extra Space Storage','Utah','Self-Storage REITs','Real Estate','EXR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ford Motor Company','Michigan','Automobile Manufacturers','Consumer Discretionary','F');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Diamondback Energy','Texas','Oil & Gas Exploration & Production','Energy','FANG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fastenal','Minnesota','Trading Companies & Distributors','Industrials','FAST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Freeport-McMoRan','Arizona','Copper','Materials','FCX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('FactSet','Connecticut','Financial Exchanges & Data','Financials','FDS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('FedEx','Tennessee','Air Freight & Logistics','Industrials','FDX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('FirstEnergy','Ohio','Electric Utilities','Utilities','FE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('F5, Inc.','Washington','Communications Equipment','Information Technology','FFIV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fair Isaac','Montana','Application Software','Information Technology','FICO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fidelity National Information Services','Florida','Transaction & Payment Processing Services','Financials','FIS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fiserv','Wisconsin','Transaction & Payment Processing Services','Financials','FISV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fifth Third Bancorp','Ohio','Regional Banks','Financials','FITB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fox Corporation (Class B)','New York','Broadcasting','Communication Services','FOX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fox Corporation (Class A)','New York','Broadcasting','Communication Services','FOXA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Federal Realty Investment Trust','Maryland','Retail REITs','Real Estate','FRT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('First Solar','Arizona','Semiconductors','Information Technology','FSLR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fortinet','California','Systems Software','Information Technology','FTNT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Fortive','Washington','Industrial Machinery & Supplies & Components','Industrials','FTV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('General Dynamics','Virginia','Aerospace & Defense','Industrials','GD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('GoDaddy','Arizona','Internet Services & Infrastructure','Information Technology','GDDY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('GE Aerospace','Ohio','Aerospace & Defense','Industrials','GE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('GE HealthCare','Illinois','Health Care Equipment','Health Care','GEHC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Gen Digital','Arizona','Systems Software','Information Technology','GEN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('GE Vernova','Massachusetts','Heavy Electrical Equipment','Industrials','GEV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Gilead Sciences','California','Biotechnology','Health Care','GILD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('General Mills','Minnesota','Packaged Foods & Meats','Consumer Staples','GIS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Globe Life','Texas','Life & Health Insurance','Financials','GL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Corning Inc.','New York','Electronic Components','Information Technology','GLW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('General Motors','Michigan','Automobile Manufacturers','Consumer Discretionary','GM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Generac','Wisconsin','Electrical Components & Equipment','Industrials','GNRC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Alphabet Inc. (Class C)','California','Interactive Media & Services','Communication Services','GOOG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Alphabet Inc. (Class A)','California','Interactive Media & Services','Communication Services','GOOGL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Genuine Parts Company','Georgia','Distributors','Consumer Discretionary','GPC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Global Payments','Georgia','Transaction & Payment Processing Services','Financials','GPN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Garmin','Switzerland','Consumer Electronics','Consumer Discretionary','GRMN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Goldman Sachs','New York','Investment Banking & Brokerage','Financials','GS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('W. W. Grainger','Illinois','Industrial Machinery & Supplies & Components','Industrials','GWW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Halliburton','Texas','Oil & Gas Equipment & Services','Energy','HAL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hasbro','Rhode Island','Leisure Products','Consumer Discretionary','HAS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Huntington Bancshares','Michigan','Regional Banks','Financials','HBAN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('HCA Healthcare','Tennessee','Health Care Facilities','Health Care','HCA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Home Depot (The)','Georgia','Home Improvement Retail','Consumer Discretionary','HD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hartford (The)','Connecticut','Property & Casualty Insurance','Financials','HIG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Huntington Ingalls Industries','Virginia','Aerospace & Defense','Industrials','HII');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hilton Worldwide','Virginia','Hotels, Resorts & Cruise Lines','Consumer Discretionary','HLT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hologic','Massachusetts','Health Care Equipment','Health Care','HOLX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Honeywell','North Carolina','Industrial Conglomerates','Industrials','HON');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Robinhood Markets','California','Investment Banking & Brokerage','Financials','HOOD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hewlett Packard Enterprise','Texas','Technology Hardware, Storage & Peripherals','Information Technology','HPE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('HP Inc.','California','Technology Hardware, Storage & Peripherals','Information Technology','HPQ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hormel Foods','Minnesota','Packaged Foods & Meats','Consumer Staples','HRL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Henry Schein','New York','Health Care Distributors','Health Care','HSIC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Host Hotels & Resorts','Maryland','Hotel & Resort REITs','Real Estate','HST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hershey Company (The)','Pennsylvania','Packaged Foods & Meats','Consumer Staples','HSY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Hubbell Incorporated','Connecticut','Industrial Machinery & Supplies & Components','Industrials','HUBB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Humana','Kentucky','Managed Health Care','Health Care','HUM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Howmet Aerospace','Pennsylvania','Aerospace & Defense','Industrials','HWM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Interactive Brokers','Connecticut','Investment Banking & Brokerage','Financials','IBKR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('IBM','New York','IT Consulting & Other Services','Information Technology','IBM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Intercontinental Exchange','Georgia','Financial Exchanges & Data','Financials','ICE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Idexx Laboratories','Maine','Health Care Equipment','Health Care','IDXX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('IDEX Corporation','Illinois','Industrial Machinery & Supplies & Components','Industrials','IEX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('International Flavors & Fragrances','New York','Specialty Chemicals','Materials','IFF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Incyte','Delaware','Biotechnology','Health Care','INCY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Intel','California','Semiconductors','Information Technology','INTC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Intuit','California','Application Software','Information Technology','INTU');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Invitation Homes','Texas','Single-Family Residential REITs','Real Estate','INVH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('International Paper','Tennessee','Paper & Plastic Packaging Products & Materials','Materials','IP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Interpublic Group of Companies (The)','New York','Advertising','Communication Services','IPG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('IQVIA','North Carolina','Life Sciences Tools & Services','Health Care','IQV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ingersoll Rand','North Carolina','Industrial Machinery & Supplies & Components','Industrials','IR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Iron Mountain','New Hampshire','Other Specialized REITs','Real Estate','IRM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Intuitive Surgical','California','Health Care Equipment','Health Care','ISRG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Gartner','Connecticut','IT Consulting & Other Services','Information Technology','IT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Illinois Tool Works','Illinois','Industrial Machinery & Supplies & Components','Industrials','ITW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Invesco','Georgia','Asset Management & Custody Banks','Financials','IVZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Jacobs Solutions','Texas','Construction & Engineering','Industrials','J');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('J.B. Hunt','Arkansas','Cargo Ground Transportation','Industrials','JBHT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Jabil','Florida','Electronic Manufacturing Services','Information Technology','JBL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Johnson Controls','Ireland','Building Products','Industrials','JCI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Jack Henry & Associates','Missouri','Transaction & Payment Processing Services','Financials','JKHY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Johnson & Johnson','New Jersey','Pharmaceuticals','Health Care','JNJ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('JPMorgan Chase','New York','Diversified Banks','Financials','JPM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kellanova','Illinois','Packaged Foods & Meats','Consumer Staples','K');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Keurig Dr Pepper','Massachusetts','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','KDP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('KeyCorp','Ohio','Regional Banks','Financials','KEY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Keysight Technologies','California','Electronic Equipment & Instruments','Information Technology','KEYS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kraft Heinz','Pennsylvania','Packaged Foods & Meats','Consumer Staples','KHC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kimco Realty','New York','Retail REITs','Real Estate','KIM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('KKR & Co.','New York','Asset Management & Custody Banks','Financials','KKR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('KLA Corporation','California','Semiconductor Materials & Equipment','Information Technology','KLAC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kimberly-Clark','Texas','Household Products','Consumer Staples','KMB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kinder Morgan','Texas','Oil & Gas Storage & Transportation','Energy','KMI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Coca-Cola Company (The)','Georgia','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','KO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kroger','Ohio','Food Retail','Consumer Staples','KR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Kenvue','New Jersey','Personal Care Products','Consumer Staples','KVUE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Loews Corporation','New York','Multi-line Insurance','Financials','L');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Leidos','Virginia','Diversified Support Services','Industrials','LDOS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lennar','Florida','Homebuilding','Consumer Discretionary','LEN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Labcorp','North Carolina','Health Care Services','Health Care','LH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('L3Harris','Florida','Aerospace & Defense','Industrials','LHX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lennox International','Texas','Building Products','Industrials','LII');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Linde plc','United Kingdom','Industrial Gases','Materials','LIN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('LKQ Corporation','Tennessee','Distributors','Consumer Discretionary','LKQ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lilly (Eli)','Indiana','Pharmaceuticals','Health Care','LLY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lockheed Martin','Maryland','Aerospace & Defense','Industrials','LMT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Alliant Energy','Wisconsin','Electric Utilities','Utilities','LNT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lowe\'s','North Carolina','Home Improvement Retail','Consumer Discretionary','LOW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lam Research','California','Semiconductor Materials & Equipment','Information Technology','LRCX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lululemon Athletica','Canada','Apparel, Accessories & Luxury Goods','Consumer Discretionary','LULU');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Southwest Airlines','Texas','Passenger Airlines','Industrials','LUV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Las Vegas Sands','Nevada','Casinos & Gaming','Consumer Discretionary','LVS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Lamb Weston','Idaho','Packaged Foods & Meats','Consumer Staples','LW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('LyondellBasell','Netherlands','Specialty Chemicals','Materials','LYB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Live Nation Entertainment','California','Movies & Entertainment','Communication Services','LYV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Mastercard','New York','Transaction & Payment Processing Services','Financials','MA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Mid-America Apartment Communities','Tennessee','Multi-Family Residential REITs','Real Estate','MAA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Marriott International','Maryland','Hotels, Resorts & Cruise Lines','Consumer Discretionary','MAR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Masco','Michigan','Building Products','Industrials','MAS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('McDonald\'s','Illinois','Restaurants','Consumer Discretionary','MCD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Microchip Technology','Arizona','Semiconductors','Information Technology','MCHP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('McKesson Corporation','Texas','Health Care Distributors','Health Care','MCK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Moody\'s Corporation','New York','Financial Exchanges & Data','Financials','MCO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Mondelez International','Illinois','Packaged Foods & Meats','Consumer Staples','MDLZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Medtronic','Ireland','Health Care Equipment','Health Care','MDT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('MetLife','New York','Life & Health Insurance','Financials','MET');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Meta Platforms','California','Interactive Media & Services','Communication Services','META');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('MGM Resorts','Nevada','Casinos & Gaming','Consumer Discretionary','MGM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Mohawk Industries','Georgia','Home Furnishings','Consumer Discretionary','MHK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('McCormick & Company','Maryland','Packaged Foods & Meats','Consumer Staples','MKC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Martin Marietta Materials','North Carolina','Construction Materials','Materials','MLM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Marsh McLennan','New York','Insurance Brokers','Financials','MMC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('3M','Minnesota','Industrial Conglomerates','Industrials','MMM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Monster Beverage','California','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','MNST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Altria','Virginia','Tobacco','Consumer Staples','MO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Molina Healthcare','California','Managed Health Care','Health Care','MOH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Mosaic Company (The)','Florida','Fertilizers & Agricultural Chemicals','Materials','MOS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Marathon Petroleum','Ohio','Oil & Gas Refining & Marketing','Energy','MPC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Monolithic Power Systems','Washington','Semiconductors','Information Technology','MPWR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Merck & Co.','New Jersey','Pharmaceuticals','Health Care','MRK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Moderna','Massachusetts','Biotechnology','Health Care','MRNA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Morgan Stanley','New York','Investment Banking & Brokerage','Financials','MS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('MSCI Inc.','New York','Financial Exchanges & Data','Financials','MSCI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Microsoft','Washington','Systems Software','Information Technology','MSFT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Motorola Solutions','Illinois','Communications Equipment','Information Technology','MSI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('M&T Bank','New York','Regional Banks','Financials','MTB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Match Group','Texas','Interactive Media & Services','Communication Services','MTCH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Mettler Toledo','Ohio','Life Sciences Tools & Services','Health Care','MTD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Micron Technology','Idaho','Semiconductors','Information Technology','MU');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Norwegian Cruise Line Holdings','Florida[4]','Hotels, Resorts & Cruise Lines','Consumer Discretionary','NCLH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Nasdaq, Inc.','New York','Financial Exchanges & Data','Financials','NDAQ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Nordson Corporation','Ohio','Industrial Machinery & Supplies & Components','Industrials','NDSN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('NextEra Energy','Florida','Multi-Utilities','Utilities','NEE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Newmont','Colorado','Gold','Materials','NEM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Netflix','California','Movies & Entertainment','Communication Services','NFLX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('NiSource','Indiana','Multi-Utilities','Utilities','NI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Nike, Inc.','Oregon','Apparel, Accessories & Luxury Goods','Consumer Discretionary','NKE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Northrop Grumman','Virginia[3]','Aerospace & Defense','Industrials','NOC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('ServiceNow','California','Systems Software','Information Technology','NOW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('NRG Energy','Texas','Independent Power Producers & Energy Traders','Utilities','NRG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Norfolk Southern','Georgia','Rail Transportation','Industrials','NSC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('NetApp','California','Technology Hardware, Storage & Peripherals','Information Technology','NTAP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Northern Trust','Illinois','Asset Management & Custody Banks','Financials','NTRS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Nucor','North Carolina','Steel','Materials','NUE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Nvidia','California','Semiconductors','Information Technology','NVDA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('NVR, Inc.','Virginia','Homebuilding','Consumer Discretionary','NVR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('News Corp (Class B)','New York','Publishing','Communication Services','NWS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('News Corp (Class A)','New York','Publishing','Communication Services','NWSA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('NXP Semiconductors','Netherlands','Semiconductors','Information Technology','NXPI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Realty Income','California','Retail REITs','Real Estate','O');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Old Dominion','North Carolina','Cargo Ground Transportation','Industrials','ODFL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Oneok','Oklahoma','Oil & Gas Storage & Transportation','Energy','OKE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Omnicom Group','New York','Advertising','Communication Services','OMC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('ON Semiconductor','Arizona','Semiconductors','Information Technology','ON');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Oracle Corporation','Texas','Application Software','Information Technology','ORCL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('O’Reilly Automotive','Missouri','Automotive Retail','Consumer Discretionary','ORLY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Otis Worldwide','Connecticut','Industrial Machinery & Supplies & Components','Industrials','OTIS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Occidental Petroleum','Texas','Oil & Gas Exploration & Production','Energy','OXY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Palo Alto Networks','California','Systems Software','Information Technology','PANW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Paycom','Oklahoma','Human Resource & Employment Services','Industrials','PAYC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Paychex','New York','Human Resource & Employment Services','Industrials','PAYX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Paccar','Washington','Construction Machinery & Heavy Transportation Equipment','Industrials','PCAR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PG&E Corporation','California','Multi-Utilities','Utilities','PCG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Public Service Enterprise Group','New Jersey','Electric Utilities','Utilities','PEG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PepsiCo','New York','Soft Drinks & Non-alcoholic Beverages','Consumer Staples','PEP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Pfizer','New York','Pharmaceuticals','Health Care','PFE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Principal Financial Group','Iowa','Life & Health Insurance','Financials','PFG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Procter & Gamble','Ohio','Personal Care Products','Consumer Staples','PG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Progressive Corporation','Ohio','Property & Casualty Insurance','Financials','PGR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Parker Hannifin','Ohio','Industrial Machinery & Supplies & Components','Industrials','PH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PulteGroup','Georgia','Homebuilding','Consumer Discretionary','PHM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Packaging Corporation of America','Illinois','Paper & Plastic Packaging Products & Materials','Materials','PKG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Prologis','California','Industrial REITs','Real Estate','PLD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Palantir Technologies','Colorado','Application Software','Information Technology','PLTR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Philip Morris International','New York','Tobacco','Consumer Staples','PM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PNC Financial Services','Pennsylvania','Diversified Banks','Financials','PNC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Pentair','United Kingdom','Industrial Machinery & Supplies & Components','Industrials','PNR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Pinnacle West Capital','Arizona','Multi-Utilities','Utilities','PNW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Insulet Corporation','Massachusetts','Health Care Equipment','Health Care','PODD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Pool Corporation','Louisiana','Distributors','Consumer Discretionary','POOL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PPG Industries','Pennsylvania','Specialty Chemicals','Materials','PPG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PPL Corporation','Pennsylvania','Electric Utilities','Utilities','PPL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Prudential Financial','New Jersey','Life & Health Insurance','Financials','PRU');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Public Storage','California','Self-Storage REITs','Real Estate','PSA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Paramount Skydance Corporation','California','Movies & Entertainment','Communication Services','PSKY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Phillips 66','Texas','Oil & Gas Refining & Marketing','Energy','PSX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PTC Inc.','Massachusetts','Application Software','Information Technology','PTC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Quanta Services','Texas','Construction & Engineering','Industrials','PWR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('PayPal','California','Transaction & Payment Processing Services','Financials','PYPL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Qnity Electronics','Delaware','Semiconductor Materials & Equipment','Information Technology','Q');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Qualcomm','California','Semiconductors','Information Technology','QCOM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Royal Caribbean Group','Florida','Hotels, Resorts & Cruise Lines','Consumer Discretionary','RCL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Regency Centers','Florida','Retail REITs','Real Estate','REG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Regeneron Pharmaceuticals','New York','Biotechnology','Health Care','REGN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Regions Financial Corporation','Alabama','Regional Banks','Financials','RF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Raymond James Financial','Florida','Investment Banking & Brokerage','Financials','RJF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ralph Lauren Corporation','New York','Apparel, Accessories & Luxury Goods','Consumer Discretionary','RL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('ResMed','California','Health Care Equipment','Health Care','RMD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Rockwell Automation','Wisconsin','Electrical Components & Equipment','Industrials','ROK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Rollins, Inc.','Georgia','Environmental & Facilities Services','Industrials','ROL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Roper Technologies','Florida','Electronic Equipment & Instruments','Information Technology','ROP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ross Stores','California','Apparel Retail','Consumer Discretionary','ROST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Republic Services','Arizona','Environmental & Facilities Services','Industrials','RSG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('RTX Corporation','Massachusetts','Aerospace & Defense','Industrials','RTX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Revvity','Massachusetts','Health Care Equipment','Health Care','RVTY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('SBA Communications','Florida','Telecom Tower REITs','Real Estate','SBAC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Starbucks','Washington','Restaurants','Consumer Discretionary','SBUX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Charles Schwab Corporation','Texas','Investment Banking & Brokerage','Financials','SCHW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Sherwin-Williams','Ohio','Specialty Chemicals','Materials','SHW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('J.M. Smucker Company (The)','Ohio','Packaged Foods & Meats','Consumer Staples','SJM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Schlumberger','Texas','Oil & Gas Equipment & Services','Energy','SLB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Supermicro','California','Technology Hardware, Storage & Peripherals','Information Technology','SMCI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Snap-on','Wisconsin','Industrial Machinery & Supplies & Components','Industrials','SNA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Synopsys','California','Application Software','Information Technology','SNPS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Southern Company','Georgia','Electric Utilities','Utilities','SO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Solstice Advanced Materials','New Jersey','TBD','Materials','SOLS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Solventum','Minnesota','Health Care Technology','Health Care','SOLV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Simon Property Group','Indiana','Retail REITs','Real Estate','SPG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('S&P Global','New York','Financial Exchanges & Data','Financials','SPGI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Sempra','California','Multi-Utilities','Utilities','SRE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Steris','Ireland','Health Care Equipment','Health Care','STE');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Steel Dynamics','Indiana','Steel','Materials','STLD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('State Street Corporation','Massachusetts','Asset Management & Custody Banks','Financials','STT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Seagate Technology','Ireland','Technology Hardware, Storage & Peripherals','Information Technology','STX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Constellation Brands','New York','Distillers & Vintners','Consumer Staples','STZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Smurfit Westrock','Ireland','Paper & Plastic Packaging Products & Materials','Materials','SW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Stanley Black & Decker','Connecticut','Industrial Machinery & Supplies & Components','Industrials','SWK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Skyworks Solutions','California','Semiconductors','Information Technology','SWKS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Synchrony Financial','Connecticut','Consumer Finance','Financials','SYF');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Stryker Corporation','Michigan','Health Care Equipment','Health Care','SYK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Sysco','Texas','Food Distributors','Consumer Staples','SYY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('AT&T','Texas','Integrated Telecommunication Services','Communication Services','T');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Molson Coors Beverage Company','Illinois','Brewers','Consumer Staples','TAP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('TransDigm Group','Ohio','Aerospace & Defense','Industrials','TDG');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Teledyne Technologies','California','Electronic Equipment & Instruments','Information Technology','TDY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Bio-Techne','Minnesota','Life Sciences Tools & Services','Health Care','TECH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('TE Connectivity','Ireland','Electronic Manufacturing Services','Information Technology','TEL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Teradyne','Massachusetts','Semiconductor Materials & Equipment','Information Technology','TER');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Truist Financial','North Carolina','Diversified Banks','Financials','TFC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Target Corporation','Minnesota','Consumer Staples Merchandise Retail','Consumer Staples','TGT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('TJX Companies','Massachusetts','Apparel Retail','Consumer Discretionary','TJX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('TKO Group Holdings','New York','Movies & Entertainment','Communication Services','TKO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Thermo Fisher Scientific','Massachusetts','Life Sciences Tools & Services','Health Care','TMO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('T-Mobile US','Washington','Wireless Telecommunication Services','Communication Services','TMUS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Texas Pacific Land Corporation','Texas','Oil & Gas Exploration & Production','Energy','TPL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Tapestry, Inc.','New York','Apparel, Accessories & Luxury Goods','Consumer Discretionary','TPR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Targa Resources','Texas','Oil & Gas Storage & Transportation','Energy','TRGP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Trimble Inc.','Colorado','Electronic Equipment & Instruments','Information Technology','TRMB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('T. Rowe Price','Maryland','Asset Management & Custody Banks','Financials','TROW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Travelers Companies (The)','New York','Property & Casualty Insurance','Financials','TRV');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Tractor Supply','Tennessee','Other Specialty Retail','Consumer Discretionary','TSCO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Tesla, Inc.','Texas','Automobile Manufacturers','Consumer Discretionary','TSLA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Tyson Foods','Arkansas','Packaged Foods & Meats','Consumer Staples','TSN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Trane Technologies','Ireland','Building Products','Industrials','TT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Trade Desk (The)','California','Advertising','Communication Services','TTD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Take-Two Interactive','New York','Interactive Home Entertainment','Communication Services','TTWO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Texas Instruments','Texas','Semiconductors','Information Technology','TXN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Textron','Rhode Island','Aerospace & Defense','Industrials','TXT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Tyler Technologies','Texas','Application Software','Information Technology','TYL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('United Airlines Holdings','Illinois','Passenger Airlines','Industrials','UAL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Uber','California','Passenger Ground Transportation','Industrials','UBER');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('UDR, Inc.','Colorado','Multi-Family Residential REITs','Real Estate','UDR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Universal Health Services','Pennsylvania','Health Care Facilities','Health Care','UHS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ulta Beauty','Illinois','Other Specialty Retail','Consumer Discretionary','ULTA');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('UnitedHealth Group','Minnesota','Managed Health Care','Health Care','UNH');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Union Pacific Corporation','Nebraska','Rail Transportation','Industrials','UNP');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('United Parcel Service','Georgia','Air Freight & Logistics','Industrials','UPS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('United Rentals','Connecticut','Trading Companies & Distributors','Industrials','URI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('U.S. Bancorp','Minnesota','Diversified Banks','Financials','USB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Visa Inc.','California','Transaction & Payment Processing Services','Financials','V');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Vici Properties','New York','Hotel & Resort REITs','Real Estate','VICI');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Valero Energy','Texas','Oil & Gas Refining & Marketing','Energy','VLO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Veralto','Massachusetts','Environmental & Facilities Services','Industrials','VLTO');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Vulcan Materials Company','Alabama','Construction Materials','Materials','VMC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Verisk Analytics','New Jersey','Research & Consulting Services','Industrials','VRSK');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Verisign','Virginia','Internet Services & Infrastructure','Information Technology','VRSN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Vertex Pharmaceuticals','Massachusetts','Biotechnology','Health Care','VRTX');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Vistra Corp.','Texas','Electric Utilities','Utilities','VST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Ventas','Illinois','Health Care REITs','Real Estate','VTR');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Viatris','Pennsylvania','Pharmaceuticals','Health Care','VTRS');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Verizon','New York','Integrated Telecommunication Services','Communication Services','VZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Wabtec','Pennsylvania','Construction Machinery & Heavy Transportation Equipment','Industrials','WAB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Waters Corporation','Massachusetts','Life Sciences Tools & Services','Health Care','WAT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Warner Bros. Discovery','New York','Broadcasting','Communication Services','WBD');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Workday, Inc.','California','Application Software','Information Technology','WDAY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Western Digital','California','Technology Hardware, Storage & Peripherals','Information Technology','WDC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('WEC Energy Group','Wisconsin','Electric Utilities','Utilities','WEC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Welltower','Ohio','Health Care REITs','Real Estate','WELL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Wells Fargo','California','Diversified Banks','Financials','WFC');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Waste Management','Texas','Environmental & Facilities Services','Industrials','WM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Williams Companies','Oklahoma','Oil & Gas Storage & Transportation','Energy','WMB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Walmart','Arkansas','Consumer Staples Merchandise Retail','Consumer Staples','WMT');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('W. R. Berkley Corporation','Connecticut','Property & Casualty Insurance','Financials','WRB');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Williams-Sonoma, Inc.','California','Homefurnishing Retail','Consumer Discretionary','WSM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('West Pharmaceutical Services','Pennsylvania','Health Care Supplies','Health Care','WST');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Willis Towers Watson','United Kingdom','Insurance Brokers','Financials','WTW');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Weyerhaeuser','Washington','Timber REITs','Real Estate','WY');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Wynn Resorts','Nevada','Casinos & Gaming','Consumer Discretionary','WYNN');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Xcel Energy','Minnesota','Multi-Utilities','Utilities','XEL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('ExxonMobil','Texas','Integrated Oil & Gas','Energy','XOM');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Xylem Inc.','New York','Industrial Machinery & Supplies & Components','Industrials','XYL');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Block, Inc.','none','Transaction & Payment Processing Services','Financials','XYZ');
-INSERT INTO `Ticker` (`company_name`,`country`,`industry`,`sector`,`ticker_symbol`) VALUES ('Yum! Brands','Kentucky','Restaurants','Consumer Discretionary','YUM');
-
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('andrethomas@example.org','oo99A+a1gYf7BBCtJyX10QKLmb8HU3bngUgdV1kxn7s=','Renee','Wright');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('hortonpaul@example.com','O4GWQryyyhUlHrCgXxIYXAOsj4x9YMUqgnokKOdjcMM=','David','Clark');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('qbarron@example.org','U1s2AagrISKZXn6j1I/MctZhvvxyD//mRF3MRnuUFc4=','Patricia','Holland');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('kristinarobinson@example.org','D9vsFprj3JXeTl/bLUy2FzP+yZtfgIeC2aZ3xGpN8pc=','James','Scott');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('cjordan@example.org','raWyWAm/lI+alW83GPma7DRmHZ6LOYTenBjHVJodZFQ=','Ronald','Burke');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('uanderson@example.net','vYIGZUvYqJPTguICAAG051hQ9XFmEXDeO79isSG0ARo=','Randall','Jackson');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('dgrant@example.org','N3UIxj3wivgElTA2nSp1sZMazjuZmpzlSXFTDJJJxUM=','Derrick','Olsen');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('hamptonkenneth@example.org','mmDP7D42WQtB9u0s/GBZdZfE6t4xXOFxSEG2mPWJLoQ=','George','Henderson');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('castillomatthew@example.net','8R/0KDxVWOIOYFAIYlr97g1MfcFfDLCSPX4ykFubCoE=','Kenneth','Molina');
-INSERT INTO `User` (`email`,`password_hash`,`first_name`,`last_name`) VALUES ('kimberlypadilla@example.org','UGvyaLAFSD0hypP3JYvqRtomsq2Z4YZXPWnyOvx/ngc=','Clinton','Harris');
+INSERT INTO `PriceHistory` (`close_price`,`date`,`high_price`,`low_price`,`open_price`,`price_history_id`,`ticker_symbol`,`volume`) VALUES
+(130.35e0,'2024-11-12',130.43e0,129.9e0,130.105e0,1,'MMM',594254),
+(131.45e0,'2024-11-13',131.56e0,131.1475e0,131.435e0,2,'MMM',363322),
+(132.33e0,'2024-11-14',132.54e0,132.12e0,132.52e0,3,'MMM',346375),
+(129.78e0,'2024-11-15',130.01e0,129.73e0,129.88e0,4,'MMM',318453),
+(130.18e0,'2024-11-18',130.24e0,129.88e0,129.93e0,5,'MMM',317504),
+(128.19e0,'2024-11-19',128.255e0,128.0e0,128.24e0,6,'MMM',335179),
+(127.83e0,'2024-11-20',128.09e0,127.54e0,127.54e0,7,'MMM',247532),
+(127.31e0,'2024-11-21',127.82e0,127.2e0,127.769e0,8,'MMM',383077),
+(128.44e0,'2024-11-22',128.48e0,128.12e0,128.13e0,9,'MMM',489524),
+(130.31e0,'2024-11-25',130.33e0,129.42e0,129.445e0,10,'MMM',695067),
+(132.945e0,'2024-11-26',133.23e0,132.75e0,132.85e0,11,'MMM',752088),
+(132.48e0,'2024-11-27',132.86e0,132.36e0,132.72e0,12,'MMM',329219),
+(133.585e0,'2024-11-29',133.63e0,133.04e0,133.2e0,13,'MMM',268307),
+(132.84e0,'2024-12-02',133.415e0,132.635e0,133.415e0,14,'MMM',590330),
+(131.15e0,'2024-12-03',131.5235e0,131.13e0,131.34e0,15,'MMM',359187),
+(130.43e0,'2024-12-04',130.75e0,130.17e0,130.27e0,16,'MMM',359242),
+(133.33e0,'2024-12-05',133.47e0,132.97e0,132.97e0,17,'MMM',540419),
+(133.08e0,'2024-12-06',133.18e0,132.47e0,132.57e0,18,'MMM',346683),
+(131.48e0,'2024-12-09',132.19e0,131.27e0,132.08e0,19,'MMM',886411),
+(129.77e0,'2024-12-10',129.89e0,129.43e0,129.87e0,20,'MMM',490103),
+(129.79e0,'2024-12-11',130.03e0,129.58e0,129.71e0,21,'MMM',496158),
+(129.74e0,'2024-12-12',129.83e0,129.17e0,129.18e0,22,'MMM',356843),
+(129.91e0,'2024-12-13',129.98e0,129.49e0,129.55e0,23,'MMM',422174),
+(129.47e0,'2024-12-16',129.74e0,129.345e0,129.535e0,24,'MMM',600734),
+(128.05e0,'2024-12-17',128.36e0,127.93e0,128.3e0,25,'MMM',423390),
+(125.5e0,'2024-12-18',127.06e0,125.37e0,126.815e0,26,'MMM',975886),
+(127.11e0,'2024-12-19',127.738e0,127.016e0,127.48e0,27,'MMM',512895),
+(129.26e0,'2024-12-20',130.35e0,129.14e0,129.4e0,28,'MMM',1108101),
+(128.94e0,'2024-12-23',129.19e0,128.695e0,128.79e0,29,'MMM',301318),
+(129.8905e0,'2024-12-24',129.94e0,129.33e0,129.52e0,30,'MMM',123666),
+(131.23e0,'2024-12-26',131.4e0,130.43e0,130.52e0,31,'MMM',311205),
+(130.18e0,'2024-12-27',130.23e0,129.565e0,129.78e0,32,'MMM',392235),
+(129.14e0,'2024-12-30',129.845e0,129.11e0,129.56e0,33,'MMM',431634),
+(129.1e0,'2024-12-31',129.335e0,128.84e0,129.26e0,34,'MMM',377924),
+(129.72e0,'2025-01-02',130.03e0,129.47e0,129.79e0,35,'MMM',527960),
+(129.84e0,'2025-01-03',130.22e0,129.8e0,129.93e0,36,'MMM',351897),
+(130.3e0,'2025-01-06',130.31e0,129.945e0,130.14e0,37,'MMM',511582),
+(132.79e0,'2025-01-07',132.8e0,131.71e0,131.88e0,38,'MMM',746750),
+(134.53e0,'2025-01-08',134.57e0,133.625e0,133.705e0,39,'MMM',761180),
+(131.21e0,'2025-01-10',131.49e0,130.63e0,130.75e0,40,'MMM',873482),
+(134.54e0,'2025-01-13',134.73e0,133.92e0,133.96e0,41,'MMM',1191342),
+(137.22e0,'2025-01-14',137.58e0,137.0749e0,137.24e0,42,'MMM',872432),
+(137.79e0,'2025-01-15',138.11e0,137.61e0,137.95e0,43,'MMM',839018),
+(139.17e0,'2025-01-16',139.45e0,139.075e0,139.13e0,44,'MMM',579080),
+(141.015e0,'2025-01-17',141.28e0,140.65e0,140.685e0,45,'MMM',1140968),
+(146.93e0,'2025-01-21',147.26e0,146.5202e0,147.2e0,46,'MMM',1080001),
+(149.14e0,'2025-01-22',150.05e0,149.04e0,149.89e0,47,'MMM',991692),
+(149.62e0,'2025-01-23',149.8e0,149.0e0,149.735e0,48,'MMM',993725),
+(149.44e0,'2025-01-24',149.7e0,149.23e0,149.43e0,49,'MMM',844795),
+(151.51e0,'2025-01-27',151.56e0,150.8e0,150.94e0,50,'MMM',864013),
+(151.39e0,'2025-01-28',151.48e0,150.73e0,150.8839e0,51,'MMM',816336),
+(151.5e0,'2025-01-29',151.655e0,150.91e0,151.6e0,52,'MMM',786219),
+(154.41e0,'2025-01-30',154.59e0,153.33e0,154.42e0,53,'MMM',968761),
+(152.22e0,'2025-01-31',152.92e0,152.13e0,152.84e0,54,'MMM',577851),
+(149.97e0,'2025-02-03',150.45e0,149.63e0,149.75e0,55,'MMM',573310),
+(151.66e0,'2025-02-04',151.98e0,151.515e0,151.87e0,56,'MMM',418170),
+(152.45e0,'2025-02-05',152.81e0,152.4e0,152.75e0,57,'MMM',427496),
+(152.31e0,'2025-02-06',152.685e0,152.064e0,152.33e0,58,'MMM',323154),
+(149.9e0,'2025-02-07',150.0e0,149.58e0,149.58e0,59,'MMM',502516),
+(149.69e0,'2025-02-10',149.765e0,149.13e0,149.2e0,60,'MMM',569336),
+(150.01e0,'2025-02-11',150.38e0,149.65e0,150.235e0,61,'MMM',381343),
+(148.895e0,'2025-02-12',149.18e0,148.76e0,148.95e0,62,'MMM',332740),
+(148.7e0,'2025-02-13',149.15e0,148.63e0,149.15e0,63,'MMM',364482),
+(148.62e0,'2025-02-14',148.9363e0,148.57e0,148.8568e0,64,'MMM',265442),
+(148.98e0,'2025-02-18',149.09e0,148.6001e0,149.01e0,65,'MMM',400881),
+(150.19e0,'2025-02-19',150.22e0,149.8601e0,150.12e0,66,'MMM',463553),
+(149.09e0,'2025-02-20',149.19e0,148.3975e0,148.535e0,67,'MMM',427434),
+(144.95e0,'2025-02-21',145.74e0,144.72e0,144.87e0,68,'MMM',875169),
+(145.5e0,'2025-02-24',146.09e0,145.38e0,145.58e0,69,'MMM',526265),
+(146.58e0,'2025-02-25',147.35e0,146.2e0,147.3e0,70,'MMM',867476),
+(147.45e0,'2025-02-26',148.28e0,147.185e0,147.39e0,71,'MMM',798088),
+(150.5e0,'2025-02-27',150.85e0,149.57e0,149.6e0,72,'MMM',1267026),
+(155.26e0,'2025-02-28',155.26e0,153.87e0,154.96e0,73,'MMM',1415149),
+(153.42e0,'2025-03-03',153.46e0,151.9e0,152.75e0,74,'MMM',975272),
+(145.9e0,'2025-03-04',148.7e0,145.62e0,148.7e0,75,'MMM',958451),
+(147.58e0,'2025-03-05',148.25e0,147.13e0,148.25e0,76,'MMM',635908),
+(146.9e0,'2025-03-06',147.35e0,146.4e0,147.0e0,77,'MMM',661573),
+(146.255e0,'2025-03-07',146.8e0,145.36e0,146.3e0,78,'MMM',877091),
+(147.63e0,'2025-03-10',148.24e0,147.28e0,147.6e0,79,'MMM',622782),
+(147.57e0,'2025-03-11',149.0e0,147.49e0,148.42e0,80,'MMM',876284),
+(150.24e0,'2025-03-12',150.895e0,150.1031e0,150.72e0,81,'MMM',624768),
+(146.11e0,'2025-03-13',146.82e0,145.91e0,146.69e0,82,'MMM',636289),
+(150.41e0,'2025-03-14',150.79e0,150.0301e0,150.26e0,83,'MMM',616206),
+(153.22e0,'2025-03-17',153.72e0,153.05e0,153.66e0,84,'MMM',614131),
+(150.9e0,'2025-03-18',151.4e0,150.5675e0,151.32e0,85,'MMM',556215),
+(153.22e0,'2025-03-19',153.69e0,152.85e0,153.11e0,86,'MMM',467720),
+(151.27e0,'2025-03-20',152.1e0,151.09e0,151.895e0,87,'MMM',569948),
+(150.355e0,'2025-03-21',150.46e0,149.86e0,150.01e0,88,'MMM',376941),
+(153.13e0,'2025-03-24',153.77e0,153.01e0,153.01e0,89,'MMM',477421),
+(153.53e0,'2025-03-25',153.73e0,152.68e0,153.2e0,90,'MMM',506386),
+(152.66e0,'2025-03-26',152.86e0,152.36e0,152.54e0,91,'MMM',512712),
+(148.44e0,'2025-03-27',149.56e0,148.33e0,149.56e0,92,'MMM',394040),
+(144.82e0,'2025-03-28',145.29e0,144.71e0,145.04e0,93,'MMM',429262),
+(146.86e0,'2025-03-31',147.735e0,146.64e0,146.97e0,94,'MMM',625216),
+(147.67e0,'2025-04-01',148.0e0,147.325e0,147.41e0,95,'MMM',385304),
+(147.75e0,'2025-04-02',148.17e0,147.17e0,147.18e0,96,'MMM',659387),
+(139.73e0,'2025-04-03',140.44e0,139.59e0,140.015e0,97,'MMM',885163),
+(126.93e0,'2025-04-04',129.17e0,126.43e0,128.315e0,98,'MMM',1193009),
+(128.61e0,'2025-04-07',128.93e0,126.97e0,127.425e0,99,'MMM',992844),
+(127.17e0,'2025-04-08',127.42e0,124.82e0,127.08e0,100,'MMM',1028769),
+(138.225e0,'2025-04-09',139.23e0,137.3e0,138.155e0,101,'MMM',1174530),
+(132.93e0,'2025-04-10',133.15e0,130.505e0,132.03e0,102,'MMM',806285),
+(135.92e0,'2025-04-11',136.485e0,135.43e0,135.8421e0,103,'MMM',763986),
+(136.015e0,'2025-04-14',136.75e0,135.83e0,136.45e0,104,'MMM',488804),
+(135.27e0,'2025-04-15',135.73e0,135.14e0,135.57e0,105,'MMM',471335),
+(130.47e0,'2025-04-16',131.22e0,129.89e0,130.04e0,106,'MMM',1358552),
+(130.17e0,'2025-04-17',131.14e0,130.08e0,130.655e0,107,'MMM',776627),
+(126.05e0,'2025-04-21',126.12e0,125.12e0,125.35e0,108,'MMM',1200864),
+(136.34e0,'2025-04-22',137.272e0,136.04e0,136.4e0,109,'MMM',1203674),
+(135.96e0,'2025-04-23',136.4e0,135.28e0,135.73e0,110,'MMM',726250),
+(138.87e0,'2025-04-24',139.45e0,138.7375e0,139.105e0,111,'MMM',482619),
+(137.285e0,'2025-04-25',137.57e0,137.105e0,137.46e0,112,'MMM',458243),
+(137.93e0,'2025-04-28',138.41e0,137.4e0,137.695e0,113,'MMM',417426),
+(138.38e0,'2025-04-29',138.68e0,138.1525e0,138.37e0,114,'MMM',346312),
+(138.83e0,'2025-04-30',139.31e0,137.35e0,137.59e0,115,'MMM',593023),
+(137.9e0,'2025-05-01',138.8e0,137.79e0,138.775e0,116,'MMM',403655),
+(142.07e0,'2025-05-02',142.625e0,141.95e0,142.31e0,117,'MMM',509019),
+(140.79e0,'2025-05-05',141.2e0,140.55e0,141.19e0,118,'MMM',463123),
+(138.0e0,'2025-05-06',138.56e0,137.93e0,138.25e0,119,'MMM',496618),
+(138.56e0,'2025-05-07',139.28e0,137.89e0,137.91e0,120,'MMM',411371),
+(141.16e0,'2025-05-08',142.2e0,140.94e0,142.0e0,121,'MMM',469888),
+(142.61e0,'2025-05-09',142.62e0,141.9e0,142.13e0,122,'MMM',561632),
+(150.35e0,'2025-05-12',150.4599e0,149.81e0,150.225e0,123,'MMM',765990),
+(150.72e0,'2025-05-13',151.28e0,150.7e0,150.96e0,124,'MMM',597976),
+(147.88e0,'2025-05-14',148.41e0,147.81e0,147.96e0,125,'MMM',537522),
+(148.8e0,'2025-05-15',149.15e0,148.59e0,149.0225e0,126,'MMM',334560),
+(153.09e0,'2025-05-16',153.28e0,152.7101e0,152.73e0,127,'MMM',616289),
+(154.1e0,'2025-05-19',154.26e0,153.65e0,153.65e0,128,'MMM',594505),
+(154.14e0,'2025-05-20',154.23e0,153.74e0,153.77e0,129,'MMM',403362),
+(149.39e0,'2025-05-21',149.9e0,149.33e0,149.45e0,130,'MMM',574393),
+(149.75e0,'2025-05-22',150.53e0,149.59e0,150.52e0,131,'MMM',446200),
+(147.62e0,'2025-05-23',148.28e0,147.45e0,148.132e0,132,'MMM',440393),
+(149.5e0,'2025-05-27',149.58e0,149.19e0,149.3e0,133,'MMM',380679),
+(148.67e0,'2025-05-28',148.77e0,148.395e0,148.635e0,134,'MMM',307743),
+(149.66e0,'2025-05-29',149.8e0,149.11e0,149.14e0,135,'MMM',290623),
+(148.3e0,'2025-05-30',148.96e0,148.11e0,148.96e0,136,'MMM',728664),
+(146.44e0,'2025-06-02',146.54e0,146.21e0,146.53e0,137,'MMM',364339),
+(148.13e0,'2025-06-03',148.36e0,147.92e0,147.945e0,138,'MMM',388537),
+(146.8e0,'2025-06-04',147.585e0,146.71e0,147.51e0,139,'MMM',551742),
+(146.25e0,'2025-06-05',146.835e0,146.0e0,146.07e0,140,'MMM',739071),
+(145.48e0,'2025-06-06',146.05e0,145.46e0,145.78e0,141,'MMM',497388),
+(144.23e0,'2025-06-09',144.95e0,144.1201e0,144.92e0,142,'MMM',535097),
+(145.04e0,'2025-06-10',145.15e0,144.685e0,144.91e0,143,'MMM',501135),
+(147.17e0,'2025-06-11',147.25e0,146.63e0,146.96e0,144,'MMM',408240),
+(144.76e0,'2025-06-12',145.08e0,144.49e0,145.0316e0,145,'MMM',449358),
+(142.31e0,'2025-06-13',142.48e0,142.02e0,142.16e0,146,'MMM',461107),
+(145.12e0,'2025-06-16',145.21e0,144.677e0,144.74e0,147,'MMM',317029),
+(142.17e0,'2025-06-17',142.48e0,141.99e0,142.16e0,148,'MMM',360757),
+(142.54e0,'2025-06-18',143.1e0,142.2414e0,142.25e0,149,'MMM',583263),
+(144.02e0,'2025-06-20',144.05e0,143.03e0,143.28e0,150,'MMM',759182),
+(147.6e0,'2025-06-23',147.72e0,146.6548e0,146.685e0,151,'MMM',831903),
+(149.89e0,'2025-06-24',150.29e0,149.75e0,150.045e0,152,'MMM',447507),
+(147.76e0,'2025-06-25',147.83e0,147.3e0,147.64e0,153,'MMM',381670),
+(150.79e0,'2025-06-26',150.92e0,150.29e0,150.57e0,154,'MMM',610460),
+(152.02e0,'2025-06-27',152.23e0,151.18e0,151.41e0,155,'MMM',371152),
+(152.17e0,'2025-06-30',152.46e0,151.8694e0,152.06e0,156,'MMM',349206),
+(153.81e0,'2025-07-01',154.625e0,153.76e0,154.625e0,157,'MMM',564597),
+(153.97e0,'2025-07-02',154.16e0,153.66e0,153.93e0,158,'MMM',630014),
+(152.845e0,'2025-07-03',153.18e0,152.39e0,152.57e0,159,'MMM',455011),
+(151.83e0,'2025-07-07',152.28e0,151.77e0,151.84e0,160,'MMM',713788),
+(153.75e0,'2025-07-08',154.43e0,153.45e0,154.43e0,161,'MMM',502625),
+(156.03e0,'2025-07-09',156.22e0,155.77e0,155.815e0,162,'MMM',492610),
+(157.34e0,'2025-07-10',158.42e0,157.21e0,158.16e0,163,'MMM',654844),
+(155.81e0,'2025-07-11',156.1e0,155.59e0,156.02e0,164,'MMM',377355),
+(157.91e0,'2025-07-14',158.11e0,157.32e0,157.4e0,165,'MMM',551476),
+(156.58e0,'2025-07-15',157.295e0,156.55e0,156.88e0,166,'MMM',433344),
+(157.46e0,'2025-07-16',157.68e0,157.035e0,157.12e0,167,'MMM',515248),
+(159.18e0,'2025-07-17',159.41e0,158.63e0,158.88e0,168,'MMM',1374137),
+(153.25e0,'2025-07-18',154.18e0,151.93e0,152.17e0,169,'MMM',2241541),
+(152.81e0,'2025-07-21',152.91e0,151.735e0,152.34e0,170,'MMM',726699),
+(151.09e0,'2025-07-22',151.83e0,151.09e0,151.65e0,171,'MMM',675245),
+(150.87e0,'2025-07-23',151.45e0,150.69e0,151.27e0,172,'MMM',759981),
+(149.34e0,'2025-07-24',149.65e0,149.16e0,149.22e0,173,'MMM',787112),
+(151.26e0,'2025-07-25',151.4e0,151.01e0,151.15e0,174,'MMM',363213),
+(152.09e0,'2025-07-28',152.22e0,151.745e0,152.03e0,175,'MMM',571695),
+(151.8e0,'2025-07-29',151.84e0,151.1501e0,151.53e0,176,'MMM',641174),
+(146.66e0,'2025-07-30',147.3e0,146.5e0,147.09e0,177,'MMM',724683),
+(149.22e0,'2025-07-31',149.46e0,148.88e0,149.33e0,178,'MMM',823669),
+(144.38e0,'2025-08-01',145.07e0,144.25e0,144.915e0,179,'MMM',830350),
+(147.9e0,'2025-08-04',148.18e0,147.58e0,147.72e0,180,'MMM',540721),
+(150.19e0,'2025-08-05',150.61e0,149.99e0,150.285e0,181,'MMM',570587),
+(150.83e0,'2025-08-06',151.385e0,150.81e0,151.17e0,182,'MMM',454055),
+(151.76e0,'2025-08-07',151.78e0,151.27e0,151.29e0,183,'MMM',326977),
+(153.345e0,'2025-08-08',153.67e0,153.02e0,153.63e0,184,'MMM',435766),
+(155.325e0,'2025-08-11',155.61e0,155.005e0,155.22e0,185,'MMM',633131),
+(157.84e0,'2025-08-12',158.46e0,157.33e0,157.57e0,186,'MMM',728648),
+(160.2e0,'2025-08-13',160.47e0,159.4376e0,159.89e0,187,'MMM',560788),
+(156.68e0,'2025-08-14',157.57e0,156.63e0,157.56e0,188,'MMM',454537),
+(152.41e0,'2025-08-15',152.77e0,152.1501e0,152.7e0,189,'MMM',714241),
+(152.81e0,'2025-08-18',152.94e0,152.7e0,152.85e0,190,'MMM',318580),
+(154.32e0,'2025-08-19',154.39e0,153.78e0,154.05e0,191,'MMM',384257),
+(154.73e0,'2025-08-20',155.195e0,154.59e0,154.93e0,192,'MMM',594124),
+(154.41e0,'2025-08-21',154.67e0,154.24e0,154.625e0,193,'MMM',286388),
+(158.69e0,'2025-08-22',158.83e0,158.43e0,158.45e0,194,'MMM',354694),
+(155.86e0,'2025-08-25',156.3e0,155.8e0,156.3e0,195,'MMM',275950),
+(156.54e0,'2025-08-26',156.72e0,155.91e0,155.97e0,196,'MMM',491782),
+(156.58e0,'2025-08-27',157.115e0,156.58e0,156.74e0,197,'MMM',517821),
+(157.56e0,'2025-08-28',157.705e0,157.09e0,157.25e0,198,'MMM',392706),
+(155.55e0,'2025-08-29',155.85e0,155.315e0,155.76e0,199,'MMM',573519),
+(154.23e0,'2025-09-02',154.415e0,153.95e0,154.16e0,200,'MMM',561378),
+(151.98e0,'2025-09-03',152.34e0,151.705e0,151.72e0,201,'MMM',605583),
+(155.5e0,'2025-09-04',155.6e0,154.88e0,154.92e0,202,'MMM',444295),
+(155.37e0,'2025-09-05',155.61e0,154.77e0,155.485e0,203,'MMM',536087),
+(153.975e0,'2025-09-08',154.04e0,153.34e0,153.525e0,204,'MMM',505843),
+(153.06e0,'2025-09-09',153.25e0,152.8101e0,153.05e0,205,'MMM',301180),
+(153.56e0,'2025-09-10',153.63e0,152.5e0,152.605e0,206,'MMM',444961),
+(159.46e0,'2025-09-11',159.5e0,158.39e0,158.39e0,207,'MMM',800007),
+(157.88e0,'2025-09-12',158.42e0,157.81e0,158.3e0,208,'MMM',384402),
+(156.66e0,'2025-09-15',156.7e0,156.105e0,156.2e0,209,'MMM',438054),
+(156.49e0,'2025-09-16',156.72e0,155.405e0,155.555e0,210,'MMM',395797),
+(155.16e0,'2025-09-17',155.35e0,154.4e0,154.69e0,211,'MMM',428044),
+(155.4e0,'2025-09-18',155.44e0,154.93e0,155.24e0,212,'MMM',281476),
+(156.63e0,'2025-09-19',157.41e0,156.3e0,156.68e0,213,'MMM',779155),
+(153.85e0,'2025-09-22',154.265e0,153.81e0,153.96e0,214,'MMM',466053),
+(156.335e0,'2025-09-23',156.75e0,156.04e0,156.115e0,215,'MMM',376357),
+(154.63e0,'2025-09-24',154.875e0,154.46e0,154.75e0,216,'MMM',244163),
+(153.04e0,'2025-09-25',153.075e0,152.385e0,152.56e0,217,'MMM',417732),
+(152.77e0,'2025-09-26',152.87e0,152.47e0,152.7e0,218,'MMM',453466),
+(154.07e0,'2025-09-29',154.4e0,153.76e0,154.25e0,219,'MMM',276692),
+(155.18e0,'2025-09-30',155.2e0,154.05e0,154.665e0,220,'MMM',387337),
+(156.04e0,'2025-10-01',156.325e0,155.83e0,156.1885e0,221,'MMM',278105),
+(158.81e0,'2025-10-02',158.89e0,158.03e0,158.85e0,222,'MMM',445635),
+(158.66e0,'2025-10-03',159.0e0,158.13e0,158.65e0,223,'MMM',469071),
+(155.94e0,'2025-10-06',156.19e0,155.475e0,155.8e0,224,'MMM',408206),
+(155.33e0,'2025-10-07',155.75e0,155.18e0,155.455e0,225,'MMM',284945),
+(155.98e0,'2025-10-08',156.09e0,155.73e0,155.805e0,226,'MMM',258694),
+(152.88e0,'2025-10-09',152.93e0,152.11e0,152.155e0,227,'MMM',408040),
+(148.8e0,'2025-10-10',149.32e0,148.455e0,149.31e0,228,'MMM',575645),
+(151.11e0,'2025-10-13',151.41e0,150.85e0,151.22e0,229,'MMM',573108),
+(152.49e0,'2025-10-14',153.21e0,152.14e0,153.21e0,230,'MMM',534678),
+(153.49e0,'2025-10-15',153.95e0,153.21e0,153.93e0,231,'MMM',396326),
+(151.41e0,'2025-10-16',151.7e0,151.18e0,151.66e0,232,'MMM',704602),
+(152.67e0,'2025-10-17',152.79e0,152.41e0,152.705e0,233,'MMM',581844),
+(154.81e0,'2025-10-20',156.07e0,154.59e0,156.0e0,234,'MMM',793693),
+(166.67e0,'2025-10-21',166.82e0,164.8e0,164.8e0,235,'MMM',1232351),
+(167.25e0,'2025-10-22',167.45e0,166.39e0,166.82e0,236,'MMM',830415),
+(171.6e0,'2025-10-23',171.63e0,170.6115e0,170.78e0,237,'MMM',1117597),
+(168.47e0,'2025-10-24',168.68e0,168.065e0,168.53e0,238,'MMM',692810),
+(168.35e0,'2025-10-27',168.46e0,168.06e0,168.2e0,239,'MMM',529089),
+(166.82e0,'2025-10-28',166.87e0,166.35e0,166.63e0,240,'MMM',510797),
+(164.62e0,'2025-10-29',164.74e0,163.61e0,164.4e0,241,'MMM',678985),
+(166.44e0,'2025-10-30',166.54e0,166.235e0,166.45e0,242,'MMM',421396),
+(166.46e0,'2025-10-31',167.22e0,166.34e0,167.05e0,243,'MMM',384119),
+(162.2e0,'2025-11-03',162.77e0,161.485e0,162.525e0,244,'MMM',805801),
+(160.57e0,'2025-11-04',161.48e0,160.18e0,161.33e0,245,'MMM',634353),
+(164.29e0,'2025-11-05',164.825e0,164.21e0,164.355e0,246,'MMM',667351),
+(163.89e0,'2025-11-06',164.42e0,163.705e0,164.0e0,247,'MMM',435825),
+(164.8e0,'2025-11-07',165.18e0,164.36e0,164.93e0,248,'MMM',470886),
+(167.63e0,'2025-11-10',168.56e0,167.5e0,168.33e0,249,'MMM',482610),
+(168.73e0,'2025-11-11',169.1e0,168.59e0,168.9675e0,250,'MMM',361520),
+(73.15e0,'2024-11-12',73.355e0,73.05e0,73.28e0,1739,'AOS',347549),
+(73.13e0,'2024-11-13',73.29e0,73.02e0,73.17e0,1740,'AOS',229786),
+(73.0e0,'2024-11-14',73.345e0,72.92e0,73.33e0,1741,'AOS',196369),
+(72.25e0,'2024-11-15',72.415e0,72.2e0,72.38e0,1742,'AOS',243935),
+(72.15e0,'2024-11-18',72.26e0,72.03e0,72.16e0,1743,'AOS',207988),
+(71.42e0,'2024-11-19',71.46e0,71.255e0,71.36e0,1744,'AOS',257523),
+(71.76e0,'2024-11-20',71.93e0,71.58e0,71.58e0,1745,'AOS',198934),
+(72.97e0,'2024-11-21',73.56e0,72.91e0,73.38e0,1746,'AOS',275175),
+(73.42e0,'2024-11-22',73.57e0,73.35e0,73.41e0,1747,'AOS',140474),
+(75.43e0,'2024-11-25',75.59e0,75.35e0,75.49e0,1748,'AOS',158218),
+(73.905e0,'2024-11-26',74.18e0,73.83e0,73.91e0,1749,'AOS',181222),
+(74.11e0,'2024-11-27',74.18e0,74.01e0,74.105e0,1750,'AOS',99862),
+(74.56e0,'2024-11-29',74.67e0,74.47e0,74.5e0,1751,'AOS',53355),
+(74.65e0,'2024-12-02',74.86e0,74.54e0,74.68e0,1752,'AOS',208012),
+(74.02e0,'2024-12-03',74.07e0,73.68e0,73.81e0,1753,'AOS',254507),
+(73.59e0,'2024-12-04',73.62e0,73.23e0,73.44e0,1754,'AOS',332780),
+(72.32e0,'2024-12-05',72.38e0,71.98e0,72.372e0,1755,'AOS',276389),
+(72.57e0,'2024-12-06',72.72e0,72.54e0,72.66e0,1756,'AOS',250762),
+(73.88e0,'2024-12-09',74.17e0,73.79e0,74.09e0,1757,'AOS',340749),
+(73.0e0,'2024-12-10',73.01e0,72.62e0,72.85e0,1758,'AOS',199560),
+(72.85e0,'2024-12-11',73.035e0,72.7e0,72.85e0,1759,'AOS',212846),
+(72.62e0,'2024-12-12',72.92e0,72.45e0,72.9e0,1760,'AOS',149857),
+(72.48e0,'2024-12-13',72.565e0,72.36e0,72.48e0,1761,'AOS',195355),
+(71.9e0,'2024-12-16',72.025e0,71.8e0,72.025e0,1762,'AOS',136959),
+(70.82e0,'2024-12-17',71.085e0,70.76e0,71.07e0,1763,'AOS',210743),
+(68.89e0,'2024-12-18',69.74e0,68.89e0,69.63e0,1764,'AOS',171369),
+(68.42e0,'2024-12-19',68.82e0,68.38e0,68.745e0,1765,'AOS',267791),
+(68.72e0,'2024-12-20',69.11e0,68.62e0,68.89e0,1766,'AOS',267862),
+(68.54e0,'2024-12-23',68.635e0,68.365e0,68.47e0,1767,'AOS',102357),
+(68.7e0,'2024-12-24',68.74e0,68.51e0,68.58e0,1768,'AOS',51032),
+(68.86e0,'2024-12-26',69.02e0,68.58e0,68.62e0,1769,'AOS',149980),
+(68.46e0,'2024-12-27',68.56e0,68.29e0,68.37e0,1770,'AOS',122162),
+(68.03e0,'2024-12-30',68.23e0,67.93e0,68.06e0,1771,'AOS',157138),
+(68.21e0,'2024-12-31',68.23e0,68.0e0,68.14e0,1772,'AOS',146610),
+(67.33e0,'2025-01-02',67.58e0,67.29e0,67.495e0,1773,'AOS',197061),
+(68.59e0,'2025-01-03',68.76e0,68.43e0,68.735e0,1774,'AOS',191098),
+(68.9e0,'2025-01-06',68.95e0,68.585e0,68.73e0,1775,'AOS',236392),
+(68.31e0,'2025-01-07',68.32e0,67.96e0,68.155e0,1776,'AOS',226745),
+(68.67e0,'2025-01-08',68.7594e0,68.51e0,68.63e0,1777,'AOS',173712),
+(67.58e0,'2025-01-10',67.62e0,67.2e0,67.415e0,1778,'AOS',285544),
+(68.61e0,'2025-01-13',68.78e0,68.4899e0,68.53e0,1779,'AOS',200612),
+(71.26e0,'2025-01-14',71.35e0,71.16e0,71.35e0,1780,'AOS',335903),
+(70.93e0,'2025-01-15',71.23e0,70.895e0,71.19e0,1781,'AOS',368508),
+(71.41e0,'2025-01-16',71.47e0,71.065e0,71.09e0,1782,'AOS',176591),
+(71.81e0,'2025-01-17',71.9e0,71.42e0,71.5e0,1783,'AOS',294953),
+(72.69e0,'2025-01-21',72.78e0,72.54e0,72.63e0,1784,'AOS',238902),
+(70.99e0,'2025-01-22',71.22e0,70.93e0,71.0809e0,1785,'AOS',257523),
+(71.27e0,'2025-01-23',71.5e0,71.26e0,71.43e0,1786,'AOS',281739),
+(70.59e0,'2025-01-24',70.68e0,70.41e0,70.44e0,1787,'AOS',249345),
+(71.44e0,'2025-01-27',71.59e0,71.295e0,71.59e0,1788,'AOS',225726),
+(69.9e0,'2025-01-28',70.09e0,69.76e0,69.93e0,1789,'AOS',290023),
+(69.22e0,'2025-01-29',69.25e0,68.9e0,69.15e0,1790,'AOS',340973),
+(67.26e0,'2025-01-30',67.41e0,66.475e0,67.14e0,1791,'AOS',897880),
+(67.3e0,'2025-01-31',67.45e0,67.1742e0,67.21e0,1792,'AOS',455448),
+(67.05e0,'2025-02-03',67.13e0,66.55e0,66.55e0,1793,'AOS',402371),
+(65.66e0,'2025-02-04',66.02e0,65.65e0,66.01e0,1794,'AOS',301131),
+(65.62e0,'2025-02-05',65.76e0,65.545e0,65.575e0,1795,'AOS',272375),
+(65.49e0,'2025-02-06',65.75e0,65.45e0,65.66e0,1796,'AOS',165539),
+(65.18e0,'2025-02-07',65.43e0,65.05e0,65.26e0,1797,'AOS',170981),
+(65.72e0,'2025-02-10',65.86e0,65.6e0,65.845e0,1798,'AOS',171492),
+(65.97e0,'2025-02-11',66.01e0,65.75e0,65.755e0,1799,'AOS',139592),
+(65.25e0,'2025-02-12',65.52e0,65.25e0,65.48e0,1800,'AOS',185092),
+(66.005e0,'2025-02-13',66.08e0,65.88e0,66.015e0,1801,'AOS',285192),
+(66.24e0,'2025-02-14',66.25e0,65.92e0,66.15e0,1802,'AOS',305213),
+(65.73e0,'2025-02-18',65.855e0,65.6132e0,65.625e0,1803,'AOS',275457),
+(67.37e0,'2025-02-19',67.45e0,67.13e0,67.31e0,1804,'AOS',400516),
+(66.82e0,'2025-02-20',67.01e0,66.65e0,66.7e0,1805,'AOS',291116),
+(66.0e0,'2025-02-21',66.055e0,65.81e0,65.88e0,1806,'AOS',212399),
+(66.24e0,'2025-02-24',66.38e0,66.1e0,66.17e0,1807,'AOS',178120),
+(66.98e0,'2025-02-25',67.01e0,66.56e0,67.0e0,1808,'AOS',234931),
+(66.18e0,'2025-02-26',66.56e0,66.1e0,66.505e0,1809,'AOS',208216),
+(65.94e0,'2025-02-27',66.21e0,65.88e0,66.08e0,1810,'AOS',146585),
+(66.47e0,'2025-02-28',66.48e0,65.73e0,65.96e0,1811,'AOS',279580),
+(66.37e0,'2025-03-03',66.53e0,66.145e0,66.16e0,1812,'AOS',367004),
+(65.61e0,'2025-03-04',66.51e0,65.55e0,66.51e0,1813,'AOS',276885),
+(66.5e0,'2025-03-05',66.68e0,66.21e0,66.68e0,1814,'AOS',350572),
+(68.23e0,'2025-03-06',68.39e0,68.03e0,68.2e0,1815,'AOS',341632),
+(69.41e0,'2025-03-07',69.64e0,69.22e0,69.59e0,1816,'AOS',210723),
+(69.61e0,'2025-03-10',70.01e0,69.61e0,69.8e0,1817,'AOS',280029),
+(67.09e0,'2025-03-11',67.62e0,67.09e0,67.53e0,1818,'AOS',293526),
+(65.62e0,'2025-03-12',66.05e0,65.62e0,65.98e0,1819,'AOS',217043),
+(65.47e0,'2025-03-13',65.59e0,65.31e0,65.45e0,1820,'AOS',287142),
+(66.82e0,'2025-03-14',66.92e0,66.4901e0,66.63e0,1821,'AOS',243216),
+(67.49e0,'2025-03-17',67.629e0,67.41e0,67.56e0,1822,'AOS',199194),
+(67.68e0,'2025-03-18',67.75e0,67.57e0,67.69e0,1823,'AOS',209256),
+(67.61e0,'2025-03-19',67.905e0,67.57e0,67.67e0,1824,'AOS',265835),
+(66.7e0,'2025-03-20',66.84e0,66.6e0,66.645e0,1825,'AOS',228456),
+(66.47e0,'2025-03-21',66.62e0,66.24e0,66.405e0,1826,'AOS',351752),
+(66.36e0,'2025-03-24',66.54e0,66.3e0,66.51e0,1827,'AOS',282070),
+(66.72e0,'2025-03-25',66.93e0,66.21e0,66.72e0,1828,'AOS',285893),
+(67.33e0,'2025-03-26',67.39e0,67.21e0,67.28e0,1829,'AOS',174204),
+(66.92e0,'2025-03-27',67.23e0,66.89e0,67.13e0,1830,'AOS',154366),
+(65.6e0,'2025-03-28',65.9e0,65.57e0,65.86e0,1831,'AOS',158656),
+(65.37e0,'2025-03-31',65.92e0,65.21e0,65.655e0,1832,'AOS',411251),
+(65.59e0,'2025-04-01',65.65e0,65.26e0,65.32e0,1833,'AOS',397133),
+(66.12e0,'2025-04-02',66.25e0,65.83e0,65.86e0,1834,'AOS',310842),
+(63.66e0,'2025-04-03',63.93e0,63.58e0,63.84e0,1835,'AOS',307614),
+(61.98e0,'2025-04-04',62.63e0,61.89e0,62.35e0,1836,'AOS',381221),
+(60.66e0,'2025-04-07',60.985e0,60.23e0,60.23e0,1837,'AOS',377084),
+(59.63e0,'2025-04-08',59.98e0,59.12e0,59.85e0,1838,'AOS',445799),
+(62.54e0,'2025-04-09',62.825e0,61.7e0,62.28e0,1839,'AOS',555644),
+(62.86e0,'2025-04-10',63.04e0,62.19e0,62.61e0,1840,'AOS',365862),
+(64.5e0,'2025-04-11',64.705e0,64.43e0,64.57e0,1841,'AOS',348583),
+(65.21e0,'2025-04-14',65.5e0,65.03e0,65.39e0,1842,'AOS',343728),
+(63.86e0,'2025-04-15',64.04e0,63.72e0,64.03e0,1843,'AOS',509801),
+(62.85e0,'2025-04-16',62.95e0,62.44e0,62.465e0,1844,'AOS',320161),
+(63.13e0,'2025-04-17',63.365e0,63.02e0,63.18e0,1845,'AOS',300007),
+(61.71e0,'2025-04-21',61.81e0,61.38e0,61.435e0,1846,'AOS',339162),
+(63.95e0,'2025-04-22',64.02e0,63.74e0,63.93e0,1847,'AOS',361511),
+(63.76e0,'2025-04-23',63.95e0,63.62e0,63.76e0,1848,'AOS',200246),
+(65.29e0,'2025-04-24',65.57e0,65.19e0,65.3e0,1849,'AOS',275252),
+(65.0e0,'2025-04-25',65.07e0,64.68e0,64.87e0,1850,'AOS',194487),
+(64.8e0,'2025-04-28',65.08e0,64.5e0,64.535e0,1851,'AOS',493308),
+(67.0e0,'2025-04-29',67.31e0,66.83e0,67.09e0,1852,'AOS',593387),
+(67.87e0,'2025-04-30',68.22e0,67.47e0,67.495e0,1853,'AOS',345612),
+(67.41e0,'2025-05-01',67.79e0,67.32e0,67.55e0,1854,'AOS',459397),
+(68.45e0,'2025-05-02',68.77e0,68.39e0,68.53e0,1855,'AOS',214346),
+(68.38e0,'2025-05-05',68.57e0,68.315e0,68.53e0,1856,'AOS',266043),
+(67.48e0,'2025-05-06',67.695e0,67.45e0,67.63e0,1857,'AOS',268678),
+(66.91e0,'2025-05-07',67.095e0,66.71e0,66.95e0,1858,'AOS',332484),
+(67.99e0,'2025-05-08',68.585e0,67.93e0,68.49e0,1859,'AOS',244411),
+(68.28e0,'2025-05-09',68.33e0,68.18e0,68.25e0,1860,'AOS',153893),
+(70.47e0,'2025-05-12',70.49e0,70.21e0,70.26e0,1861,'AOS',231114),
+(70.11e0,'2025-05-13',70.45e0,70.08e0,70.37e0,1862,'AOS',196316),
+(68.34e0,'2025-05-14',68.67e0,68.29e0,68.6e0,1863,'AOS',271807),
+(69.43e0,'2025-05-15',69.48e0,69.175e0,69.195e0,1864,'AOS',285748),
+(70.5e0,'2025-05-16',70.54e0,70.26e0,70.32e0,1865,'AOS',366535),
+(70.52e0,'2025-05-19',70.58e0,70.33e0,70.33e0,1866,'AOS',323907),
+(69.59e0,'2025-05-20',69.62e0,69.46e0,69.54e0,1867,'AOS',191788),
+(67.1e0,'2025-05-21',67.2e0,67.011e0,67.02e0,1868,'AOS',303623),
+(67.35e0,'2025-05-22',67.599e0,67.285e0,67.49e0,1869,'AOS',308295),
+(67.01e0,'2025-05-23',67.085e0,66.8e0,67.02e0,1870,'AOS',256033),
+(68.569e0,'2025-05-27',68.67e0,68.23e0,68.31e0,1871,'AOS',436687),
+(64.225e0,'2025-05-28',64.27e0,63.8e0,64.05e0,1872,'AOS',813069),
+(64.74e0,'2025-05-29',64.81e0,64.51e0,64.75e0,1873,'AOS',498379),
+(64.31e0,'2025-05-30',64.64e0,64.08e0,64.55e0,1874,'AOS',921681),
+(63.01e0,'2025-06-02',63.24e0,62.89e0,63.24e0,1875,'AOS',681392),
+(64.01e0,'2025-06-03',64.14e0,63.87e0,64.025e0,1876,'AOS',374329),
+(64.3e0,'2025-06-04',64.63e0,64.3e0,64.57e0,1877,'AOS',308476),
+(63.79e0,'2025-06-05',63.92e0,63.64e0,63.76e0,1878,'AOS',404319),
+(64.35e0,'2025-06-06',64.51e0,64.32e0,64.43e0,1879,'AOS',321507),
+(64.83e0,'2025-06-09',65.02e0,64.81e0,64.91e0,1880,'AOS',263318),
+(65.73e0,'2025-06-10',65.8e0,65.67e0,65.74e0,1881,'AOS',260734),
+(65.44e0,'2025-06-11',65.49e0,65.21e0,65.26e0,1882,'AOS',273946),
+(64.2e0,'2025-06-12',64.22e0,63.98e0,64.11e0,1883,'AOS',368731),
+(63.82e0,'2025-06-13',63.83e0,63.57e0,63.59e0,1884,'AOS',375907),
+(64.3e0,'2025-06-16',64.37e0,64.16e0,64.22e0,1885,'AOS',280248),
+(63.22e0,'2025-06-17',63.28e0,63.08e0,63.14e0,1886,'AOS',250194),
+(63.09e0,'2025-06-18',63.25e0,63.0e0,63.12e0,1887,'AOS',234886),
+(62.73e0,'2025-06-20',62.77e0,62.25e0,62.25e0,1888,'AOS',440053),
+(64.135e0,'2025-06-23',64.15e0,63.77e0,63.88e0,1889,'AOS',314681),
+(64.94e0,'2025-06-24',64.983e0,64.775e0,64.97e0,1890,'AOS',212954),
+(65.055e0,'2025-06-25',65.11e0,64.895e0,65.085e0,1891,'AOS',287829),
+(64.66e0,'2025-06-26',64.735e0,64.47e0,64.61e0,1892,'AOS',208526),
+(65.64e0,'2025-06-27',65.69e0,65.18e0,65.245e0,1893,'AOS',412110),
+(65.565e0,'2025-06-30',65.79e0,65.55e0,65.62e0,1894,'AOS',283493),
+(67.76e0,'2025-07-01',67.93e0,67.64e0,67.92e0,1895,'AOS',178289),
+(68.09e0,'2025-07-02',68.12e0,67.87e0,67.895e0,1896,'AOS',269658),
+(67.855e0,'2025-07-03',67.955e0,67.76e0,67.8e0,1897,'AOS',84252),
+(68.07e0,'2025-07-07',68.11e0,67.87e0,67.9266e0,1898,'AOS',346646),
+(68.45e0,'2025-07-08',68.62e0,68.375e0,68.515e0,1899,'AOS',292556),
+(69.48e0,'2025-07-09',69.655e0,69.375e0,69.42e0,1900,'AOS',268605),
+(70.45e0,'2025-07-10',71.0e0,70.39e0,70.96e0,1901,'AOS',356218),
+(69.06e0,'2025-07-11',69.33e0,69.06e0,69.285e0,1902,'AOS',207739),
+(68.84e0,'2025-07-14',68.9699e0,68.82e0,68.92e0,1903,'AOS',212395),
+(67.23e0,'2025-07-15',67.59e0,67.16e0,67.57e0,1904,'AOS',233746),
+(68.05e0,'2025-07-16',68.085e0,67.8e0,67.97e0,1905,'AOS',423171),
+(70.75e0,'2025-07-17',70.795e0,70.53e0,70.53e0,1906,'AOS',456028),
+(70.31e0,'2025-07-18',70.34e0,69.9e0,70.04e0,1907,'AOS',439235),
+(69.07e0,'2025-07-21',69.32e0,69.03e0,69.3e0,1908,'AOS',420603),
+(71.09e0,'2025-07-22',71.15e0,70.86e0,70.925e0,1909,'AOS',358641),
+(71.31e0,'2025-07-23',71.54e0,71.24e0,71.25e0,1910,'AOS',352247),
+(73.97e0,'2025-07-24',74.68e0,73.93e0,74.68e0,1911,'AOS',721290),
+(72.05e0,'2025-07-25',72.235e0,71.87e0,71.91e0,1912,'AOS',414854),
+(71.035e0,'2025-07-28',71.195e0,70.93e0,71.16e0,1913,'AOS',369356),
+(71.65e0,'2025-07-29',71.72e0,71.38e0,71.49e0,1914,'AOS',325388),
+(70.84e0,'2025-07-30',70.875e0,70.3175e0,70.52e0,1915,'AOS',335883),
+(70.8e0,'2025-07-31',70.99e0,70.71e0,70.75e0,1916,'AOS',382878),
+(70.43e0,'2025-08-01',70.57e0,70.24e0,70.57e0,1917,'AOS',333140),
+(70.33e0,'2025-08-04',70.39e0,70.27e0,70.33e0,1918,'AOS',166386),
+(70.3e0,'2025-08-05',70.35e0,70.0e0,70.03e0,1919,'AOS',253256),
+(70.57e0,'2025-08-06',70.83e0,70.54e0,70.8e0,1920,'AOS',224841),
+(70.64e0,'2025-08-07',70.66e0,70.38e0,70.5e0,1921,'AOS',176007),
+(70.84e0,'2025-08-08',70.84e0,70.62e0,70.73e0,1922,'AOS',374715),
+(70.53e0,'2025-08-11',70.56e0,70.37e0,70.45e0,1923,'AOS',151394),
+(71.35e0,'2025-08-12',71.42e0,71.1e0,71.11e0,1924,'AOS',276732),
+(73.66e0,'2025-08-13',73.81e0,73.61e0,73.61e0,1925,'AOS',260410),
+(72.52e0,'2025-08-14',72.58e0,72.32e0,72.39e0,1926,'AOS',230045),
+(72.22e0,'2025-08-15',72.33e0,72.09e0,72.29e0,1927,'AOS',226425),
+(72.16e0,'2025-08-18',72.355e0,72.105e0,72.19e0,1928,'AOS',205755),
+(72.82e0,'2025-08-19',72.8925e0,72.76e0,72.885e0,1929,'AOS',145528),
+(71.87e0,'2025-08-20',72.15e0,71.845e0,72.15e0,1930,'AOS',188514),
+(71.74e0,'2025-08-21',71.84e0,71.65e0,71.83e0,1931,'AOS',99090),
+(73.61e0,'2025-08-22',73.66e0,73.49e0,73.49e0,1932,'AOS',129655),
+(72.53e0,'2025-08-25',72.66e0,72.4e0,72.44e0,1933,'AOS',138026),
+(72.36e0,'2025-08-26',72.53e0,72.21e0,72.475e0,1934,'AOS',258477),
+(72.39e0,'2025-08-27',72.6e0,72.39e0,72.42e0,1935,'AOS',263943),
+(71.61e0,'2025-08-28',71.77e0,71.45e0,71.59e0,1936,'AOS',254515),
+(71.29e0,'2025-08-29',71.42e0,71.02e0,71.13e0,1937,'AOS',234331),
+(70.36e0,'2025-09-02',70.58e0,70.3e0,70.535e0,1938,'AOS',262006),
+(70.78e0,'2025-09-03',70.81e0,70.52e0,70.52e0,1939,'AOS',350323),
+(72.64e0,'2025-09-04',72.64e0,72.23e0,72.27e0,1940,'AOS',283738),
+(73.7e0,'2025-09-05',73.72e0,73.36e0,73.47e0,1941,'AOS',350750),
+(73.96e0,'2025-09-08',73.97e0,73.54e0,73.6e0,1942,'AOS',234342),
+(72.0e0,'2025-09-09',72.16e0,71.81e0,71.89e0,1943,'AOS',241559),
+(72.49e0,'2025-09-10',72.54e0,72.36e0,72.36e0,1944,'AOS',310626),
+(74.3e0,'2025-09-11',74.41e0,73.83e0,73.84e0,1945,'AOS',306117),
+(72.55e0,'2025-09-12',72.96e0,72.53e0,72.94e0,1946,'AOS',205254),
+(73.27e0,'2025-09-15',73.43e0,72.97e0,73.115e0,1947,'AOS',196198),
+(73.605e0,'2025-09-16',73.71e0,73.21e0,73.34e0,1948,'AOS',208952),
+(73.15e0,'2025-09-17',73.36e0,72.915e0,73.05e0,1949,'AOS',207136),
+(73.06e0,'2025-09-18',73.26e0,72.97e0,73.095e0,1950,'AOS',212857),
+(73.09e0,'2025-09-19',73.385e0,72.98e0,73.19e0,1951,'AOS',278085),
+(72.26e0,'2025-09-22',72.51e0,72.26e0,72.34e0,1952,'AOS',205426),
+(72.17e0,'2025-09-23',72.32e0,71.83e0,71.85e0,1953,'AOS',149939),
+(71.97e0,'2025-09-24',72.23e0,71.96e0,72.165e0,1954,'AOS',142215),
+(71.4e0,'2025-09-25',71.535e0,71.2261e0,71.23e0,1955,'AOS',161838),
+(72.45e0,'2025-09-26',72.55e0,72.25e0,72.27e0,1956,'AOS',140301),
+(72.745e0,'2025-09-29',72.98e0,72.66e0,72.96e0,1957,'AOS',189746),
+(73.42e0,'2025-09-30',73.56e0,73.32e0,73.38e0,1958,'AOS',203755),
+(73.1e0,'2025-10-01',73.28e0,73.07e0,73.2e0,1959,'AOS',245219),
+(73.54e0,'2025-10-02',73.615e0,73.35e0,73.56e0,1960,'AOS',207251),
+(73.33e0,'2025-10-03',73.56e0,73.3e0,73.48e0,1961,'AOS',127705),
+(72.42e0,'2025-10-06',72.67e0,72.295e0,72.32e0,1962,'AOS',161537),
+(71.39e0,'2025-10-07',71.61e0,71.37e0,71.4e0,1963,'AOS',179194),
+(71.07e0,'2025-10-08',71.19e0,70.92e0,70.98e0,1964,'AOS',153225),
+(69.73e0,'2025-10-09',70.05e0,69.72e0,69.82e0,1965,'AOS',203803),
+(67.74e0,'2025-10-10',68.24e0,67.67e0,67.92e0,1966,'AOS',278063),
+(67.685e0,'2025-10-13',67.86e0,67.66e0,67.81e0,1967,'AOS',213323),
+(68.84e0,'2025-10-14',69.04e0,68.54e0,69.0e0,1968,'AOS',262388),
+(69.22e0,'2025-10-15',69.355e0,69.09e0,69.22e0,1969,'AOS',325192),
+(69.36e0,'2025-10-16',69.48e0,69.25e0,69.29e0,1970,'AOS',244206),
+(69.71e0,'2025-10-17',69.86e0,69.59e0,69.62e0,1971,'AOS',251696),
+(69.81e0,'2025-10-20',69.99e0,69.8e0,69.87e0,1972,'AOS',238149),
+(71.01e0,'2025-10-21',71.031e0,70.6525e0,70.7e0,1973,'AOS',337629),
+(68.21e0,'2025-10-22',68.6e0,68.12e0,68.27e0,1974,'AOS',321199),
+(69.04e0,'2025-10-23',69.355e0,68.97e0,69.045e0,1975,'AOS',168934),
+(68.9e0,'2025-10-24',69.1e0,68.88e0,68.98e0,1976,'AOS',323743),
+(68.61e0,'2025-10-27',68.78e0,68.57e0,68.59e0,1977,'AOS',364127),
+(66.84e0,'2025-10-28',67.39e0,66.76e0,67.29e0,1978,'AOS',540474),
+(65.61e0,'2025-10-29',65.7e0,65.06e0,65.2e0,1979,'AOS',407741),
+(66.71e0,'2025-10-30',66.84e0,66.63e0,66.7e0,1980,'AOS',356233),
+(66.0e0,'2025-10-31',66.14e0,65.882e0,66.102e0,1981,'AOS',364397),
+(65.67e0,'2025-11-03',65.77e0,65.51e0,65.56e0,1982,'AOS',298595),
+(65.16e0,'2025-11-04',65.35e0,65.11e0,65.29e0,1983,'AOS',265184),
+(66.04e0,'2025-11-05',66.19e0,65.98e0,66.0175e0,1984,'AOS',261218),
+(65.6e0,'2025-11-06',65.88e0,65.575e0,65.75e0,1985,'AOS',262430),
+(66.27e0,'2025-11-07',66.27e0,65.94e0,65.97e0,1986,'AOS',214100),
+(66.17e0,'2025-11-10',66.34e0,66.125e0,66.225e0,1987,'AOS',194290),
+(65.78e0,'2025-11-11',65.91e0,65.71e0,65.735e0,1988,'AOS',229607);
 
@@ -0,0 +1,10 @@
+-- Migrates PriceHistory from the surrogate price_history_id key to the clustered (ticker_symbol, date) key.
+-- One ALTER, so the table is rebuilt once: rows get stored in (ticker, date) order and the
+-- unique key and index that duplicated the new primary key are dropped.
+-- idx_date stays for the queries over one date across all tickers.
+ALTER TABLE PriceHistory
+    DROP PRIMARY KEY,
+    DROP COLUMN price_history_id,
+    ADD PRIMARY KEY (ticker_symbol, date),
+    DROP INDEX unique_ticker_date,
+    DROP INDEX idx_ticker_date;
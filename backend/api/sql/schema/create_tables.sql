@@ -19,9 +19,8 @@ CREATE TABLE Ticker (
     INDEX idx_company_name (company_name)
 );
 
--- Create PriceHistory Table
+-- Create PriceHistory Table (partitioned by month, see api/internal/partitions.py)
 CREATE TABLE PriceHistory (
-    price_history_id INT AUTO_INCREMENT PRIMARY KEY,
     ticker_symbol VARCHAR(10) NOT NULL,
     date DATE NOT NULL,
     open_price DECIMAL(19, 4) NOT NULL,
@@ -30,12 +29,11 @@ CREATE TABLE PriceHistory (
     close_price DECIMAL(19, 4) NOT NULL,
     volume BIGINT NOT NULL,
 
-    UNIQUE KEY unique_ticker_date (ticker_symbol, date),
+    -- rows are stored in key order, so one ticker's bars over a range are adjacent;
+    -- every unique key of a partitioned table holds the partitioning column
+    PRIMARY KEY (ticker_symbol, date),
 
-    CONSTRAINT fk_pricehistory_ticker
-        FOREIGN KEY (ticker_symbol)
-        REFERENCES Ticker(ticker_symbol)
-        ON DELETE RESTRICT,
+    -- no foreign key to Ticker: partitioned tables can't have one, the price loader checks tickers instead
 
     CONSTRAINT chk_open_price_positive CHECK (open_price > 0),
     CONSTRAINT chk_high_price_positive CHECK (high_price > 0),
@@ -44,8 +42,83 @@ CREATE TABLE PriceHistory (
     CONSTRAINT chk_volume_0_or_positive CHECK (volume >= 0),
     CONSTRAINT chk_low_not_greater_than_high CHECK (low_price <= high_price),
 
-    INDEX idx_ticker_date (ticker_symbol, date),
+    -- queries over one date across all tickers
     INDEX idx_date (date)
+)
+-- monthly partitions pYYYYMM are split off p_future ahead of time
+PARTITION BY RANGE COLUMNS (date) (
+    PARTITION p_future VALUES LESS THAN (MAXVALUE)
+);
+
+-- Create PriceBar Table (intraday bars as downloaded, PriceHistory holds their daily rollup)
+CREATE TABLE PriceBar (
+    ticker_symbol VARCHAR(10) NOT NULL,
+    bar_interval ENUM('1m', '5m', '15m', '30m', '1h') NOT NULL,
+    bar_time DATETIME NOT NULL,
+    open_price DECIMAL(19, 4) NOT NULL,
+    high_price DECIMAL(19, 4) NOT NULL,
+    low_price DECIMAL(19, 4) NOT NULL,
+    close_price DECIMAL(19, 4) NOT NULL,
+    volume BIGINT NOT NULL,
+
+    PRIMARY KEY (ticker_symbol, bar_interval, bar_time),
+
+    CONSTRAINT fk_pricebar_ticker
+        FOREIGN KEY (ticker_symbol)
+        REFERENCES Ticker(ticker_symbol)
+        ON DELETE RESTRICT,
+
+    CONSTRAINT chk_pricebar_open_price_positive CHECK (open_price > 0),
+    CONSTRAINT chk_pricebar_high_price_positive CHECK (high_price > 0),
+    CONSTRAINT chk_pricebar_low_price_positive CHECK (low_price > 0),
+    CONSTRAINT chk_pricebar_close_price_positive CHECK (close_price > 0),
+    CONSTRAINT chk_pricebar_volume_0_or_positive CHECK (volume >= 0),
+    CONSTRAINT chk_pricebar_low_not_greater_than_high CHECK (low_price <= high_price)
+);
+
+-- Create PriceRollup Table (weekly and monthly bars rolled up from PriceHistory as it changes)
+CREATE TABLE PriceRollup (
+    ticker_symbol VARCHAR(10) NOT NULL,
+    rollup_period ENUM('1w', '1M') NOT NULL,
+    period_start DATE NOT NULL,
+    open_price DECIMAL(19, 4) NOT NULL,
+    high_price DECIMAL(19, 4) NOT NULL,
+    low_price DECIMAL(19, 4) NOT NULL,
+    close_price DECIMAL(19, 4) NOT NULL,
+    volume BIGINT NOT NULL,
+    trading_days SMALLINT NOT NULL,
+
+    PRIMARY KEY (ticker_symbol, rollup_period, period_start),
+
+    CONSTRAINT fk_pricerollup_ticker
+        FOREIGN KEY (ticker_symbol)
+        REFERENCES Ticker(ticker_symbol)
+        ON DELETE CASCADE
+);
+
+-- Create IndicatorSnapshot Table (latest indicator values per ticker, rewritten after each ingest)
+CREATE TABLE IndicatorSnapshot (
+    ticker_symbol VARCHAR(10) PRIMARY KEY,
+    as_of_date DATE NOT NULL,
+    close_price DECIMAL(19, 4) NOT NULL,
+    rsi_14 DOUBLE,
+    macd DOUBLE,
+    macd_signal DOUBLE,
+    sma_50 DOUBLE,
+    bb_middle DOUBLE,
+    bb_upper DOUBLE,
+    bb_lower DOUBLE,
+    atr_14 DOUBLE,
+    stoch_k DOUBLE,
+    stoch_d DOUBLE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    CONSTRAINT fk_indicatorsnapshot_ticker
+        FOREIGN KEY (ticker_symbol)
+        REFERENCES Ticker(ticker_symbol)
+        ON DELETE CASCADE,
+
+    INDEX idx_rsi_14 (rsi_14)
 );
 
 -- Create Table Portfolio
@@ -120,7 +193,7 @@ CREATE TABLE Alert (
 
 -- Create AuditLog Table
 CREATE TABLE AuditLog (
-    audit_id INT AUTO_INCREMENT PRIMARY KEY,
+    audit_id INT AUTO_INCREMENT,
     table_name VARCHAR(50) NOT NULL,
     operation_type VARCHAR(20) NOT NULL,
     record_id INT NOT NULL,
@@ -128,8 +201,14 @@ CREATE TABLE AuditLog (
     quantity DECIMAL(10, 4),
     purchase_price DECIMAL(19, 4),
     user_id INT,
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (audit_id, timestamp),
 
     INDEX idx_table_operation (table_name, operation_type),
     INDEX idx_timestamp (timestamp)
+)
+-- partitioned by month like PriceHistory (TIMESTAMP columns partition through UNIX_TIMESTAMP)
+PARTITION BY RANGE (UNIX_TIMESTAMP(timestamp)) (
+    PARTITION p_future VALUES LESS THAN (MAXVALUE)
 );
\ No newline at end of file
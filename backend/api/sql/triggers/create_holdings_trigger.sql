@@ -6,6 +6,9 @@ FOR EACH ROW
 BEGIN
     DECLARE v_user_id INT;
 
+    -- bulk loads set @skip_holdings_audit and write the AuditLog rows in one statement afterwards
+    IF @skip_holdings_audit IS NULL THEN
+
     SELECT user_id INTO v_user_id
     FROM Portfolio
     WHERE portfolio_id = NEW.portfolio_id;
@@ -29,4 +32,6 @@ BEGIN
         v_user_id,
         CURRENT_TIMESTAMP
     );
+
+    END IF;
 END;
\ No newline at end of file
@@ -4,6 +4,8 @@ from .macd import macd
 from .moving_avg import moving_avg
 from .rsi import rsi
 from .stochastic import stochastic
+from .fused import compute
+from .panel import compute_panel, load_panel
 
 
 
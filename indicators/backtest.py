@@ -0,0 +1,277 @@
+"""
+Vectorized backtests of long-only entry/exit rules over one or many tickers.
+
+A strategy is a module level function `strategy(panel, **params)` returning
+(entries, exits): boolean DataFrames (date x ticker) built from the indicator
+outputs, e.g.
+
+    def rsi_reversion(panel, range=14, lower=30, upper=70):
+        rsi = panel.indicator("rsi", range=range)[f"RSI_{range}"]
+        return rsi < lower, rsi > upper
+
+backtest() turns the signals into positions (enter at the close of an entry
+bar, leave at the close of an exit bar, an exit wins over an entry on the same
+bar), trades, equity curves and stats with whole-matrix NumPy operations: no
+Python loop runs per bar or per ticker.
+
+sweep() backtests every combination of a parameter grid on a process pool.
+The price panel is copied once into shared memory like compute_panel_parallel()
+does, each worker evaluates the indicators it needs once and reuses them for
+every combination it gets, so e.g. RSI thresholds share one RSI computation
+per worker:
+
+    prices = load_panel()
+    summary = sweep(rsi_reversion, {"lower": [20, 25, 30], "upper": [70, 75, 80]}, prices)
+    summary.sort_values("sharpe", ascending=False).head()
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from . import parallel
+from .fused import compute_columns
+from .panel import load_panel
+
+TRADING_DAYS = 252
+
+
+class Panel:
+    """Prices handed to a strategy, with its indicator outputs memoized per parameter set."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self._outputs = {}
+
+    @property
+    def close(self):
+        return self.prices["close_price"]
+
+    def indicator(self, name, **params):
+        """{output name: DataFrame(date x ticker)} of one indicator, computed once per parameter set."""
+        key = (name, tuple(sorted(params.items())))
+        if key not in self._outputs:
+            self._outputs[key] = compute_columns(self.prices, {name: params})
+        return self._outputs[key]
+
+
+@dataclass
+class BacktestResult:
+    positions: pd.DataFrame  # 1 while in the market after that bar's close
+    returns: pd.DataFrame  # daily strategy returns per ticker, after fees
+    equity: pd.DataFrame  # growth of 1 per ticker, plus "portfolio" (equal weight, rebalanced daily)
+    trades: pd.DataFrame  # one row per round trip, still open ones exit at the last close
+    stats: pd.DataFrame  # one row per ticker, plus "portfolio"
+
+
+def _ffill(values):
+    """Forward fill NaNs down the rows of a 2-D array."""
+    rows = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return values[rows, np.arange(values.shape[1])]
+
+
+def positions_from_signals(entries, exits):
+    """1 from an entry bar up to (not including) the next exit bar, else 0."""
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+    state = np.where(exits, 0.0, np.where(entries, 1.0, np.nan))
+    return np.nan_to_num(_ffill(state))
+
+
+def _trades(positions, close, dates, tickers, fee):
+    # closing every position after the last bar pairs each entry with an exit
+    changes = np.diff(positions, axis=0, prepend=0.0, append=0.0)
+    # transposed, nonzero() orders the trades by ticker then time, so entries and exits line up
+    ticker_idx, entry_idx = np.nonzero(changes.T > 0)
+    _, exit_idx = np.nonzero(changes.T < 0)
+    is_open = exit_idx == len(close)
+    exit_idx = np.minimum(exit_idx, len(close) - 1)
+    entry_price = close[entry_idx, ticker_idx]
+    exit_price = close[exit_idx, ticker_idx]
+    return pd.DataFrame({
+        "ticker": np.asarray(tickers)[ticker_idx],
+        "entry_date": np.asarray(dates)[entry_idx],
+        "exit_date": np.asarray(dates)[exit_idx],
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "return": exit_price / entry_price - 1 - 2 * fee,
+        "bars": exit_idx - entry_idx,
+        "open": is_open,
+    })
+
+
+def _stats(returns, valid, trade_returns, trade_ticker_idx):
+    """Stats of every column of `returns` (bars x columns), using only its `valid` bars."""
+    n_columns = returns.shape[1]
+    bars = valid.sum(axis=0)
+    equity = np.cumprod(1.0 + returns, axis=0)
+    final = equity[-1] if len(equity) else np.ones(n_columns)
+    masked = np.where(valid, returns, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        years = bars / TRADING_DAYS
+        mean = np.nanmean(masked, axis=0)
+        volatility = np.nanstd(masked, axis=0, ddof=1) * np.sqrt(TRADING_DAYS)
+        sharpe = mean * TRADING_DAYS / volatility
+        cagr = final ** (1 / years) - 1
+        drawdown = (1 - equity / np.maximum.accumulate(equity, axis=0)).max(axis=0, initial=0.0)
+        n_trades = np.bincount(trade_ticker_idx, minlength=n_columns)
+        wins = np.bincount(trade_ticker_idx, weights=trade_returns > 0, minlength=n_columns)
+        trade_sum = np.bincount(trade_ticker_idx, weights=trade_returns, minlength=n_columns)
+        return {
+            "total_return": final - 1,
+            "cagr": cagr,
+            "volatility": volatility,
+            "sharpe": np.where(volatility > 0, sharpe, np.nan),
+            "max_drawdown": drawdown,
+            "trades": n_trades,
+            "win_rate": wins / n_trades,
+            "avg_trade_return": trade_sum / n_trades,
+        }
+
+
+def backtest(close, entries, exits, fee=0.0):
+    """Backtest entry/exit signals (date x ticker) on closes of the same shape.
+
+    `fee` is the cost of one side of a trade as a fraction of its value, paid
+    on the bar the position changes. Missing closes count as an unchanged price.
+    """
+    tickers = list(close.columns)
+    dates = close.index
+    prices = close.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(prices)
+    filled = _ffill(prices)
+    # from a ticker's first bar on
+    live = np.logical_or.accumulate(valid, axis=0)
+    positions = positions_from_signals(entries, exits) * live
+
+    daily = np.zeros_like(filled)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        daily[1:] = np.nan_to_num(filled[1:] / filled[:-1] - 1)
+    held = np.vstack([np.zeros((1, len(tickers))), positions[:-1]])
+    turnover = np.abs(np.diff(positions, axis=0, prepend=0.0))
+    returns = held * daily - fee * turnover
+
+    trades = _trades(positions, filled, dates, tickers, fee)
+    trade_ticker_idx = pd.Index(tickers).get_indexer(trades["ticker"])
+
+    # equal weight across the tickers trading that day
+    with np.errstate(invalid="ignore"):
+        portfolio = np.nan_to_num((returns * live).sum(axis=1) / live.sum(axis=1))
+    all_returns = np.column_stack([returns, portfolio])
+    all_valid = np.column_stack([live, live.any(axis=1)])
+    stats = _stats(
+        all_returns,
+        all_valid,
+        np.concatenate([trades["return"].to_numpy(), trades["return"].to_numpy()]),
+        np.concatenate([trade_ticker_idx, np.full(len(trades), len(tickers))]),
+    )
+    stats["exposure"] = np.append(
+        (positions * live).sum(axis=0) / live.sum(axis=0), (positions * live).sum() / live.sum()
+    )
+
+    columns = [*tickers, "portfolio"]
+    return BacktestResult(
+        positions=pd.DataFrame(positions, index=dates, columns=tickers),
+        returns=pd.DataFrame(returns, index=dates, columns=tickers),
+        equity=pd.DataFrame(np.cumprod(1.0 + all_returns, axis=0), index=dates, columns=columns),
+        trades=trades,
+        stats=pd.DataFrame(stats, index=pd.Index(columns, name="ticker")),
+    )
+
+
+def run_strategy(strategy, panel, fee=0.0, **params):
+    """backtest() of the signals `strategy(panel, **params)` returns."""
+    entries, exits = strategy(panel, **params)
+    return backtest(panel.close, entries, exits, fee=fee)
+
+
+def _summary(result, params):
+    portfolio = result.stats.loc["portfolio"]
+    return {**params, **portfolio.to_dict()}
+
+
+# this worker's Panel over the shared memory segments of the current sweep
+_worker_panel = {}
+
+
+def _sweep_chunk(inputs, index, columns, strategy, combinations, fee):
+    """Worker task: backtests of some grid combinations over the shared price panel."""
+    key = tuple(sorted(name for name, _ in inputs.values()))
+    if key not in _worker_panel:
+        _worker_panel.clear()
+        parallel._detach_all_except(set(key))
+        prices = {
+            column: pd.DataFrame(parallel._view(name, shape).T, index=index, columns=columns, copy=False)
+            for column, (name, shape) in inputs.items()
+        }
+        _worker_panel[key] = Panel(prices)
+    panel = _worker_panel[key]
+    return [_summary(run_strategy(strategy, panel, fee, **params), params) for params in combinations]
+
+
+def sweep(strategy, grid, prices=None, tickers=None, fee=0.0, workers=None, executor=None, columns=("close_price",)):
+    """Portfolio stats of `strategy` for every combination of `grid` ({param: [values]}), one row each.
+
+    `prices` is a load_panel() result holding at least `columns` (loaded if
+    omitted). Pass an existing ProcessPoolExecutor as `executor` to reuse its
+    processes across calls, otherwise one with `workers` processes (default:
+    every core) is started; workers=1 runs in this process.
+    """
+    if prices is None:
+        prices = load_panel(tickers, columns=columns)
+    names = list(grid)
+    combinations = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+    workers = workers or os.cpu_count() or 1
+
+    if executor is None and workers == 1:
+        panel = Panel(prices)
+        rows = [_summary(run_strategy(strategy, panel, fee, **params), params) for params in combinations]
+        return pd.DataFrame(rows)
+
+    first = prices["close_price"]
+    segments = []
+    try:
+        inputs = {}
+        for column, frame in prices.items():
+            segment = parallel._Segment(frame.shape[::-1])
+            # ticker rows like compute_panel_parallel, viewed back as (date x ticker) by the workers
+            segment.array[:] = frame.to_numpy(dtype=np.float64).T
+            segments.append(segment)
+            inputs[column] = segment.spec
+
+        chunk_size = max(1, math.ceil(len(combinations) / (workers * 2)))
+        chunks = [combinations[i : i + chunk_size] for i in range(0, len(combinations), chunk_size)]
+        owns_executor = executor is None
+        executor = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_sweep_chunk, inputs, first.index, first.columns, strategy, chunk, fee)
+                for chunk in chunks
+            ]
+            rows = [row for future in futures for row in future.result()]
+        finally:
+            if owns_executor:
+                executor.shutdown()
+    finally:
+        for segment in segments:
+            segment.release()
+    return pd.DataFrame(rows)
+
+
+def rsi_reversion(panel, range=14, lower=30, upper=70):
+    """Buy when RSI drops below `lower`, sell when it rises above `upper`."""
+    rsi = panel.indicator("rsi", range=range)[f"RSI_{range}"]
+    return rsi < lower, rsi > upper
+
+
+def sma_crossover(panel, fast=20, slow=50):
+    """Hold while the `fast` SMA is above the `slow` one."""
+    fast_sma = panel.indicator("moving_avg", range=fast)[f"SMA_{fast}"]
+    slow_sma = panel.indicator("moving_avg", range=slow)[f"SMA_{slow}"]
+    return fast_sma > slow_sma, fast_sma < slow_sma
@@ -0,0 +1,433 @@
+"""
+Indicator benchmark and memory profile.
+
+Generates synthetic OHLCV series into a throwaway cache directory (MySQL is
+never touched), then for every series length times each indicator function,
+its NumPy kernel, the fused compute(), a memoized hit and the streaming
+updates; for every panel width it times compute_panel() and the process-pool
+compute_panel_parallel() against one fused compute() per ticker, and an RSI
+threshold backtest sweep sequentially and on the pool. Peak memory of each
+call is measured with tracemalloc in a separate, untimed run. Every
+implementation is also checked against plain pandas reference formulas.
+
+The JSON report can be compared with one from another commit:
+
+    python -m indicators.benchmark --output bench.json
+    python -m indicators.benchmark --quick --compare bench.json
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import backtest, cache, fused, kernels, memo, panel, parallel, streaming
+from .atr import atr
+from .bollinger import bollinger
+from .macd import macd
+from .moving_avg import moving_avg
+from .rsi import rsi
+from .stochastic import stochastic
+
+DEFAULT_BARS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_PANEL_TICKERS = [1, 10, 100, 500]
+PANEL_BARS = 2_500  # ~10 years of daily bars per panel ticker
+QUICK_BARS = [1_000, 10_000]
+QUICK_PANEL_TICKERS = [1, 10]
+
+# streaming is a Python loop per bar, longer series would take minutes
+MAX_STREAMING_BARS = 100_000
+
+# new bars fed to a replayed stream to time single updates
+STREAMING_UPDATES = 1_000
+
+# equivalence checks pass when |candidate - reference| <= ATOL + RTOL * |reference|
+# for every value, so outputs near zero (MACD, its signal line) are held to ATOL
+RTOL = 1e-8
+ATOL = 1e-8
+
+# the unwrapped functions: memoization would turn every repeat into a cache hit
+SINGLE_FUNCTIONS = {
+    "rsi": (rsi.__wrapped__, {"RSI": "RSI_14"}),
+    "macd": (macd.__wrapped__, {"MACD": "MACD_12_26_9", "Signal": "Signal_12_26_9"}),
+    "bollinger": (bollinger.__wrapped__, {"MA": "MA_20", "Upper": "Upper_20", "Lower": "Lower_20"}),
+    "moving_avg": (moving_avg.__wrapped__, {"SMA": "SMA_50"}),
+    "atr": (atr.__wrapped__, {"ATR": "ATR_14"}),
+    "stochastic": (stochastic.__wrapped__, {"%K": "%K_14", "%D": "%D_14"}),
+}
+
+def _pandas_rsi(df, range=14):
+    delta = df["close_price"].diff()
+    avg_gain = delta.clip(lower=0).rolling(window=range, min_periods=1).mean()
+    avg_loss = (-delta.clip(upper=0)).rolling(window=range, min_periods=1).mean()
+    return {"RSI": 100 - (100 / (1 + avg_gain / avg_loss.where(avg_loss != 0)))}
+
+
+def _pandas_macd(df, fast=12, slow=26, signal=9):
+    close = df["close_price"]
+    line = close.ewm(span=fast, adjust=False).mean() - close.ewm(span=slow, adjust=False).mean()
+    return {"MACD": line, "Signal": line.ewm(span=signal, adjust=False).mean()}
+
+
+def _pandas_bollinger(df, range=20, num_std=2):
+    ma = df["close_price"].rolling(window=range).mean()
+    std = df["close_price"].rolling(window=range).std()
+    return {"MA": ma, "Upper": ma + num_std * std, "Lower": ma - num_std * std}
+
+
+def _pandas_atr(df, range=14):
+    prev_close = df["close_price"].shift(1)
+    true_range = np.fmax(
+        np.fmax(df["high_price"] - df["low_price"], (df["high_price"] - prev_close).abs()),
+        (df["low_price"] - prev_close).abs(),
+    )
+    return {"ATR": true_range.rolling(window=range).mean()}
+
+
+def _pandas_stochastic(df, range=14):
+    lowest = df["low_price"].rolling(window=range).min()
+    highest = df["high_price"].rolling(window=range).max()
+    k = (df["close_price"] - lowest) / (highest - lowest) * 100
+    return {"%K": k, "%D": k.rolling(window=3).mean()}
+
+
+# the textbook pandas formulas, independent of kernels.py: the reference of every check
+PANDAS_REFERENCES = {
+    "rsi": _pandas_rsi,
+    "macd": _pandas_macd,
+    "bollinger": _pandas_bollinger,
+    "moving_avg": lambda df, range=50: {"SMA": df["close_price"].rolling(window=range).mean()},
+    "atr": _pandas_atr,
+    "stochastic": _pandas_stochastic,
+}
+
+KERNELS = {
+    "rsi": lambda p: kernels.rsi(p["close_price"], 14),
+    "macd": lambda p: kernels.macd(p["close_price"]),
+    "bollinger": lambda p: kernels.bollinger(p["close_price"], 20),
+    "moving_avg": lambda p: kernels.moving_avg(p["close_price"], 50),
+    "atr": lambda p: kernels.atr(p["high_price"], p["low_price"], p["close_price"], 14),
+    "stochastic": lambda p: kernels.stochastic(p["high_price"], p["low_price"], p["close_price"], 14),
+}
+
+ALL_SPECS = list(fused.INDICATORS)
+
+# RSI thresholds grid-searched by the backtest sweeps of every panel width
+SWEEP_GRID = {"lower": [20, 25, 30, 35], "upper": [65, 70, 75, 80]}
+
+
+def synthetic_bars(n, seed=0, start="1990-01-01"):
+    """Geometric random walk OHLCV columns in the cache layout.
+
+    The log price is folded back into 100 * e^±1 like a triangle wave, so even
+    10M bars keep a realistic price range instead of drifting over dozens of
+    orders of magnitude.
+    """
+    rng = np.random.default_rng(seed)
+    walk = np.cumsum(rng.normal(0, 0.01, n))
+    close = 100 * np.exp(np.abs(np.mod(walk + 1, 4) - 2) - 1)
+    open_price = np.empty(n)
+    open_price[0] = close[0]
+    open_price[1:] = close[:-1] * np.exp(rng.normal(0, 0.002, n - 1))
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+    return {
+        "date": np.datetime64(start, "D") + np.arange(n),
+        "open_price": open_price,
+        "high_price": np.maximum(open_price, close) + spread,
+        "low_price": np.minimum(open_price, close) - spread,
+        "close_price": close,
+        "volume": rng.integers(1_000, 1_000_000, n),
+    }
+
+
+def _timed(fn, min_repeats=3, max_repeats=20, budget=1.0):
+    """Best and mean wall time of `fn`, repeated while it fits in `budget` seconds."""
+    times = []
+    started = time.perf_counter()
+    while len(times) < max_repeats:
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+        if len(times) >= min_repeats and time.perf_counter() - started > budget:
+            break
+    return min(times), sum(times) / len(times), len(times)
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(group, name, fn, bars, tickers=1, repeats=None):
+    best, mean, n = _timed(fn, **({"min_repeats": repeats, "max_repeats": repeats} if repeats else {}))
+    result = {
+        "group": group,
+        "name": name,
+        "bars": bars,
+        "tickers": tickers,
+        "best_s": best,
+        "mean_s": mean,
+        "repeats": n,
+        "bars_per_s": bars * tickers / best if best else None,
+        "peak_bytes": _peak_bytes(fn),
+    }
+    print(f"  {group:<10} {name:<14} {bars:>10} bars x {tickers:<4} {best * 1e3:>12.3f} ms  "
+          f"{result['peak_bytes'] / 2**20:>9.1f} MiB")
+    return result
+
+
+def _max_diff(a, b):
+    """(max |a - b| / (ATOL + RTOL * |b|) over the values, NaN positions agree); 1 is the limit."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    same_nan = bool((np.isnan(a) == np.isnan(b)).all())
+    both = ~np.isnan(a) & ~np.isnan(b)
+    if not both.any():
+        return 0.0, 0.0, same_nan
+    diff = np.abs(a[both] - b[both])
+    return float(diff.max()), float((diff / (ATOL + RTOL * np.abs(b[both]))).max()), same_nan
+
+
+def _equivalence(bars, reference, candidate, output, a, b):
+    diff, ratio, same_nan = _max_diff(a, b)
+    return {
+        "bars": bars,
+        "reference": reference,
+        "candidate": candidate,
+        "output": output,
+        "max_abs_diff": diff,
+        "tolerance_used": ratio,
+        "same_nan": same_nan,
+        "ok": same_nan and ratio <= 1.0,
+    }
+
+
+def bench_series(ticker, n):
+    """Time every per-ticker implementation on one cached series of `n` bars."""
+    results = []
+    checks = []
+    prices = cache.load_arrays(ticker, ["high_price", "low_price", "close_price"])
+    prices_frame = pd.DataFrame(prices)
+    fused_frame = fused.compute.__wrapped__(ticker, ALL_SPECS)
+    reference_last = {}
+
+    for name, (fn, outputs) in SINGLE_FUNCTIONS.items():
+        results.append(_measure("pandas", name, lambda: PANDAS_REFERENCES[name](prices_frame), n))
+        results.append(_measure("single", name, lambda: fn(ticker), n))
+        results.append(_measure("kernel", name, lambda: KERNELS[name](prices), n))
+
+        reference = PANDAS_REFERENCES[name](prices_frame)
+        frame = fn(ticker)
+        kernel_outputs = KERNELS[name](prices)
+        if isinstance(kernel_outputs, np.ndarray):
+            kernel_outputs = (kernel_outputs,)
+        for (column, fused_column), values in zip(outputs.items(), kernel_outputs):
+            expected = reference[column]
+            reference_last[fused_column] = expected.iloc[-1]
+            checks.append(_equivalence(n, "pandas", "single", column, frame[column], expected))
+            checks.append(_equivalence(n, "pandas", "kernel", column, values, expected))
+            checks.append(_equivalence(n, "pandas", "fused", fused_column, fused_frame[fused_column], expected))
+
+    results.append(_measure("fused", "all", lambda: fused.compute.__wrapped__(ticker, ALL_SPECS), n))
+
+    memo.results_cache.clear()
+    fused.compute(ticker, ALL_SPECS)
+    results.append(_measure("memo_hit", "all", lambda: fused.compute(ticker, ALL_SPECS), n))
+
+    if n <= MAX_STREAMING_BARS:
+        stream = streaming.TickerStream(ticker)
+        results.append(_measure(
+            "streaming", "replay", lambda: streaming.TickerStream(ticker).update_many(cache.load_columns(ticker)),
+            n, repeats=1,
+        ))
+        latest = stream.update_many(cache.load_columns(ticker))
+        last = {column: values[-1] for column, values in cache.load_columns(ticker).items()}
+        new_bars = [
+            {**{column: float(last[column]) for column in cache.PRICE_COLUMNS}, "date": last["date"] + i}
+            for i in range(1, STREAMING_UPDATES + 1)
+        ]
+
+        def feed():
+            replayed = copy.deepcopy(stream)
+            for bar in new_bars:
+                replayed.update(bar)
+
+        results.append(_measure("streaming", "update", feed, STREAMING_UPDATES))
+        for output, value in latest.items():
+            checks.append(_equivalence(n, "pandas", "streaming", output, [value], [reference_last[output]]))
+    return results, checks
+
+
+def bench_panel(n_tickers, tickers, executor):
+    """compute_panel() and its process-pool variant against one fused compute() per ticker."""
+    tickers = tickers[:n_tickers]
+    prices = panel.load_panel(tickers, columns=fused.required_columns(ALL_SPECS))
+    results = [
+        _measure("panel", "load", lambda: panel.load_panel(tickers, columns=fused.required_columns(ALL_SPECS)),
+                 PANEL_BARS, n_tickers),
+        _measure("panel", "compute", lambda: panel.compute_panel(ALL_SPECS, prices=prices),
+                 PANEL_BARS, n_tickers),
+        _measure("panel", "per_ticker",
+                 lambda: [fused.compute.__wrapped__(ticker, ALL_SPECS) for ticker in tickers],
+                 PANEL_BARS, n_tickers),
+        # tracemalloc only sees the parent: shared memory and workers are not counted
+        _measure("panel", "parallel",
+                 lambda: parallel.compute_panel_parallel(ALL_SPECS, prices=prices, executor=executor),
+                 PANEL_BARS, n_tickers),
+        _measure("backtest", "single",
+                 lambda: backtest.run_strategy(backtest.rsi_reversion, backtest.Panel(prices)),
+                 PANEL_BARS, n_tickers),
+        # a whole grid per call, once: it takes seconds at 500 tickers
+        _measure("backtest", "sweep",
+                 lambda: backtest.sweep(backtest.rsi_reversion, SWEEP_GRID, prices, workers=1),
+                 PANEL_BARS, n_tickers, repeats=1),
+        _measure("backtest", "sweep_parallel",
+                 lambda: backtest.sweep(backtest.rsi_reversion, SWEEP_GRID, prices, executor=executor),
+                 PANEL_BARS, n_tickers, repeats=1),
+    ]
+
+    checks = []
+    sequential = backtest.sweep(backtest.rsi_reversion, SWEEP_GRID, prices, workers=1)
+    pooled = backtest.sweep(backtest.rsi_reversion, SWEEP_GRID, prices, executor=executor)
+    for output in ("total_return", "sharpe", "trades"):
+        checks.append(_equivalence(PANEL_BARS, "sweep", "sweep_parallel", output,
+                                   pooled[output], sequential[output]))
+    for candidate, outputs in [
+        ("panel", panel.compute_panel(ALL_SPECS, prices=prices)),
+        ("parallel", parallel.compute_panel_parallel(ALL_SPECS, prices=prices, executor=executor)),
+    ]:
+        for ticker in tickers[:5]:
+            frame = fused.compute.__wrapped__(ticker, ALL_SPECS)
+            for output, values in outputs.items():
+                checks.append(_equivalence(PANEL_BARS, "fused", candidate, output,
+                                           values[ticker].to_numpy(), frame[output]))
+    return results, checks
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(bars=DEFAULT_BARS, panel_tickers=DEFAULT_PANEL_TICKERS):
+    """Run the whole suite in a temporary cache directory, returns the report dict."""
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "bars": list(bars),
+            "panel_tickers": list(panel_tickers),
+            "panel_bars": PANEL_BARS,
+            "cpu_count": os.cpu_count(),
+            "rtol": RTOL,
+            "atol": ATOL,
+        },
+        "results": [],
+        "equivalence": [],
+    }
+
+    original_dir = cache.CACHE_DIR
+    with tempfile.TemporaryDirectory(prefix="indicators-bench-") as tmp:
+        cache.CACHE_DIR = Path(tmp)
+        try:
+            for n in bars:
+                print(f"{n} bars")
+                ticker = f"B{n}"  # within the 10 characters of a ticker symbol
+                cache.write_bars(ticker, synthetic_bars(n, seed=n))
+                results, checks = bench_series(ticker, n)
+                report["results"].extend(results)
+                report["equivalence"].extend(checks)
+
+            if panel_tickers:
+                tickers = [f"PANEL{i:03d}" for i in range(max(panel_tickers))]
+                for i, ticker in enumerate(tickers):
+                    cache.write_bars(ticker, synthetic_bars(PANEL_BARS, seed=i))
+                # one pool for every width, so its start-up isn't part of the timings
+                with ProcessPoolExecutor() as executor:
+                    for n_tickers in panel_tickers:
+                        print(f"{n_tickers} tickers panel")
+                        results, checks = bench_panel(n_tickers, tickers, executor)
+                        report["results"].extend(results)
+                        report["equivalence"].extend(checks)
+        finally:
+            cache.CACHE_DIR = original_dir
+            memo.results_cache.clear()
+    return report
+
+
+def _key(result):
+    return result["group"], result["name"], result["bars"], result["tickers"]
+
+
+def compare(report, baseline):
+    """Print best-time ratios of `report` against `baseline` (<1 is faster)."""
+    previous = {_key(r): r for r in baseline["results"]}
+    print(f"\nAgainst {baseline['meta'].get('commit')} ({baseline['meta'].get('created_at')}):")
+    for result in report["results"]:
+        before = previous.get(_key(result))
+        if before is None or not before["best_s"]:
+            continue
+        ratio = result["best_s"] / before["best_s"]
+        memory = result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else float("nan")
+        print(f"  {result['group']:<10} {result['name']:<14} {result['bars']:>10} x {result['tickers']:<4} "
+              f"time x{ratio:6.2f}  memory x{memory:6.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--bars", type=int, nargs="*", help=f"series lengths (default {DEFAULT_BARS})")
+    parser.add_argument("--panel-tickers", type=int, nargs="*",
+                        help=f"panel widths (default {DEFAULT_PANEL_TICKERS})")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"small sizes only: {QUICK_BARS} bars, {QUICK_PANEL_TICKERS} tickers")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    bars = args.bars if args.bars is not None else (QUICK_BARS if args.quick else DEFAULT_BARS)
+    panel_tickers = (
+        args.panel_tickers if args.panel_tickers is not None
+        else (QUICK_PANEL_TICKERS if args.quick else DEFAULT_PANEL_TICKERS)
+    )
+    report = run(bars, panel_tickers)
+
+    failed = [check for check in report["equivalence"] if not check["ok"]]
+    print(f"\n{len(report['equivalence']) - len(failed)}/{len(report['equivalence'])} equivalence checks passed")
+    for check in failed:
+        print(f"  MISMATCH {check}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text()))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""
+Local columnar cache of PriceHistory, one directory per ticker.
+
+Each column is a flat binary file of float64 (prices) or int64 (date as days
+since epoch, volume) values, so reading a ticker is a zero-copy np.memmap of
+its files instead of a MySQL round trip that returns DECIMALs as objects.
+refresh() appends the bars stored since the last refresh; run it after every
+ingest (insert_price_history.py does) or by hand:
+
+    python -m indicators.cache [TICKER ...]
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pymysql
+from dotenv import load_dotenv
+
+CACHE_DIR = Path(
+    os.getenv(
+        "INDICATORS_CACHE_DIR",
+        Path(__file__).resolve().parent.parent / ".cache" / "pricehistory",
+    )
+)
+
+# on-disk dtype of every cached column, dates are stored as int64 days
+COLUMNS = {
+    "date": np.int64,
+    "open_price": np.float64,
+    "high_price": np.float64,
+    "low_price": np.float64,
+    "close_price": np.float64,
+    "volume": np.int64,
+}
+
+PRICE_COLUMNS = ["open_price", "high_price", "low_price", "close_price"]
+
+# Ticker.ticker_symbol is a VARCHAR(10): letters and digits, with the - . ^ =
+# of share classes, indexes and futures, so no symbol can name a path outside CACHE_DIR
+TICKER_SYMBOL = re.compile(r"[A-Za-z0-9^][A-Za-z0-9.^=-]{0,9}")
+
+
+# Shared DB connection helper
+def get_db_connection():
+    load_dotenv()
+    return pymysql.connect(
+        host=os.getenv('DB_HOST'),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        database=os.getenv('DB_NAME'),
+        port=int(os.getenv('DB_PORT', 3306)),
+    )
+
+
+def _ticker_dir(ticker):
+    if not isinstance(ticker, str) or not TICKER_SYMBOL.fullmatch(ticker) or ".." in ticker:
+        raise ValueError(f"invalid ticker symbol: {ticker!r}")
+    return CACHE_DIR / ticker
+
+
+def _column_path(ticker, column):
+    return _ticker_dir(ticker) / f"{column}.bin"
+
+
+def _n_rows(ticker):
+    # a write interrupted half way leaves some columns longer, only full rows count
+    sizes = [
+        _column_path(ticker, column).stat().st_size // np.dtype(dtype).itemsize
+        if _column_path(ticker, column).exists()
+        else 0
+        for column, dtype in COLUMNS.items()
+    ]
+    return min(sizes)
+
+
+def is_cached(ticker):
+    return _column_path(ticker, "date").exists()
+
+
+def load_columns(ticker, columns=None):
+    """Read-only memory-mapped arrays of a ticker's cached bars (no copy)."""
+    columns = columns or list(COLUMNS)
+    n = _n_rows(ticker) if is_cached(ticker) else 0
+    arrays = {}
+    for column in columns:
+        dtype = COLUMNS[column]
+        if n == 0:
+            array = np.empty(0, dtype=dtype)
+        else:
+            array = np.memmap(_column_path(ticker, column), dtype=dtype, mode="r", shape=(n,))
+        arrays[column] = array.view("datetime64[D]") if column == "date" else array
+    return arrays
+
+
+def last_date(ticker):
+    """Date of the newest cached bar, None if nothing is cached."""
+    if not is_cached(ticker):
+        return None
+    n = _n_rows(ticker)
+    if n == 0:
+        return None
+    return load_columns(ticker, ["date"])["date"][n - 1].astype(object)
+
+
+def bar_version(ticker):
+    """(last cached date, write stamp) of a ticker, changes whenever write_bars() stores bars.
+
+    The date alone misses the hourly ingest rewriting today's bar in place.
+    """
+    day = last_date(ticker)
+    if day is None:
+        return None
+    return str(day), _column_path(ticker, "close_price").stat().st_mtime_ns
+
+
+def load_arrays(ticker, columns=None):
+    """Like load_columns(), plus the date column, and loads from MySQL on first use."""
+    if not is_cached(ticker):
+        refresh([ticker])
+    columns = columns or list(COLUMNS)
+    if "date" not in columns:
+        columns = ["date", *columns]
+    return load_columns(ticker, columns)
+
+
+def load_frame(ticker, columns=None):
+    """Cached bars as a DataFrame with float64/int64 columns, loads from MySQL on first use."""
+    return pd.DataFrame(load_arrays(ticker, columns), copy=False)
+
+
+def write_bars(ticker, bars):
+    """Store `bars` (date-sorted columns) replacing every cached bar from its first date on.
+
+    Usually an append, except that the last cached day is replaced when it
+    comes back (the daily row of an hourly ingest changes until the day is
+    over); refresh() also rewrites from an older date when a backfill filled
+    a hole before it.
+    """
+    if len(bars["date"]) == 0:
+        return
+    _ticker_dir(ticker).mkdir(parents=True, exist_ok=True)
+
+    first_new = np.asarray(bars["date"], dtype="datetime64[D]").astype(np.int64)[0]
+    n = _n_rows(ticker) if is_cached(ticker) else 0
+    if n:
+        cached_dates = load_columns(ticker, ["date"])["date"].astype(np.int64)
+        n = int(np.searchsorted(cached_dates, first_new, side="left"))
+
+    for column, dtype in COLUMNS.items():
+        path = _column_path(ticker, column)
+        values = np.asarray(bars[column])
+        if column == "date":
+            values = values.astype("datetime64[D]")
+        values = np.ascontiguousarray(values.astype(dtype))
+        with open(path, "ab") as f:
+            f.truncate(n * np.dtype(dtype).itemsize)
+            f.write(values.tobytes())
+
+
+def _bars_from_rows(rows):
+    return {
+        "date": np.array([row[1] for row in rows], dtype="datetime64[D]"),
+        **{
+            column: np.array([row[i] for row in rows], dtype=np.float64)
+            for i, column in enumerate(PRICE_COLUMNS, start=2)
+        },
+        "volume": np.array([row[6] for row in rows], dtype=np.int64),
+    }
+
+
+def _first_changed(cached_dates, stored_dates):
+    """Oldest date at which the cached and the stored dates of a ticker differ, None if equal."""
+    cached_dates = np.asarray(cached_dates, dtype="datetime64[D]")
+    stored_dates = np.asarray(stored_dates, dtype="datetime64[D]")
+    n = min(len(cached_dates), len(stored_dates))
+    differ = np.flatnonzero(cached_dates[:n] != stored_dates[:n])
+    if len(differ):
+        i = differ[0]
+        return min(cached_dates[i], stored_dates[i]).astype(object)
+    if len(cached_dates) != len(stored_dates):
+        return (cached_dates if len(cached_dates) > n else stored_dates)[n].astype(object)
+    return None
+
+
+def refresh(tickers=None, conn=None):
+    """Bring the cache up to date with PriceHistory, returns {ticker: bars written}.
+
+    Uncached tickers get their whole history in one query, cached ones share
+    one query for everything dated on or after the oldest of their last bars.
+    The stored first date and row count of every cached ticker are checked
+    against the cache too: when a backfill added (or a purge removed) older
+    bars, the ticker is rewritten from the oldest changed date and its
+    streaming state is replayed.
+    """
+    owns_conn = conn is None
+    conn = conn or get_db_connection()
+    try:
+        cursor = conn.cursor()
+        if tickers is None:
+            cursor.execute("SELECT ticker_symbol FROM Ticker ORDER BY ticker_symbol;")
+            tickers = [row[0] for row in cursor.fetchall()]
+
+        last_dates = {ticker: last_date(ticker) for ticker in tickers}
+        cold = [ticker for ticker, day in last_dates.items() if day is None]
+        warm = {ticker: day for ticker, day in last_dates.items() if day is not None}
+        known = set()
+
+        sql_select = """
+            SELECT ticker_symbol, date, open_price, high_price, low_price, close_price, volume
+            FROM PriceHistory
+        """
+        rows = []
+        if cold:
+            cursor.execute(
+                sql_select + " WHERE ticker_symbol IN %s ORDER BY ticker_symbol, date;", (cold,)
+            )
+            rows.extend(cursor.fetchall())
+            cursor.execute("SELECT ticker_symbol FROM Ticker WHERE ticker_symbol IN %s;", (cold,))
+            known = {row[0] for row in cursor.fetchall()}
+        rewritten = set()
+        if warm:
+            cursor.execute(
+                sql_select + " WHERE ticker_symbol IN %s AND date >= %s ORDER BY ticker_symbol, date;",
+                (list(warm), min(warm.values())),
+            )
+            newer = [row for row in cursor.fetchall() if row[1] >= warm[row[0]]]
+            rows.extend(newer)
+
+            # the bars before each last cached date must still be the cached ones
+            cursor.execute(
+                "SELECT ticker_symbol, MIN(date), COUNT(*) FROM PriceHistory"
+                " WHERE ticker_symbol IN %s GROUP BY ticker_symbol;",
+                (list(warm),),
+            )
+            stored = {ticker: (first, count) for ticker, first, count in cursor.fetchall()}
+            n_newer = {}
+            for row in newer:
+                n_newer[row[0]] = n_newer.get(row[0], 0) + 1
+            changed = []
+            for ticker, day in warm.items():
+                first, count = stored.get(ticker, (None, 0))
+                n_cached = _n_rows(ticker)
+                cached_first = load_columns(ticker, ["date"])["date"][0].astype(object)
+                if first != cached_first or count - n_newer.get(ticker, 0) != n_cached - 1:
+                    changed.append(ticker)
+
+            if changed:
+                cursor.execute(
+                    "SELECT ticker_symbol, date FROM PriceHistory"
+                    " WHERE ticker_symbol IN %s ORDER BY ticker_symbol, date;",
+                    (changed,),
+                )
+                stored_dates = {}
+                replaced = []
+                for ticker, day in cursor.fetchall():
+                    stored_dates.setdefault(ticker, []).append(day)
+                for ticker in changed:
+                    since = _first_changed(load_columns(ticker, ["date"])["date"], stored_dates.get(ticker, []))
+                    if since is None or since >= warm[ticker]:
+                        continue
+                    cursor.execute(
+                        sql_select + " WHERE ticker_symbol = %s AND date >= %s ORDER BY date;", (ticker, since)
+                    )
+                    replaced.extend(cursor.fetchall())
+                    rewritten.add(ticker)
+                rows = [row for row in rows if row[0] not in rewritten] + replaced
+        cursor.close()
+    finally:
+        if owns_conn:
+            conn.close()
+
+    by_ticker = {}
+    for row in rows:
+        by_ticker.setdefault(row[0], []).append(row)
+
+    written = {}
+    for ticker in cold:
+        if ticker not in by_ticker and ticker in known:
+            # no history yet: cache it as empty so readers stop asking MySQL
+            # (unknown symbols get nothing on disk, they just read as empty)
+            _ticker_dir(ticker).mkdir(parents=True, exist_ok=True)
+            for column in COLUMNS:
+                _column_path(ticker, column).touch()
+    from . import streaming  # streaming reads the cache, import it lazily
+
+    for ticker, ticker_rows in by_ticker.items():
+        bars = _bars_from_rows(ticker_rows)
+        write_bars(ticker, bars)
+        if ticker in rewritten:
+            # a stream can't take bars older than its last one back, it starts over
+            streaming.rebuild(ticker)
+        else:
+            # O(1) per bar for tickers that keep streaming indicator state
+            streaming.advance(ticker, bars)
+        written[ticker] = len(ticker_rows)
+    return written
+
+
+if __name__ == "__main__":
+    written = refresh(sys.argv[1:] or None)
+    print(f"Cached {sum(written.values())} bars for {len(written)} tickers in {CACHE_DIR}")
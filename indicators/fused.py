@@ -0,0 +1,217 @@
+"""
+Fused multi-indicator computation.
+
+compute() loads a ticker's OHLCV once and evaluates any set of indicators on
+it. Intermediates shared between indicators (close diffs, rolling means, EMAs,
+true range, rolling highs/lows) are computed once per distinct parameter set
+and reused, e.g. bollinger(20) and moving_avg(20) share one rolling mean and
+every MACD variant shares its EMAs.
+
+The formulas are exactly those of the single-indicator modules. They only use
+element-wise and column-wise pandas operations, so the same code evaluates a
+(time x ticker) panel when the price columns are DataFrames instead of Series.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import cache, memo
+
+
+class Intermediates:
+    """Memoized building blocks over one set of price columns (Series or DataFrames)."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self._memo = {}
+
+    def _memoized(self, key, fn):
+        if key not in self._memo:
+            self._memo[key] = fn()
+        return self._memo[key]
+
+    def column(self, name):
+        return self.prices[name]
+
+    def diff(self, name="close_price"):
+        return self._memoized(("diff", name), lambda: self.column(name).diff())
+
+    def gain(self):
+        return self._memoized("gain", lambda: self.diff().clip(lower=0))
+
+    def loss(self):
+        return self._memoized("loss", lambda: -self.diff().clip(upper=0))
+
+    def rolling_mean(self, source, window, min_periods=None):
+        return self._memoized(
+            ("rolling_mean", source, window, min_periods),
+            lambda: self.series(source).rolling(window=window, min_periods=min_periods).mean(),
+        )
+
+    def rolling_std(self, source, window):
+        return self._memoized(
+            ("rolling_std", source, window),
+            lambda: self.series(source).rolling(window=window).std(),
+        )
+
+    def rolling_min(self, source, window):
+        return self._memoized(
+            ("rolling_min", source, window),
+            lambda: self.series(source).rolling(window=window).min(),
+        )
+
+    def rolling_max(self, source, window):
+        return self._memoized(
+            ("rolling_max", source, window),
+            lambda: self.series(source).rolling(window=window).max(),
+        )
+
+    def ewm_mean(self, source, span):
+        return self._memoized(
+            ("ewm_mean", source, span),
+            lambda: self.series(source).ewm(span=span, adjust=False).mean(),
+        )
+
+    def true_range(self):
+        def _true_range():
+            high = self.column("high_price")
+            low = self.column("low_price")
+            prev_close = self.column("close_price").shift(1)
+            # fmax skips the NaN of the first bar like DataFrame.max(axis=1) did
+            return np.fmax(
+                np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs()
+            )
+
+        return self._memoized("true_range", _true_range)
+
+    def series(self, source):
+        """A price column or a named intermediate, used as input of rolling/ewm ops."""
+        if source == "gain":
+            return self.gain()
+        if source == "loss":
+            return self.loss()
+        if source == "true_range":
+            return self.true_range()
+        if isinstance(source, tuple) and source[0] == "macd":
+            return self._macd_line(*source[1:])
+        if isinstance(source, tuple) and source[0] == "stochastic_k":
+            return self._stochastic_k(source[1])
+        return self.column(source)
+
+    def _macd_line(self, fast, slow):
+        return self._memoized(
+            ("macd", fast, slow),
+            lambda: self.ewm_mean("close_price", fast) - self.ewm_mean("close_price", slow),
+        )
+
+    def _stochastic_k(self, range):
+        def _k():
+            lowest = self.rolling_min("low_price", range)
+            highest = self.rolling_max("high_price", range)
+            return (self.column("close_price") - lowest) / (highest - lowest) * 100
+
+        return self._memoized(("stochastic_k", range), _k)
+
+
+def _rsi(ctx, range=14):
+    avg_gain = ctx.rolling_mean("gain", range, min_periods=1)
+    avg_loss = ctx.rolling_mean("loss", range, min_periods=1)
+    rs = avg_gain / avg_loss.where(avg_loss != 0)
+    return {f"RSI_{range}": 100 - (100 / (1 + rs))}
+
+
+def _macd(ctx, fast=12, slow=26, signal=9):
+    line = ctx.series(("macd", fast, slow))
+    suffix = f"{fast}_{slow}_{signal}"
+    return {
+        f"MACD_{suffix}": line,
+        f"Signal_{suffix}": ctx.ewm_mean(("macd", fast, slow), signal),
+    }
+
+
+def _bollinger(ctx, range=20, num_std=2):
+    ma = ctx.rolling_mean("close_price", range)
+    std = ctx.rolling_std("close_price", range)
+    return {
+        f"MA_{range}": ma,
+        f"Upper_{range}": ma + (num_std * std),
+        f"Lower_{range}": ma - (num_std * std),
+    }
+
+
+def _moving_avg(ctx, range=50):
+    return {f"SMA_{range}": ctx.rolling_mean("close_price", range)}
+
+
+def _atr(ctx, range=14):
+    return {f"ATR_{range}": ctx.rolling_mean("true_range", range)}
+
+
+def _stochastic(ctx, range=14):
+    k = ctx.series(("stochastic_k", range))
+    return {
+        f"%K_{range}": k,
+        f"%D_{range}": ctx.rolling_mean(("stochastic_k", range), 3),
+    }
+
+
+# name -> (evaluator, price columns it reads)
+INDICATORS = {
+    "rsi": (_rsi, ["close_price"]),
+    "macd": (_macd, ["close_price"]),
+    "bollinger": (_bollinger, ["close_price"]),
+    "moving_avg": (_moving_avg, ["close_price"]),
+    "atr": (_atr, ["high_price", "low_price", "close_price"]),
+    "stochastic": (_stochastic, ["high_price", "low_price", "close_price"]),
+}
+
+
+def normalize_specs(specs):
+    """Accepts "rsi", ["rsi", "macd"], {"rsi": {"range": 14}} or [("rsi", {"range": 7}), ...]."""
+    if isinstance(specs, str):
+        specs = [specs]
+    if isinstance(specs, dict):
+        specs = list(specs.items())
+
+    normalized = []
+    for spec in specs:
+        name, params = (spec, {}) if isinstance(spec, str) else spec
+        if name not in INDICATORS:
+            raise ValueError(f"Unknown indicator '{name}', expected one of {list(INDICATORS)}")
+        normalized.append((name, dict(params or {})))
+    return normalized
+
+
+def required_columns(specs):
+    columns = []
+    for name, _ in normalize_specs(specs):
+        for column in INDICATORS[name][1]:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def compute_columns(prices, specs):
+    """Evaluate `specs` over price columns, returns {output name: Series or DataFrame}."""
+    ctx = Intermediates(prices)
+    outputs = {}
+    for name, params in normalize_specs(specs):
+        evaluator, _ = INDICATORS[name]
+        outputs.update(evaluator(ctx, **params))
+    return outputs
+
+
+def compute_frame(df, specs):
+    """Evaluate `specs` over an OHLCV frame, one aligned frame with date + every output."""
+    outputs = compute_columns(df, specs)
+    return pd.DataFrame({"date": df["date"], **outputs})
+
+
+@memo.memoized("compute")
+def compute(ticker, specs):
+    """Load `ticker` once and evaluate every indicator in `specs` in one pass.
+
+    >>> compute("AAPL", {"rsi": {"range": 14}, "bollinger": {"range": 20}, "macd": {}})
+    """
+    df = cache.load_frame(ticker, required_columns(specs))
+    return compute_frame(df, specs)
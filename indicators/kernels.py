@@ -0,0 +1,255 @@
+"""
+Pure-NumPy indicator kernels.
+
+Every kernel takes contiguous float64 arrays and writes into preallocated
+outputs (pass `out=` to reuse buffers across calls), so computing an
+indicator allocates a handful of arrays instead of one pandas column per
+intermediate step. Rolling means and standard deviations use cumulative sums,
+rolling min/max a sliding-window view, and the EMAs a blocked closed form of
+the recursion.
+
+The results match the pandas formulas of the indicator modules (rolling with
+min_periods, ewm(adjust=False), NaN propagation) within floating point
+tolerance. Inputs may contain NaN except for the EMAs, which only accept
+leading NaNs.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# outputs per cumulative sum in the rolling kernels
+_CHUNK = 4096
+
+# largest growth factor of the blocked EMA before values are rescaled
+_EMA_MAX_SCALE = 1e150
+
+
+def as_float_array(values):
+    """Contiguous float64 view of `values`, a copy only if it isn't one already."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _output(out, n):
+    return np.empty(n, dtype=np.float64) if out is None else out
+
+
+def _window_sums(values, window, centre=False, squares=None):
+    """Sum over each trailing window (positions window-1 ... n-1) from cumulative sums.
+
+    The cumulative sums restart every _CHUNK outputs so rounding error can't
+    grow with the series length. With centre=True each chunk is shifted by its
+    mean first and `squares` receives the centred sums of squares.
+    """
+    n_out = len(values) - window + 1
+    sums = np.empty(max(n_out, 0), dtype=np.float64)
+    cumsum = np.empty(_CHUNK + window, dtype=np.float64)
+    cumsum[0] = 0.0
+    for start in range(0, n_out, _CHUNK):
+        stop = min(start + _CHUNK, n_out)
+        segment = values[start : stop + window - 1]
+        length = len(segment)
+        if centre:
+            segment = segment - segment.mean()
+        np.cumsum(segment, out=cumsum[1 : length + 1])
+        np.subtract(cumsum[window : length + 1], cumsum[: length + 1 - window], out=sums[start:stop])
+        if squares is not None:
+            np.cumsum(segment * segment, out=cumsum[1 : length + 1])
+            np.subtract(
+                cumsum[window : length + 1], cumsum[: length + 1 - window], out=squares[start:stop]
+            )
+    return sums
+
+
+def _window_counts(valid, window):
+    cumsum = np.zeros(len(valid) + 1, dtype=np.int64)
+    np.cumsum(valid, out=cumsum[1:])
+    counts = np.empty(len(valid), dtype=np.int64)
+    # the first windows are partial, they start at 0
+    counts[:window] = cumsum[1 : window + 1]
+    counts[window:] = cumsum[window + 1 :] - cumsum[1:-window]
+    return counts
+
+
+def rolling_mean(values, window, min_periods=None, out=None):
+    """rolling(window, min_periods).mean(), NaNs count as missing values."""
+    n = len(values)
+    out = _output(out, n)
+    min_periods = window if min_periods is None else min_periods
+    if n == 0:
+        return out
+
+    valid = ~np.isnan(values)
+    # windows of the first bars are partial: prepend zeros so every window is full
+    padded = np.zeros(n + window - 1, dtype=np.float64)
+    padded[window - 1 :] = np.where(valid, values, 0.0)
+    sums = _window_sums(padded, window)
+    counts = _window_counts(valid, window)
+
+    np.divide(sums, counts, out=out, where=counts > 0)
+    out[counts < max(min_periods, 1)] = np.nan
+    return out
+
+
+def rolling_std(values, window, out=None):
+    """rolling(window).std() with ddof=1, NaN unless the window has `window` values."""
+    n = len(values)
+    out = _output(out, n)
+    out[:] = np.nan
+    if n < window or window < 2:
+        return out
+
+    # a NaN would poison every later cumulative sum: sum zeros, then blank the windows holding one
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, np.nanmean(values) if valid.any() else 0.0)
+    # centring before squaring keeps the sum of squares from cancelling out
+    squares = np.empty(n - window + 1, dtype=np.float64)
+    sums = _window_sums(filled, window, centre=True, squares=squares)
+    variance = (squares - sums * sums / window) / (window - 1)
+    np.sqrt(np.maximum(variance, 0.0), out=out[window - 1 :])
+    out[_window_counts(valid, window) < window] = np.nan
+    return out
+
+
+def rolling_min(values, window, out=None):
+    """rolling(window).min(), NaN if the window holds a NaN."""
+    out = _output(out, len(values))
+    out[: window - 1] = np.nan
+    if len(values) >= window:
+        np.min(sliding_window_view(values, window), axis=1, out=out[window - 1 :])
+    return out
+
+
+def rolling_max(values, window, out=None):
+    """rolling(window).max(), NaN if the window holds a NaN."""
+    out = _output(out, len(values))
+    out[: window - 1] = np.nan
+    if len(values) >= window:
+        np.max(sliding_window_view(values, window), axis=1, out=out[window - 1 :])
+    return out
+
+
+def ewm_mean(values, span, out=None):
+    """ewm(span, adjust=False).mean(): y[0] = x[0], y[t] = y[t-1] + alpha * (x[t] - y[t-1]).
+
+    The recursion is solved in closed form one block at a time,
+    y[t] = decay**k * (y[t0] + alpha * sum(x[t0+j] / decay**j for j in 1..k)),
+    with blocks short enough that decay**-k stays finite.
+    """
+    n = len(values)
+    out = _output(out, n)
+    if n == 0:
+        return out
+
+    start = int(np.argmax(~np.isnan(values))) if np.isnan(values[0]) else 0
+    out[:start] = np.nan
+    if start == n or np.isnan(values[start]):
+        out[:] = np.nan
+        return out
+
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    out[start] = values[start]
+    if decay == 0.0:
+        out[start:] = values[start:]
+        return out
+
+    block = max(1, min(n, int(np.log(_EMA_MAX_SCALE) / -np.log(decay))))
+    powers = decay ** np.arange(1, block + 1, dtype=np.float64)
+    position = start + 1
+    while position < n:
+        k = min(block, n - position)
+        chunk = values[position : position + k] / powers[:k]
+        np.cumsum(chunk, out=chunk)
+        chunk *= alpha
+        chunk += out[position - 1]
+        chunk *= powers[:k]
+        out[position : position + k] = chunk
+        position += k
+    return out
+
+
+def true_range(high, low, close, out=None):
+    """max(high - low, |high - previous close|, |low - previous close|), first bar high - low."""
+    n = len(close)
+    out = _output(out, n)
+    if n == 0:
+        return out
+    np.subtract(high, low, out=out)
+    gap = np.empty(n - 1, dtype=np.float64)
+    np.abs(np.subtract(high[1:], close[:-1], out=gap), out=gap)
+    np.fmax(out[1:], gap, out=out[1:])
+    np.abs(np.subtract(low[1:], close[:-1], out=gap), out=gap)
+    np.fmax(out[1:], gap, out=out[1:])
+    return out
+
+
+def rsi(close, range=14, out=None):
+    """Simple-mean RSI, NaN while the average loss is zero."""
+    n = len(close)
+    out = _output(out, n)
+    if n == 0:
+        return out
+    delta = np.empty(n, dtype=np.float64)
+    delta[0] = np.nan
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+
+    # fmax turns the NaN first delta into 0, diff() keeps it missing
+    gain = np.fmax(delta, 0.0)
+    gain[0] = np.nan
+    avg_gain = rolling_mean(gain, range, min_periods=1)
+    loss = np.fmax(np.negative(delta, out=delta), 0.0, out=delta)
+    loss[0] = np.nan
+    avg_loss = rolling_mean(loss, range, min_periods=1)
+
+    avg_loss[avg_loss == 0] = np.nan
+    np.divide(avg_gain, avg_loss, out=out)
+    out += 1
+    np.divide(100.0, out, out=out)
+    np.subtract(100.0, out, out=out)
+    return out
+
+
+def macd(close, fast=12, slow=26, signal=9, out=None):
+    """(MACD line, signal line)."""
+    n = len(close)
+    line, signal_line = out if out is not None else (np.empty(n), np.empty(n))
+    slow_ema = ewm_mean(close, slow)
+    ewm_mean(close, fast, out=line)
+    line -= slow_ema
+    ewm_mean(line, signal, out=signal_line)
+    return line, signal_line
+
+
+def bollinger(close, range=20, num_std=2, out=None):
+    """(moving average, upper band, lower band)."""
+    n = len(close)
+    ma, upper, lower = out if out is not None else (np.empty(n), np.empty(n), np.empty(n))
+    rolling_mean(close, range, out=ma)
+    std = rolling_std(close, range)
+    std *= num_std
+    np.add(ma, std, out=upper)
+    np.subtract(ma, std, out=lower)
+    return ma, upper, lower
+
+
+def moving_avg(close, range=50, out=None):
+    return rolling_mean(close, range, out=out)
+
+
+def atr(high, low, close, range=14, out=None):
+    return rolling_mean(true_range(high, low, close), range, out=out)
+
+
+def stochastic(high, low, close, range=14, out=None):
+    """(%K, %D)."""
+    n = len(close)
+    k, d = out if out is not None else (np.empty(n), np.empty(n))
+    lowest = rolling_min(low, range)
+    span = rolling_max(high, range, out=np.empty(n))
+    span -= lowest
+    np.subtract(close, lowest, out=k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k /= span
+    k *= 100
+    rolling_mean(k, 3, out=d)
+    return k, d
@@ -0,0 +1,183 @@
+"""
+Memoized indicator results.
+
+Results are cached under (indicator, ticker, params, last cached bar), so a
+refresh that appends or rewrites a bar automatically produces new keys and stale results
+simply age out of the LRU. Entries can also expire after a TTL, and an optional
+on-disk tier (one pickle per indicator/ticker/params, overwritten when a newer
+bar comes in) lets results survive restarts.
+
+Configured from the environment:
+
+    INDICATORS_MEMO_MAXSIZE   in-memory entries (default 256)
+    INDICATORS_MEMO_TTL       seconds before an entry expires (default: never)
+    INDICATORS_MEMO_DISK_DIR  enables the disk tier in that directory
+
+stats() returns hit/miss/eviction counters for metrics.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from . import cache
+
+_MISSING = object()
+
+
+def _freeze(value):
+    """Hashable version of nested dicts/lists so params can be part of a key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _copy(value):
+    # callers get their own copy so mutating a result can't corrupt the cache
+    return value.copy() if hasattr(value, "copy") else value
+
+
+class IndicatorCache:
+    """Thread-safe bounded LRU with optional TTL and optional disk tier."""
+
+    def __init__(self, maxsize=256, ttl=None, disk_dir=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            ["hits", "misses", "evictions", "expirations", "disk_hits", "disk_writes"], 0
+        )
+
+    def _expired(self, stored_at):
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _disk_path(self, key):
+        # the last bar (key[-1]) is left out: a newer result overwrites the older file
+        digest = hashlib.sha1(repr(key[:-1]).encode("utf-8")).hexdigest()
+        return self.disk_dir / f"{digest}.pkl"
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if not self._expired(stored_at):
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return value
+                del self._entries[key]
+                self._counters["expirations"] += 1
+
+        value = self._disk_get(key)
+        with self._lock:
+            if value is _MISSING:
+                self._counters["misses"] += 1
+            else:
+                self._counters["hits"] += 1
+                self._counters["disk_hits"] += 1
+                self._store(key, value, time.time())
+        return value
+
+    def put(self, key, value):
+        stored_at = time.time()
+        with self._lock:
+            self._store(key, value, stored_at)
+        self._disk_put(key, value, stored_at)
+
+    def _store(self, key, value, stored_at):
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _disk_get(self, key):
+        if self.disk_dir is None:
+            return _MISSING
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, stored_at, value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return _MISSING
+        if stored_key != key or self._expired(stored_at):
+            return _MISSING
+        return value
+
+    def _disk_put(self, key, value, stored_at):
+        if self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        path = self._disk_path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, stored_at, value), f)
+        tmp_path.replace(path)
+        with self._lock:
+            self._counters["disk_writes"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "disk": str(self.disk_dir) if self.disk_dir else None,
+            }
+
+
+results_cache = IndicatorCache(
+    maxsize=int(os.getenv("INDICATORS_MEMO_MAXSIZE", 256)),
+    ttl=float(os.environ["INDICATORS_MEMO_TTL"]) if os.getenv("INDICATORS_MEMO_TTL") else None,
+    disk_dir=os.getenv("INDICATORS_MEMO_DISK_DIR"),
+)
+
+
+def stats():
+    return results_cache.stats()
+
+
+def memoized(indicator):
+    """Cache an indicator function `fn(ticker, ...)` in results_cache."""
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(ticker, *args, **kwargs):
+            last_bar = cache.bar_version(ticker)
+            if last_bar is None:
+                # nothing cached yet, the call itself loads the ticker
+                return fn(ticker, *args, **kwargs)
+
+            bound = signature.bind(ticker, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "ticker"}
+            key = (indicator, ticker, _freeze(params), last_bar)
+
+            value = results_cache.get(key)
+            if value is _MISSING:
+                value = fn(ticker, *args, **kwargs)
+                results_cache.put(key, _copy(value))
+            return _copy(value)
+
+        return wrapper
+
+    return decorator
@@ -1,24 +1,9 @@
-import os
 import pandas as pd
-import pymysql
-from dotenv import load_dotenv
 
-# Shared DB connection helper
-def get_db_connection():
-    load_dotenv()
-    return pymysql.connect(
-        host=os.getenv('DB_HOST'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME')
-    )
+from . import cache, kernels, memo
 
+@memo.memoized("moving_avg")
 def moving_avg(ticker, range=50):
-    conn = get_db_connection()
-    df = pd.read_sql(f"SELECT date, close_price FROM PriceHistory WHERE ticker_symbol='{ticker}' ORDER BY date ASC;", conn)
-    conn.close()
-
-
-    df['SMA'] = df['close_price'].rolling(window=range).mean()
-    print(df.tail())
-    return df[['date', 'SMA']]
\ No newline at end of file
+    # float64 arrays straight from the local cache, no MySQL round trip
+    prices = cache.load_arrays(ticker, ["close_price"])
+    return pd.DataFrame({'date': prices['date'], 'SMA': kernels.moving_avg(prices['close_price'], range)})
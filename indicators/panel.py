@@ -0,0 +1,70 @@
+"""
+Cross-sectional panel mode: indicators for many tickers at once.
+
+load_panel() reads the cached price columns of every ticker once and aligns
+them into (time x ticker) float64 matrices; compute_panel() then evaluates the
+fused indicator formulas on those matrices, so each rolling/ewm/element-wise
+step runs once over the whole universe instead of once per ticker.
+
+Tickers with a shorter history are NaN before their first bar, which gives the
+same values as computing them one by one. A date one ticker is missing while
+others have it is treated as a missing bar for that ticker.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import cache
+from .fused import compute_columns, required_columns
+
+
+def cached_tickers():
+    """Every ticker that has a cache directory."""
+    if not cache.CACHE_DIR.exists():
+        return []
+    return sorted(path.name for path in cache.CACHE_DIR.iterdir() if path.is_dir())
+
+
+def load_panel(tickers=None, columns=("high_price", "low_price", "close_price")):
+    """{column: DataFrame(index=date, columns=tickers)} of cached prices.
+
+    Defaults to every cached ticker; tickers that aren't cached yet are loaded
+    from MySQL first, all in one refresh.
+    """
+    tickers = list(tickers) if tickers is not None else cached_tickers()
+    missing = [ticker for ticker in tickers if not cache.is_cached(ticker)]
+    if missing:
+        cache.refresh(missing)
+
+    arrays = {ticker: cache.load_columns(ticker, ["date", *columns]) for ticker in tickers}
+    dates = np.unique(
+        np.concatenate([a["date"] for a in arrays.values()])
+        if arrays
+        else np.empty(0, dtype="datetime64[D]")
+    )
+
+    panel = {
+        column: np.full((len(dates), len(tickers)), np.nan, dtype=np.float64)
+        for column in columns
+    }
+    for j, ticker in enumerate(tickers):
+        rows = np.searchsorted(dates, arrays[ticker]["date"])
+        for column in columns:
+            panel[column][rows, j] = arrays[ticker][column]
+
+    index = pd.DatetimeIndex(dates, name="date")
+    return {
+        column: pd.DataFrame(matrix, index=index, columns=tickers, copy=False)
+        for column, matrix in panel.items()
+    }
+
+
+def compute_panel(specs, tickers=None, prices=None):
+    """Evaluate `specs` for every ticker at once, returns {output name: DataFrame(date x ticker)}.
+
+    >>> out = compute_panel({"rsi": {"range": 14}, "bollinger": {}})
+    >>> out["RSI_14"].iloc[-1].nsmallest(10)   # most oversold tickers today
+    """
+    if prices is None:
+        prices = load_panel(tickers, columns=required_columns(specs))
+    return compute_columns(prices, specs)
@@ -0,0 +1,195 @@
+"""
+Full-universe indicators on a process pool over shared memory.
+
+compute_panel_parallel() copies the price panel once into
+multiprocessing.shared_memory, one contiguous row per ticker, and allocates
+the outputs there too. Workers only receive (segment names, ticker range,
+specs): they attach to the segments without copying, run the NumPy kernels
+for their chunk of tickers and write straight into their rows of the output
+buffers, so nothing but a few names is pickled per task and the work scales
+with cores instead of being serialized by the GIL.
+
+The outputs are the same {output name: DataFrame(date x ticker)} as
+compute_panel().
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from . import kernels
+from .fused import compute_columns, normalize_specs, required_columns
+from .panel import load_panel
+
+# name -> (kernel writing into preallocated outputs, output names)
+KERNELS = {
+    "rsi": (
+        lambda p, out, range=14: kernels.rsi(p["close_price"], range, out=out[0]),
+        lambda range=14: [f"RSI_{range}"],
+    ),
+    "macd": (
+        lambda p, out, fast=12, slow=26, signal=9: kernels.macd(p["close_price"], fast, slow, signal, out=out),
+        lambda fast=12, slow=26, signal=9: [f"MACD_{fast}_{slow}_{signal}", f"Signal_{fast}_{slow}_{signal}"],
+    ),
+    "bollinger": (
+        lambda p, out, range=20, num_std=2: kernels.bollinger(p["close_price"], range, num_std, out=out),
+        lambda range=20, num_std=2: [f"MA_{range}", f"Upper_{range}", f"Lower_{range}"],
+    ),
+    "moving_avg": (
+        lambda p, out, range=50: kernels.moving_avg(p["close_price"], range, out=out[0]),
+        lambda range=50: [f"SMA_{range}"],
+    ),
+    "atr": (
+        lambda p, out, range=14: kernels.atr(p["high_price"], p["low_price"], p["close_price"], range, out=out[0]),
+        lambda range=14: [f"ATR_{range}"],
+    ),
+    "stochastic": (
+        lambda p, out, range=14: kernels.stochastic(
+            p["high_price"], p["low_price"], p["close_price"], range, out=out
+        ),
+        lambda range=14: [f"%K_{range}", f"%D_{range}"],
+    ),
+}
+
+# segments attached by this worker process, kept open across tasks of one run
+_attached = {}
+
+
+def _attach(name):
+    if name not in _attached:
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # before 3.13 attaching registers the name again with the resource
+            # tracker the pool shares with the parent, which unlinks it once
+            segment = shared_memory.SharedMemory(name=name)
+        _attached[name] = segment
+    return _attached[name]
+
+
+def _detach_all_except(names):
+    for name in list(_attached):
+        if name not in names:
+            _attached.pop(name).close()
+
+
+def _view(name, shape):
+    return np.ndarray(shape, dtype=np.float64, buffer=_attach(name).buf)
+
+
+def output_names(specs):
+    names = []
+    for name, params in normalize_specs(specs):
+        names.extend(KERNELS[name][1](**params))
+    return names
+
+
+def _compute_chunk(inputs, outputs, start, stop, specs):
+    """Worker task: indicators of tickers [start, stop) from and into shared memory."""
+    _detach_all_except({name for name, _ in inputs.values()} | {outputs[0]})
+    prices = {column: _view(name, shape) for column, (name, shape) in inputs.items()}
+    return _compute_rows(prices, _view(*outputs), start, stop, normalize_specs(specs))
+
+
+def _compute_rows(prices, out, start, stop, specs):
+    for j in range(start, stop):
+        row = {column: values[j] for column, values in prices.items()}
+        first = int(np.argmax(~np.isnan(row["close_price"])))
+        if np.isnan(row["close_price"][first:]).any():
+            # a bar missing in the middle of the series: the EMA kernels
+            # only skip leading NaNs, let pandas handle this ticker
+            values = compute_columns(pd.DataFrame(row), specs).values()
+            out[:, j, :] = np.asarray(list(values))
+            continue
+
+        position = 0
+        for name, params in specs:
+            kernel, names = KERNELS[name]
+            n_outputs = len(names(**params))
+            kernel(row, tuple(out[position + k, j] for k in range(n_outputs)), **params)
+            position += n_outputs
+    return stop - start
+
+
+class _Segment:
+    """A float64 array in a new shared memory segment, unlinked by release()."""
+
+    def __init__(self, shape):
+        self.shape = tuple(shape)
+        size = max(1, math.prod(self.shape) * np.dtype(np.float64).itemsize)
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(self.shape, dtype=np.float64, buffer=self.memory.buf)
+
+    @property
+    def spec(self):
+        return self.memory.name, self.shape
+
+    def release(self):
+        del self.array
+        self.memory.close()
+        self.memory.unlink()
+
+
+def compute_panel_parallel(specs, tickers=None, prices=None, workers=None, chunk_size=None, executor=None):
+    """Evaluate `specs` for every ticker on a process pool, returns {output name: DataFrame(date x ticker)}.
+
+    `prices` is a load_panel() result (loaded if omitted). Pass an existing
+    ProcessPoolExecutor as `executor` to reuse its processes across calls,
+    otherwise one with `workers` processes (default: every core) is started.
+    """
+    if prices is None:
+        prices = load_panel(tickers, columns=required_columns(specs))
+    specs = normalize_specs(specs)
+    names = output_names(specs)
+    columns = required_columns(specs)
+    first = prices[columns[0]]
+    n_dates, n_tickers = first.shape
+
+    segments = []
+    try:
+        inputs = {}
+        for column in columns:
+            segment = _Segment((n_tickers, n_dates))
+            # transposed once so every ticker is one contiguous row for the kernels
+            segment.array[:] = prices[column].to_numpy(dtype=np.float64).T
+            segments.append(segment)
+            inputs[column] = segment.spec
+        output = _Segment((len(names), n_tickers, n_dates))
+        segments.append(output)
+
+        workers = workers or os.cpu_count() or 1
+        chunk_size = chunk_size or max(1, math.ceil(n_tickers / (workers * 4)))
+        chunks = [(start, min(start + chunk_size, n_tickers)) for start in range(0, n_tickers, chunk_size)]
+
+        if executor is None and workers == 1:
+            arrays = {column: segment.array for column, segment in zip(columns, segments)}
+            for start, stop in chunks:
+                _compute_rows(arrays, output.array, start, stop, specs)
+        else:
+            owns_executor = executor is None
+            executor = executor or ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = [
+                    executor.submit(_compute_chunk, inputs, output.spec, start, stop, specs)
+                    for start, stop in chunks
+                ]
+                for future in futures:
+                    future.result()
+            finally:
+                if owns_executor:
+                    executor.shutdown()
+
+        # one copy out of shared memory, the segments are unlinked below
+        results = output.array.transpose(0, 2, 1).copy()
+    finally:
+        for segment in segments:
+            segment.release()
+
+    return {
+        name: pd.DataFrame(results[i], index=first.index, columns=first.columns, copy=False)
+        for i, name in enumerate(names)
+    }
@@ -0,0 +1,120 @@
+"""
+Latest indicator values of every ticker, stored in the IndicatorSnapshot table.
+
+The API's screener filters and ranks that table instead of recomputing
+indicators per request. refresh_snapshot() reads every ticker's latest values
+from its saved stream (streaming.py), which an ingest only advances by the new
+bars, and upserts one row per ticker. A ticker without a saved stream replays
+its cached history once. Run it after every ingest (insert_price_history.py
+does) or by hand:
+
+    python -m indicators.snapshot [TICKER ...]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from . import cache, streaming
+from .panel import cached_tickers
+
+# IndicatorSnapshot column -> output of the ticker's stream (same names as compute())
+SNAPSHOT_COLUMNS = {
+    "rsi_14": "RSI_14",
+    "macd": "MACD_12_26_9",
+    "macd_signal": "Signal_12_26_9",
+    "sma_50": "SMA_50",
+    "bb_middle": "MA_20",
+    "bb_upper": "Upper_20",
+    "bb_lower": "Lower_20",
+    "atr_14": "ATR_14",
+    "stoch_k": "%K_14",
+    "stoch_d": "%D_14",
+}
+
+# the streams cache.refresh() advances, so the snapshot never replays them with other specs
+SNAPSHOT_SPECS = streaming.DEFAULT_SPECS
+
+SQL_UPSERT_SNAPSHOT = """
+    INSERT INTO IndicatorSnapshot (ticker_symbol, as_of_date, close_price, {columns})
+    VALUES (%s, %s, %s, {placeholders})
+    ON DUPLICATE KEY UPDATE
+        as_of_date = VALUES(as_of_date),
+        close_price = VALUES(close_price),
+        {updates};
+""".format(
+    columns=", ".join(SNAPSHOT_COLUMNS),
+    placeholders=", ".join(["%s"] * len(SNAPSHOT_COLUMNS)),
+    updates=",\n        ".join(f"{column} = VALUES({column})" for column in SNAPSHOT_COLUMNS),
+)
+
+
+def _value(x):
+    # NaN (not enough bars yet) is stored as NULL, which no screener filter matches
+    return None if np.isnan(x) else float(x)
+
+
+def _current_stream(ticker):
+    """The ticker's saved stream, caught up with its cached bars."""
+    stream = streaming.load_stream(ticker, SNAPSHOT_SPECS)
+    bars = cache.load_columns(ticker)
+    dates = bars["date"]
+    if not len(dates) or stream.last_date is None:
+        return stream
+    # cache.refresh() advances saved streams, this only catches bars cached without it
+    i = np.searchsorted(dates, stream.last_date)
+    if i == len(dates) or dates[i] != stream.last_date:
+        # the stream's last bar is no longer cached, start over
+        stream = streaming.TickerStream(ticker, SNAPSHOT_SPECS)
+        stream.update_many(bars)
+    elif i < len(dates) - 1:
+        stream.update_many({column: values[i + 1:] for column, values in bars.items()})
+    else:
+        return stream
+    streaming.save_stream(stream)
+    return stream
+
+
+def latest_rows(tickers=None):
+    """One IndicatorSnapshot row per ticker with cached bars, values as of its last bar.
+
+    Each ticker's stream only ever saw its own bars: on the union-of-dates panel
+    a date another ticker traded would put a NaN into this ticker's windows.
+    """
+    tickers = list(tickers) if tickers is not None else cached_tickers()
+    rows = []
+    for ticker in tickers:
+        stream = _current_stream(ticker)
+        if stream.last_date is None:
+            continue
+        close = cache.load_columns(ticker, ["close_price"])["close_price"]
+        rows.append((
+            ticker,
+            pd.Timestamp(stream.last_date).date(),
+            float(close[-1]),
+            *(_value(stream.latest[output]) for output in SNAPSHOT_COLUMNS.values()),
+        ))
+    return rows
+
+
+def refresh_snapshot(tickers=None, conn=None):
+    """Upsert the latest snapshot rows of `tickers` (default: every cached ticker)."""
+    rows = latest_rows(tickers)
+    owns_conn = conn is None
+    conn = conn or cache.get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.executemany(SQL_UPSERT_SNAPSHOT, rows)
+        conn.commit()
+    finally:
+        if owns_conn:
+            conn.close()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    tickers = sys.argv[1:] or None
+    if tickers:
+        cache.refresh(tickers)
+    print(f"IndicatorSnapshot: {refresh_snapshot(tickers)} tickers updated")
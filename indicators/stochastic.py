@@ -1,27 +1,10 @@
-import os
 import pandas as pd
-import pymysql
-from dotenv import load_dotenv
 
-# Shared DB connection helper
-def get_db_connection():
-    load_dotenv()
-    return pymysql.connect(
-        host=os.getenv('DB_HOST'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME')
-    )
+from . import cache, kernels, memo
 
+@memo.memoized("stochastic")
 def stochastic(ticker, range=14):
-    conn = get_db_connection()
-    df = pd.read_sql(f"SELECT date, high_price, low_price, close_price FROM PriceHistory WHERE ticker_symbol='{ticker}' ORDER BY date ASC;", conn)
-    conn.close()
-
-
-    df['L14'] = df['low_price'].rolling(window=range).min()
-    df['H14'] = df['high_price'].rolling(window=range).max()
-    df['%K'] = (df['close_price'] - df['L14']) / (df['H14'] - df['L14']) * 100
-    df['%D'] = df['%K'].rolling(window=3).mean()
-    print(df.tail())
-    return df[['date', '%K', '%D']]
\ No newline at end of file
+    # float64 arrays straight from the local cache, no MySQL round trip
+    prices = cache.load_arrays(ticker, ["high_price", "low_price", "close_price"])
+    k, d = kernels.stochastic(prices['high_price'], prices['low_price'], prices['close_price'], range)
+    return pd.DataFrame({'date': prices['date'], '%K': k, '%D': d})
@@ -0,0 +1,400 @@
+"""
+Streaming indicators: O(1) state updates per new bar.
+
+Each streamer keeps just enough state (EMAs, running sums, windowed Welford
+mean/variance, monotonic deques for rolling min/max) to produce the next value
+from one new bar, instead of recomputing from the first bar, and remembers
+what its last update changed so undo() can take that bar back. The outputs match
+the batch formulas in fused.py (within floating point tolerance) and use the
+same output names.
+
+TickerStream bundles the streamers for a set of specs and persists them per
+ticker next to the cached prices; cache.refresh() advances every ticker that
+has a saved stream as new bars arrive:
+
+    stream = load_stream("AAPL")          # replays the cached history once
+    stream.latest                          # {"RSI_14": ..., "MACD_12_26_9": ..., ...}
+"""
+
+import math
+import pickle
+from collections import deque
+
+import numpy as np
+
+from . import cache
+from .fused import normalize_specs
+
+DEFAULT_SPECS = ["rsi", "macd", "bollinger", "moving_avg", "atr", "stochastic"]
+
+# running sums are recomputed exactly every this many updates to stop float drift
+RESUM_EVERY = 10_000
+
+# bumped when the pickled state changes, older saved streams are rebuilt
+STREAM_VERSION = 2
+
+NAN = float("nan")
+
+
+class EMA:
+    """pandas ewm(span, adjust=False).mean(): seeded with the first value."""
+
+    def __init__(self, span):
+        self.alpha = 2 / (span + 1)
+        self.value = NAN
+        self._undo = NAN
+
+    def update(self, x):
+        self._undo = self.value
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+    def undo(self):
+        self.value = self._undo
+
+
+class RollingMean:
+    """rolling(window, min_periods).mean() with NaN inputs counted as missing."""
+
+    def __init__(self, window, min_periods=None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self.count = 0
+        self.n_updates = 0
+        self._undo = None
+
+    def update(self, x):
+        full = len(self.values) == self.window
+        self._undo = (self.total, self.count, full, self.values[0] if full else None)
+        if full:
+            dropped = self.values[0]
+            if not math.isnan(dropped):
+                self.total -= dropped
+                self.count -= 1
+        self.values.append(x)
+        if not math.isnan(x):
+            self.total += x
+            self.count += 1
+
+        self.n_updates += 1
+        if self.n_updates % RESUM_EVERY == 0:
+            self.total = math.fsum(v for v in self.values if not math.isnan(v))
+
+        return self.total / self.count if self.count >= self.min_periods else NAN
+
+    def undo(self):
+        self.total, self.count, full, dropped = self._undo
+        self.values.pop()
+        if full:
+            self.values.appendleft(dropped)
+        self.n_updates -= 1
+
+
+class RollingMeanStd:
+    """rolling(window).mean() and .std() (ddof=1) via windowed Welford updates."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.n_updates = 0
+        self._undo = None
+
+    def update(self, x):
+        full = len(self.values) == self.window
+        self._undo = (self.mean, self.m2, full, self.values[0] if full else None)
+        if full:
+            dropped = self.values[0]
+            self.values.append(x)
+            new_mean = self.mean + (x - dropped) / self.window
+            self.m2 += (x - dropped) * (x - new_mean + dropped - self.mean)
+            self.mean = new_mean
+        else:
+            self.values.append(x)
+            delta = x - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (x - self.mean)
+
+        self.n_updates += 1
+        if self.n_updates % RESUM_EVERY == 0:
+            self.mean = math.fsum(self.values) / len(self.values)
+            self.m2 = math.fsum((v - self.mean) ** 2 for v in self.values)
+
+        if len(self.values) < self.window:
+            return NAN, NAN
+        variance = max(self.m2, 0.0) / (self.window - 1) if self.window > 1 else NAN
+        return self.mean, math.sqrt(variance)
+
+    def undo(self):
+        self.mean, self.m2, full, dropped = self._undo
+        self.values.pop()
+        if full:
+            self.values.appendleft(dropped)
+        self.n_updates -= 1
+
+
+class RollingExtreme:
+    """rolling(window).min() / .max() with a monotonic deque of (index, value)."""
+
+    def __init__(self, window, kind="min"):
+        self.window = window
+        self.is_min = kind == "min"
+        self.candidates = deque()
+        self.index = -1
+        self._undo = None
+
+    def update(self, x):
+        self.index += 1
+        popped = []
+        while self.candidates and (
+            self.candidates[-1][1] >= x if self.is_min else self.candidates[-1][1] <= x
+        ):
+            popped.append(self.candidates.pop())
+        self.candidates.append((self.index, x))
+        expired = None
+        if self.candidates[0][0] <= self.index - self.window:
+            expired = self.candidates.popleft()
+        self._undo = (popped, expired)
+        return self.candidates[0][1] if self.index >= self.window - 1 else NAN
+
+    def undo(self):
+        popped, expired = self._undo
+        if expired is not None:
+            self.candidates.appendleft(expired)
+        self.candidates.pop()
+        self.candidates.extend(reversed(popped))
+        self.index -= 1
+
+
+class RSI:
+    def __init__(self, range=14):
+        self.range = range
+        self.prev_close = NAN
+        self._undo = NAN
+        self.avg_gain = RollingMean(range, min_periods=1)
+        self.avg_loss = RollingMean(range, min_periods=1)
+
+    def update(self, bar):
+        delta = bar["close_price"] - self.prev_close  # NaN on the first bar, like diff()
+        self._undo = self.prev_close
+        self.prev_close = bar["close_price"]
+        avg_gain = self.avg_gain.update(max(delta, 0.0) if not math.isnan(delta) else NAN)
+        avg_loss = self.avg_loss.update(max(-delta, 0.0) if not math.isnan(delta) else NAN)
+        if math.isnan(avg_loss) or avg_loss == 0:
+            return {f"RSI_{self.range}": NAN}
+        return {f"RSI_{self.range}": 100 - (100 / (1 + avg_gain / avg_loss))}
+
+    def undo(self):
+        self.prev_close = self._undo
+        self.avg_gain.undo()
+        self.avg_loss.undo()
+
+
+class MACD:
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.suffix = f"{fast}_{slow}_{signal}"
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+
+    def update(self, bar):
+        line = self.fast.update(bar["close_price"]) - self.slow.update(bar["close_price"])
+        return {f"MACD_{self.suffix}": line, f"Signal_{self.suffix}": self.signal.update(line)}
+
+    def undo(self):
+        self.fast.undo()
+        self.slow.undo()
+        self.signal.undo()
+
+
+class Bollinger:
+    def __init__(self, range=20, num_std=2):
+        self.range = range
+        self.num_std = num_std
+        self.mean_std = RollingMeanStd(range)
+
+    def update(self, bar):
+        ma, std = self.mean_std.update(bar["close_price"])
+        return {
+            f"MA_{self.range}": ma,
+            f"Upper_{self.range}": ma + self.num_std * std,
+            f"Lower_{self.range}": ma - self.num_std * std,
+        }
+
+    def undo(self):
+        self.mean_std.undo()
+
+
+class MovingAvg:
+    def __init__(self, range=50):
+        self.range = range
+        self.mean = RollingMean(range)
+
+    def update(self, bar):
+        return {f"SMA_{self.range}": self.mean.update(bar["close_price"])}
+
+    def undo(self):
+        self.mean.undo()
+
+
+class ATR:
+    def __init__(self, range=14):
+        self.range = range
+        self.prev_close = NAN
+        self._undo = NAN
+        self.mean = RollingMean(range)
+
+    def update(self, bar):
+        true_range = bar["high_price"] - bar["low_price"]
+        if not math.isnan(self.prev_close):
+            true_range = max(
+                true_range,
+                abs(bar["high_price"] - self.prev_close),
+                abs(bar["low_price"] - self.prev_close),
+            )
+        self._undo = self.prev_close
+        self.prev_close = bar["close_price"]
+        return {f"ATR_{self.range}": self.mean.update(true_range)}
+
+    def undo(self):
+        self.prev_close = self._undo
+        self.mean.undo()
+
+
+class Stochastic:
+    def __init__(self, range=14):
+        self.range = range
+        self.lowest = RollingExtreme(range, "min")
+        self.highest = RollingExtreme(range, "max")
+        self.d = RollingMean(3)
+
+    def update(self, bar):
+        lowest = self.lowest.update(bar["low_price"])
+        highest = self.highest.update(bar["high_price"])
+        span = highest - lowest
+        k = (bar["close_price"] - lowest) / span * 100 if span else NAN
+        return {f"%K_{self.range}": k, f"%D_{self.range}": self.d.update(k)}
+
+    def undo(self):
+        self.lowest.undo()
+        self.highest.undo()
+        self.d.undo()
+
+
+STREAMERS = {
+    "rsi": RSI,
+    "macd": MACD,
+    "bollinger": Bollinger,
+    "moving_avg": MovingAvg,
+    "atr": ATR,
+    "stochastic": Stochastic,
+}
+
+
+class TickerStream:
+    """Every streamer of one ticker, able to replace the last day.
+
+    An hourly ingest rewrites today's PriceHistory row until the day is over,
+    so a bar dated like the last one replaces it: every streamer undoes its
+    last update, then the new bar is applied.
+    """
+
+    def __init__(self, ticker, specs=None):
+        self.ticker = ticker
+        self.specs = normalize_specs(specs or DEFAULT_SPECS)
+        self.streamers = [STREAMERS[name](**params) for name, params in self.specs]
+        self.last_date = None
+        self.latest = {}
+        self.version = STREAM_VERSION
+
+    def update(self, bar):
+        """Apply one bar (dict with date and OHLC), returns the latest outputs."""
+        day = np.datetime64(bar["date"], "D")
+        if self.last_date is not None and day < self.last_date:
+            return self.latest  # already applied
+        if self.last_date is not None and day == self.last_date:
+            for streamer in self.streamers:
+                streamer.undo()
+
+        latest = {}
+        for streamer in self.streamers:
+            latest.update(streamer.update(bar))
+        self.latest = latest
+        self.last_date = day
+        return latest
+
+    def update_many(self, bars):
+        """Apply column arrays (as stored in the cache) bar by bar."""
+        columns = [column for column in cache.COLUMNS if column in bars]
+        for values in zip(*(bars[column] for column in columns)):
+            bar = dict(zip(columns, values))
+            for column in cache.PRICE_COLUMNS:
+                bar[column] = float(bar[column])
+            self.update(bar)
+        return self.latest
+
+
+def _stream_path(ticker):
+    return cache._ticker_dir(ticker) / "streaming.pkl"
+
+
+def has_stream(ticker):
+    return _stream_path(ticker).exists()
+
+
+def save_stream(stream):
+    path = _stream_path(stream.ticker)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(stream, f)
+    tmp_path.replace(path)
+
+
+def load_stream(ticker, specs=None):
+    """The ticker's saved stream, built by replaying its cached history once if there is none."""
+    if has_stream(ticker):
+        with open(_stream_path(ticker), "rb") as f:
+            stream = pickle.load(f)
+        current = getattr(stream, "version", 1) == STREAM_VERSION
+        if current and (specs is None or stream.specs == normalize_specs(specs)):
+            return stream
+
+    if not cache.is_cached(ticker):
+        cache.refresh([ticker])
+    stream = TickerStream(ticker, specs)
+    stream.update_many(cache.load_columns(ticker))
+    if cache.is_cached(ticker):
+        save_stream(stream)
+    return stream
+
+
+def rebuild(ticker):
+    """Replay the ticker's saved stream over its whole cached history (no-op if it has none).
+
+    For when bars older than the stream's last one changed, e.g. a backfilled hole.
+    """
+    if not has_stream(ticker):
+        return None
+    with open(_stream_path(ticker), "rb") as f:
+        specs = pickle.load(f).specs
+    stream = TickerStream(ticker, specs)
+    stream.update_many(cache.load_columns(ticker))
+    save_stream(stream)
+    return stream.latest
+
+
+def advance(ticker, bars):
+    """Feed newly cached bars to the ticker's saved stream (no-op if it has none)."""
+    if not has_stream(ticker):
+        return None
+    stream = load_stream(ticker)
+    stream.update_many(bars)
+    save_stream(stream)
+    return stream.latest
@@ -0,0 +1,90 @@
+"""
+Scaling benchmark of the Monte Carlo value at risk (api/internal/risk.py).
+
+Simulates a synthetic portfolio (random correlated holdings, no database
+needed) with 10k to 1M paths, once per process pool size, and reports the
+wall time, paths per second and the 1 day / longest horizon VaR and CVaR, so
+both the parallel speedup and the convergence of the estimates show. With the
+same seed every pool size must produce identical figures.
+
+    python tests/benchmark_monte_carlo_var.py --holdings 100 --workers 1 4 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "backend"))
+from api.internal import risk
+
+
+def synthetic_inputs(holdings, days, seed):
+    """simulation_inputs() of a portfolio of `holdings` tickers with `days` of one factor returns."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0003, 0.01, days)
+    betas = rng.uniform(0.5, 1.5, holdings)
+    log_returns = np.outer(market, betas) + rng.normal(0, 0.015, (days, holdings))
+    values = rng.uniform(1_000, 50_000, holdings)
+    return {
+        "value": float(values.sum()),
+        "weights": values / values.sum(),
+        "mean": log_returns.mean(axis=0),
+        "factor": risk._covariance_factor(np.atleast_2d(np.cov(log_returns, rowvar=False))),
+    }
+
+
+def bench(inputs, horizons, levels, paths, seed, executor):
+    start = time.perf_counter()
+    results = risk.monte_carlo_var(inputs, horizons, levels, paths, seed, executor)
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": elapsed,
+        "paths_per_second": paths / elapsed,
+        "var_1": results[0]["levels"][-1]["var"],
+        "cvar_1": results[0]["levels"][-1]["cvar"],
+        f"var_{results[-1]['days']}": results[-1]["levels"][-1]["var"],
+        f"cvar_{results[-1]['days']}": results[-1]["levels"][-1]["cvar"],
+    }
+
+
+def print_results(results):
+    metrics = list(next(iter(results.values())))
+    print(f"{'workers':>8}{'paths':>10}" + "".join(f"{metric:>18}" for metric in metrics))
+    for (workers, paths), row in results.items():
+        print(f"{workers:>8}{paths:>10,}" + "".join(f"{row[metric]:>18,.6f}" for metric in metrics))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Monte Carlo VaR from 10k to 1M paths.")
+    parser.add_argument("--holdings", type=int, default=100)
+    parser.add_argument("--days", type=int, default=252, help="days of synthetic history for the covariance")
+    parser.add_argument("--paths", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--horizons", type=int, nargs="+", default=[1, 5, 10, 21])
+    parser.add_argument("--confidence", type=float, default=0.99)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    inputs = synthetic_inputs(args.holdings, args.days, args.seed)
+    results = {}
+    for workers in sorted(set(args.workers)):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # warm up the processes so their startup is not timed
+            warm_up = risk.BATCH_PATHS * workers
+            risk.monte_carlo_var(inputs, args.horizons, [args.confidence], warm_up, args.seed, executor)
+            for paths in args.paths:
+                results[(workers, paths)] = bench(
+                    inputs, args.horizons, [args.confidence], paths, args.seed, executor
+                )
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f_json:
+            json.dump({f"{workers}x{paths}": row for (workers, paths), row in results.items()}, f_json, indent=2)
@@ -0,0 +1,213 @@
+"""
+Before/after benchmark of the PriceHistory physical layout.
+
+"surrogate" is the old layout (price_history_id primary key, unique key and
+index on (ticker_symbol, date), index on date), "clustered" the current one
+(primary key (ticker_symbol, date), index on date). Both are created as
+scratch tables without partitions or foreign keys, so only the keys differ,
+loaded with the same synthetic rows, measured, and dropped again:
+
+- insert throughput of the initial load (ticker by ticker, like a backfill)
+  and of daily appends (every ticker for one new day at a time),
+- latency of per-ticker range scans (one year of one ticker),
+- storage (data + indexes) per million rows.
+
+    python tests/benchmark_price_history_layout.py --tickers 500 --days 2000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import statistics
+import time
+
+import pymysql
+from dotenv import load_dotenv
+
+LAYOUTS = {
+    "surrogate": """
+        CREATE TABLE {table} (
+            price_history_id INT AUTO_INCREMENT PRIMARY KEY,
+            ticker_symbol VARCHAR(10) NOT NULL,
+            date DATE NOT NULL,
+            open_price DECIMAL(19, 4) NOT NULL,
+            high_price DECIMAL(19, 4) NOT NULL,
+            low_price DECIMAL(19, 4) NOT NULL,
+            close_price DECIMAL(19, 4) NOT NULL,
+            volume BIGINT NOT NULL,
+            UNIQUE KEY unique_ticker_date (ticker_symbol, date),
+            INDEX idx_ticker_date (ticker_symbol, date),
+            INDEX idx_date (date)
+        );
+    """,
+    "clustered": """
+        CREATE TABLE {table} (
+            ticker_symbol VARCHAR(10) NOT NULL,
+            date DATE NOT NULL,
+            open_price DECIMAL(19, 4) NOT NULL,
+            high_price DECIMAL(19, 4) NOT NULL,
+            low_price DECIMAL(19, 4) NOT NULL,
+            close_price DECIMAL(19, 4) NOT NULL,
+            volume BIGINT NOT NULL,
+            PRIMARY KEY (ticker_symbol, date),
+            INDEX idx_date (date)
+        );
+    """,
+}
+
+SQL_INSERT = """
+    INSERT INTO {table} (ticker_symbol, date, open_price, high_price, low_price, close_price, volume)
+    VALUES (%s, %s, %s, %s, %s, %s, %s);
+"""
+
+SQL_RANGE_SCAN = """
+    SELECT date, open_price, high_price, low_price, close_price, volume
+    FROM {table}
+    WHERE ticker_symbol = %s AND date BETWEEN %s AND %s
+    ORDER BY date;
+"""
+
+SQL_TABLE_SIZE = """
+    SELECT DATA_LENGTH, INDEX_LENGTH
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s;
+"""
+
+FIRST_DAY = datetime.date(2015, 1, 2)
+
+
+def trading_days(n, start=FIRST_DAY):
+    days = []
+    day = start
+    while len(days) < n:
+        if day.weekday() < 5:
+            days.append(day)
+        day += datetime.timedelta(days=1)
+    return days
+
+
+def synthetic_rows(ticker, days, rng):
+    price = rng.uniform(20, 400)
+    rows = []
+    for day in days:
+        open_price = price
+        price = max(1.0, price * (1 + rng.gauss(0, 0.02)))
+        high = max(open_price, price) * (1 + abs(rng.gauss(0, 0.005)))
+        low = min(open_price, price) * (1 - abs(rng.gauss(0, 0.005)))
+        volume = rng.randint(100_000, 50_000_000)
+        rows.append((ticker, day, round(open_price, 4), round(high, 4), round(low, 4), round(price, 4), volume))
+    return rows
+
+
+def _insert(conn, table, rows, batch_size):
+    start = time.perf_counter()
+    with conn.cursor() as cursor:
+        sql = SQL_INSERT.format(table=table)
+        for i in range(0, len(rows), batch_size):
+            cursor.executemany(sql, rows[i : i + batch_size])
+            conn.commit()
+    return len(rows) / (time.perf_counter() - start)
+
+
+def bench_layout(conn, layout, tickers, days, append_days, scans, batch_size, seed):
+    table = f"PriceHistoryBench_{layout}"
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table};")
+        cursor.execute(LAYOUTS[layout].format(table=table))
+    try:
+        rng = random.Random(seed)
+        load_days, new_days = days[: len(days) - append_days], days[len(days) - append_days :]
+        series = {ticker: synthetic_rows(ticker, days, rng) for ticker in tickers}
+
+        # backfill: each ticker's history at once
+        bulk = [row for ticker in tickers for row in series[ticker][: len(load_days)]]
+        bulk_rate = _insert(conn, table, bulk, batch_size)
+        # steady state: one new bar per ticker per day
+        appends = [series[ticker][len(load_days) + i] for i in range(len(new_days)) for ticker in tickers]
+        append_rate = _insert(conn, table, appends, batch_size) if appends else 0.0
+
+        with conn.cursor() as cursor:
+            cursor.execute(f"ANALYZE TABLE {table};")
+            cursor.fetchall()
+            cursor.execute(SQL_TABLE_SIZE, (table,))
+            data_bytes, index_bytes = cursor.fetchone()
+
+            latencies = []
+            sql = SQL_RANGE_SCAN.format(table=table)
+            scan_rng = random.Random(seed + 1)
+            for _ in range(scans):
+                first = scan_rng.randrange(max(1, len(days) - 252))
+                ticker = scan_rng.choice(tickers)
+                start = time.perf_counter()
+                cursor.execute(sql, (ticker, days[first], days[min(first + 251, len(days) - 1)]))
+                cursor.fetchall()
+                latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table};")
+
+    n_rows = len(bulk) + len(appends)
+    latencies.sort()
+    return {
+        "rows": n_rows,
+        "bulk_rows_per_second": bulk_rate,
+        "append_rows_per_second": append_rate,
+        "scan_ms_p50": statistics.median(latencies),
+        "scan_ms_p95": latencies[int(0.95 * (len(latencies) - 1))],
+        "data_mb_per_million_rows": data_bytes / n_rows * 1e6 / 2**20,
+        "index_mb_per_million_rows": index_bytes / n_rows * 1e6 / 2**20,
+    }
+
+
+def print_results(results):
+    metrics = list(next(iter(results.values())))
+    print(f"{'':28}" + "".join(f"{layout:>14}" for layout in results))
+    for metric in metrics:
+        print(f"{metric:28}" + "".join(f"{results[layout][metric]:>14,.2f}" for layout in results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the surrogate vs clustered PriceHistory keys.")
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=2000, help="trading days per ticker")
+    parser.add_argument("--append-days", type=int, default=20, help="of --days, loaded as daily appends")
+    parser.add_argument("--scans", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    # load environment variables from .env file
+    load_dotenv()
+
+    DB_CONNECT_CONFIG = {
+        "host": os.environ["DB_HOST"],
+        "user": os.environ["DB_USER"],
+        "password": os.environ["DB_PASSWORD"],
+        "database": os.environ["DB_NAME"],
+        "port": int(os.environ["DB_PORT"]),
+    }
+
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    days = trading_days(args.days)
+    with pymysql.connect(**DB_CONNECT_CONFIG) as conn:
+        results = {
+            layout: bench_layout(
+                conn,
+                layout,
+                tickers,
+                days,
+                min(args.append_days, args.days - 1),
+                args.scans,
+                args.batch_size,
+                args.seed,
+            )
+            for layout in LAYOUTS
+        }
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f_json:
+            json.dump(results, f_json, indent=2)
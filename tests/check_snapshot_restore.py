@@ -0,0 +1,96 @@
+"""
+Round trip of Holdings and AuditLog through "Sample Data/db_snapshot.py".
+
+Saves User, Ticker, Portfolio, Holdings and AuditLog of the configured
+database, restores them into a scratch database that has the holdings trigger
+installed, and checks that the trigger wrote no AuditLog rows of its own: both
+tables must come back with exactly the snapshot's rows.
+
+    python tests/check_snapshot_restore.py [--format csv|parquet] [--keep]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pymysql
+from pymysql.constants import CLIENT
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parents[1]
+SNAPSHOT_SCRIPT = ROOT / "Sample Data" / "db_snapshot.py"
+TRIGGER_SQL = ROOT / "backend" / "api" / "sql" / "triggers" / "create_holdings_trigger.sql"
+
+TABLES = ["User", "Ticker", "Portfolio", "Holdings", "AuditLog"]
+# parents before the tables referencing them
+CREATE_ORDER = ["User", "Ticker", "AuditLog", "Portfolio", "Holdings"]
+
+
+def snapshot(command, directory, database, *args):
+    """Runs db_snapshot.py `command` against `database`, returns its exit code."""
+    return subprocess.run(
+        [sys.executable, str(SNAPSHOT_SCRIPT), command, directory, "--tables", *TABLES, *args],
+        env={**os.environ, "DB_NAME": database},
+    ).returncode
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that a restore of Holdings keeps AuditLog unchanged.")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--scratch-db", help="database to restore into (default: <DB_NAME>_restore_check)")
+    parser.add_argument("--keep", action="store_true", help="don't drop the scratch database afterwards")
+    args = parser.parse_args()
+
+    load_dotenv()
+    source = os.environ["DB_NAME"]
+    scratch = args.scratch_db or f"{source}_restore_check"
+    server = {
+        "host": os.environ["DB_HOST"],
+        "user": os.environ["DB_USER"],
+        "password": os.environ["DB_PASSWORD"],
+        "port": int(os.environ["DB_PORT"]),
+    }
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        if snapshot("save", snapshot_dir, source, "--format", args.format):
+            sys.exit("saving the snapshot failed")
+        with open(Path(snapshot_dir) / "manifest.json") as f_json:
+            manifest = json.load(f_json)
+
+        with pymysql.connect(**server) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"CREATE DATABASE `{scratch}`;")
+        try:
+            # the tables and the trigger exist before the restore, like in a schema built by setup_db
+            # the trigger script drops any old trigger first, two statements
+            with pymysql.connect(**server, database=scratch, client_flag=CLIENT.MULTI_STATEMENTS) as conn:
+                with conn.cursor() as cursor:
+                    for table in CREATE_ORDER:
+                        cursor.execute(manifest["tables"][table]["create_table"])
+                    cursor.execute(TRIGGER_SQL.read_text())
+
+            failures = ["restore reported a row count mismatch"] if snapshot("restore", snapshot_dir, scratch) else []
+            with pymysql.connect(**server, database=scratch) as conn:
+                with conn.cursor() as cursor:
+                    for table in ("Holdings", "AuditLog"):
+                        cursor.execute(f"SELECT COUNT(*) FROM `{table}`;")
+                        (count,) = cursor.fetchone()
+                        expected = manifest["tables"][table]["rows"]
+                        print(f"{table}: {count:,} rows restored, snapshot has {expected:,}")
+                        if count != expected:
+                            failures.append(f"{table} has {count - expected:+,} rows")
+        finally:
+            if not args.keep:
+                with pymysql.connect(**server) as conn:
+                    with conn.cursor() as cursor:
+                        cursor.execute(f"DROP DATABASE `{scratch}`;")
+
+    for failure in failures:
+        print(f"FAILED {failure}")
+    if not failures:
+        print("Holdings and AuditLog restored unchanged")
+    sys.exit(1 if failures else 0)